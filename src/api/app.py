@@ -4,9 +4,15 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.types import Lifespan
 
 from src.api.exceptions import exception_handlers
+from src.api.middlewares import MetricsMiddleware, QueryStatsMiddleware
 from src.api.openapi import generate_custom_openapi
 from src.api.routers import root_router
+from src.config.settings import settings
+from src.core.use_case import set_execution_observer
 from src.di.container import build_container
+from src.services.metrics import observe_use_case, register_pool_metrics
+from src.storages.database import async_engine
+from src.storages.query_stats import instrument_engine
 
 
 def create_app(lifespan: Lifespan[FastAPI] | None = None) -> FastAPI:
@@ -32,6 +38,17 @@ def create_app(lifespan: Lifespan[FastAPI] | None = None) -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.QUERY_STATS.ENABLED:
+        instrument_engine(engine=async_engine.sync_engine)
+        app.add_middleware(
+            QueryStatsMiddleware,
+            repeat_threshold=settings.QUERY_STATS.REPEAT_THRESHOLD,
+            server_timing=settings.QUERY_STATS.SERVER_TIMING,
+        )
+    if settings.METRICS.ENABLED:
+        set_execution_observer(observe_use_case)
+        register_pool_metrics(engine=async_engine)
+        app.add_middleware(MetricsMiddleware)
     container = build_container()
     setup_dishka(container=container, app=app)
     app.openapi = generate_custom_openapi(app=app)  # type: ignore[method-assign]
@@ -1,14 +1,25 @@
 from fastapi import APIRouter, Response, status
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
+
+from src.services.metrics import metrics_registry
 
 router = APIRouter(prefix="", tags=["default"])
 
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 @router.get(path="/health")
 async def health() -> Response:
     return Response(status_code=status.HTTP_200_OK)
 
 
+@router.get(path="/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return PlainTextResponse(
+        content=await metrics_registry.render(), media_type=METRICS_CONTENT_TYPE
+    )
+
+
 @router.get("/")
 async def default_redirect() -> RedirectResponse:
     return RedirectResponse("/docs", status_code=status.HTTP_302_FOUND)
@@ -12,7 +12,13 @@ from src.core.competencies.exceptions import (
     CompetencySkillRelationAlreadyExistsError,
 )
 from src.core.exceptions import BaseExceptionError, InvalidJWTTokenError, PermissionDeniedError
-from src.core.media.exceptions import MediaNotFoundError
+from src.core.media.exceptions import (
+    InvalidUploadChunkError,
+    MediaNotFoundError,
+    MediaTooLargeError,
+    UploadSessionIncompleteError,
+    UploadSessionNotFoundError,
+)
 from src.core.mission_chains.exceptions import (
     CircularDependencyError,
     InvalidMissionOrderError,
@@ -105,6 +111,10 @@ exception_handlers: (
     TaskNameAlreadyExistError: handler(status_code=status.HTTP_409_CONFLICT),
     TaskNotFoundError: handler(status_code=status.HTTP_404_NOT_FOUND),
     MediaNotFoundError: handler(status_code=status.HTTP_404_NOT_FOUND),
+    MediaTooLargeError: handler(status_code=status.HTTP_413_CONTENT_TOO_LARGE),
+    UploadSessionNotFoundError: handler(status_code=status.HTTP_404_NOT_FOUND),
+    UploadSessionIncompleteError: handler(status_code=status.HTTP_409_CONFLICT),
+    InvalidUploadChunkError: handler(status_code=status.HTTP_400_BAD_REQUEST),
     ArtifactNotFoundError: handler(status_code=status.HTTP_404_NOT_FOUND),
     ArtifactTitleAlreadyExistError: handler(status_code=status.HTTP_409_CONFLICT),
     CompetencyNameAlreadyExistError: handler(status_code=status.HTTP_409_CONFLICT),
@@ -1,13 +1,43 @@
+from collections.abc import AsyncGenerator, AsyncIterator
+from datetime import UTC
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Annotated
+from urllib.parse import unquote
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, File, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, File, Header, Request, UploadFile, status
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 
 from src.api.auth.schemas import JwtUser
-from src.api.media.schemas import FileObjectResponse
+from src.api.media.schemas import (
+    FileObjectResponse,
+    MediaDownloadUrlResponse,
+    UploadPartResponse,
+    UploadSessionCreateRequest,
+    UploadSessionResponse,
+    UploadSessionStatusResponse,
+)
 from src.api.openapi import openapi_extra
-from src.services.minio import MinioService
+from src.config.settings import settings
+from src.core.file_storage import FileStorage
+from src.core.media.enums import MediaVariantEnum
+from src.core.media.exceptions import MediaTooLargeError
+from src.core.media.schemas import FileMetadata
+from src.core.media.use_cases import (
+    AbortUploadSessionUseCase,
+    CompleteUploadSessionUseCase,
+    CreateUploadSessionUseCase,
+    GetUploadSessionUseCase,
+    UploadChunkUseCase,
+    UploadFileUseCase,
+)
+from src.services.image_variants import ImageVariantService, build_variant_key
 
 router = APIRouter(tags=["media"], route_class=DishkaRoute)
 
@@ -17,46 +47,301 @@ router = APIRouter(tags=["media"], route_class=DishkaRoute)
     openapi_extra=openapi_extra,
     status_code=status.HTTP_201_CREATED,
     summary="Загрузить файл",
-    description="Загружает файл в систему хранения медиа",
+    description=(
+        "Загружает файл в систему хранения медиа. "
+        "С параметром variants=true для изображений дополнительно создаются уменьшенные копии"
+    ),
 )
 async def upload_file(
     file: Annotated[UploadFile, File(...)],
     user: FromDishka[JwtUser],
-    minio_service: FromDishka[MinioService],
+    use_case: FromDishka[UploadFileUseCase],
+    image_variant_service: FromDishka[ImageVariantService],
+    variants: bool = False,  # noqa: FBT001, FBT002
 ) -> FileObjectResponse:
     _ = user
-    file_object = await minio_service.upload_file_stream(
+    file_object = await use_case.execute(
         file_name=file.filename or "unknown",
         file_stream=file.file,
         content_type=file.content_type,
         file_size=file.size,
     )
+    variant_objects = {}
+    if variants and file.content_type and file.content_type.startswith("image/"):
+        await file.seek(0)
+        variant_objects = await image_variant_service.create_variants(
+            key=file_object.key,
+            content=await file.read(),
+        )
+    return FileObjectResponse.from_schema(file_object=file_object, variants=variant_objects)
+
+
+@router.post(
+    path="/media/stream",
+    openapi_extra={
+        **openapi_extra,
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+            },
+        },
+    },
+    status_code=status.HTTP_201_CREATED,
+    summary="Загрузить файл потоком",
+    description=(
+        "Загружает файл, передаваемый телом запроса без multipart-обёртки, "
+        "сразу в систему хранения медиа без промежуточной записи на диск. "
+        "Имя файла передаётся в заголовке X-File-Name (допускается percent-encoding), "
+        "тип содержимого в Content-Type"
+    ),
+)
+async def upload_file_stream(
+    request: Request,
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[UploadFileUseCase],
+    file_name: Annotated[str, Header(alias="X-File-Name")] = "unknown",
+    content_type: Annotated[str, Header(alias="Content-Type")] = "application/octet-stream",
+    content_length: Annotated[int | None, Header(alias="Content-Length")] = None,
+) -> FileObjectResponse:
+    _ = user
+    max_size = settings.MEDIA.MAX_UPLOAD_SIZE
+    if content_length is not None and content_length > max_size:
+        raise MediaTooLargeError
+    file_object = await use_case.execute(
+        file_name=unquote(file_name),
+        file_stream=_limit_stream(stream=request.stream(), max_size=max_size),
+        content_type=content_type,
+        file_size=content_length,
+    )
     return FileObjectResponse.from_schema(file_object=file_object)
 
 
+@router.post(
+    path="/media/uploads",
+    openapi_extra=openapi_extra,
+    status_code=status.HTTP_201_CREATED,
+    summary="Создать сессию загрузки",
+    description=(
+        "Создает сессию загрузки файла по частям. "
+        "Части загружаются отдельными запросами и могут повторяться при обрыве соединения"
+    ),
+)
+async def create_upload_session(
+    body: UploadSessionCreateRequest,
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[CreateUploadSessionUseCase],
+) -> UploadSessionResponse:
+    upload_session = await use_case.execute(
+        file_name=body.file_name,
+        content_type=body.content_type,
+        owner_login=user.login,
+    )
+    return UploadSessionResponse.from_schema(upload_session=upload_session)
+
+
+@router.get(
+    path="/media/uploads/{session_id}",
+    openapi_extra=openapi_extra,
+    summary="Получить состояние сессии загрузки",
+    description=(
+        "Возвращает полученные части и количество байт, полученных без пропусков, "
+        "чтобы клиент мог дозагрузить только недостающие части"
+    ),
+)
+async def get_upload_session(
+    session_id: str,
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[GetUploadSessionUseCase],
+) -> UploadSessionStatusResponse:
+    upload_status = await use_case.execute(session_id=session_id, owner_login=user.login)
+    return UploadSessionStatusResponse.from_schema(status=upload_status)
+
+
+@router.put(
+    path="/media/uploads/{session_id}/chunks/{part_number}",
+    openapi_extra={
+        **openapi_extra,
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+            },
+        },
+    },
+    summary="Загрузить часть файла",
+    description=(
+        "Загружает часть файла с указанным номером (начиная с 1). "
+        "Повторная загрузка части с тем же номером заменяет ее"
+    ),
+)
+async def upload_chunk(
+    session_id: str,
+    part_number: int,
+    request: Request,
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[UploadChunkUseCase],
+) -> UploadPartResponse:
+    content = bytearray()
+    async for chunk in _limit_stream(
+        stream=request.stream(), max_size=settings.MEDIA.UPLOAD_CHUNK_SIZE
+    ):
+        content.extend(chunk)
+    upload_part = await use_case.execute(
+        session_id=session_id,
+        owner_login=user.login,
+        part_number=part_number,
+        content=bytes(content),
+    )
+    return UploadPartResponse.from_schema(upload_part=upload_part)
+
+
+@router.post(
+    path="/media/uploads/{session_id}/complete",
+    openapi_extra=openapi_extra,
+    status_code=status.HTTP_201_CREATED,
+    summary="Завершить сессию загрузки",
+    description="Собирает загруженные части в файл и закрывает сессию загрузки",
+)
+async def complete_upload_session(
+    session_id: str,
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[CompleteUploadSessionUseCase],
+) -> FileObjectResponse:
+    file_object = await use_case.execute(session_id=session_id, owner_login=user.login)
+    return FileObjectResponse.from_schema(file_object=file_object)
+
+
+@router.delete(
+    path="/media/uploads/{session_id}",
+    openapi_extra=openapi_extra,
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Отменить сессию загрузки",
+    description="Удаляет сессию загрузки вместе с уже загруженными частями",
+)
+async def abort_upload_session(
+    session_id: str,
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[AbortUploadSessionUseCase],
+) -> None:
+    await use_case.execute(session_id=session_id, owner_login=user.login)
+
+
 @router.get(
     path="/media/{key:path}",
     openapi_extra=openapi_extra,
     summary="Скачать файл",
-    description="Скачивает файл из системы хранения медиа по ключу",
+    description=(
+        "Скачивает файл из системы хранения медиа по ключу. "
+        "Параметр variant позволяет получить уменьшенную копию изображения. "
+        "В зависимости от настройки MINIO_DOWNLOAD_MODE возвращает содержимое файла, "
+        "перенаправление на временную ссылку хранилища или саму ссылку; "
+        "локальное хранилище всегда отдает содержимое файла. "
+        "Поддерживает условные запросы: при совпадении If-None-Match или If-Modified-Since "
+        "возвращает 304 без тела"
+    ),
 )
 async def download_file(
     key: str,
+    request: Request,
     user: FromDishka[JwtUser],
-    minio_service: FromDishka[MinioService],
-) -> StreamingResponse:
+    file_storage: FromDishka[FileStorage],
+    variant: MediaVariantEnum | None = None,
+) -> Response:
     _ = user
-    file_metadata = await minio_service.get_file_metadata(key=key)
-    file_stream = minio_service.download_file(key)
-    content_disposition = (
-        "inline" if file_metadata.media_type.startswith("image/") else "attachment"
-    )
+    if variant is not None:
+        key = build_variant_key(key=key, variant=variant)
+
+    # The local storage URL points back at this route, so redirecting to it would loop
+    if settings.MINIO.DOWNLOAD_MODE != "proxy" and settings.MEDIA.STORAGE != "local":
+        download_url = await file_storage.get_download_url(key=key)
+        if settings.MINIO.DOWNLOAD_MODE == "redirect":
+            return RedirectResponse(download_url, status_code=status.HTTP_302_FOUND)
+        return JSONResponse(
+            content=MediaDownloadUrlResponse(
+                url=download_url,
+                expires_in=settings.MINIO.PRESIGNED_URL_TTL,
+            ).dict(),
+        )
+    return await _build_storage_response(request=request, key=key, file_storage=file_storage)
+
+
+async def _build_storage_response(
+    request: Request, key: str, file_storage: FileStorage
+) -> Response:
+    file = await file_storage.open_file(key=key)
+    if _is_not_modified(request=request, metadata=file.metadata):
+        await file.close()
+        return _build_not_modified_response(metadata=file.metadata)
+
+    if file.path is not None:
+        return FileResponse(
+            path=file.path,
+            media_type=file.metadata.media_type,
+            headers=_build_media_headers(key=key, metadata=file.metadata),
+        )
+
     return StreamingResponse(
-        content=file_stream,
-        media_type=file_metadata.media_type,
+        content=file.stream,
+        media_type=file.metadata.media_type,
         headers={
-            "Content-Disposition": f'{content_disposition}; filename="{key.rsplit("/", 1)[-1]}"',
-            "Content-Length": str(file_metadata.file_size),
-            "Cache-Control": "public, max-age=3600",
+            **_build_media_headers(key=key, metadata=file.metadata),
+            "Content-Length": str(file.metadata.file_size),
         },
     )
+
+
+async def _limit_stream(stream: AsyncIterator[bytes], max_size: int) -> AsyncGenerator[bytes]:
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+        if size > max_size:
+            raise MediaTooLargeError
+        if chunk:
+            yield chunk
+
+
+def _build_media_headers(key: str, metadata: FileMetadata) -> dict[str, str]:
+    content_disposition = "inline" if metadata.media_type.startswith("image/") else "attachment"
+    return {
+        "Content-Disposition": f'{content_disposition}; filename="{key.rsplit("/", 1)[-1]}"',
+        **_build_cache_headers(metadata=metadata),
+    }
+
+
+def _build_cache_headers(metadata: FileMetadata) -> dict[str, str]:
+    headers = {"Cache-Control": f"public, max-age={settings.MEDIA.CACHE_MAX_AGE}, immutable"}
+    if metadata.etag:
+        headers["ETag"] = f'"{metadata.etag}"'
+    if metadata.last_modified:
+        headers["Last-Modified"] = format_datetime(
+            metadata.last_modified.astimezone(UTC), usegmt=True
+        )
+    return headers
+
+
+def _build_not_modified_response(metadata: FileMetadata) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=_build_cache_headers(metadata=metadata),
+    )
+
+
+def _is_not_modified(request: Request, metadata: FileMetadata) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if metadata.etag is None:
+            return False
+        etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        return "*" in etags or f'"{metadata.etag}"' in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or metadata.last_modified is None:
+        return False
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if modified_since.tzinfo is None:
+        modified_since = modified_since.replace(tzinfo=UTC)
+    return metadata.last_modified.replace(microsecond=0) <= modified_since
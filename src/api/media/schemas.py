@@ -1,7 +1,8 @@
 from pydantic import Field
 
 from src.api.boundary import BoundaryModel
-from src.core.media.schemas import FileObject
+from src.core.media.enums import MediaVariantEnum
+from src.core.media.schemas import FileObject, UploadPart, UploadSession, UploadSessionStatus
 
 
 class FileObjectResponse(BoundaryModel):
@@ -10,13 +11,79 @@ class FileObjectResponse(BoundaryModel):
     size: int | None = Field(default=..., description="Размер файла")
     etag: str = Field(default=..., description="Е-тэг файла")
     content_type: str | None = Field(default=..., description="Тип файла")
+    variants: dict[MediaVariantEnum, str] = Field(
+        default_factory=dict, description="Ссылки на уменьшенные копии изображения"
+    )
 
     @classmethod
-    def from_schema(cls, file_object: FileObject) -> "FileObjectResponse":
+    def from_schema(
+        cls,
+        file_object: FileObject,
+        variants: dict[MediaVariantEnum, FileObject] | None = None,
+    ) -> "FileObjectResponse":
         return cls(
             key=file_object.key,
             url=file_object.url,
             size=file_object.size,
             etag=file_object.etag,
             content_type=file_object.content_type,
+            variants={
+                variant: variant_object.url for variant, variant_object in (variants or {}).items()
+            },
+        )
+
+
+class MediaDownloadUrlResponse(BoundaryModel):
+    url: str = Field(default=..., description="Временная ссылка на скачивание файла")
+    expires_in: int = Field(default=..., description="Время жизни ссылки в секундах")
+
+
+class UploadSessionCreateRequest(BoundaryModel):
+    file_name: str = Field(default=..., min_length=1, description="Имя загружаемого файла")
+    content_type: str | None = Field(default=None, description="Тип файла")
+
+
+class UploadSessionResponse(BoundaryModel):
+    id: str = Field(default=..., description="Идентификатор сессии загрузки")
+    key: str = Field(default=..., description="Идентификатор файла после завершения загрузки")
+    file_name: str = Field(default=..., description="Имя загружаемого файла")
+    content_type: str | None = Field(default=..., description="Тип файла")
+    chunk_size: int = Field(
+        default=..., description="Размер частей в байтах (кроме последней части)"
+    )
+
+    @classmethod
+    def from_schema(cls, upload_session: UploadSession) -> "UploadSessionResponse":
+        return cls(
+            id=upload_session.id,
+            key=upload_session.key,
+            file_name=upload_session.file_name,
+            content_type=upload_session.content_type,
+            chunk_size=upload_session.chunk_size,
+        )
+
+
+class UploadPartResponse(BoundaryModel):
+    number: int = Field(default=..., description="Номер части")
+    etag: str = Field(default=..., description="Е-тэг части")
+    size: int = Field(default=..., description="Размер части в байтах")
+
+    @classmethod
+    def from_schema(cls, upload_part: UploadPart) -> "UploadPartResponse":
+        return cls(number=upload_part.number, etag=upload_part.etag, size=upload_part.size)
+
+
+class UploadSessionStatusResponse(BoundaryModel):
+    session: UploadSessionResponse = Field(default=..., description="Сессия загрузки")
+    parts: list[UploadPartResponse] = Field(default=..., description="Полученные части")
+    offset: int = Field(
+        default=..., description="Количество байт, полученных без пропусков с начала файла"
+    )
+
+    @classmethod
+    def from_schema(cls, status: UploadSessionStatus) -> "UploadSessionStatusResponse":
+        return cls(
+            session=UploadSessionResponse.from_schema(upload_session=status.session),
+            parts=[UploadPartResponse.from_schema(upload_part=part) for part in status.parts],
+            offset=status.offset,
         )
@@ -0,0 +1,92 @@
+import logging
+import time
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.metrics import http_request_duration, http_requests_in_progress
+from src.storages.query_stats import QueryStats, query_stats
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_STATEMENT_LENGTH = 500
+UNMATCHED_ROUTE = "unmatched"
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp, *, repeat_threshold: int, server_timing: bool = False) -> None:
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                structlog.contextvars.bind_contextvars(
+                    db_queries=stats.count, db_time_ms=round(stats.duration * 1000, 2)
+                )
+                if self.server_timing:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"',
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            query_stats.reset(token)
+            structlog.contextvars.unbind_contextvars("db_queries", "db_time_ms")
+            self._warn_repeated_statements(scope=scope, stats=stats)
+
+    def _warn_repeated_statements(self, scope: Scope, stats: QueryStats) -> None:
+        for statement, count in stats.get_repeated_statements(threshold=self.repeat_threshold):
+            logger.warning(
+                "Possible N+1 query: %s %s repeated a statement %d times",
+                scope["method"],
+                scope["path"],
+                count,
+                extra={"statement": statement[:MAX_LOGGED_STATEMENT_LENGTH]},
+            )
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc(method=method)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_progress.dec(method=method)
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started_at,
+                method=method,
+                route=getattr(route, "path", UNMATCHED_ROUTE),
+                status=str(status_code),
+            )
@@ -1,5 +1,7 @@
+from typing import Annotated
+
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from src.api.auth.schemas import JwtHRUser, JwtUser
 from src.api.missions.schemas import (
@@ -15,6 +17,8 @@ from src.core.artifacts.use_cases import (
     AddArtifactToMissionUseCase,
     RemoveArtifactFromMissionUseCase,
 )
+from src.core.missions.enums import MissionCategoryEnum, MissionSortEnum
+from src.core.missions.schemas import MissionFilter
 from src.core.missions.use_cases import (
     AddCompetencyRewardToMissionUseCase,
     AddSkillRewardToMissionUseCase,
@@ -54,14 +58,42 @@ async def create_mission(
     openapi_extra=openapi_extra,
     status_code=status.HTTP_200_OK,
     summary="Получить список миссий",
-    description="Возвращает все доступные миссии",
+    description=(
+        "Возвращает миссии, подходящие под фильтры, в заданном порядке. "
+        "Без limit возвращаются все подходящие миссии"
+    ),
 )
-async def get_missions(
+async def get_missions(  # noqa: PLR0913
     user: FromDishka[JwtUser],
     use_case: FromDishka[GetMissionsUseCase],
+    season_id: Annotated[int | None, Query(description="ID сезона")] = None,
+    category: Annotated[MissionCategoryEnum | None, Query(description="Категория миссии")] = None,
+    rank_requirement: Annotated[int | None, Query(description="Требуемый ранг")] = None,
+    min_reward_xp: Annotated[int | None, Query(ge=0, description="Минимум опыта")] = None,
+    max_reward_xp: Annotated[int | None, Query(ge=0, description="Максимум опыта")] = None,
+    min_reward_mana: Annotated[int | None, Query(ge=0, description="Минимум маны")] = None,
+    max_reward_mana: Annotated[int | None, Query(ge=0, description="Максимум маны")] = None,
+    sort_by: Annotated[MissionSortEnum, Query(description="Поле сортировки")] = MissionSortEnum.ID,
+    descending: Annotated[bool, Query(description="Сортировка по убыванию")] = False,  # noqa: FBT002
+    limit: Annotated[int | None, Query(ge=1, le=100, description="Размер страницы")] = None,
+    offset: Annotated[int, Query(ge=0, description="Смещение от начала выдачи")] = 0,
 ) -> MissionsResponse:
     _ = user
-    missions = await use_case.execute()
+    missions = await use_case.execute(
+        filters=MissionFilter(
+            season_id=season_id,
+            category=category,
+            rank_requirement=rank_requirement,
+            min_reward_xp=min_reward_xp,
+            max_reward_xp=max_reward_xp,
+            min_reward_mana=min_reward_mana,
+            max_reward_mana=max_reward_mana,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
+    )
     return MissionsResponse.from_schema(missions=missions)
 
 
@@ -150,9 +150,11 @@ class MissionDependencyResponse(BoundaryModel):
 
 class MissionsResponse(BoundaryModel):
     values: list[MissionResponse]
+    total: int | None = Field(default=None, description="Всего миссий, подходящих под фильтры")
 
     @classmethod
     def from_schema(cls, missions: Missions) -> "MissionsResponse":
         return cls(
-            values=[MissionResponse.from_schema(mission=mission) for mission in missions.values]
+            values=[MissionResponse.from_schema(mission=mission) for mission in missions.values],
+            total=missions.total,
         )
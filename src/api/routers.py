@@ -7,6 +7,7 @@ from src.api.media import endpoints as media
 from src.api.mission_chains import endpoints as mission_chains
 from src.api.missions import endpoints as missions
 from src.api.ranks import endpoints as ranks
+from src.api.search import endpoints as search
 from src.api.seasons import endpoints as seasons
 from src.api.skills import endpoints as skills
 from src.api.store import endpoints as store
@@ -26,3 +27,4 @@ root_router.include_router(skills.router)
 root_router.include_router(store.router)
 root_router.include_router(artifacts.router)
 root_router.include_router(media.router)
+root_router.include_router(search.router)
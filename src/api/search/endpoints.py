@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Query, status
+
+from src.api.auth.schemas import JwtUser
+from src.api.openapi import openapi_extra
+from src.api.search.schemas import SearchResultsResponse
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.schemas import SearchQuery
+from src.core.search.use_cases import SearchUseCase
+
+router = APIRouter(tags=["search"], route_class=DishkaRoute)
+
+
+@router.get(
+    path="/search",
+    openapi_extra=openapi_extra,
+    status_code=status.HTTP_200_OK,
+    summary="Полнотекстовый поиск",
+    description=(
+        "Ищет миссии, задачи, артефакты и товары магазина по названию и описанию. "
+        "Результаты упорядочены по релевантности, совпадения в названии важнее"
+    ),
+)
+async def search(
+    user: FromDishka[JwtUser],
+    use_case: FromDishka[SearchUseCase],
+    query: Annotated[str, Query(min_length=1, max_length=200, description="Поисковый запрос")],
+    types: Annotated[
+        list[SearchEntityEnum] | None, Query(description="Типы сущностей, по умолчанию все")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Размер страницы")] = 20,
+    offset: Annotated[int, Query(ge=0, description="Смещение от начала выдачи")] = 0,
+) -> SearchResultsResponse:
+    _ = user
+    results = await use_case.execute(
+        query=SearchQuery(
+            text=query,
+            entity_types=types or list(SearchEntityEnum),
+            limit=limit,
+            offset=offset,
+        )
+    )
+    return SearchResultsResponse.from_schema(results=results)
@@ -0,0 +1,35 @@
+from pydantic import Field
+
+from src.api.boundary import BoundaryModel
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.schemas import SearchResult, SearchResults
+
+
+class SearchResultResponse(BoundaryModel):
+    entity_type: SearchEntityEnum = Field(default=..., description="Тип найденной сущности")
+    id: int = Field(default=..., description="Идентификатор сущности")
+    title: str = Field(default=..., description="Название")
+    description: str = Field(default=..., description="Описание")
+    rank: float = Field(default=..., description="Релевантность")
+
+    @classmethod
+    def from_schema(cls, result: SearchResult) -> "SearchResultResponse":
+        return cls(
+            entity_type=result.entity_type,
+            id=result.id,
+            title=result.title,
+            description=result.description,
+            rank=result.rank,
+        )
+
+
+class SearchResultsResponse(BoundaryModel):
+    values: list[SearchResultResponse]
+    total: int = Field(default=..., description="Всего найдено")
+
+    @classmethod
+    def from_schema(cls, results: SearchResults) -> "SearchResultsResponse":
+        return cls(
+            values=[SearchResultResponse.from_schema(result=result) for result in results.values],
+            total=results.total,
+        )
@@ -0,0 +1,156 @@
+import asyncio
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from src.config.constants import constants
+
+READY_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    method: str
+    path: str
+    headers: dict[str, str] | None = None
+    json: dict[str, Any] | None = None
+
+
+@dataclass
+class LoadResult:
+    latencies: list[float] = field(default_factory=list)
+    failed: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def merge(self, other: "LoadResult") -> None:
+        self.latencies.extend(other.latencies)
+        self.failed += other.failed
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+
+
+def start_service(port: int, env: dict[str, str] | None = None) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "src.main"],
+        cwd=constants.DIRS.ROOT,
+        env={**os.environ, "APP_PORT": str(port), **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(base_url: str) -> None:
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").is_success:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    msg = f"Service at {base_url} did not become ready"
+    raise RuntimeError(msg)
+
+
+def stop_service(process: subprocess.Popen[bytes]) -> None:
+    process.terminate()
+    process.wait()
+
+
+async def _run_load(
+    base_url: str, specs: list[RequestSpec], concurrency: int, duration: float, seed: int
+) -> LoadResult:
+    result = LoadResult()
+    rnd = random.Random(seed)  # noqa: S311
+    deadline = time.monotonic() + duration
+
+    async def _worker(client: httpx.AsyncClient) -> None:
+        while time.monotonic() < deadline:
+            spec = rnd.choice(specs)
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(
+                    spec.method, spec.path, headers=spec.headers, json=spec.json
+                )
+            except httpx.HTTPError:
+                result.failed += 1
+                continue
+            result.statuses[response.status_code] = result.statuses.get(response.status_code, 0) + 1
+            if response.is_success:
+                result.latencies.append(time.perf_counter() - started_at)
+            else:
+                result.failed += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        await asyncio.gather(*(_worker(client) for _ in range(concurrency)))
+    return result
+
+
+def _load_process(
+    base_url: str, specs: list[RequestSpec], concurrency: int, duration: float, seed: int
+) -> LoadResult:
+    return asyncio.run(
+        _run_load(
+            base_url=base_url, specs=specs, concurrency=concurrency, duration=duration, seed=seed
+        )
+    )
+
+
+def run_load(
+    base_url: str,
+    specs: list[RequestSpec],
+    *,
+    concurrency: int,
+    clients: int,
+    duration: float,
+    seed: int = 0,
+) -> LoadResult:
+    result = LoadResult()
+    with ProcessPoolExecutor(max_workers=clients) as executor:
+        futures = [
+            executor.submit(
+                _load_process,
+                base_url,
+                specs,
+                max(concurrency // clients, 1),
+                duration,
+                seed + index,
+            )
+            for index in range(clients)
+        ]
+        for future in futures:
+            result.merge(future.result())
+    return result
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def summarize(result: LoadResult, duration: float) -> dict[str, Any]:
+    latencies = sorted(result.latencies)
+    return {
+        "requests": len(latencies),
+        "failed": result.failed,
+        "statuses": {str(status): count for status, count in sorted(result.statuses.items())},
+        "throughput": round(len(latencies) / duration, 2),
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        },
+    }
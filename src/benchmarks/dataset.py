@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+
+import asyncpg
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.users.enums import UserRoleEnum
+from src.scripts.generate_data import GenerationVolume, SyntheticDataGenerator, build_dsn
+
+BENCHMARK_PASSWORD = "benchmark"  # noqa: S105
+UNLIMITED = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class BenchmarkDataset:
+    candidates: list[str]
+    hr_login: str
+    store_item_ids: list[int]
+    completed_missions: list[tuple[int, str]]
+
+
+async def ensure_database(db_url: str) -> None:
+    url = make_url(db_url)
+    engine = create_async_engine(
+        url.set(database="postgres"), poolclass=NullPool, isolation_level="AUTOCOMMIT"
+    )
+    try:
+        async with engine.connect() as connection:
+            exists = await connection.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": url.database}
+            )
+            if not exists:
+                await connection.execute(text(f'CREATE DATABASE "{url.database}"'))
+    finally:
+        await engine.dispose()
+
+
+async def seed_dataset(db_url: str, volume: GenerationVolume, seed: int) -> None:
+    generator = SyntheticDataGenerator(volume=volume, seed=seed, password=BENCHMARK_PASSWORD)
+    connection = await asyncpg.connect(build_dsn(db_url=db_url))
+    try:
+        await generator.run(connection=connection, truncate=True)
+    finally:
+        await connection.close()
+
+
+async def load_dataset(db_url: str, sample_size: int, seed: int) -> BenchmarkDataset:
+    connection = await asyncpg.connect(build_dsn(db_url=db_url))
+    try:
+        candidates = await connection.fetch(
+            "SELECT login FROM users_user WHERE role = $1 ORDER BY md5(login || $2) LIMIT $3",
+            UserRoleEnum.CANDIDATE.value,
+            str(seed),
+            sample_size,
+        )
+        candidate_logins = [row["login"] for row in candidates]
+        hr_login = await connection.fetchval(
+            "SELECT login FROM users_user WHERE role = $1 ORDER BY login LIMIT 1",
+            UserRoleEnum.HR.value,
+        )
+        store_items = await connection.fetch("SELECT id FROM store_item ORDER BY id")
+        completed_missions = await connection.fetch(
+            "SELECT relation.mission_id, user_task.user_login "
+            "FROM users_tasks AS user_task "
+            "JOIN missions_missions_tasks AS relation USING (task_id) "
+            "WHERE user_task.user_login = ANY($1) "
+            "GROUP BY relation.mission_id, user_task.user_login "
+            "HAVING bool_and(user_task.is_completed) "
+            "ORDER BY relation.mission_id, user_task.user_login",
+            candidate_logins,
+        )
+        # Purchases must not fail on balance or stock, so the sampled users never run out
+        await connection.execute(
+            "UPDATE users_user SET mana = $1 WHERE login = ANY($2)", UNLIMITED, candidate_logins
+        )
+        await connection.execute("UPDATE store_item SET stock = $1", UNLIMITED)
+    finally:
+        await connection.close()
+
+    if hr_login is None or not candidate_logins or not store_items:
+        msg = "Benchmark database is empty, run the benchmark without --skip-seed"
+        raise RuntimeError(msg)
+    return BenchmarkDataset(
+        candidates=candidate_logins,
+        hr_login=hr_login,
+        store_item_ids=[row["id"] for row in store_items],
+        completed_missions=[(row["mission_id"], row["user_login"]) for row in completed_missions],
+    )
@@ -0,0 +1,262 @@
+#! /usr/bin/env python3
+"""
+Бенчмарк горячих эндпоинтов на заполненной базе данных.
+Создает отдельную базу, применяет миграции, заполняет базу данными заданного объема,
+запускает сервис и измеряет p50/p95/p99 и пропускную способность по каждому эндпоинту.
+Результаты сохраняются в JSON, чтобы прогоны можно было сравнивать между собой.
+"""
+
+import argparse
+import asyncio
+import random
+import subprocess
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from src.benchmarks.common import (
+    RequestSpec,
+    run_load,
+    start_service,
+    stop_service,
+    summarize,
+    wait_ready,
+)
+from src.benchmarks.dataset import (
+    BENCHMARK_PASSWORD,
+    BenchmarkDataset,
+    ensure_database,
+    load_dataset,
+    seed_dataset,
+)
+from src.config.constants import constants
+from src.config.settings import DatabaseSettings
+from src.core.users.enums import UserRoleEnum
+from src.migrations.commands import migrate_if_needed
+from src.scripts.generate_data import GenerationVolume
+from src.services.user_password_service import UserPasswordService
+
+RESULTS_DIR = constants.DIRS.ROOT / "benchmarks" / "results"
+
+SpecsBuilder = Callable[[BenchmarkDataset], list[RequestSpec]]
+
+
+def _auth_headers(login: str, role: str) -> dict[str, str]:
+    token = UserPasswordService().encode(payload={"login": login, "role": role})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _build_users_me(dataset: BenchmarkDataset) -> list[RequestSpec]:
+    return [
+        RequestSpec(
+            method="GET",
+            path="/users/me",
+            headers=_auth_headers(login=login, role=UserRoleEnum.CANDIDATE),
+        )
+        for login in dataset.candidates
+    ]
+
+
+def _build_user_missions(dataset: BenchmarkDataset) -> list[RequestSpec]:
+    return [
+        RequestSpec(
+            method="GET",
+            path="/users/missions/list",
+            headers=_auth_headers(login=login, role=UserRoleEnum.CANDIDATE),
+        )
+        for login in dataset.candidates
+    ]
+
+
+def _build_missions(dataset: BenchmarkDataset) -> list[RequestSpec]:
+    return [
+        RequestSpec(
+            method="GET",
+            path="/missions",
+            headers=_auth_headers(login=login, role=UserRoleEnum.CANDIDATE),
+        )
+        for login in dataset.candidates
+    ]
+
+
+def _build_store_purchase(dataset: BenchmarkDataset, seed: str) -> list[RequestSpec]:
+    rnd = random.Random(seed)  # noqa: S311
+    return [
+        RequestSpec(
+            method="POST",
+            path="/store/purchase",
+            headers=_auth_headers(login=login, role=UserRoleEnum.CANDIDATE),
+            json={"store_item_id": rnd.choice(dataset.store_item_ids)},
+        )
+        for login in dataset.candidates
+    ]
+
+
+def _build_approve_mission(dataset: BenchmarkDataset) -> list[RequestSpec]:
+    headers = _auth_headers(login=dataset.hr_login, role=UserRoleEnum.HR)
+    return [
+        RequestSpec(
+            method="POST",
+            path=f"/users/missions/{mission_id}/approve?user_login={login}",
+            headers=headers,
+        )
+        for mission_id, login in dataset.completed_missions
+    ]
+
+
+def _build_login(dataset: BenchmarkDataset) -> list[RequestSpec]:
+    return [
+        RequestSpec(
+            method="POST",
+            path="/users/login",
+            json={"login": login, "password": BENCHMARK_PASSWORD},
+        )
+        for login in dataset.candidates
+    ]
+
+
+# Read-only endpoints go first, so writes do not skew their results
+ENDPOINTS: dict[str, SpecsBuilder] = {
+    "users_me": _build_users_me,
+    "user_missions": _build_user_missions,
+    "missions": _build_missions,
+    # The sampled candidates already depend on --seed, so a fixed item seed keeps runs reproducible
+    "store_purchase": partial(_build_store_purchase, seed="store_purchase"),
+    "approve_mission": _build_approve_mission,
+    "login": _build_login,
+}
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            cwd=constants.DIRS.ROOT,
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_result(name: str, result: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    latency = result["latency_ms"]
+    line = (
+        f"⏱  {name:<16} {result['throughput']:>9.1f} rps  "
+        f"p50 {latency['p50']:>8.2f}  p95 {latency['p95']:>8.2f}  p99 {latency['p99']:>8.2f} мс  "
+        f"ошибок: {result['failed']}"
+    )
+    if baseline is not None:
+        line += (
+            f"  (rps {_format_change(result['throughput'], baseline['throughput'])}, "
+            f"p95 {_format_change(latency['p95'], baseline['latency_ms']['p95'])})"
+        )
+    print(line)  # noqa: T201
+
+
+def _format_change(current: float, previous: float) -> str:
+    if not previous:
+        return "n/a"
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    volume = GenerationVolume(
+        users=args.users,
+        missions=args.missions,
+        tasks=args.tasks,
+        seasons=args.seasons,
+        missions_per_user=args.missions_per_user,
+    )
+    db_url = DatabaseSettings(NAME=args.db_name).URL.get_secret_value()
+    asyncio.run(ensure_database(db_url=db_url))
+    migrate_if_needed(db_url=db_url)
+    if not args.skip_seed:
+        print(f"🌱 Заполнение базы {args.db_name}: {volume}")  # noqa: T201
+        asyncio.run(seed_dataset(db_url=db_url, volume=volume, seed=args.seed))
+    dataset = asyncio.run(load_dataset(db_url=db_url, sample_size=args.sample_size, seed=args.seed))
+
+    baseline = orjson.loads(args.baseline.read_bytes())["results"] if args.baseline else {}
+    base_url = f"http://127.0.0.1:{args.port}"
+    process = start_service(
+        port=args.port,
+        env={
+            "DB_NAME": args.db_name,
+            "APP_WORKERS": str(args.workers),
+            "APP_MIGRATE_ON_STARTUP": "false",
+        },
+    )
+    results: dict[str, Any] = {}
+    try:
+        wait_ready(base_url=base_url)
+        for name in args.endpoints:
+            specs = ENDPOINTS[name](dataset)
+            if not specs:
+                print(f"⚠️  {name}: нет данных для запросов, пропущено")  # noqa: T201
+                continue
+            result = run_load(
+                base_url=base_url,
+                specs=specs,
+                concurrency=args.concurrency,
+                clients=args.clients,
+                duration=args.duration,
+                seed=args.seed,
+            )
+            results[name] = summarize(result=result, duration=args.duration)
+            _print_result(name=name, result=results[name], baseline=baseline.get(name))
+    finally:
+        stop_service(process=process)
+
+    return {
+        "created_at": datetime.now(tz=UTC).isoformat(),
+        "commit": _get_commit(),
+        "volume": asdict(volume),
+        "config": {
+            "seed": args.seed,
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "clients": args.clients,
+            "workers": args.workers,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Главная функция для запуска бенчмарка"""
+    parser = argparse.ArgumentParser(description="Бенчмарк горячих эндпоинтов")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--missions", type=int, default=5_000)
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--seasons", type=int, default=GenerationVolume.seasons)
+    parser.add_argument(
+        "--missions-per-user", type=float, default=GenerationVolume.missions_per_user
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Зерно генератора данных и нагрузки")
+    parser.add_argument("--skip-seed", action="store_true", help="Не пересоздавать данные")
+    parser.add_argument("--db-name", default="alabuga_benchmark", help="Имя базы для бенчмарка")
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--duration", type=float, default=15.0, help="Секунд на эндпоинт")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--clients", type=int, default=2, help="Количество клиентских процессов")
+    parser.add_argument("--workers", type=int, default=1, help="Количество воркеров сервиса")
+    parser.add_argument("--sample-size", type=int, default=1000, help="Пользователей в выборке")
+    parser.add_argument("--port", type=int, default=8098)
+    parser.add_argument("--output", type=Path, default=None, help="Файл для результатов")
+    parser.add_argument("--baseline", type=Path, default=None, help="Результаты для сравнения")
+    args = parser.parse_args()
+
+    report = run_benchmark(args=args)
+    output = args.output or RESULTS_DIR / f"endpoints-{datetime.now(tz=UTC):%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    print(f"💾 Результаты сохранены в {output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
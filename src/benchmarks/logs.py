@@ -0,0 +1,74 @@
+#! /usr/bin/env python3
+"""
+Бенчмарк накладных расходов логирования на вызывающем потоке.
+Сравнивает синхронную запись логов и запись через очередь и фоновый поток,
+плюс влияние сэмплирования access-логов и callsite-информации.
+Каждый вариант запускается в отдельном процессе, чтобы конфигурация логирования была чистой.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import structlog
+
+from src.config.logger import configure_logging
+from src.config.settings import LoggingConfig
+
+VARIANTS: dict[str, dict[str, object]] = {
+    "sync + callsite": {"QUEUE_ENABLED": False, "CALLSITE": True},
+    "sync": {"QUEUE_ENABLED": False},
+    "queue": {"QUEUE_ENABLED": True},
+    "queue + sampling 10%": {"QUEUE_ENABLED": True, "SAMPLING": {"uvicorn.access": 0.1}},
+}
+
+
+def _measure(options: dict[str, object], records: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        configure_logging(
+            cfg=LoggingConfig.model_validate({
+                "RENDER_JSON_LOGS": True,
+                "PATH": Path(directory) / "logs.log",
+                "QUEUE_SIZE": records * 2,
+                **options,
+            })
+        )
+        # Консольный вывод отключается, чтобы терминал не влиял на результат
+        for handler in logging.root.handlers:
+            for nested in getattr(handler, "handlers", [handler]):
+                if isinstance(nested, logging.StreamHandler) and nested.name == "default":
+                    nested.setLevel(logging.CRITICAL)
+        access_logger = logging.getLogger("uvicorn.access")
+        app_logger = structlog.get_logger("benchmark")
+        structlog.contextvars.bind_contextvars(db_queries=3, db_time_ms=1.5)
+
+        started_at = time.perf_counter()
+        for index in range(records):
+            access_logger.info(
+                '%s - "%s %s HTTP/%s" %d', "127.0.0.1:5000", "GET", "/missions", "1.1", 200
+            )
+            if index % 10 == 0:
+                app_logger.info("Mission completed", mission_id=index)
+        elapsed = time.perf_counter() - started_at
+        logging.shutdown()
+    return elapsed / records * 1_000_000
+
+
+def main() -> None:
+    """Главная функция для запуска бенчмарка"""
+    parser = argparse.ArgumentParser(description="Накладные расходы логирования на запрос")
+    parser.add_argument("--records", type=int, default=50_000, help="Количество access-логов")
+    args = parser.parse_args()
+
+    for name, options in VARIANTS.items():
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            overhead = executor.submit(_measure, options, args.records).result()
+        print(f"📝 {name:<22} {overhead:>8.2f} мкс на запрос")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
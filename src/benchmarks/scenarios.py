@@ -0,0 +1,321 @@
+#! /usr/bin/env python3
+"""
+Нагрузочный генератор пользовательских сценариев для запущенного сервиса.
+Кандидат регистрируется, входит, открывает миссии; HR выполняет задачи миссии и одобряет миссию;
+кандидат проверяет профиль и покупает товар в магазине.
+Нагрузка задается числом виртуальных пользователей или интенсивностью прихода сценариев,
+которую можно ступенчато повышать до точки насыщения.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+
+from src.benchmarks.common import LoadResult, summarize
+
+SATURATION_RATIO = 0.9
+
+
+class ScenarioError(Exception):
+    pass
+
+
+@dataclass
+class ScenarioStats:
+    steps: dict[str, LoadResult] = field(default_factory=lambda: defaultdict(LoadResult))
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+@dataclass
+class StepReport:
+    offered_rate: float | None
+    duration: float
+    stats: ScenarioStats
+
+    @property
+    def completed_rate(self) -> float:
+        return self.stats.completed / self.duration
+
+    def is_saturated(self, max_error_rate: float, max_p95: float | None) -> bool:
+        if self.stats.started and self.stats.failed / self.stats.started > max_error_rate:
+            return True
+        if self.offered_rate and self.completed_rate < self.offered_rate * SATURATION_RATIO:
+            return True
+        if max_p95 is None:
+            return False
+        return any(
+            summarize(result=result, duration=self.duration)["latency_ms"]["p95"] > max_p95
+            for result in self.stats.steps.values()
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "offered_rate": self.offered_rate,
+            "duration": self.duration,
+            "started": self.stats.started,
+            "completed": self.stats.completed,
+            "failed": self.stats.failed,
+            "completed_rate": round(self.completed_rate, 2),
+            "errors": dict(self.stats.errors),
+            "steps": {
+                name: summarize(result=result, duration=self.duration)
+                for name, result in self.stats.steps.items()
+            },
+        }
+
+
+@dataclass
+class CandidateJourney:
+    client: httpx.AsyncClient
+    stats: ScenarioStats
+    hr_headers: dict[str, str]
+    login: str
+    rnd: random.Random
+    password: str = "load-test-password"  # noqa: S105
+
+    async def run(self) -> None:
+        self.stats.started += 1
+        try:
+            await self._run()
+        except ScenarioError as error:
+            self.stats.failed += 1
+            self.stats.errors[str(error)] += 1
+        else:
+            self.stats.completed += 1
+
+    async def _run(self) -> None:
+        await self._request(
+            "register",
+            "POST",
+            "/mobile/users/register",
+            json={"login": self.login, "password": self.password, "first_name": "Load"},
+        )
+        token = (
+            await self._request(
+                "login",
+                "POST",
+                "/users/login",
+                json={"login": self.login, "password": self.password},
+            )
+        ).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        missions = (
+            await self._request("list_missions", "GET", "/users/missions/list", headers=headers)
+        ).json()["missions"]
+        missions = [mission for mission in missions if mission["tasks"]]
+        if not missions:
+            msg = "no_missions"
+            raise ScenarioError(msg)
+        mission_id = self.rnd.choice(missions)["id"]
+        mission = (
+            await self._request(
+                "get_mission", "GET", f"/users/missions/{mission_id}", headers=headers
+            )
+        ).json()
+
+        for task in mission["tasks"]:
+            await self._request(
+                "complete_task",
+                "POST",
+                f"/users/tasks/{task['id']}/complete",
+                headers=self.hr_headers,
+                json={"user_login": self.login},
+            )
+        await self._request(
+            "approve_mission",
+            "POST",
+            f"/users/missions/{mission_id}/approve",
+            headers=self.hr_headers,
+            params={"user_login": self.login},
+        )
+
+        mana = (await self._request("get_me", "GET", "/users/me", headers=headers)).json()["mana"]
+        items = (await self._request("list_store", "GET", "/store", headers=headers)).json()
+        affordable = [
+            item for item in items["values"] if item["stock"] > 0 and item["price"] <= mana
+        ]
+        if affordable:
+            await self._request(
+                "purchase",
+                "POST",
+                "/store/purchase",
+                headers=headers,
+                json={"store_item_id": self.rnd.choice(affordable)["id"]},
+            )
+
+    async def _request(self, step: str, method: str, path: str, **kwargs: Any) -> httpx.Response:  # noqa: ANN401
+        result = self.stats.steps[step]
+        started_at = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except httpx.HTTPError as error:
+            result.failed += 1
+            msg = f"{step}: {type(error).__name__}"
+            raise ScenarioError(msg) from error
+        result.statuses[response.status_code] = result.statuses.get(response.status_code, 0) + 1
+        if not response.is_success:
+            result.failed += 1
+            msg = f"{step}: {response.status_code}"
+            raise ScenarioError(msg)
+        result.latencies.append(time.perf_counter() - started_at)
+        return response
+
+
+async def _login_hr(client: httpx.AsyncClient, login: str, password: str) -> dict[str, str]:
+    response = await client.post("/users/login", json={"login": login, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+async def run_closed_step(
+    journey_factory: Callable[[ScenarioStats], Coroutine[Any, Any, None]],
+    users: int,
+    duration: float,
+) -> StepReport:
+    stats = ScenarioStats()
+    deadline = time.monotonic() + duration
+
+    async def _virtual_user() -> None:
+        while time.monotonic() < deadline:
+            await journey_factory(stats)
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(_virtual_user() for _ in range(users)))
+    return StepReport(offered_rate=None, duration=time.monotonic() - started_at, stats=stats)
+
+
+async def run_open_step(
+    journey_factory: Callable[[ScenarioStats], Coroutine[Any, Any, None]],
+    rate: float,
+    duration: float,
+    rnd: random.Random,
+) -> StepReport:
+    stats = ScenarioStats()
+    tasks: set[asyncio.Task[None]] = set()
+    started_at = time.monotonic()
+    next_arrival = started_at
+    while next_arrival < started_at + duration:
+        await asyncio.sleep(max(next_arrival - time.monotonic(), 0))
+        task = asyncio.create_task(journey_factory(stats))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        # Poisson arrivals, so bursts happen the way they do with real users
+        next_arrival += rnd.expovariate(rate)
+    if tasks:
+        await asyncio.gather(*tasks)
+    return StepReport(offered_rate=rate, duration=time.monotonic() - started_at, stats=stats)
+
+
+def _print_step(report: StepReport) -> None:
+    offered = f"{report.offered_rate:>7.1f}/с" if report.offered_rate else "закрытая"
+    print(  # noqa: T201
+        f"📈 Нагрузка {offered}: завершено {report.stats.completed} "
+        f"({report.completed_rate:.1f}/с), ошибок {report.stats.failed}"
+    )
+    for name, result in report.stats.steps.items():
+        summary = summarize(result=result, duration=report.duration)
+        latency = summary["latency_ms"]
+        print(  # noqa: T201
+            f"    {name:<16} p50 {latency['p50']:>8.2f}  p95 {latency['p95']:>8.2f}  "
+            f"p99 {latency['p99']:>8.2f} мс  ошибок: {summary['failed']}"
+        )
+    for error, count in sorted(report.stats.errors.items(), key=lambda item: -item[1]):
+        print(f"    ❌ {error}: {count}")  # noqa: T201
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    rnd = random.Random(args.seed)  # noqa: S311
+    run_id = uuid.uuid4().hex[:8]
+    counter = 0
+    limits = httpx.Limits(max_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        hr_headers = await _login_hr(client=client, login=args.hr_login, password=args.hr_password)
+
+        def journey_factory(stats: ScenarioStats) -> Coroutine[Any, Any, None]:
+            nonlocal counter
+            counter += 1
+            return CandidateJourney(
+                client=client,
+                stats=stats,
+                hr_headers=hr_headers,
+                login=f"load-{run_id}-{counter}",
+                rnd=rnd,
+            ).run()
+
+        reports: list[StepReport] = []
+        ceiling: float | None = None
+        if args.rate is None:
+            reports.append(
+                await run_closed_step(
+                    journey_factory=journey_factory, users=args.users, duration=args.duration
+                )
+            )
+            _print_step(report=reports[-1])
+        else:
+            rate = args.rate
+            while True:
+                report = await run_open_step(
+                    journey_factory=journey_factory, rate=rate, duration=args.duration, rnd=rnd
+                )
+                reports.append(report)
+                _print_step(report=report)
+                if report.is_saturated(max_error_rate=args.max_error_rate, max_p95=args.max_p95):
+                    print(f"🛑 Насыщение при {rate:.1f} сценариев/с")  # noqa: T201
+                    break
+                ceiling = report.completed_rate
+                if args.rate_step <= 0 or rate + args.rate_step > args.max_rate:
+                    break
+                rate += args.rate_step
+            if ceiling is not None:
+                print(f"🏁 Потолок пропускной способности: {ceiling:.1f} сценариев/с")  # noqa: T201
+
+    return {
+        "url": args.url,
+        "mode": "closed" if args.rate is None else "open",
+        "ceiling": round(ceiling, 2) if ceiling is not None else None,
+        "steps": [report.to_dict() for report in reports],
+    }
+
+
+def main() -> None:
+    """Главная функция для запуска нагрузочного теста"""
+    parser = argparse.ArgumentParser(description="Нагрузка сценариями кандидата и HR")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="Адрес сервиса")
+    parser.add_argument("--hr-login", default="admin")
+    parser.add_argument("--hr-password", default="admin123")
+    parser.add_argument("--users", type=int, default=20, help="Виртуальных пользователей")
+    parser.add_argument("--rate", type=float, default=None, help="Сценариев в секунду")
+    parser.add_argument("--rate-step", type=float, default=0.0, help="Прирост интенсивности")
+    parser.add_argument("--max-rate", type=float, default=1000.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="Секунд на ступень")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--max-p95", type=float, default=None, help="Порог p95 шага в мс")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="Файл для JSON-отчета")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args=args))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        print(f"💾 Отчет сохранен в {args.output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#! /usr/bin/env python3
+"""
+Бенчмарк пропускной способности сервиса при разном количестве воркеров.
+Поочередно запускает сервис, задавая APP_WORKERS=1 и APP_WORKERS=N, и нагружает эндпоинт
+из нескольких клиентских процессов, чтобы клиент не становился узким местом.
+"""
+
+import argparse
+import os
+
+from src.benchmarks.common import RequestSpec, run_load, start_service, stop_service, wait_ready
+
+
+def measure(workers: int, args: argparse.Namespace) -> float:
+    base_url = f"http://127.0.0.1:{args.port}"
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else None
+    process = start_service(
+        port=args.port, env={"APP_WORKERS": str(workers), "APP_MIGRATE_ON_STARTUP": "false"}
+    )
+    try:
+        wait_ready(base_url=base_url)
+        result = run_load(
+            base_url=base_url,
+            specs=[RequestSpec(method="GET", path=args.path, headers=headers)],
+            concurrency=args.concurrency,
+            clients=args.clients,
+            duration=args.duration,
+        )
+    finally:
+        stop_service(process=process)
+
+    throughput: float = len(result.latencies) / args.duration
+    print(  # noqa: T201
+        f"👷 Воркеров: {workers:<3} запросов/с: {throughput:>10.1f}  ошибок: {result.failed}"
+    )
+    return throughput
+
+
+def main() -> None:
+    """Главная функция для запуска бенчмарка"""
+    parser = argparse.ArgumentParser(description="Сравнение пропускной способности 1 и N воркеров")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--path", default="/health", help="Нагружаемый эндпоинт")
+    parser.add_argument("--token", default=None, help="JWT для защищенных эндпоинтов")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=4, help="Количество клиентских процессов")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8099)
+    args = parser.parse_args()
+
+    single = measure(workers=1, args=args)
+    multiple = measure(workers=args.workers, args=args)
+    print(f"🚀 Ускорение: x{multiple / single:.2f}" if single else "🚫 Нет успешных запросов")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
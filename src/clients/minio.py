@@ -1,18 +1,29 @@
+from typing import NewType
+
 import aioboto3
 from aiobotocore.client import BaseClient
+from aiobotocore.config import AioConfig
 
 from src.config.settings import settings
 
 _minio_session = aioboto3.Session()
 
+MinioPresignClient = NewType("MinioPresignClient", BaseClient)  # type: ignore[valid-newtype]
+
 
-def get_minio_client() -> BaseClient:
+def get_minio_client(endpoint_url: str = settings.MINIO.ENDPOINT) -> BaseClient:
     minio_client: BaseClient = _minio_session.client(
         service_name="s3",
-        endpoint_url=settings.MINIO.ENDPOINT,
+        endpoint_url=endpoint_url,
         aws_access_key_id=settings.MINIO.ACCESS_KEY.get_secret_value(),
         aws_secret_access_key=settings.MINIO.SECRET_KEY.get_secret_value(),
         region_name=settings.MINIO.REGION,
         use_ssl=settings.MINIO.USE_SSL,
+        config=AioConfig(
+            max_pool_connections=settings.MINIO.MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.MINIO.CONNECT_TIMEOUT,
+            read_timeout=settings.MINIO.READ_TIMEOUT,
+            connector_args={"keepalive_timeout": settings.MINIO.KEEPALIVE_TIMEOUT},
+        ),
     )
     return minio_client
@@ -1,6 +1,12 @@
+import atexit
 import logging
 import logging.config
+import os
+import queue
+import random
 from collections.abc import Callable
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import cast
 from uuid import UUID
 
@@ -16,6 +22,7 @@ from src.config.settings import LoggingConfig
 
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
 ProcessorType = Callable[
     [
@@ -51,6 +58,99 @@ def get_render_processor(
     return structlog.dev.ConsoleRenderer(colors=colors)
 
 
+class SamplingFilter(logging.Filter):
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(record.name)
+        return rate is None or random.random() < rate  # noqa: S311
+
+
+class BlockingQueueListener(QueueListener):
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord | None], *handlers: logging.Handler
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.log_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room in a bounded queue instead of failing on shutdown
+        self.log_queue.put(None)
+
+
+class AsyncQueueHandler(QueueHandler):
+    def __init__(self, handlers: list[logging.Handler], max_size: int) -> None:
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=max_size)
+        super().__init__(log_queue)
+        self.handlers = handlers
+        self.max_size = max_size
+        self.dropped = 0
+        self.closed = False
+        self.queue_listener = BlockingQueueListener(log_queue, *handlers)
+
+    def start(self) -> None:
+        self._start_listener()
+        # The listener thread does not survive fork, so it is drained before
+        # fork and started again in both processes
+        os.register_at_fork(
+            before=self._stop_listener,
+            after_in_parent=self._start_listener,
+            after_in_child=self._restart_after_fork,
+        )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not isinstance(record.msg, dict):
+            # Foreign records are rendered in the listener thread, so everything
+            # that depends on the caller context has to be captured here
+            record.msg = record.getMessage()
+            record.args = None
+            for key, value in structlog.contextvars.get_contextvars().items():
+                record.__dict__.setdefault(key, value)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self.closed = True
+        self.queue_listener.stop()
+        super().close()
+
+    def _stop_listener(self) -> None:
+        self.queue_listener.stop()
+
+    def _start_listener(self) -> None:
+        if not self.closed:
+            self.queue_listener.start()
+
+    def _restart_after_fork(self) -> None:
+        if self.closed:
+            return
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=self.max_size)
+        self.queue = log_queue
+        self.dropped = 0
+        self.queue_listener = BlockingQueueListener(log_queue, *self.handlers)
+        self.queue_listener.start()
+
+
+def add_record_timestamp(
+    logger: structlog.types.WrappedLogger,  # noqa: ARG001
+    method_name: str,  # noqa: ARG001
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    record = event_dict.get("_record")
+    created = datetime.fromtimestamp(record.created, tz=UTC) if record else datetime.now(tz=UTC)
+    event_dict["timestamp"] = created.strftime(TIMESTAMP_FORMAT)
+    return event_dict
+
+
 def _mute_sa_default_handler(logger: logging.Logger) -> None:  # noqa: ARG001
     """Disable SQLAlchemy default handler added to the provided logger."""
     return
@@ -60,20 +160,39 @@ def configure_logging(cfg: LoggingConfig) -> None:
     # Mute SQLAlchemy default logger handler
     sa_log._add_default_handler = _mute_sa_default_handler  # noqa: SLF001  # type: ignore[assignment]
 
+    callsite_processors = (
+        (
+            CallsiteParameterAdder(
+                (
+                    CallsiteParameter.FUNC_NAME,
+                    CallsiteParameter.LINENO,
+                ),
+            ),
+        )
+        if cfg.CALLSITE
+        else ()
+    )
     common_processors = (
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.ExtraAdder(),
         structlog.dev.set_exc_info,
-        structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S.%f", utc=True),
+        structlog.processors.TimeStamper(fmt=TIMESTAMP_FORMAT, utc=True),
         structlog.contextvars.merge_contextvars,
         structlog.processors.format_exc_info,
-        CallsiteParameterAdder(
-            (
-                CallsiteParameter.FUNC_NAME,
-                CallsiteParameter.LINENO,
-            ),
-        ),
+        *callsite_processors,
+    )
+    # Foreign records may be rendered later in the listener thread,
+    # so their timestamp is taken from the record itself
+    foreign_processors = (
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.ExtraAdder(),
+        structlog.dev.set_exc_info,
+        add_record_timestamp,
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.format_exc_info,
+        *callsite_processors,
     )
     structlog_processors = (
         structlog.processors.StackInfoRenderer(),
@@ -95,7 +214,7 @@ def configure_logging(cfg: LoggingConfig) -> None:
     handler.set_name("default")
     handler.setLevel(cfg.LEVEL)
     console_formatter = structlog.stdlib.ProcessorFormatter(
-        foreign_pre_chain=cast("tuple[structlog.types.Processor, ...]", common_processors),
+        foreign_pre_chain=cast("tuple[structlog.types.Processor, ...]", foreign_processors),
         processors=logging_console_processors,
     )
     handler.setFormatter(console_formatter)
@@ -109,12 +228,22 @@ def configure_logging(cfg: LoggingConfig) -> None:
         file_handler.set_name("file")
         file_handler.setLevel(cfg.LEVEL)
         file_formatter = structlog.stdlib.ProcessorFormatter(
-            foreign_pre_chain=cast("tuple[structlog.types.Processor, ...]", common_processors),
+            foreign_pre_chain=cast("tuple[structlog.types.Processor, ...]", foreign_processors),
             processors=logging_file_processors,
         )
         file_handler.setFormatter(file_formatter)
         handlers.append(file_handler)
 
+    if cfg.QUEUE_ENABLED:
+        queue_handler = AsyncQueueHandler(handlers=handlers, max_size=cfg.QUEUE_SIZE)
+        queue_handler.set_name("queue")
+        queue_handler.start()
+        atexit.register(queue_handler.close)
+        handlers = [queue_handler]
+    if cfg.SAMPLING:
+        for sampled_handler in handlers:
+            sampled_handler.addFilter(SamplingFilter(rates=cfg.SAMPLING))
+
     logging.basicConfig(handlers=handlers, level=cfg.LEVEL)
     structlog.configure(
         processors=cast(
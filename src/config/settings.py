@@ -1,8 +1,13 @@
+import tempfile
 from pathlib import Path
+from typing import Literal
 
-from pydantic import SecretStr
+from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# S3 rejects every multipart part except the last one below this size with EntityTooSmall
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
 
 class AppSettings(BaseSettings):
     NAME: str = "alabuga"
@@ -10,6 +15,13 @@ class AppSettings(BaseSettings):
     ADDRESS: str = "0.0.0.0"  # noqa: S104 Possible binding to all interfaces
     PORT: int = 8080
     PROTOCOL: str = "http"
+    MIGRATE_ON_STARTUP: bool = True
+    STORAGE: Literal["database", "memory"] = "database"
+    WORKERS: int = 1
+    WORKER_MAX_REQUESTS: int | None = None
+    WORKER_MAX_REQUESTS_JITTER: int = 0
+    WORKER_MAX_MEMORY: int | None = None
+    WORKER_GRACEFUL_TIMEOUT: int = 30
 
     model_config = SettingsConfigDict(env_prefix="APP_")
 
@@ -33,6 +45,8 @@ class DatabaseSettings(BaseSettings):
     USER: str = "postgres"
     PASSWORD: SecretStr = SecretStr("postgres")
     NAME: str = "alabuga"
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 20
 
     model_config = SettingsConfigDict(env_prefix="DB_")
 
@@ -58,14 +72,75 @@ class MinioSettings(BaseSettings):
     REGION: str = "us-east-1"
     BUCKET: str = "alabuga"
     USE_SSL: bool = False
+    MAX_POOL_CONNECTIONS: int = 50
+    CONNECT_TIMEOUT: float = 5.0
+    READ_TIMEOUT: float = 60.0
+    KEEPALIVE_TIMEOUT: float = 60.0
+    PUBLIC_ENDPOINT: str | None = None
+    DOWNLOAD_MODE: Literal["proxy", "redirect", "url"] = "proxy"
+    PRESIGNED_URL_TTL: int = 300
+    MULTIPART_PART_SIZE: int = Field(default=8 * 1024 * 1024, ge=MIN_MULTIPART_PART_SIZE)
 
     model_config = SettingsConfigDict(env_prefix="MINIO_")
 
 
+class MediaSettings(BaseSettings):
+    STORAGE: Literal["minio", "local"] = "minio"
+    LOCAL_PATH: Path = Path("media")
+    CONTENT_ADDRESSED: bool = False
+    MAX_UPLOAD_SIZE: int = 512 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = Field(default=8 * 1024 * 1024, ge=MIN_MULTIPART_PART_SIZE)
+    UPLOAD_SESSION_TTL: int = 24 * 60 * 60
+    ORPHAN_GRACE_PERIOD: int = 24 * 60 * 60
+    CACHE_MAX_AGE: int = 365 * 24 * 60 * 60
+
+    model_config = SettingsConfigDict(env_prefix="MEDIA_")
+
+
+class MediaCacheSettings(BaseSettings):
+    ENABLED: bool = False
+    PATH: Path = Path(tempfile.gettempdir()) / "alabuga" / "media"
+    MAX_SIZE: int = 1024 * 1024 * 1024
+    MAX_OBJECT_SIZE: int = 16 * 1024 * 1024
+    MEMORY_MAX_SIZE: int = 64 * 1024 * 1024
+    MEMORY_MAX_OBJECT_SIZE: int = 256 * 1024
+
+    model_config = SettingsConfigDict(env_prefix="MEDIA_CACHE_")
+
+
+class ImageVariantSettings(BaseSettings):
+    WORKERS: int = 2
+    THUMB_SIZE: int = 128
+    MEDIUM_SIZE: int = 512
+    QUALITY: int = 80
+
+    model_config = SettingsConfigDict(env_prefix="IMAGE_VARIANTS_")
+
+
+class QueryStatsSettings(BaseSettings):
+    ENABLED: bool = True
+    SERVER_TIMING: bool = False
+    REPEAT_THRESHOLD: int = 10
+
+    model_config = SettingsConfigDict(env_prefix="QUERY_STATS_")
+
+
+class MetricsSettings(BaseSettings):
+    ENABLED: bool = True
+    MULTIPROCESS_DIR: Path | None = None
+    FLUSH_INTERVAL: float = 5.0
+
+    model_config = SettingsConfigDict(env_prefix="METRICS_")
+
+
 class LoggingConfig(BaseSettings):
     RENDER_JSON_LOGS: bool = False
     PATH: Path | None = None
     LEVEL: str = "INFO"
+    QUEUE_ENABLED: bool = True
+    QUEUE_SIZE: int = 10000
+    SAMPLING: dict[str, float] = {}
+    CALLSITE: bool = False
 
     model_config = SettingsConfigDict(env_prefix="LOGGING_")
 
@@ -76,6 +151,11 @@ class Settings(BaseSettings):
     DATABASE: DatabaseSettings = DatabaseSettings()
     AUTH: AuthSettings = AuthSettings()
     MINIO: MinioSettings = MinioSettings()
+    MEDIA: MediaSettings = MediaSettings()
+    MEDIA_CACHE: MediaCacheSettings = MediaCacheSettings()
+    IMAGE_VARIANTS: ImageVariantSettings = ImageVariantSettings()
+    QUERY_STATS: QueryStatsSettings = QueryStatsSettings()
+    METRICS: MetricsSettings = MetricsSettings()
     LOGGER: LoggingConfig = LoggingConfig()
 
 
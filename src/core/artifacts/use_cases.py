@@ -1,9 +1,5 @@
 from dataclasses import dataclass
 
-from src.core.artifacts.exceptions import (
-    ArtifactNotFoundError,
-    ArtifactTitleAlreadyExistError,
-)
 from src.core.artifacts.schemas import Artifact, Artifacts
 from src.core.missions.schemas import Mission
 from src.core.storages import ArtifactStorage, MissionStorage, UserStorage
@@ -16,12 +12,7 @@ class CreateArtifactUseCase(UseCase):
     storage: ArtifactStorage
 
     async def execute(self, artifact: Artifact) -> Artifact:
-        try:
-            await self.storage.get_artifact_by_title(title=artifact.title)
-            raise ArtifactTitleAlreadyExistError
-        except ArtifactNotFoundError:
-            await self.storage.insert_artifact(artifact=artifact)
-            return await self.storage.get_artifact_by_title(title=artifact.title)
+        return await self.storage.insert_artifact(artifact=artifact)
 
 
 @dataclass
@@ -45,14 +36,7 @@ class UpdateArtifactUseCase(UseCase):
     storage: ArtifactStorage
 
     async def execute(self, artifact: Artifact) -> Artifact:
-        try:
-            existing_artifact = await self.storage.get_artifact_by_title(title=artifact.title)
-            if existing_artifact.id != artifact.id:
-                raise ArtifactTitleAlreadyExistError
-        except ArtifactNotFoundError:
-            pass
-        await self.storage.update_artifact(artifact=artifact)
-        return await self.storage.get_artifact_by_id(artifact_id=artifact.id)
+        return await self.storage.update_artifact(artifact=artifact)
 
 
 @dataclass
@@ -1,9 +1,5 @@
 from dataclasses import dataclass
 
-from src.core.competencies.exceptions import (
-    CompetencyNameAlreadyExistError,
-    CompetencyNotFoundError,
-)
 from src.core.competencies.schemas import Competencies, Competency
 from src.core.storages import CompetencyStorage
 from src.core.use_case import UseCase
@@ -14,12 +10,7 @@ class CreateCompetencyUseCase(UseCase):
     storage: CompetencyStorage
 
     async def execute(self, competency: Competency) -> Competency:
-        try:
-            await self.storage.get_competency_by_name(name=competency.name)
-            raise CompetencyNameAlreadyExistError
-        except CompetencyNotFoundError:
-            await self.storage.insert_competency(competency=competency)
-            return await self.storage.get_competency_by_name(name=competency.name)
+        return await self.storage.insert_competency(competency=competency)
 
 
 @dataclass
@@ -43,14 +34,7 @@ class UpdateCompetencyUseCase(UseCase):
     storage: CompetencyStorage
 
     async def execute(self, competency: Competency) -> Competency:
-        try:
-            existing = await self.storage.get_competency_by_name(name=competency.name)
-            if existing.id != competency.id:
-                raise CompetencyNameAlreadyExistError
-        except CompetencyNotFoundError:
-            pass
-        await self.storage.update_competency(competency=competency)
-        return await self.storage.get_competency_by_id(competency_id=competency.id)
+        return await self.storage.update_competency(competency=competency)
 
 
 @dataclass
@@ -1,11 +1,23 @@
+import uuid
 from abc import ABCMeta, abstractmethod
 from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import IO
 
-from src.core.media.schemas import FileMetadata, FileObject
+from src.core.media.schemas import (
+    FileMetadata,
+    FileObject,
+    FileStream,
+    StoredFile,
+    UploadPart,
+)
 
 
 class FileStorage(metaclass=ABCMeta):
+    @abstractmethod
+    async def ensure_bucket(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_file_metadata(self, key: str) -> FileMetadata:
         raise NotImplementedError
@@ -15,15 +27,76 @@ class FileStorage(metaclass=ABCMeta):
         self,
         file_name: str,
         file_stream: AsyncIterator[bytes] | IO[bytes],
-        content_type: str,
+        content_type: str | None,
         file_size: int | None = None,
+        key: str | None = None,
     ) -> FileObject:
         raise NotImplementedError
 
+    @abstractmethod
+    async def upload_file(self, key: str, content: bytes, content_type: str) -> FileObject:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def move_file(self, file_object: FileObject, key: str) -> FileObject:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def open_file(self, key: str) -> FileStream:
+        raise NotImplementedError
+
     @abstractmethod
     def download_file(self, key: str) -> AsyncIterator[bytes]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_download_url(self, key: str) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def build_url(self, key: str) -> str:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_file(self, key: str) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_files(self, keys: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_files(self, prefix: str = "") -> AsyncIterator[StoredFile]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_multipart_upload(self, key: str, content_type: str | None) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, content: bytes
+    ) -> UploadPart:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_parts(self, key: str, upload_id: str) -> list[UploadPart]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[UploadPart], content_type: str | None
+    ) -> FileObject:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def generate_unique_key(file_name: str) -> str:
+        timestamp = datetime.now(UTC)
+        date_path = timestamp.strftime("%Y/%m/%d")
+        filename = file_name.lstrip("/").rsplit("/", 1)[-1]
+
+        return f"{date_path}/{timestamp.strftime('%H%M%S')}_{uuid.uuid4()}_{filename}"
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class MediaVariantEnum(StrEnum):
+    THUMB = "thumb"  # превью для списков и аватаров
+    MEDIUM = "medium"  # карточки и детальные экраны
+    WEBP = "webp"  # оригинальный размер в формате WebP
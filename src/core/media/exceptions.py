@@ -3,3 +3,19 @@ from src.core.exceptions import BaseExceptionError
 
 class MediaNotFoundError(BaseExceptionError):
     detail = "MEDIA_NOT_FOUND_ERROR"
+
+
+class MediaTooLargeError(BaseExceptionError):
+    detail = "MEDIA_TOO_LARGE_ERROR"
+
+
+class UploadSessionNotFoundError(BaseExceptionError):
+    detail = "UPLOAD_SESSION_NOT_FOUND_ERROR"
+
+
+class UploadSessionIncompleteError(BaseExceptionError):
+    detail = "UPLOAD_SESSION_INCOMPLETE_ERROR"
+
+
+class InvalidUploadChunkError(BaseExceptionError):
+    detail = "INVALID_UPLOAD_CHUNK_ERROR"
@@ -1,4 +1,7 @@
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
 
 
 @dataclass
@@ -14,3 +17,75 @@ class FileObject:
 class FileMetadata:
     file_size: int
     media_type: str
+    etag: str | None = None
+    last_modified: datetime | None = None
+
+
+@dataclass
+class MediaObject:
+    digest: str
+    key: str
+    size: int | None
+    etag: str
+    content_type: str | None
+
+
+@dataclass
+class FileStream:
+    metadata: FileMetadata
+    stream: AsyncIterator[bytes]
+    path: Path | None = None
+    release: Callable[[], Awaitable[None]] | None = None
+
+    async def close(self) -> None:
+        # An unstarted stream never enters its own cleanup, so the backend releases it here
+        if self.release is not None:
+            await self.release()
+
+
+@dataclass
+class StoredFile:
+    key: str
+    size: int
+    last_modified: datetime
+
+
+@dataclass
+class MediaCleanupReport:
+    scanned: int = 0
+    deleted: int = 0
+    reclaimed_bytes: int = 0
+
+
+@dataclass
+class UploadPart:
+    number: int
+    etag: str
+    size: int
+
+
+@dataclass
+class UploadSession:
+    id: str
+    key: str
+    upload_id: str
+    file_name: str
+    content_type: str | None
+    owner_login: str
+    chunk_size: int
+    created_at: datetime | None = None
+
+
+@dataclass
+class UploadSessionStatus:
+    session: UploadSession
+    parts: list[UploadPart] = field(default_factory=list)
+
+    @property
+    def offset(self) -> int:
+        offset = 0
+        for number, part in enumerate(sorted(self.parts, key=lambda part: part.number), start=1):
+            if part.number != number:
+                break
+            offset += part.size
+        return offset
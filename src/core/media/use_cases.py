@@ -0,0 +1,357 @@
+import asyncio
+import hashlib
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import PurePosixPath
+from typing import IO, Any
+from urllib.parse import unquote, urlsplit
+
+from src.core.file_storage import FileStorage
+from src.core.media.enums import MediaVariantEnum
+from src.core.media.exceptions import (
+    InvalidUploadChunkError,
+    MediaNotFoundError,
+    UploadSessionIncompleteError,
+    UploadSessionNotFoundError,
+)
+from src.core.media.schemas import (
+    FileObject,
+    MediaCleanupReport,
+    MediaObject,
+    StoredFile,
+    UploadPart,
+    UploadSession,
+    UploadSessionStatus,
+)
+from src.core.storages import MediaStorage
+from src.core.use_case import UseCase
+
+HASH_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_PARTS = 10000
+MEDIA_PATH_MARKER = "/media/"
+
+
+@dataclass
+class UploadFileUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+    content_addressed: bool = False
+
+    async def execute(
+        self,
+        file_name: str,
+        file_stream: AsyncIterator[bytes] | IO[bytes],
+        content_type: str | None,
+        file_size: int | None,
+    ) -> FileObject:
+        if not self.content_addressed:
+            return await self.file_storage.upload_file_stream(
+                file_name=file_name,
+                file_stream=file_stream,
+                content_type=content_type,
+                file_size=file_size,
+            )
+        if isinstance(file_stream, AsyncIterator):
+            return await self._upload_async_stream(
+                file_name=file_name,
+                file_stream=file_stream,
+                content_type=content_type,
+                file_size=file_size,
+            )
+
+        digest = await asyncio.to_thread(self._hash_file, file_stream)
+        try:
+            return await self._get_file_object(digest=digest)
+        except MediaNotFoundError:
+            file_object = await self.file_storage.upload_file_stream(
+                file_name=file_name,
+                file_stream=file_stream,
+                content_type=content_type,
+                file_size=file_size,
+                key=self._build_content_key(digest=digest, file_name=file_name),
+            )
+            return await self._record_media_object(digest=digest, file_object=file_object)
+
+    async def _upload_async_stream(
+        self,
+        file_name: str,
+        file_stream: AsyncIterator[bytes],
+        content_type: str | None,
+        file_size: int | None,
+    ) -> FileObject:
+        digest = hashlib.sha256()
+        # The digest is only known once the stream is consumed, so it lands under a temporary key.
+        # S3 can neither rename an object nor complete a multipart upload under another key, so
+        # moving it is a server-side copy and streamed uploads are written to storage twice.
+        temp_object = await self.file_storage.upload_file_stream(
+            file_name=file_name,
+            file_stream=self._hash_stream(file_stream, digest),
+            content_type=content_type,
+            file_size=file_size,
+        )
+        try:
+            existing = await self._get_file_object(digest=digest.hexdigest())
+        except MediaNotFoundError:
+            file_object = await self.file_storage.move_file(
+                file_object=temp_object,
+                key=self._build_content_key(digest=digest.hexdigest(), file_name=file_name),
+            )
+            return await self._record_media_object(
+                digest=digest.hexdigest(), file_object=file_object
+            )
+        await self.file_storage.delete_file(key=temp_object.key)
+        return existing
+
+    async def _get_file_object(self, digest: str) -> FileObject:
+        media_object = await self.storage.get_media_object_by_digest(digest=digest)
+        return FileObject(
+            key=media_object.key,
+            url=self.file_storage.build_url(media_object.key),
+            size=media_object.size,
+            etag=media_object.etag,
+            content_type=media_object.content_type,
+        )
+
+    async def _record_media_object(self, digest: str, file_object: FileObject) -> FileObject:
+        await self.storage.insert_media_object(
+            media_object=MediaObject(
+                digest=digest,
+                key=file_object.key,
+                size=file_object.size,
+                etag=file_object.etag,
+                content_type=file_object.content_type,
+            )
+        )
+        # A concurrent upload of the same content may have won the insert
+        winner = await self._get_file_object(digest=digest)
+        if winner.key != file_object.key:
+            await self.file_storage.delete_file(key=file_object.key)
+        return winner
+
+    @staticmethod
+    async def _hash_stream(
+        file_stream: AsyncIterator[bytes],
+        digest: Any,  # noqa: ANN401
+    ) -> AsyncGenerator[bytes]:
+        async for chunk in file_stream:
+            digest.update(chunk)
+            yield chunk
+
+    @staticmethod
+    def _hash_file(file_stream: IO[bytes]) -> str:
+        digest = hashlib.sha256()
+        while chunk := file_stream.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        file_stream.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _build_content_key(digest: str, file_name: str) -> str:
+        suffix = PurePosixPath(file_name).suffix.lower()
+        return f"sha256/{digest[:2]}/{digest}{suffix}"
+
+
+@dataclass
+class CreateUploadSessionUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+    chunk_size: int
+
+    async def execute(
+        self, file_name: str, content_type: str | None, owner_login: str
+    ) -> UploadSession:
+        key = self.file_storage.generate_unique_key(file_name=file_name)
+        upload_id = await self.file_storage.create_multipart_upload(
+            key=key, content_type=content_type
+        )
+        upload_session = UploadSession(
+            id=uuid.uuid4().hex,
+            key=key,
+            upload_id=upload_id,
+            file_name=file_name,
+            content_type=content_type,
+            owner_login=owner_login,
+            chunk_size=self.chunk_size,
+        )
+        await self.storage.insert_upload_session(upload_session=upload_session)
+        return upload_session
+
+
+@dataclass
+class GetUploadSessionUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+
+    async def execute(self, session_id: str, owner_login: str) -> UploadSessionStatus:
+        upload_session = await _get_owned_upload_session(
+            storage=self.storage, session_id=session_id, owner_login=owner_login
+        )
+        parts = await _list_parts(file_storage=self.file_storage, upload_session=upload_session)
+        return UploadSessionStatus(session=upload_session, parts=parts)
+
+
+@dataclass
+class UploadChunkUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+
+    async def execute(
+        self, session_id: str, owner_login: str, part_number: int, content: bytes
+    ) -> UploadPart:
+        upload_session = await _get_owned_upload_session(
+            storage=self.storage, session_id=session_id, owner_login=owner_login
+        )
+        if not 1 <= part_number <= MAX_UPLOAD_PARTS:
+            raise InvalidUploadChunkError
+        if not content or len(content) > upload_session.chunk_size:
+            raise InvalidUploadChunkError
+        try:
+            return await self.file_storage.upload_part(
+                key=upload_session.key,
+                upload_id=upload_session.upload_id,
+                part_number=part_number,
+                content=content,
+            )
+        except MediaNotFoundError as error:
+            raise UploadSessionNotFoundError from error
+
+
+@dataclass
+class CompleteUploadSessionUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+
+    async def execute(self, session_id: str, owner_login: str) -> FileObject:
+        upload_session = await _get_owned_upload_session(
+            storage=self.storage, session_id=session_id, owner_login=owner_login
+        )
+        parts = await _list_parts(file_storage=self.file_storage, upload_session=upload_session)
+        if not parts or [part.number for part in parts] != list(range(1, len(parts) + 1)):
+            raise UploadSessionIncompleteError
+        if any(part.size != upload_session.chunk_size for part in parts[:-1]):
+            raise UploadSessionIncompleteError
+
+        file_object = await self.file_storage.complete_multipart_upload(
+            key=upload_session.key,
+            upload_id=upload_session.upload_id,
+            parts=parts,
+            content_type=upload_session.content_type,
+        )
+        await self.storage.delete_upload_session(session_id=upload_session.id)
+        return file_object
+
+
+@dataclass
+class AbortUploadSessionUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+
+    async def execute(self, session_id: str, owner_login: str) -> None:
+        upload_session = await _get_owned_upload_session(
+            storage=self.storage, session_id=session_id, owner_login=owner_login
+        )
+        await self.file_storage.abort_multipart_upload(
+            key=upload_session.key, upload_id=upload_session.upload_id
+        )
+        await self.storage.delete_upload_session(session_id=upload_session.id)
+
+
+@dataclass
+class CleanupUploadSessionsUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+    session_ttl: int
+
+    async def execute(self) -> int:
+        created_before = datetime.now(UTC) - timedelta(seconds=self.session_ttl)
+        upload_sessions = await self.storage.get_stale_upload_sessions(
+            created_before=created_before
+        )
+        for upload_session in upload_sessions:
+            await self.file_storage.abort_multipart_upload(
+                key=upload_session.key, upload_id=upload_session.upload_id
+            )
+            await self.storage.delete_upload_session(session_id=upload_session.id)
+        return len(upload_sessions)
+
+
+@dataclass
+class CollectOrphanedMediaUseCase(UseCase):
+    file_storage: FileStorage
+    storage: MediaStorage
+    grace_period: int
+    batch_size: int = 1000
+
+    async def execute(self, *, dry_run: bool = False) -> MediaCleanupReport:
+        referenced_keys = {
+            self._source_key(key)
+            for key in map(self._extract_key, await self.storage.get_media_urls())
+            if key is not None
+        }
+        modified_before = datetime.now(UTC) - timedelta(seconds=self.grace_period)
+        report = MediaCleanupReport()
+        batch: list[StoredFile] = []
+        async for stored_file in self.file_storage.list_files():
+            report.scanned += 1
+            if stored_file.last_modified >= modified_before:
+                continue
+            if self._source_key(stored_file.key) in referenced_keys:
+                continue
+            batch.append(stored_file)
+            if len(batch) >= self.batch_size:
+                await self._delete(batch=batch, report=report, dry_run=dry_run)
+                batch = []
+        if batch:
+            await self._delete(batch=batch, report=report, dry_run=dry_run)
+        return report
+
+    async def _delete(
+        self,
+        batch: list[StoredFile],
+        report: MediaCleanupReport,
+        *,
+        dry_run: bool,
+    ) -> None:
+        keys = [stored_file.key for stored_file in batch]
+        if not dry_run:
+            await self.storage.delete_media_objects(keys=keys)
+            await self.file_storage.delete_files(keys=keys)
+        report.deleted += len(batch)
+        report.reclaimed_bytes += sum(stored_file.size for stored_file in batch)
+
+    @staticmethod
+    def _extract_key(url: str) -> str | None:
+        path = unquote(urlsplit(url).path)
+        _, marker, key = path.partition(MEDIA_PATH_MARKER)
+        if not marker or not key:
+            return None
+        return key
+
+    @staticmethod
+    def _source_key(key: str) -> str:
+        for variant in MediaVariantEnum:
+            suffix = f".{variant}.webp"
+            if key.endswith(suffix):
+                return key.removesuffix(suffix)
+        return key
+
+
+async def _get_owned_upload_session(
+    storage: MediaStorage, session_id: str, owner_login: str
+) -> UploadSession:
+    upload_session = await storage.get_upload_session(session_id=session_id)
+    if upload_session.owner_login != owner_login:
+        raise UploadSessionNotFoundError
+    return upload_session
+
+
+async def _list_parts(file_storage: FileStorage, upload_session: UploadSession) -> list[UploadPart]:
+    try:
+        parts = await file_storage.list_parts(
+            key=upload_session.key, upload_id=upload_session.upload_id
+        )
+    except MediaNotFoundError as error:
+        raise UploadSessionNotFoundError from error
+    return sorted(parts, key=lambda part: part.number)
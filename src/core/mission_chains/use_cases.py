@@ -1,11 +1,6 @@
 from dataclasses import dataclass
 
-from src.core.mission_chains.exceptions import (
-    CircularDependencyError,
-    InvalidMissionOrderError,
-    MissionChainNameAlreadyExistError,
-    MissionChainNotFoundError,
-)
+from src.core.mission_chains.exceptions import CircularDependencyError, InvalidMissionOrderError
 from src.core.mission_chains.schemas import MissionChain, MissionChains
 from src.core.missions.exceptions import MissionNotFoundError, PrerequisiteMissionNotFoundError
 from src.core.storages import MissionStorage
@@ -17,12 +12,7 @@ class CreateMissionChainUseCase(UseCase):
     storage: MissionStorage
 
     async def execute(self, mission_chain: MissionChain) -> MissionChain:
-        try:
-            await self.storage.get_mission_chain_by_name(name=mission_chain.name)
-            raise MissionChainNameAlreadyExistError
-        except MissionChainNotFoundError:
-            await self.storage.insert_mission_chain(mission_chain=mission_chain)
-            return await self.storage.get_mission_chain_by_name(name=mission_chain.name)
+        return await self.storage.insert_mission_chain(mission_chain=mission_chain)
 
 
 @dataclass
@@ -46,15 +36,7 @@ class UpdateMissionChainUseCase(UseCase):
     storage: MissionStorage
 
     async def execute(self, mission_chain: MissionChain) -> MissionChain:
-        await self.storage.get_mission_chain_by_id(chain_id=mission_chain.id)
-        try:
-            existing_chain = await self.storage.get_mission_chain_by_name(name=mission_chain.name)
-            if existing_chain.id != mission_chain.id:
-                raise MissionChainNameAlreadyExistError
-        except MissionChainNotFoundError:
-            pass
-        await self.storage.update_mission_chain(mission_chain=mission_chain)
-        return await self.storage.get_mission_chain_by_id(chain_id=mission_chain.id)
+        return await self.storage.update_mission_chain(mission_chain=mission_chain)
 
 
 @dataclass
@@ -6,3 +6,11 @@ class MissionCategoryEnum(StrEnum):
     RECRUITING = "recruiting"  # задания для привлечения новых кандидатов
     LECTURE = "lecture"  # задания для обучения коллег и кандидатов
     SIMULATOR = "simulator"  # задания для проверки знаний (тесты, соревнования)
+
+
+class MissionSortEnum(StrEnum):
+    ID = "id"
+    TITLE = "title"
+    REWARD_XP = "reward_xp"
+    REWARD_MANA = "reward_mana"
+    RANK_REQUIREMENT = "rank_requirement"
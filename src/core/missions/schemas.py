@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from src.core.artifacts.schemas import Artifact
 from src.core.competencies.schemas import Competency
-from src.core.missions.enums import MissionCategoryEnum
+from src.core.missions.enums import MissionCategoryEnum, MissionSortEnum
 from src.core.skills.schemas import Skill
 from src.core.tasks.schemas import MissionTask, UserTask
 
@@ -52,3 +52,19 @@ class Mission:
 @dataclass
 class Missions:
     values: list[Mission]
+    total: int | None = None
+
+
+@dataclass
+class MissionFilter:
+    season_id: int | None = None
+    category: MissionCategoryEnum | None = None
+    rank_requirement: int | None = None
+    min_reward_xp: int | None = None
+    max_reward_xp: int | None = None
+    min_reward_mana: int | None = None
+    max_reward_mana: int | None = None
+    sort_by: MissionSortEnum = MissionSortEnum.ID
+    descending: bool = False
+    limit: int | None = None
+    offset: int = 0
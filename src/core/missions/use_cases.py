@@ -1,11 +1,7 @@
 from dataclasses import dataclass
 
-from src.core.missions.exceptions import (
-    MissionNameAlreadyExistError,
-    MissionNotCompletedError,
-    MissionNotFoundError,
-)
-from src.core.missions.schemas import Mission, Missions
+from src.core.missions.exceptions import MissionNotCompletedError
+from src.core.missions.schemas import Mission, MissionFilter, Missions
 from src.core.storages import (
     ArtifactStorage,
     CompetencyStorage,
@@ -22,21 +18,15 @@ class CreateMissionUseCase(UseCase):
     storage: MissionStorage
 
     async def execute(self, mission: Mission) -> Mission:
-        await self.storage.get_season_by_id(season_id=mission.season_id)
-        try:
-            await self.storage.get_mission_by_title(title=mission.title)
-            raise MissionNameAlreadyExistError
-        except MissionNotFoundError:
-            await self.storage.insert_mission(mission=mission)
-            return await self.storage.get_mission_by_title(title=mission.title)
+        return await self.storage.insert_mission(mission=mission)
 
 
 @dataclass
 class GetMissionsUseCase(UseCase):
     storage: MissionStorage
 
-    async def execute(self) -> Missions:
-        return await self.storage.list_missions()
+    async def execute(self, filters: MissionFilter) -> Missions:
+        return await self.storage.list_missions(filters=filters)
 
 
 @dataclass
@@ -52,13 +42,7 @@ class UpdateMissionUseCase(UseCase):
     storage: MissionStorage
 
     async def execute(self, mission: Mission) -> Mission:
-        await self.storage.get_season_by_id(season_id=mission.season_id)
-        try:
-            await self.storage.get_mission_by_title(title=mission.title)
-            raise MissionNameAlreadyExistError
-        except MissionNotFoundError:
-            await self.storage.update_mission(mission=mission)
-            return await self.storage.get_mission_by_id(mission_id=mission.id)
+        return await self.storage.update_mission(mission=mission)
 
 
 @dataclass
@@ -1,9 +1,5 @@
 from dataclasses import dataclass
 
-from src.core.ranks.exceptions import (
-    RankNameAlreadyExistError,
-    RankNotFoundError,
-)
 from src.core.ranks.schemas import Rank, Ranks
 from src.core.storages import RankStorage
 from src.core.use_case import UseCase
@@ -14,12 +10,7 @@ class CreateRankUseCase(UseCase):
     storage: RankStorage
 
     async def execute(self, rank: Rank) -> Rank:
-        try:
-            await self.storage.get_rank_by_name(name=rank.name)
-            raise RankNameAlreadyExistError
-        except RankNotFoundError:
-            await self.storage.insert_rank(rank=rank)
-            return await self.storage.get_rank_by_name(name=rank.name)
+        return await self.storage.insert_rank(rank=rank)
 
 
 @dataclass
@@ -43,14 +34,7 @@ class UpdateRankUseCase(UseCase):
     storage: RankStorage
 
     async def execute(self, rank: Rank) -> Rank:
-        try:
-            existing = await self.storage.get_rank_by_name(name=rank.name)
-            if existing.id != rank.id:
-                raise RankNameAlreadyExistError
-        except RankNotFoundError:
-            pass
-        await self.storage.update_rank(rank=rank)
-        return await self.storage.get_rank_by_id(rank_id=rank.id)
+        return await self.storage.update_rank(rank=rank)
 
 
 @dataclass
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class SearchEntityEnum(StrEnum):
+    MISSION = "mission"
+    TASK = "task"
+    ARTIFACT = "artifact"
+    STORE_ITEM = "store_item"
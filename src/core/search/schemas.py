@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from src.core.search.enums import SearchEntityEnum
+
+
+@dataclass
+class SearchQuery:
+    text: str
+    entity_types: list[SearchEntityEnum]
+    limit: int
+    offset: int
+
+
+@dataclass
+class SearchResult:
+    entity_type: SearchEntityEnum
+    id: int
+    title: str
+    description: str
+    rank: float
+
+
+@dataclass
+class SearchResults:
+    values: list[SearchResult]
+    total: int
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from src.core.search.schemas import SearchQuery, SearchResults
+from src.core.storages import SearchStorage
+from src.core.use_case import UseCase
+
+
+@dataclass
+class SearchUseCase(UseCase):
+    storage: SearchStorage
+
+    async def execute(self, query: SearchQuery) -> SearchResults:
+        if not query.text.strip() or not query.entity_types:
+            return SearchResults(values=[], total=0)
+        return await self.storage.search(query=query)
@@ -1,9 +1,5 @@
 from dataclasses import dataclass
 
-from src.core.skills.exceptions import (
-    SkillNameAlreadyExistError,
-    SkillNotFoundError,
-)
 from src.core.skills.schemas import Skill, Skills
 from src.core.storages import SkillStorage
 from src.core.use_case import UseCase
@@ -14,12 +10,7 @@ class CreateSkillUseCase(UseCase):
     storage: SkillStorage
 
     async def execute(self, skill: Skill) -> Skill:
-        try:
-            await self.storage.get_skill_by_name(name=skill.name)
-            raise SkillNameAlreadyExistError
-        except SkillNotFoundError:
-            await self.storage.insert_skill(skill=skill)
-            return await self.storage.get_skill_by_name(name=skill.name)
+        return await self.storage.insert_skill(skill=skill)
 
 
 @dataclass
@@ -43,14 +34,7 @@ class UpdateSkillUseCase(UseCase):
     storage: SkillStorage
 
     async def execute(self, skill: Skill) -> Skill:
-        try:
-            existing = await self.storage.get_skill_by_name(name=skill.name)
-            if existing.id != skill.id:
-                raise SkillNameAlreadyExistError
-        except SkillNotFoundError:
-            pass
-        await self.storage.update_skill(skill=skill)
-        return await self.storage.get_skill_by_id(skill_id=skill.id)
+        return await self.storage.update_skill(skill=skill)
 
 
 @dataclass
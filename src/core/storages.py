@@ -1,13 +1,17 @@
 from abc import ABCMeta, abstractmethod
+from datetime import datetime
 
 from src.core.artifacts.schemas import Artifact, Artifacts
 from src.core.competencies.schemas import Competencies, Competency
+from src.core.media.schemas import MediaObject, UploadSession
 from src.core.mission_chains.schemas import MissionChain, MissionChains
 from src.core.missions.schemas import (
     Mission,
+    MissionFilter,
     Missions,
 )
 from src.core.ranks.schemas import Rank, Ranks
+from src.core.search.schemas import SearchQuery, SearchResults
 from src.core.seasons.schemas import Season, Seasons
 from src.core.skills.schemas import Skill, Skills
 from src.core.store.schemas import StoreItem, StoreItems, StorePurchase
@@ -102,7 +106,7 @@ class UserStorage(metaclass=ABCMeta):
 
 class MissionStorage(metaclass=ABCMeta):
     @abstractmethod
-    async def insert_season(self, season: Season) -> None:
+    async def insert_season(self, season: Season) -> Season:
         raise NotImplementedError
 
     @abstractmethod
@@ -118,7 +122,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def insert_mission(self, mission: Mission) -> None:
+    async def insert_mission(self, mission: Mission) -> Mission:
         raise NotImplementedError
 
     @abstractmethod
@@ -130,7 +134,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def list_missions(self) -> Missions:
+    async def list_missions(self, filters: MissionFilter) -> Missions:
         raise NotImplementedError
 
     @abstractmethod
@@ -138,7 +142,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_mission(self, mission: Mission) -> None:
+    async def update_mission(self, mission: Mission) -> Mission:
         raise NotImplementedError
 
     @abstractmethod
@@ -146,7 +150,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_season(self, branch: Season) -> None:
+    async def update_season(self, branch: Season) -> Season:
         raise NotImplementedError
 
     @abstractmethod
@@ -154,7 +158,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def insert_mission_task(self, task: MissionTask) -> None:
+    async def insert_mission_task(self, task: MissionTask) -> MissionTask:
         raise NotImplementedError
 
     @abstractmethod
@@ -170,7 +174,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_mission_task(self, task: MissionTask) -> None:
+    async def update_mission_task(self, task: MissionTask) -> MissionTask:
         raise NotImplementedError
 
     @abstractmethod
@@ -232,7 +236,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def insert_mission_chain(self, mission_chain: MissionChain) -> None:
+    async def insert_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
         raise NotImplementedError
 
     @abstractmethod
@@ -248,7 +252,7 @@ class MissionStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_mission_chain(self, mission_chain: MissionChain) -> None:
+    async def update_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
         raise NotImplementedError
 
     @abstractmethod
@@ -304,7 +308,7 @@ class MissionStorage(metaclass=ABCMeta):
 
 class ArtifactStorage(metaclass=ABCMeta):
     @abstractmethod
-    async def insert_artifact(self, artifact: Artifact) -> None:
+    async def insert_artifact(self, artifact: Artifact) -> Artifact:
         raise NotImplementedError
 
     @abstractmethod
@@ -320,7 +324,7 @@ class ArtifactStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_artifact(self, artifact: Artifact) -> None:
+    async def update_artifact(self, artifact: Artifact) -> Artifact:
         raise NotImplementedError
 
     @abstractmethod
@@ -346,7 +350,7 @@ class ArtifactStorage(metaclass=ABCMeta):
 
 class CompetencyStorage(metaclass=ABCMeta):
     @abstractmethod
-    async def insert_competency(self, competency: Competency) -> None:
+    async def insert_competency(self, competency: Competency) -> Competency:
         raise NotImplementedError
 
     @abstractmethod
@@ -362,7 +366,7 @@ class CompetencyStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_competency(self, competency: Competency) -> None:
+    async def update_competency(self, competency: Competency) -> Competency:
         raise NotImplementedError
 
     @abstractmethod
@@ -384,7 +388,7 @@ class CompetencyStorage(metaclass=ABCMeta):
 
 class RankStorage(metaclass=ABCMeta):
     @abstractmethod
-    async def insert_rank(self, rank: Rank) -> None:
+    async def insert_rank(self, rank: Rank) -> Rank:
         raise NotImplementedError
 
     @abstractmethod
@@ -400,7 +404,7 @@ class RankStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_rank(self, rank: Rank) -> None:
+    async def update_rank(self, rank: Rank) -> Rank:
         raise NotImplementedError
 
     @abstractmethod
@@ -431,7 +435,7 @@ class RankStorage(metaclass=ABCMeta):
 
 class SkillStorage(metaclass=ABCMeta):
     @abstractmethod
-    async def insert_skill(self, skill: Skill) -> None:
+    async def insert_skill(self, skill: Skill) -> Skill:
         raise NotImplementedError
 
     @abstractmethod
@@ -447,7 +451,7 @@ class SkillStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_skill(self, skill: Skill) -> None:
+    async def update_skill(self, skill: Skill) -> Skill:
         raise NotImplementedError
 
     @abstractmethod
@@ -457,7 +461,7 @@ class SkillStorage(metaclass=ABCMeta):
 
 class StoreStorage(metaclass=ABCMeta):
     @abstractmethod
-    async def insert_store_item(self, store_item: StoreItem) -> None:
+    async def insert_store_item(self, store_item: StoreItem) -> StoreItem:
         raise NotImplementedError
 
     @abstractmethod
@@ -473,7 +477,7 @@ class StoreStorage(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_store_item(self, store_item: StoreItem) -> None:
+    async def update_store_item(self, store_item: StoreItem) -> StoreItem:
         raise NotImplementedError
 
     @abstractmethod
@@ -483,3 +487,43 @@ class StoreStorage(metaclass=ABCMeta):
     @abstractmethod
     async def purchase_store_item(self, purchase: StorePurchase, mana_count: int) -> None:
         raise NotImplementedError
+
+
+class MediaStorage(metaclass=ABCMeta):
+    @abstractmethod
+    async def insert_media_object(self, media_object: MediaObject) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_media_object_by_digest(self, digest: str) -> MediaObject:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_media_objects(self, keys: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_media_urls(self) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def insert_upload_session(self, upload_session: UploadSession) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_upload_session(self, session_id: str) -> UploadSession:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_upload_session(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_stale_upload_sessions(self, created_before: datetime) -> list[UploadSession]:
+        raise NotImplementedError
+
+
+class SearchStorage(metaclass=ABCMeta):
+    @abstractmethod
+    async def search(self, query: SearchQuery) -> SearchResults:
+        raise NotImplementedError
@@ -4,8 +4,6 @@ from src.core.storages import StoreStorage, UserStorage
 from src.core.store.exceptions import (
     InsufficientManaError,
     StoreItemInsufficientStockError,
-    StoreItemNotFoundError,
-    StoreItemTitleAlreadyExistError,
 )
 from src.core.store.schemas import StoreItem, StoreItems, StorePurchase
 from src.core.use_case import UseCase
@@ -16,12 +14,7 @@ class CreateStoreItemUseCase(UseCase):
     storage: StoreStorage
 
     async def execute(self, store_item: StoreItem) -> StoreItem:
-        try:
-            await self.storage.get_store_item_by_title(title=store_item.title)
-            raise StoreItemTitleAlreadyExistError
-        except StoreItemNotFoundError:
-            await self.storage.insert_store_item(store_item=store_item)
-            return await self.storage.get_store_item_by_title(title=store_item.title)
+        return await self.storage.insert_store_item(store_item=store_item)
 
 
 @dataclass
@@ -45,9 +38,7 @@ class UpdateStoreItemUseCase(UseCase):
     storage: StoreStorage
 
     async def execute(self, store_item: StoreItem) -> StoreItem:
-        await self.storage.get_store_item_by_id(store_item_id=store_item.id)
-        await self.storage.update_store_item(store_item=store_item)
-        return await self.storage.get_store_item_by_id(store_item_id=store_item.id)
+        return await self.storage.update_store_item(store_item=store_item)
 
 
 @dataclass
@@ -55,7 +46,6 @@ class DeleteStoreItemUseCase(UseCase):
     storage: StoreStorage
 
     async def execute(self, store_item_id: int) -> None:
-        await self.storage.get_store_item_by_id(store_item_id=store_item_id)
         await self.storage.delete_store_item(store_item_id=store_item_id)
 
 
@@ -1,10 +1,6 @@
 from dataclasses import dataclass
 
 from src.core.storages import MissionStorage
-from src.core.tasks.exceptions import (
-    TaskNameAlreadyExistError,
-    TaskNotFoundError,
-)
 from src.core.tasks.schemas import MissionTask, MissionTasks, TaskApproveParams
 from src.core.use_case import UseCase
 
@@ -14,12 +10,7 @@ class CreateMissionTaskUseCase(UseCase):
     storage: MissionStorage
 
     async def execute(self, task: MissionTask) -> MissionTask:
-        try:
-            await self.storage.get_mission_task_by_title(title=task.title)
-            raise TaskNameAlreadyExistError
-        except TaskNotFoundError:
-            await self.storage.insert_mission_task(task=task)
-            return await self.storage.get_mission_task_by_title(title=task.title)
+        return await self.storage.insert_mission_task(task=task)
 
 
 @dataclass
@@ -43,14 +34,7 @@ class UpdateMissionTaskUseCase(UseCase):
     storage: MissionStorage
 
     async def execute(self, task: MissionTask) -> MissionTask:
-        try:
-            existing_task = await self.storage.get_mission_task_by_title(title=task.title)
-            if existing_task.id != task.id:
-                raise TaskNameAlreadyExistError
-        except TaskNotFoundError:
-            pass
-        await self.storage.update_mission_task(task=task)
-        return await self.storage.get_mission_task_by_id(task_id=task.id)
+        return await self.storage.update_mission_task(task=task)
 
 
 @dataclass
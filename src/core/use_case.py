@@ -1,8 +1,46 @@
+import functools
+import time
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Coroutine
 from typing import Any
 
+ExecutionObserver = Callable[[str, float, str], None]
+
+_execution_observer: ExecutionObserver | None = None
+
+
+def set_execution_observer(observer: ExecutionObserver | None) -> None:
+    global _execution_observer  # noqa: PLW0603
+    _execution_observer = observer
+
+
+def _observe_execution(
+    name: str, execute: Callable[..., Coroutine[Any, Any, Any]]
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    @functools.wraps(execute)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if _execution_observer is None:
+            return await execute(*args, **kwargs)
+        started_at = time.perf_counter()
+        status = "error"
+        try:
+            result = await execute(*args, **kwargs)
+            status = "success"
+        finally:
+            if _execution_observer is not None:
+                _execution_observer(name, time.perf_counter() - started_at, status)
+        return result
+
+    return wrapper
+
 
 class UseCase(metaclass=ABCMeta):
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if execute is not None:
+            cls.execute = _observe_execution(name=cls.__name__, execute=execute)  # type: ignore[method-assign]
+
     @abstractmethod
     async def execute(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
         raise NotImplementedError
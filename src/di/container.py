@@ -1,15 +1,21 @@
 from dishka import AsyncContainer, make_async_container
 from dishka.integrations.fastapi import FastapiProvider
 
+from src.config.settings import settings
 from src.di.providers import (
     ArtifactProvider,
     AuthProvider,
     CompetencyProvider,
     DatabaseProvider,
     FileStorageProvider,
+    LocalStorageProvider,
+    MediaProvider,
+    MemoryStorageProvider,
+    MinioStorageProvider,
     MissionChainProvider,
     MissionProvider,
     RankProvider,
+    SearchProvider,
     SkillProvider,
     StoreProvider,
     UserProvider,
@@ -17,6 +23,12 @@ from src.di.providers import (
 
 
 def build_container() -> AsyncContainer:
+    storage_provider = (
+        MemoryStorageProvider() if settings.APP.STORAGE == "memory" else DatabaseProvider()
+    )
+    file_storage_provider = (
+        LocalStorageProvider() if settings.MEDIA.STORAGE == "local" else MinioStorageProvider()
+    )
     return make_async_container(
         FastapiProvider(),
         AuthProvider(),
@@ -24,10 +36,13 @@ def build_container() -> AsyncContainer:
         MissionProvider(),
         MissionChainProvider(),
         ArtifactProvider(),
+        file_storage_provider,
         FileStorageProvider(),
+        MediaProvider(),
         CompetencyProvider(),
         RankProvider(),
         SkillProvider(),
         StoreProvider(),
-        DatabaseProvider(),
+        SearchProvider(),
+        storage_provider,
     )
@@ -1,13 +1,15 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor
 
 from aiobotocore.client import AioBaseClient
-from dishka import Provider, Scope, provide
+from dishka import Provider, Scope, decorate, provide
 from fastapi import Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.auth.schemas import JwtCandidateUser, JwtHRUser, JwtUser
-from src.clients.minio import get_minio_client
+from src.clients.minio import MinioPresignClient, get_minio_client
+from src.config.settings import settings
 from src.core.artifacts.use_cases import (
     AddArtifactToMissionUseCase,
     AddArtifactToUserUseCase,
@@ -30,6 +32,17 @@ from src.core.competencies.use_cases import (
     UpdateCompetencyUseCase,
 )
 from src.core.exceptions import InvalidJWTTokenError, PermissionDeniedError
+from src.core.file_storage import FileStorage
+from src.core.media.use_cases import (
+    AbortUploadSessionUseCase,
+    CleanupUploadSessionsUseCase,
+    CollectOrphanedMediaUseCase,
+    CompleteUploadSessionUseCase,
+    CreateUploadSessionUseCase,
+    GetUploadSessionUseCase,
+    UploadChunkUseCase,
+    UploadFileUseCase,
+)
 from src.core.mission_chains.use_cases import (
     AddMissionDependencyUseCase,
     AddMissionToChainUseCase,
@@ -70,6 +83,7 @@ from src.core.ranks.use_cases import (
     RemoveRequiredMissionFromRankUseCase,
     UpdateRankUseCase,
 )
+from src.core.search.use_cases import SearchUseCase
 from src.core.seasons.use_cases import (
     CreateSeasonUseCase,
     DeleteSeasonUseCase,
@@ -87,8 +101,10 @@ from src.core.skills.use_cases import (
 from src.core.storages import (
     ArtifactStorage,
     CompetencyStorage,
+    MediaStorage,
     MissionStorage,
     RankStorage,
+    SearchStorage,
     SkillStorage,
     StoreStorage,
     UserStorage,
@@ -126,10 +142,16 @@ from src.core.users.use_cases import (
     UpdateUserSkillLevelUseCase,
     UpdateUserUseCase,
 )
+from src.services.image_variants import ImageVariantService
+from src.services.local_storage import LocalFileStorage
+from src.services.media_cache import CachedFileStorage, MediaCache
+from src.services.metrics import instrument_minio_client, register_media_cache_metrics
 from src.services.minio import MinioService
 from src.services.user_password_service import UserPasswordService
 from src.storages.database import async_session
 from src.storages.database_storage import DatabaseStorage
+from src.storages.identity_map import IdentityMapStorage
+from src.storages.memory_storage import InMemoryStorage
 
 
 class UserProvider(Provider):
@@ -619,32 +641,88 @@ class DatabaseProvider(Provider):
             await session.commit()
 
     @provide
-    def get_user_storage(self, session: AsyncSession) -> UserStorage:
-        return DatabaseStorage(session=session)
+    def get_database_storage(self, session: AsyncSession) -> DatabaseStorage:
+        return IdentityMapStorage(session=session)
+
+    @provide
+    def get_user_storage(self, storage: DatabaseStorage) -> UserStorage:
+        return storage
+
+    @provide
+    def get_mission_storage(self, storage: DatabaseStorage) -> MissionStorage:
+        return storage
+
+    @provide
+    def get_competency_storage(self, storage: DatabaseStorage) -> CompetencyStorage:
+        return storage
+
+    @provide
+    def get_rank_storage(self, storage: DatabaseStorage) -> RankStorage:
+        return storage
+
+    @provide
+    def get_skill_storage(self, storage: DatabaseStorage) -> SkillStorage:
+        return storage
 
     @provide
-    def get_mission_storage(self, session: AsyncSession) -> MissionStorage:
-        return DatabaseStorage(session=session)
+    def get_store_storage(self, storage: DatabaseStorage) -> StoreStorage:
+        return storage
 
     @provide
-    def get_competency_storage(self, session: AsyncSession) -> CompetencyStorage:
-        return DatabaseStorage(session=session)
+    def get_artifact_storage(self, storage: DatabaseStorage) -> ArtifactStorage:
+        return storage
 
     @provide
-    def get_rank_storage(self, session: AsyncSession) -> RankStorage:
-        return DatabaseStorage(session=session)
+    def get_media_storage(self, storage: DatabaseStorage) -> MediaStorage:
+        return storage
 
     @provide
-    def get_skill_storage(self, session: AsyncSession) -> SkillStorage:
-        return DatabaseStorage(session=session)
+    def get_search_storage(self, storage: DatabaseStorage) -> SearchStorage:
+        return storage
+
+
+class MemoryStorageProvider(Provider):
+    scope = Scope.APP
 
     @provide
-    def get_store_storage(self, session: AsyncSession) -> StoreStorage:
-        return DatabaseStorage(session=session)
+    def get_memory_storage(self) -> InMemoryStorage:
+        return InMemoryStorage()
 
     @provide
-    def get_artifact_storage(self, session: AsyncSession) -> ArtifactStorage:
-        return DatabaseStorage(session=session)
+    def get_user_storage(self, storage: InMemoryStorage) -> UserStorage:
+        return storage
+
+    @provide
+    def get_mission_storage(self, storage: InMemoryStorage) -> MissionStorage:
+        return storage
+
+    @provide
+    def get_competency_storage(self, storage: InMemoryStorage) -> CompetencyStorage:
+        return storage
+
+    @provide
+    def get_rank_storage(self, storage: InMemoryStorage) -> RankStorage:
+        return storage
+
+    @provide
+    def get_skill_storage(self, storage: InMemoryStorage) -> SkillStorage:
+        return storage
+
+    @provide
+    def get_store_storage(self, storage: InMemoryStorage) -> StoreStorage:
+        return storage
+
+    @provide
+    def get_artifact_storage(self, storage: InMemoryStorage) -> ArtifactStorage:
+        return storage
+
+    @provide
+    def get_media_storage(self, storage: InMemoryStorage) -> MediaStorage:
+        return storage
+
+    @provide
+    def get_search_storage(self, storage: InMemoryStorage) -> SearchStorage:
+        return storage
 
 
 class AuthProvider(Provider):
@@ -686,17 +764,151 @@ class AuthProvider(Provider):
         raise PermissionDeniedError
 
 
-class FileStorageProvider(Provider):
-    scope = Scope.REQUEST
+class MinioStorageProvider(Provider):
+    scope = Scope.APP
 
-    @provide(scope=Scope.REQUEST)
+    @provide
     async def get_minio_connection(self) -> AsyncIterator[AioBaseClient]:
         async with get_minio_client() as minio_connection:
+            if settings.METRICS.ENABLED:
+                instrument_minio_client(minio_connection)
             yield minio_connection
 
     @provide
-    async def get_minio_service(self, minio_connection: AioBaseClient) -> MinioService:
-        return MinioService(minio_connection=minio_connection)
+    async def get_minio_presign_connection(
+        self, minio_connection: AioBaseClient
+    ) -> AsyncIterator[MinioPresignClient]:
+        if not settings.MINIO.PUBLIC_ENDPOINT:
+            # Signing is local, so without a public endpoint the upload client signs URLs as well
+            yield MinioPresignClient(minio_connection)
+            return
+        async with get_minio_client(
+            endpoint_url=settings.MINIO.PUBLIC_ENDPOINT
+        ) as presign_connection:
+            yield MinioPresignClient(presign_connection)
+
+    @provide
+    async def get_minio_service(
+        self,
+        minio_connection: AioBaseClient,
+        presign_connection: MinioPresignClient,
+    ) -> MinioService:
+        return MinioService(
+            minio_connection=minio_connection,
+            presign_connection=presign_connection,
+        )
+
+    @provide
+    def get_file_storage(self, minio_service: MinioService) -> FileStorage:
+        return minio_service
+
+
+class LocalStorageProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_file_storage(self) -> FileStorage:
+        return LocalFileStorage()
+
+
+class FileStorageProvider(Provider):
+    scope = Scope.APP
+
+    @decorate
+    def get_cached_file_storage(
+        self, file_storage: FileStorage, media_cache: MediaCache
+    ) -> FileStorage:
+        if not media_cache.enabled:
+            return file_storage
+        return CachedFileStorage(file_storage=file_storage, media_cache=media_cache)
+
+    @provide
+    async def get_media_cache(self) -> AsyncIterator[MediaCache]:
+        media_cache = MediaCache()
+        await media_cache.load()
+        if settings.METRICS.ENABLED:
+            register_media_cache_metrics(media_cache)
+        yield media_cache
+        media_cache.close()
+
+    @provide
+    def get_image_variant_executor(self) -> Iterator[ProcessPoolExecutor]:
+        with ProcessPoolExecutor(max_workers=settings.IMAGE_VARIANTS.WORKERS) as executor:
+            yield executor
+
+    @provide
+    def get_image_variant_service(
+        self, file_storage: FileStorage, executor: ProcessPoolExecutor
+    ) -> ImageVariantService:
+        return ImageVariantService(file_storage=file_storage, executor=executor)
+
+
+class MediaProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def build_upload_file_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> UploadFileUseCase:
+        return UploadFileUseCase(
+            file_storage=file_storage,
+            storage=storage,
+            content_addressed=settings.MEDIA.CONTENT_ADDRESSED,
+        )
+
+    @provide
+    def build_create_upload_session_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> CreateUploadSessionUseCase:
+        return CreateUploadSessionUseCase(
+            file_storage=file_storage,
+            storage=storage,
+            chunk_size=settings.MEDIA.UPLOAD_CHUNK_SIZE,
+        )
+
+    @provide
+    def build_get_upload_session_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> GetUploadSessionUseCase:
+        return GetUploadSessionUseCase(file_storage=file_storage, storage=storage)
+
+    @provide
+    def build_upload_chunk_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> UploadChunkUseCase:
+        return UploadChunkUseCase(file_storage=file_storage, storage=storage)
+
+    @provide
+    def build_complete_upload_session_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> CompleteUploadSessionUseCase:
+        return CompleteUploadSessionUseCase(file_storage=file_storage, storage=storage)
+
+    @provide
+    def build_abort_upload_session_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> AbortUploadSessionUseCase:
+        return AbortUploadSessionUseCase(file_storage=file_storage, storage=storage)
+
+    @provide
+    def build_cleanup_upload_sessions_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> CleanupUploadSessionsUseCase:
+        return CleanupUploadSessionsUseCase(
+            file_storage=file_storage,
+            storage=storage,
+            session_ttl=settings.MEDIA.UPLOAD_SESSION_TTL,
+        )
+
+    @provide
+    def build_collect_orphaned_media_use_case(
+        self, file_storage: FileStorage, storage: MediaStorage
+    ) -> CollectOrphanedMediaUseCase:
+        return CollectOrphanedMediaUseCase(
+            file_storage=file_storage,
+            storage=storage,
+            grace_period=settings.MEDIA.ORPHAN_GRACE_PERIOD,
+        )
 
 
 class StoreProvider(Provider):
@@ -729,3 +941,11 @@ class StoreProvider(Provider):
         user_storage: UserStorage,
     ) -> PurchaseStoreItemUseCase:
         return PurchaseStoreItemUseCase(store_storage=storage, user_storage=user_storage)
+
+
+class SearchProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def build_search_use_case(self, storage: SearchStorage) -> SearchUseCase:
+        return SearchUseCase(storage=storage)
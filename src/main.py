@@ -7,24 +7,40 @@ from fastapi import FastAPI
 from src.api.app import create_app
 from src.config.logger import configure_logging
 from src.config.settings import settings
-from src.migrations.commands import migrate
-from src.services.minio import MinioService
+from src.core.file_storage import FileStorage
+from src.migrations.commands import migrate_if_needed
+from src.server import PreforkServer
+from src.storages.database import async_engine
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    async with app.state.dishka_container() as container:
-        minio_service = await container.get(MinioService)
-        await minio_service.ensure_bucket()
+    file_storage = await app.state.dishka_container.get(FileStorage)
+    await file_storage.ensure_bucket()
     yield
     await app.state.dishka_container.close()
+    await async_engine.dispose()
 
 
 def start_service() -> None:
     configure_logging(cfg=settings.LOGGER)
-    migrate(revision="heads", db_url=settings.DATABASE.URL.get_secret_value())
+    if settings.APP.MIGRATE_ON_STARTUP and settings.APP.STORAGE == "database":
+        migrate_if_needed(db_url=settings.DATABASE.URL.get_secret_value())
+    app = create_app(lifespan=lifespan)
+    if settings.APP.WORKERS > 1:
+        PreforkServer(
+            app=app,
+            host=settings.APP.ADDRESS,
+            port=settings.APP.PORT,
+            workers=settings.APP.WORKERS,
+            max_requests=settings.APP.WORKER_MAX_REQUESTS,
+            max_requests_jitter=settings.APP.WORKER_MAX_REQUESTS_JITTER,
+            max_memory=settings.APP.WORKER_MAX_MEMORY,
+            graceful_timeout=settings.APP.WORKER_GRACEFUL_TIMEOUT,
+        ).run()
+        return
     uvicorn.run(
-        app=create_app(lifespan=lifespan),
+        app=app,
         host=settings.APP.ADDRESS,
         port=settings.APP.PORT,
         access_log=True,
@@ -1,16 +1,58 @@
+import asyncio
+import logging
+
 from alembic.command import downgrade as alembic_downgrade
 from alembic.command import upgrade as alembic_upgrade
 from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from src.config.constants import constants
 
+logger = logging.getLogger(__name__)
 
-def migrate(revision: str, db_url: str) -> None:
+
+def _build_config(db_url: str) -> Config:
     config = Config(constants.DIRS.SRC / "migrations" / "alembic.ini")
     config.set_main_option("sqlalchemy.url", db_url)
-    alembic_upgrade(config=config, revision=revision)
+    return config
+
+
+def migrate(revision: str, db_url: str) -> None:
+    alembic_upgrade(config=_build_config(db_url=db_url), revision=revision)
 
 
 def downgrade(revision: str, db_url: str) -> None:
-    config = Config(constants.DIRS.SRC / "migrations" / "alembic.ini")
-    config.set_main_option("sqlalchemy.url", db_url)
-    alembic_downgrade(config=config, revision=revision)
+    alembic_downgrade(config=_build_config(db_url=db_url), revision=revision)
+
+
+def get_head_revisions(db_url: str) -> set[str]:
+    script = ScriptDirectory.from_config(_build_config(db_url=db_url))
+    return set(script.get_heads())
+
+
+def get_current_revisions(db_url: str) -> set[str]:
+    return asyncio.run(_fetch_current_revisions(db_url=db_url))
+
+
+def migrate_if_needed(db_url: str) -> bool:
+    current_revisions = get_current_revisions(db_url=db_url)
+    if current_revisions == get_head_revisions(db_url=db_url):
+        logger.info("Database schema is up to date (%s)", ", ".join(sorted(current_revisions)))
+        return False
+    migrate(revision="heads", db_url=db_url)
+    return True
+
+
+async def _fetch_current_revisions(db_url: str) -> set[str]:
+    engine = create_async_engine(db_url, poolclass=NullPool)
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+            return set(result.scalars())
+    except ProgrammingError:
+        return set()
+    finally:
+        await engine.dispose()
@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0030"
+down_revision = "0029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_upload_session",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("upload_id", sa.String(), nullable=False),
+        sa.Column("file_name", sa.String(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=True),
+        sa.Column("owner_login", sa.String(), nullable=False),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_media_upload_session_created_at", "media_upload_session", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_media_upload_session_created_at", table_name="media_upload_session")
+    op.drop_table("media_upload_session")
@@ -0,0 +1,43 @@
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0031"
+down_revision = "0030"
+branch_labels = None
+depends_on = None
+
+TITLE_VECTOR = "setweight(to_tsvector('russian', coalesce(title, '')), 'A')"
+DESCRIPTION_VECTOR = "setweight(to_tsvector('russian', coalesce(description, '')), 'B')"
+
+SEARCH_VECTORS = {
+    "missions_mission": f"{TITLE_VECTOR} || {DESCRIPTION_VECTOR}",
+    "missions_mission_task": f"{TITLE_VECTOR} || {DESCRIPTION_VECTOR}",
+    "artifacts_artifact": f"{TITLE_VECTOR} || {DESCRIPTION_VECTOR}",
+    "store_item": TITLE_VECTOR,
+}
+
+
+def upgrade() -> None:
+    for table_name, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table_name,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=False,
+            ),
+        )
+        op.create_index(
+            f"ix_{table_name}_search_vector",
+            table_name,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for table_name in SEARCH_VECTORS:
+        op.drop_index(f"ix_{table_name}_search_vector", table_name=table_name)
+        op.drop_column(table_name, "search_vector")
@@ -0,0 +1,23 @@
+from alembic import op
+
+revision = "0032"
+down_revision = "0031"
+branch_labels = None
+depends_on = None
+
+MISSION_INDEXES = {
+    "ix_missions_mission_branch_id_category": ["branch_id", "category"],
+    "ix_missions_mission_rank_requirement": ["rank_requirement"],
+    "ix_missions_mission_reward_xp": ["reward_xp"],
+    "ix_missions_mission_reward_mana": ["reward_mana"],
+}
+
+
+def upgrade() -> None:
+    for index_name, columns in MISSION_INDEXES.items():
+        op.create_index(index_name, "missions_mission", columns)
+
+
+def downgrade() -> None:
+    for index_name in MISSION_INDEXES:
+        op.drop_index(index_name, table_name="missions_mission")
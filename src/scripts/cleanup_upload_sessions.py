@@ -0,0 +1,26 @@
+#! /usr/bin/env python3
+"""
+Скрипт для удаления устаревших сессий загрузки файлов по частям.
+Отменяет незавершенные загрузки в хранилище и удаляет сессии старше MEDIA_UPLOAD_SESSION_TTL.
+"""
+
+import asyncio
+
+from src.core.media.use_cases import CleanupUploadSessionsUseCase
+from src.di.container import build_container
+
+
+async def main() -> None:
+    """Главная функция для запуска скрипта"""
+    container = build_container()
+    try:
+        async with container() as request_container:
+            use_case = await request_container.get(CleanupUploadSessionsUseCase)
+            removed = await use_case.execute()
+        print(f"🧹 Удалено устаревших сессий загрузки: {removed}")  # noqa: T201
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+#! /usr/bin/env python3
+"""
+Скрипт для удаления файлов хранилища, на которые не ссылается ни одна запись в базе данных.
+Удаляются только файлы старше MEDIA_ORPHAN_GRACE_PERIOD.
+Флаг --dry-run только выводит отчет без удаления.
+"""
+
+import argparse
+import asyncio
+
+from src.core.media.use_cases import CollectOrphanedMediaUseCase
+from src.di.container import build_container
+
+
+async def main(dry_run: bool) -> None:  # noqa: FBT001
+    """Главная функция для запуска скрипта"""
+    container = build_container()
+    try:
+        async with container() as request_container:
+            use_case = await request_container.get(CollectOrphanedMediaUseCase)
+            report = await use_case.execute(dry_run=dry_run)
+        action = "Будет удалено" if dry_run else "Удалено"
+        print(f"🔎 Проверено файлов: {report.scanned}")  # noqa: T201
+        print(f"🧹 {action} файлов: {report.deleted}")  # noqa: T201
+        print(f"💾 Освобождено байт: {report.reclaimed_bytes}")  # noqa: T201
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Удаление неиспользуемых файлов хранилища")
+    parser.add_argument("--dry-run", action="store_true", help="Только вывести отчет")
+    asyncio.run(main(dry_run=parser.parse_args().dry_run))
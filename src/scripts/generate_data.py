@@ -0,0 +1,418 @@
+#! /usr/bin/env python3
+"""
+Генератор синтетических данных большого объема для бенчмарков и подбора индексов.
+Создает ранги, сезоны, миссии, задачи, пользователей, прогресс по задачам и одобрения миссий,
+распределенные правдоподобно, и загружает их в базу через COPY.
+Результат детерминирован: одинаковые параметры и --seed дают одинаковые данные
+(даты отсчитываются от начала текущих суток).
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+import asyncpg
+from sqlalchemy import make_url
+from src.config.settings import settings
+from src.core.missions.enums import MissionCategoryEnum
+from src.core.users.enums import UserRoleEnum
+from src.services.user_password_service import UserPasswordService
+
+CANDIDATE_LOGIN_PREFIX = "user"
+HR_LOGIN_PREFIX = "hr"
+SEASON_LENGTH = timedelta(days=90)
+MAX_TASKS_PER_MISSION = 30
+
+RANKS = (
+    ("Кадет", 0),
+    ("Рядовой космонавт", 100),
+    ("Младший офицер", 300),
+    ("Офицер", 600),
+    ("Старший офицер", 1000),
+    ("Капитан", 1500),
+    ("Командир эскадрильи", 2200),
+    ("Командир флота", 3000),
+    ("Адмирал", 4000),
+    ("Главнокомандующий", 5000),
+)
+CATEGORY_WEIGHTS = {
+    MissionCategoryEnum.QUEST: 50,
+    MissionCategoryEnum.LECTURE: 20,
+    MissionCategoryEnum.SIMULATOR: 20,
+    MissionCategoryEnum.RECRUITING: 10,
+}
+GENERATED_TABLES = (
+    "users_missions_approval",
+    "users_tasks",
+    "users_user",
+    "missions_missions_tasks",
+    "missions_mission_task",
+    "missions_mission",
+    "missions_branch",
+    "ranks_rank",
+    "store_item",
+)
+SERIAL_TABLES = (
+    "ranks_rank",
+    "missions_branch",
+    "missions_mission",
+    "missions_mission_task",
+    "store_item",
+)
+
+
+def candidate_login(number: int) -> str:
+    return f"{CANDIDATE_LOGIN_PREFIX}{number}"
+
+
+def hr_login(number: int) -> str:
+    return f"{HR_LOGIN_PREFIX}{number}"
+
+
+@dataclass(frozen=True)
+class GenerationVolume:
+    users: int = 10_000
+    seasons: int = 4
+    missions: int = 500
+    tasks: int = 2_500
+    missions_per_user: float = 6.0
+    hr_ratio: float = 0.01
+    completion_ratio: float = 0.45
+    approval_ratio: float = 0.7
+    store_items: int = 100
+
+
+@dataclass
+class GeneratedMission:
+    id: int
+    season_id: int
+    season_start: datetime
+    rank_requirement: int
+    task_ids: list[int] = field(default_factory=list)
+
+
+class SyntheticDataGenerator:
+    """Генератор синтетических данных, загружаемых через COPY"""
+
+    NOT_EMPTY_MSG = "Database already contains users, pass --truncate to replace them"
+
+    def __init__(self, volume: GenerationVolume, seed: int, password: str) -> None:
+        self.volume = volume
+        self.random = random.Random(seed)  # noqa: S311
+        self.password_hash = UserPasswordService().generate_password_hash(password=password)
+        self.now = datetime.now(tz=UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.missions: list[GeneratedMission] = []
+        self.candidate_ranks: list[int] = []
+        self.approvals: list[tuple[int, str, bool, datetime]] = []
+
+    async def run(self, connection: asyncpg.Connection, *, truncate: bool) -> dict[str, int]:
+        """Генерирует и загружает все таблицы в одной транзакции"""
+        loaded: dict[str, int] = {}
+        async with connection.transaction():
+            if truncate:
+                await connection.execute(
+                    f"TRUNCATE {', '.join(GENERATED_TABLES)} RESTART IDENTITY CASCADE"
+                )
+            elif await connection.fetchval("SELECT EXISTS (SELECT 1 FROM users_user)"):
+                raise RuntimeError(self.NOT_EMPTY_MSG)
+
+            seasons = self.generate_seasons()
+            tasks_relations = self.generate_missions(seasons=seasons)
+            tables: list[tuple[str, tuple[str, ...], Iterable[tuple[object, ...]]]] = [
+                ("ranks_rank", ("id", "name", "required_xp", "image_url"), self.generate_ranks()),
+                ("missions_branch", ("id", "name", "start_date", "end_date"), seasons),
+                (
+                    "missions_mission",
+                    (
+                        "id",
+                        "title",
+                        "description",
+                        "reward_xp",
+                        "reward_mana",
+                        "rank_requirement",
+                        "category",
+                        "branch_id",
+                    ),
+                    self.generate_mission_rows(),
+                ),
+                (
+                    "missions_mission_task",
+                    ("id", "title", "description"),
+                    self.generate_tasks(count=len(tasks_relations)),
+                ),
+                ("missions_missions_tasks", ("task_id", "mission_id"), tasks_relations),
+                (
+                    "users_user",
+                    (
+                        "login",
+                        "password",
+                        "role",
+                        "rank_id",
+                        "exp",
+                        "mana",
+                        "first_name",
+                        "last_name",
+                    ),
+                    self.generate_users(),
+                ),
+                (
+                    "users_tasks",
+                    ("task_id", "user_login", "is_completed"),
+                    self.generate_user_tasks(),
+                ),
+                (
+                    "users_missions_approval",
+                    ("mission_id", "user_login", "is_approved", "approved_at"),
+                    self.approvals,
+                ),
+                (
+                    "store_item",
+                    ("id", "title", "price", "stock", "image_url"),
+                    self.generate_store_items(),
+                ),
+            ]
+            for table, columns, records in tables:
+                started_at = time.perf_counter()
+                status = await connection.copy_records_to_table(
+                    table, records=records, columns=columns
+                )
+                loaded[table] = int(status.split()[-1])
+                print(  # noqa: T201
+                    f"✅ {table}: {loaded[table]} строк за {time.perf_counter() - started_at:.2f} с"
+                )
+
+            for table in SERIAL_TABLES:
+                await connection.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "  # noqa: S608
+                    f"(SELECT coalesce(max(id), 0) + 1 FROM {table}), false)"
+                )
+        await connection.execute(f"ANALYZE {', '.join(GENERATED_TABLES)}")
+        return loaded
+
+    def generate_ranks(self) -> list[tuple[object, ...]]:
+        """Создает фиксированную лестницу рангов"""
+        return [
+            (index, name, required_xp, f"ranks/{index}.png")
+            for index, (name, required_xp) in enumerate(RANKS, start=1)
+        ]
+
+    def generate_seasons(self) -> list[tuple[int, str, datetime, datetime]]:
+        """Создает идущие подряд сезоны, последний из которых активен"""
+        first_start = self.now - SEASON_LENGTH * (self.volume.seasons - 1) - SEASON_LENGTH / 2
+        return [
+            (
+                index,
+                f"Сезон {index}",
+                first_start + SEASON_LENGTH * (index - 1),
+                first_start + SEASON_LENGTH * index,
+            )
+            for index in range(1, self.volume.seasons + 1)
+        ]
+
+    def generate_missions(
+        self, seasons: list[tuple[int, str, datetime, datetime]]
+    ) -> list[tuple[int, int]]:
+        """Распределяет миссии по сезонам и задачи по миссиям"""
+        # Later seasons have more missions, and most missions are for the lower ranks
+        season_weights = list(range(1, len(seasons) + 1))
+        rank_weights = [0.75**index for index in range(len(RANKS))]
+        for mission_id in range(1, self.volume.missions + 1):
+            season_id, _, season_start, _ = self.random.choices(seasons, weights=season_weights)[0]
+            self.missions.append(
+                GeneratedMission(
+                    id=mission_id,
+                    season_id=season_id,
+                    season_start=season_start,
+                    rank_requirement=self.random.choices(
+                        range(1, len(RANKS) + 1), weights=rank_weights
+                    )[0],
+                )
+            )
+
+        task_counts = self._split_tasks()
+        relations: list[tuple[int, int]] = []
+        task_id = 0
+        for mission, count in zip(self.missions, task_counts, strict=True):
+            for _ in range(count):
+                task_id += 1
+                mission.task_ids.append(task_id)
+                relations.append((task_id, mission.id))
+        return relations
+
+    def generate_mission_rows(self) -> Iterator[tuple[object, ...]]:
+        """Создает миссии, награды которых растут по мере роста требуемого ранга"""
+        categories = list(CATEGORY_WEIGHTS)
+        category_weights = list(CATEGORY_WEIGHTS.values())
+        for mission in self.missions:
+            reward_xp = int(mission.rank_requirement * 40 * self.random.uniform(0.5, 1.5))
+            yield (
+                mission.id,
+                f"Миссия {mission.id}",
+                f"Описание миссии {mission.id}",
+                reward_xp,
+                int(reward_xp * self.random.uniform(0.2, 0.6)),
+                mission.rank_requirement,
+                self.random.choices(categories, weights=category_weights)[0].value,
+                mission.season_id,
+            )
+
+    def generate_tasks(self, count: int) -> Iterator[tuple[object, ...]]:
+        """Создает задачи миссий"""
+        for task_id in range(1, count + 1):
+            yield task_id, f"Задача {task_id}", f"Описание задачи {task_id}"
+
+    def generate_users(self) -> Iterator[tuple[object, ...]]:
+        """Создает HR-пользователей и кандидатов, большая часть которых на младших рангах"""
+        hr_count = max(1, int(self.volume.users * self.volume.hr_ratio))
+        for number in range(1, hr_count + 1):
+            yield (
+                hr_login(number),
+                self.password_hash,
+                UserRoleEnum.HR.value,
+                1,
+                0,
+                0,
+                "HR",
+                str(number),
+            )
+
+        # Most candidates stay at the lower ranks
+        self.candidate_ranks = self.random.choices(
+            range(1, len(RANKS) + 1),
+            weights=[0.6**index for index in range(len(RANKS))],
+            k=self._candidates_count(),
+        )
+        for number, rank_id in enumerate(self.candidate_ranks, start=1):
+            low = RANKS[rank_id - 1][1]
+            high = RANKS[rank_id][1] if rank_id < len(RANKS) else low * 2
+            exp = self.random.randrange(low, max(high, low + 1))
+            yield (
+                candidate_login(number),
+                self.password_hash,
+                UserRoleEnum.CANDIDATE.value,
+                rank_id,
+                exp,
+                int(exp * self.random.uniform(0.05, 0.5)),
+                "Кандидат",
+                str(number),
+            )
+
+    def generate_user_tasks(self) -> Iterator[tuple[object, ...]]:
+        """Создает прогресс кандидатов по задачам и одобрения полностью выполненных миссий"""
+        missions_by_rank = [
+            [mission for mission in self.missions if mission.rank_requirement <= rank_id]
+            for rank_id in range(len(RANKS) + 1)
+        ]
+        for number, rank_id in enumerate(self.candidate_ranks, start=1):
+            login = candidate_login(number)
+            available = missions_by_rank[rank_id] or self.missions
+            engaged = min(
+                len(available),
+                round(self.random.expovariate(1 / self.volume.missions_per_user)),
+            )
+            for mission in self.random.sample(available, k=engaged):
+                if self.random.random() < self.volume.completion_ratio:
+                    completed = len(mission.task_ids)
+                else:
+                    completed = self.random.randrange(len(mission.task_ids))
+                for index, task_id in enumerate(mission.task_ids):
+                    yield task_id, login, index < completed
+                if completed == len(mission.task_ids):
+                    is_approved = self.random.random() < self.volume.approval_ratio
+                    approved_at = mission.season_start + timedelta(
+                        seconds=self.random.uniform(0, SEASON_LENGTH.total_seconds())
+                    )
+                    self.approvals.append((mission.id, login, is_approved, approved_at))
+
+    def generate_store_items(self) -> Iterator[tuple[object, ...]]:
+        """Создает товары магазина: дешевые в большом количестве, дорогие в малом"""
+        for item_id in range(1, self.volume.store_items + 1):
+            price = int(50 * self.random.paretovariate(1.2))
+            yield (
+                item_id,
+                f"Товар {item_id}",
+                price,
+                max(1, 100_000 // price),
+                f"store/{item_id}.png",
+            )
+
+    def _candidates_count(self) -> int:
+        return self.volume.users - max(1, int(self.volume.users * self.volume.hr_ratio))
+
+    def _split_tasks(self) -> list[int]:
+        # Every mission gets at least one task, the rest follows a long-tailed distribution
+        missions = len(self.missions)
+        extra = max(self.volume.tasks - missions, 0)
+        weights = [self.random.expovariate(1) for _ in range(missions)]
+        total = sum(weights)
+        counts = [min(1 + int(extra * weight / total), MAX_TASKS_PER_MISSION) for weight in weights]
+        for index in range(max(self.volume.tasks - sum(counts), 0)):
+            counts[index % missions] += 1
+        return counts
+
+
+def build_dsn(db_url: str) -> str:
+    return make_url(db_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Главная функция для запуска скрипта"""
+    volume = GenerationVolume(
+        users=args.users,
+        seasons=args.seasons,
+        missions=args.missions,
+        tasks=args.tasks,
+        missions_per_user=args.missions_per_user,
+        hr_ratio=args.hr_ratio,
+        completion_ratio=args.completion_ratio,
+        approval_ratio=args.approval_ratio,
+        store_items=args.store_items,
+    )
+    print(f"🚀 Генерация данных: {volume}")  # noqa: T201
+    started_at = time.perf_counter()
+    generator = SyntheticDataGenerator(volume=volume, seed=args.seed, password=args.password)
+    connection = await asyncpg.connect(build_dsn(db_url=args.db_url))
+    try:
+        loaded = await generator.run(connection=connection, truncate=args.truncate)
+    finally:
+        await connection.close()
+    print(  # noqa: T201
+        f"🎉 Загружено {sum(loaded.values())} строк за {time.perf_counter() - started_at:.2f} с"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Генерация синтетических данных через COPY")
+    parser.add_argument("--users", type=int, default=GenerationVolume.users)
+    parser.add_argument("--seasons", type=int, default=GenerationVolume.seasons)
+    parser.add_argument("--missions", type=int, default=GenerationVolume.missions)
+    parser.add_argument("--tasks", type=int, default=GenerationVolume.tasks)
+    parser.add_argument(
+        "--missions-per-user",
+        type=float,
+        default=GenerationVolume.missions_per_user,
+        help="Среднее количество миссий, начатых кандидатом",
+    )
+    parser.add_argument("--hr-ratio", type=float, default=GenerationVolume.hr_ratio)
+    parser.add_argument(
+        "--completion-ratio",
+        type=float,
+        default=GenerationVolume.completion_ratio,
+        help="Доля начатых миссий, выполненных полностью",
+    )
+    parser.add_argument(
+        "--approval-ratio",
+        type=float,
+        default=GenerationVolume.approval_ratio,
+        help="Доля выполненных миссий, одобренных HR",
+    )
+    parser.add_argument("--store-items", type=int, default=GenerationVolume.store_items)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default="password", help="Пароль всех пользователей")
+    parser.add_argument("--db-url", default=settings.DATABASE.URL.get_secret_value())
+    parser.add_argument("--truncate", action="store_true", help="Очистить таблицы перед загрузкой")
+    asyncio.run(main(args=parser.parse_args()))
@@ -0,0 +1,31 @@
+#! /usr/bin/env python3
+"""
+Скрипт для применения миграций базы данных перед запуском сервиса.
+Предназначен для отдельного шага деплоя: при APP_MIGRATE_ON_STARTUP=false
+сервис не проверяет схему при старте и сразу начинает обслуживать запросы.
+"""
+
+import argparse
+
+from src.config.logger import configure_logging
+from src.config.settings import settings
+from src.migrations.commands import migrate, migrate_if_needed
+
+
+def main(revision: str) -> None:
+    """Главная функция для запуска скрипта"""
+    configure_logging(cfg=settings.LOGGER)
+    db_url = settings.DATABASE.URL.get_secret_value()
+    if revision == "heads":
+        applied = migrate_if_needed(db_url=db_url)
+    else:
+        migrate(revision=revision, db_url=db_url)
+        applied = True
+    message = "Миграции применены" if applied else "Схема базы данных актуальна"
+    print(f"✅ {message}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Применение миграций базы данных")
+    parser.add_argument("--revision", default="heads", help="Целевая ревизия")
+    main(revision=parser.parse_args().revision)
@@ -0,0 +1,161 @@
+import gc
+import logging
+import os
+import random
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+
+import uvicorn
+from fastapi import FastAPI
+
+from src.config.settings import settings
+from src.services.metrics import metrics_registry
+from src.storages.database import reset_engine_after_fork
+
+logger = logging.getLogger(__name__)
+
+MEMORY_CHECK_INTERVAL = 50
+TICK_INTERVAL = 0.1
+MIN_WORKER_LIFETIME = 1.0
+
+
+def get_memory_usage() -> int:
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class WorkerServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, max_memory: int | None = None) -> None:
+        super().__init__(config=config)
+        self.max_memory = max_memory
+
+    async def on_tick(self, counter: int) -> bool:
+        should_exit = await super().on_tick(counter)
+        if counter % max(int(settings.METRICS.FLUSH_INTERVAL / TICK_INTERVAL), 1) == 0:
+            await metrics_registry.flush_async()
+        if should_exit or self.max_memory is None or counter % MEMORY_CHECK_INTERVAL:
+            return should_exit
+        memory_usage = get_memory_usage()
+        if memory_usage > self.max_memory:
+            logger.warning(
+                "Worker %d uses %d bytes of memory (limit %d), recycling",
+                os.getpid(),
+                memory_usage,
+                self.max_memory,
+            )
+            return True
+        return False
+
+
+@dataclass
+class PreforkServer:
+    app: FastAPI
+    host: str
+    port: int
+    workers: int
+    max_requests: int | None = None
+    max_requests_jitter: int = 0
+    max_memory: int | None = None
+    graceful_timeout: int = 30
+    _workers: dict[int, float] = field(default_factory=dict, init=False)
+    _stopping: bool = field(default=False, init=False)
+
+    def run(self) -> None:
+        metrics_dir = settings.METRICS.MULTIPROCESS_DIR
+        if metrics_dir is None:
+            metrics_dir = Path(tempfile.mkdtemp(prefix="alabuga-metrics-"))
+        else:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+        metrics_registry.multiprocess_dir = metrics_dir
+        try:
+            self._run()
+        finally:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+    def _run(self) -> None:
+        sock = uvicorn.Config(app=self.app, host=self.host, port=self.port).bind_socket()
+        gc.collect()
+        gc.freeze()
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGALRM, self._handle_kill)
+        logger.info("Starting %d workers on %s:%d", self.workers, self.host, self.port)
+        for _ in range(self.workers):
+            self._spawn(sock)
+
+        while self._workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started_at = self._workers.pop(pid, None)
+            if started_at is None or self._stopping:
+                continue
+            logger.info(
+                "Worker %d exited with code %d, respawning", pid, os.waitstatus_to_exitcode(status)
+            )
+            if time.monotonic() - started_at < MIN_WORKER_LIFETIME:
+                time.sleep(MIN_WORKER_LIFETIME)
+            self._spawn(sock)
+        sock.close()
+
+    def _spawn(self, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid:
+            self._workers[pid] = time.monotonic()
+            return
+
+        exit_code = 0
+        try:
+            for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGALRM):
+                signal.signal(signum, signal.SIG_DFL)
+            reset_engine_after_fork()
+            self._serve(sock)
+        except BaseException:
+            logger.exception("Worker %d crashed", os.getpid())
+            exit_code = 1
+        finally:
+            logging.shutdown()
+            os._exit(exit_code)
+
+    def _serve(self, sock: socket.socket) -> None:
+        config = uvicorn.Config(
+            app=self.app,
+            lifespan="on",
+            access_log=True,
+            log_config=None,
+            limit_max_requests=self._get_max_requests(),
+        )
+        WorkerServer(config=config, max_memory=self.max_memory).run(sockets=[sock])
+        metrics_registry.flush()
+
+    def _get_max_requests(self) -> int | None:
+        if self.max_requests is None:
+            return None
+        return self.max_requests + random.randint(0, self.max_requests_jitter)  # noqa: S311
+
+    def _handle_stop(self, signum: int, frame: FrameType | None) -> None:
+        _ = frame
+        self._stopping = True
+        self._signal_workers(signum)
+        signal.alarm(self.graceful_timeout)
+
+    def _handle_kill(self, signum: int, frame: FrameType | None) -> None:
+        _ = signum, frame
+        self._signal_workers(signal.SIGKILL)
+
+    def _signal_workers(self, signum: int) -> None:
+        for pid in self._workers:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                continue
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from io import BytesIO
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from src.config.settings import settings
+from src.core.file_storage import FileStorage
+from src.core.media.enums import MediaVariantEnum
+from src.core.media.schemas import FileObject
+
+logger = logging.getLogger(__name__)
+
+VARIANT_CONTENT_TYPE = "image/webp"
+# WebP stores each dimension in 14 bits
+WEBP_MAX_SIZE = 16383
+
+
+def build_variant_key(key: str, variant: MediaVariantEnum) -> str:
+    return f"{key}.{variant}.webp"
+
+
+def render_variant(content: bytes, max_size: int, quality: int) -> bytes:
+    with Image.open(BytesIO(content)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in {"RGB", "RGBA"}:
+            image = image.convert("RGBA")
+        image.thumbnail((max_size, max_size))
+        output = BytesIO()
+        image.save(output, format="WEBP", quality=quality)
+        return output.getvalue()
+
+
+@dataclass
+class ImageVariantService:
+    file_storage: FileStorage
+    executor: Executor
+    thumb_size: int = settings.IMAGE_VARIANTS.THUMB_SIZE
+    medium_size: int = settings.IMAGE_VARIANTS.MEDIUM_SIZE
+    quality: int = settings.IMAGE_VARIANTS.QUALITY
+
+    async def create_variants(self, key: str, content: bytes) -> dict[MediaVariantEnum, FileObject]:
+        sizes = {
+            MediaVariantEnum.THUMB: self.thumb_size,
+            MediaVariantEnum.MEDIUM: self.medium_size,
+            MediaVariantEnum.WEBP: WEBP_MAX_SIZE,
+        }
+        loop = asyncio.get_running_loop()
+        try:
+            rendered = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.executor,
+                        partial(render_variant, content, max_size=size, quality=self.quality),
+                    )
+                    for size in sizes.values()
+                )
+            )
+        except (UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError):
+            logger.warning("Unable to render image variants for %s", key)
+            return {}
+
+        file_objects = await asyncio.gather(
+            *(
+                self.file_storage.upload_file(
+                    key=build_variant_key(key=key, variant=variant),
+                    content=variant_content,
+                    content_type=VARIANT_CONTENT_TYPE,
+                )
+                for variant, variant_content in zip(sizes, rendered, strict=True)
+            )
+        )
+        return dict(zip(sizes, file_objects, strict=True))
@@ -0,0 +1,314 @@
+import hashlib
+import shutil
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
+
+import anyio
+import anyio.to_thread
+import orjson
+
+from src.config.settings import settings
+from src.core.file_storage import FileStorage
+from src.core.media.exceptions import MediaNotFoundError
+from src.core.media.schemas import (
+    FileMetadata,
+    FileObject,
+    FileStream,
+    StoredFile,
+    UploadPart,
+)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+SIDECAR_SUFFIX = ".meta.json"
+UPLOADS_DIR = ".uploads"
+
+
+@dataclass
+class LocalFileStorage(FileStorage):
+    root: Path = settings.MEDIA.LOCAL_PATH
+    server_url: str = settings.SERVER.URL
+    bucket: str = settings.MINIO.BUCKET
+    chunk_size: int = 65536
+
+    @property
+    def media_url_prefix(self) -> str:
+        return f"{self.server_url}/media"
+
+    @property
+    def bucket_path(self) -> Path:
+        return self.root / self.bucket
+
+    @property
+    def uploads_path(self) -> Path:
+        return self.root / UPLOADS_DIR
+
+    async def ensure_bucket(self) -> None:
+        await anyio.Path(self.bucket_path).mkdir(parents=True, exist_ok=True)
+
+    async def get_file_metadata(self, key: str) -> FileMetadata:
+        return await self._read_metadata(self._path(key))
+
+    async def upload_file_stream(
+        self,
+        file_name: str,
+        file_stream: AsyncIterator[bytes] | IO[bytes],
+        content_type: str | None = None,
+        file_size: int | None = None,
+        key: str | None = None,
+    ) -> FileObject:
+        _ = file_size
+        unique_key = key or self.generate_unique_key(file_name=file_name)
+        return await self._write(
+            key=unique_key,
+            chunks=self._iter_stream(file_stream),
+            content_type=content_type,
+        )
+
+    async def upload_file(self, key: str, content: bytes, content_type: str) -> FileObject:
+        return await self._write(
+            key=key,
+            chunks=self._iter_content(content),
+            content_type=content_type,
+        )
+
+    async def move_file(self, file_object: FileObject, key: str) -> FileObject:
+        source_path = self._path(file_object.key)
+        path = self._path(key)
+        meta = await self._read_sidecar(source_path)
+        await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+        # The source sidecar doubles as the temporary one, so the move reuses the write commit
+        await anyio.to_thread.run_sync(self._commit, path, source_path, {**meta, "key": key})
+        return replace(file_object, key=key, url=self.build_url(key))
+
+    async def open_file(self, key: str) -> FileStream:
+        path = self._path(key)
+        return FileStream(
+            metadata=await self._read_metadata(path),
+            stream=self._iter_file(path),
+            path=path,
+        )
+
+    async def download_file(self, key: str) -> AsyncGenerator[bytes]:
+        file = await self.open_file(key=key)
+        async for chunk in file.stream:
+            yield chunk
+
+    async def get_download_url(self, key: str) -> str:
+        return self.build_url(key)
+
+    async def delete_file(self, key: str) -> None:
+        path = self._path(key)
+        await anyio.Path(path).unlink(missing_ok=True)
+        await anyio.Path(self._sidecar_path(path)).unlink(missing_ok=True)
+
+    async def delete_files(self, keys: list[str]) -> None:
+        for key in keys:
+            await self.delete_file(key=key)
+
+    async def list_files(self, prefix: str = "") -> AsyncGenerator[StoredFile]:
+        for stored_file in await anyio.to_thread.run_sync(self._list_files, prefix):
+            yield stored_file
+
+    async def create_multipart_upload(self, key: str, content_type: str | None) -> str:
+        _ = self._path(key)
+        upload_id = uuid.uuid4().hex
+        upload_path = self.uploads_path / upload_id
+        await anyio.Path(upload_path).mkdir(parents=True)
+        await anyio.Path(upload_path / "upload.json").write_bytes(
+            orjson.dumps({"key": key, "content_type": content_type})
+        )
+        return upload_id
+
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, content: bytes
+    ) -> UploadPart:
+        upload_path = await self._upload_path(key=key, upload_id=upload_id)
+        part_path = upload_path / f"{part_number:05d}.part"
+        temp_path = upload_path / f"{part_number:05d}.{uuid.uuid4().hex}.tmp"
+        part = UploadPart(
+            number=part_number,
+            etag=hashlib.md5(content, usedforsecurity=False).hexdigest(),
+            size=len(content),
+        )
+        try:
+            await anyio.Path(temp_path).write_bytes(content)
+            # Status and completion read the sidecar instead of hashing every part again
+            meta = {"number": part.number, "etag": part.etag, "size": part.size}
+            await anyio.to_thread.run_sync(self._commit, part_path, temp_path, meta)
+        except BaseException:
+            await anyio.Path(temp_path).unlink(missing_ok=True)
+            raise
+        return part
+
+    async def list_parts(self, key: str, upload_id: str) -> list[UploadPart]:
+        upload_path = await self._upload_path(key=key, upload_id=upload_id)
+        return await anyio.to_thread.run_sync(self._list_parts, upload_path)
+
+    async def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[UploadPart], content_type: str | None
+    ) -> FileObject:
+        upload_path = await self._upload_path(key=key, upload_id=upload_id)
+        file_object = await self._write(
+            key=key,
+            chunks=self._iter_parts(upload_path, parts),
+            content_type=content_type,
+        )
+        await anyio.to_thread.run_sync(shutil.rmtree, upload_path)
+        return file_object
+
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        try:
+            upload_path = await self._upload_path(key=key, upload_id=upload_id)
+        except MediaNotFoundError:
+            return
+        await anyio.to_thread.run_sync(partial(shutil.rmtree, upload_path, ignore_errors=True))
+
+    def build_url(self, key: str) -> str:
+        base = self.media_url_prefix.rstrip("/")
+        return f"{base}/{key.lstrip('/')}"
+
+    async def _write(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str | None,
+    ) -> FileObject:
+        path = self._path(key)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+        md5 = hashlib.md5(usedforsecurity=False)
+        size = 0
+        try:
+            async with await anyio.open_file(temp_path, "wb") as temp_file:
+                async for chunk in chunks:
+                    await temp_file.write(chunk)
+                    md5.update(chunk)
+                    size += len(chunk)
+            meta = {
+                "key": key,
+                "size": size,
+                "etag": md5.hexdigest(),
+                "content_type": content_type or DEFAULT_CONTENT_TYPE,
+            }
+            await anyio.to_thread.run_sync(self._commit, path, temp_path, meta)
+        except BaseException:
+            await anyio.Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        return FileObject(
+            key=key,
+            url=self.build_url(key),
+            etag=md5.hexdigest(),
+            content_type=content_type,
+            size=size,
+        )
+
+    @classmethod
+    def _commit(cls, path: Path, temp_path: Path, meta: dict[str, Any]) -> None:
+        sidecar_path = cls._sidecar_path(path)
+        temp_sidecar_path = temp_path.with_name(f"{temp_path.name}{SIDECAR_SUFFIX}")
+        temp_sidecar_path.write_bytes(orjson.dumps(meta))
+        temp_path.replace(path)
+        temp_sidecar_path.replace(sidecar_path)
+
+    async def _read_metadata(self, path: Path) -> FileMetadata:
+        meta = await self._read_sidecar(path)
+        try:
+            stat = await anyio.Path(path).stat()
+        except FileNotFoundError as error:
+            raise MediaNotFoundError from error
+        return FileMetadata(
+            file_size=meta["size"],
+            media_type=meta["content_type"],
+            etag=meta["etag"],
+            last_modified=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+        )
+
+    async def _read_sidecar(self, path: Path) -> dict[str, Any]:
+        try:
+            meta: dict[str, Any] = orjson.loads(
+                await anyio.Path(self._sidecar_path(path)).read_bytes()
+            )
+        except FileNotFoundError as error:
+            raise MediaNotFoundError from error
+        return meta
+
+    async def _upload_path(self, key: str, upload_id: str) -> Path:
+        if not upload_id.isalnum():
+            raise MediaNotFoundError
+        upload_path = self.uploads_path / upload_id
+        try:
+            meta = orjson.loads(await anyio.Path(upload_path / "upload.json").read_bytes())
+        except FileNotFoundError as error:
+            raise MediaNotFoundError from error
+        if meta["key"] != key:
+            raise MediaNotFoundError
+        return upload_path
+
+    def _list_files(self, prefix: str) -> list[StoredFile]:
+        stored_files = []
+        for path in sorted(self.bucket_path.rglob("*")):
+            if not path.is_file() or path.name.endswith((SIDECAR_SUFFIX, ".tmp")):
+                continue
+            key = path.relative_to(self.bucket_path).as_posix()
+            if not key.startswith(prefix):
+                continue
+            stat = path.stat()
+            stored_files.append(
+                StoredFile(
+                    key=key,
+                    size=stat.st_size,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+                )
+            )
+        return stored_files
+
+    @staticmethod
+    def _list_parts(upload_path: Path) -> list[UploadPart]:
+        parts = []
+        for sidecar_path in sorted(upload_path.glob(f"*.part{SIDECAR_SUFFIX}")):
+            meta = orjson.loads(sidecar_path.read_bytes())
+            parts.append(UploadPart(number=meta["number"], etag=meta["etag"], size=meta["size"]))
+        return parts
+
+    async def _iter_parts(
+        self, upload_path: Path, parts: list[UploadPart]
+    ) -> AsyncGenerator[bytes]:
+        for part in parts:
+            async for chunk in self._iter_file(upload_path / f"{part.number:05d}.part"):
+                yield chunk
+
+    @staticmethod
+    async def _iter_content(content: bytes) -> AsyncGenerator[bytes]:
+        yield content
+
+    async def _iter_stream(
+        self, file_stream: AsyncIterator[bytes] | IO[bytes]
+    ) -> AsyncGenerator[bytes]:
+        if isinstance(file_stream, AsyncIterator):
+            async for chunk in file_stream:
+                yield chunk
+            return
+        while chunk := await anyio.to_thread.run_sync(file_stream.read, self.chunk_size):
+            yield chunk
+
+    async def _iter_file(self, path: Path) -> AsyncGenerator[bytes]:
+        async with await anyio.open_file(path, "rb") as file:
+            while chunk := await file.read(self.chunk_size):
+                yield chunk
+
+    def _path(self, key: str) -> Path:
+        bucket_path = self.bucket_path.resolve()
+        path = (bucket_path / key.lstrip("/")).resolve()
+        if not path.is_relative_to(bucket_path) or path == bucket_path:
+            raise MediaNotFoundError
+        return path
+
+    @staticmethod
+    def _sidecar_path(path: Path) -> Path:
+        return path.with_name(f"{path.name}{SIDECAR_SUFFIX}")
@@ -0,0 +1,426 @@
+import fcntl
+import hashlib
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import IO
+
+import anyio
+import anyio.to_thread
+import orjson
+
+from src.config.settings import settings
+from src.core.file_storage import FileStorage
+from src.core.media.schemas import FileMetadata, FileObject, FileStream, StoredFile, UploadPart
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CachedMedia:
+    key: str
+    path: Path
+    size: int
+    media_type: str
+    etag: str | None = None
+    last_modified: datetime | None = None
+    content: bytes | None = None
+
+    @property
+    def metadata(self) -> FileMetadata:
+        return FileMetadata(
+            file_size=self.size,
+            media_type=self.media_type,
+            etag=self.etag,
+            last_modified=self.last_modified,
+        )
+
+    def open(self) -> FileStream:
+        if self.content is not None:
+            return FileStream(metadata=self.metadata, stream=_iter_content(self.content))
+        return FileStream(metadata=self.metadata, stream=_iter_file(self.path), path=self.path)
+
+
+@dataclass
+class MediaCacheStats:
+    hits: int = 0
+    memory_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+    memory_evictions: int = 0
+
+
+@dataclass
+class MediaCache:
+    enabled: bool = settings.MEDIA_CACHE.ENABLED
+    root: Path = settings.MEDIA_CACHE.PATH
+    max_size: int = settings.MEDIA_CACHE.MAX_SIZE
+    max_object_size: int = settings.MEDIA_CACHE.MAX_OBJECT_SIZE
+    memory_max_size: int = settings.MEDIA_CACHE.MEMORY_MAX_SIZE
+    memory_max_object_size: int = settings.MEDIA_CACHE.MEMORY_MAX_OBJECT_SIZE
+    workers: int = settings.APP.WORKERS
+    stats: MediaCacheStats = field(default_factory=MediaCacheStats)
+    _entries: OrderedDict[str, CachedMedia] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _memory: OrderedDict[str, bytes] = field(default_factory=OrderedDict, init=False, repr=False)
+    _size: int = field(default=0, init=False, repr=False)
+    _memory_size: int = field(default=0, init=False, repr=False)
+    _directory: Path | None = field(default=None, init=False, repr=False)
+    _lock: IO[bytes] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    @property
+    def _max_worker_size(self) -> int:
+        # Every prefork worker owns one slot directory, so together they stay within MAX_SIZE
+        return self.max_size // max(self.workers, 1)
+
+    async def load(self) -> None:
+        if not self.enabled:
+            return
+        await anyio.to_thread.run_sync(self._load)
+
+    def close(self) -> None:
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    async def get(self, key: str) -> CachedMedia | None:
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        # The file is gone when another worker invalidated the key
+        if not await anyio.Path(entry.path).exists():
+            await self._drop(key)
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        content = self._memory.get(key)
+        if content is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return replace(entry, content=content)
+        self.stats.hits += 1
+        return entry
+
+    async def invalidate(self, key: str) -> None:
+        if not self.enabled:
+            return
+        if key in self._entries:
+            self._forget(key)
+        await anyio.to_thread.run_sync(self._remove_from_slots, key)
+
+    async def cache_stream(
+        self,
+        key: str,
+        metadata: FileMetadata,
+        stream: AsyncIterator[bytes],
+    ) -> AsyncGenerator[bytes]:
+        if metadata.file_size > self.max_object_size:
+            async for chunk in stream:
+                yield chunk
+            return
+
+        path = self._path(key)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        buffer = bytearray() if metadata.file_size <= self.memory_max_object_size else None
+        await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+        written = 0
+        temp_file = await anyio.open_file(temp_path, "wb")
+        try:
+            async for chunk in stream:
+                await temp_file.write(chunk)
+                written += len(chunk)
+                if buffer is not None:
+                    buffer.extend(chunk)
+                yield chunk
+        except BaseException:
+            await temp_file.aclose()
+            await anyio.Path(temp_path).unlink(missing_ok=True)
+            raise
+        await temp_file.aclose()
+
+        if written != metadata.file_size:
+            await anyio.Path(temp_path).unlink(missing_ok=True)
+            return
+        entry = CachedMedia(
+            key=key,
+            path=path,
+            size=written,
+            media_type=metadata.media_type,
+            etag=metadata.etag,
+            last_modified=metadata.last_modified,
+        )
+        await anyio.to_thread.run_sync(self._persist, entry, temp_path)
+        self._register(entry)
+        if buffer is not None:
+            self._remember(key, bytes(buffer))
+        await self._evict()
+
+    def _load(self) -> None:
+        directory = self._claim_directory()
+        for leftover in directory.glob("*/*.tmp"):
+            leftover.unlink(missing_ok=True)
+
+        sidecars = sorted(directory.glob("*/*.json"), key=lambda path: path.stat().st_mtime)
+        for sidecar in sidecars:
+            path = sidecar.with_suffix("")
+            try:
+                meta = orjson.loads(sidecar.read_bytes())
+                size = path.stat().st_size
+                last_modified = meta.get("last_modified")
+                entry = CachedMedia(
+                    key=meta["key"],
+                    path=path,
+                    size=size,
+                    media_type=meta["media_type"],
+                    etag=meta.get("etag"),
+                    last_modified=datetime.fromisoformat(last_modified) if last_modified else None,
+                )
+            except (OSError, ValueError, KeyError):
+                _remove_files(path)
+                continue
+            self._register(entry)
+        _remove_entries(self._pop_excess())
+
+    def _claim_directory(self) -> Path:
+        # Prefork workers share the root, so each one locks a slot directory of its own and
+        # never evicts files another worker has indexed. A respawned worker takes over the
+        # slot freed by the one it replaces, together with its files.
+        slot = 0
+        while True:
+            directory = self.root / f"worker-{slot}"
+            directory.mkdir(parents=True, exist_ok=True)
+            lock = (directory / ".lock").open("wb")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock.close()
+                slot += 1
+                continue
+            self._directory = directory
+            self._lock = lock
+            return directory
+
+    @staticmethod
+    def _persist(entry: CachedMedia, temp_path: Path) -> None:
+        _sidecar_path(entry.path).write_bytes(
+            orjson.dumps({
+                "key": entry.key,
+                "media_type": entry.media_type,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+            })
+        )
+        temp_path.replace(entry.path)
+
+    def _register(self, entry: CachedMedia) -> None:
+        previous = self._entries.pop(entry.key, None)
+        if previous is not None:
+            self._size -= previous.size
+        self._entries[entry.key] = entry
+        self._size += entry.size
+
+    def _remember(self, key: str, content: bytes) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = content
+        self._memory_size += len(content)
+        while self._memory_size > self.memory_max_size and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+            self.stats.memory_evictions += 1
+
+    async def _evict(self) -> None:
+        evicted = self._pop_excess()
+        if evicted:
+            await anyio.to_thread.run_sync(_remove_entries, evicted)
+
+    def _pop_excess(self) -> list[CachedMedia]:
+        evicted = []
+        while self._size > self._max_worker_size and self._entries:
+            key = next(iter(self._entries))
+            entry = self._forget(key)
+            self.stats.evictions += 1
+            self.stats.evicted_bytes += entry.size
+            logger.debug("Evicted media %s from cache (%d bytes)", key, entry.size)
+            evicted.append(entry)
+        return evicted
+
+    async def _drop(self, key: str) -> None:
+        entry = self._forget(key)
+        await anyio.to_thread.run_sync(_remove_files, entry.path)
+
+    def _forget(self, key: str) -> CachedMedia:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        content = self._memory.pop(key, None)
+        if content is not None:
+            self._memory_size -= len(content)
+        return entry
+
+    def _remove_from_slots(self, key: str) -> None:
+        relative_path = _relative_path(key)
+        for directory in self.root.glob("worker-*"):
+            _remove_files(directory / relative_path)
+
+    def _path(self, key: str) -> Path:
+        if self._directory is None:
+            msg = "Media cache is not loaded"
+            raise RuntimeError(msg)
+        return self._directory / _relative_path(key)
+
+
+@dataclass
+class CachedFileStorage(FileStorage):
+    file_storage: FileStorage
+    media_cache: MediaCache
+
+    async def ensure_bucket(self) -> None:
+        await self.file_storage.ensure_bucket()
+
+    async def get_file_metadata(self, key: str) -> FileMetadata:
+        return await self.file_storage.get_file_metadata(key=key)
+
+    async def upload_file_stream(
+        self,
+        file_name: str,
+        file_stream: AsyncIterator[bytes] | IO[bytes],
+        content_type: str | None,
+        file_size: int | None = None,
+        key: str | None = None,
+    ) -> FileObject:
+        file_object = await self.file_storage.upload_file_stream(
+            file_name=file_name,
+            file_stream=file_stream,
+            content_type=content_type,
+            file_size=file_size,
+            key=key,
+        )
+        if key is not None:
+            await self.media_cache.invalidate(key)
+        return file_object
+
+    async def upload_file(self, key: str, content: bytes, content_type: str) -> FileObject:
+        file_object = await self.file_storage.upload_file(
+            key=key, content=content, content_type=content_type
+        )
+        await self.media_cache.invalidate(key)
+        return file_object
+
+    async def move_file(self, file_object: FileObject, key: str) -> FileObject:
+        moved_file_object = await self.file_storage.move_file(file_object=file_object, key=key)
+        await self.media_cache.invalidate(key)
+        return moved_file_object
+
+    async def open_file(self, key: str) -> FileStream:
+        cached_media = await self.media_cache.get(key)
+        if cached_media is not None:
+            return cached_media.open()
+        file = await self.file_storage.open_file(key=key)
+        # Files the backend serves from local disk gain nothing from a second copy
+        if file.path is not None or not self.media_cache.enabled:
+            return file
+        return replace(
+            file,
+            stream=self.media_cache.cache_stream(
+                key=key, metadata=file.metadata, stream=file.stream
+            ),
+        )
+
+    async def download_file(self, key: str) -> AsyncGenerator[bytes]:
+        file = await self.open_file(key=key)
+        async for chunk in file.stream:
+            yield chunk
+
+    async def get_download_url(self, key: str) -> str:
+        return await self.file_storage.get_download_url(key=key)
+
+    def build_url(self, key: str) -> str:
+        return self.file_storage.build_url(key=key)
+
+    async def delete_file(self, key: str) -> None:
+        await self.file_storage.delete_file(key=key)
+        await self.media_cache.invalidate(key)
+
+    async def delete_files(self, keys: list[str]) -> None:
+        await self.file_storage.delete_files(keys=keys)
+        for key in keys:
+            await self.media_cache.invalidate(key)
+
+    def list_files(self, prefix: str = "") -> AsyncIterator[StoredFile]:
+        return self.file_storage.list_files(prefix=prefix)
+
+    async def create_multipart_upload(self, key: str, content_type: str | None) -> str:
+        return await self.file_storage.create_multipart_upload(key=key, content_type=content_type)
+
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, content: bytes
+    ) -> UploadPart:
+        return await self.file_storage.upload_part(
+            key=key, upload_id=upload_id, part_number=part_number, content=content
+        )
+
+    async def list_parts(self, key: str, upload_id: str) -> list[UploadPart]:
+        return await self.file_storage.list_parts(key=key, upload_id=upload_id)
+
+    async def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[UploadPart], content_type: str | None
+    ) -> FileObject:
+        file_object = await self.file_storage.complete_multipart_upload(
+            key=key, upload_id=upload_id, parts=parts, content_type=content_type
+        )
+        await self.media_cache.invalidate(key)
+        return file_object
+
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        await self.file_storage.abort_multipart_upload(key=key, upload_id=upload_id)
+
+
+def _relative_path(key: str) -> Path:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return Path(digest[:2]) / digest
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.json")
+
+
+def _remove_files(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    _sidecar_path(path).unlink(missing_ok=True)
+
+
+def _remove_entries(entries: list[CachedMedia]) -> None:
+    for entry in entries:
+        _remove_files(entry.path)
+
+
+async def _iter_content(content: bytes) -> AsyncGenerator[bytes]:
+    yield content
+
+
+async def _iter_file(path: Path) -> AsyncGenerator[bytes]:
+    async with await anyio.open_file(path, "rb") as file:
+        while chunk := await file.read(READ_CHUNK_SIZE):
+            yield chunk
@@ -0,0 +1,394 @@
+import asyncio
+import bisect
+import fcntl
+import math
+import os
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar, Literal
+
+import orjson
+from sqlalchemy import QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.services.media_cache import MediaCache
+
+MetricType = Literal["counter", "gauge", "histogram"]
+LabelValues = tuple[str, ...]
+
+MINIO_START_TIME_KEY = "metrics_start_time"
+MEDIA_CACHE_EVENTS = ("hits", "memory_hits", "misses", "evictions", "memory_evictions")
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ARCHIVE_FILE_NAME = "archive.json"
+LOCK_FILE_NAME = ".lock"
+
+
+@dataclass
+class Metric:
+    name: str
+    documentation: str
+    label_names: tuple[str, ...] = ()
+
+    type: ClassVar[MetricType]
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def dump(self) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+@dataclass
+class Counter(Metric):
+    type: ClassVar[MetricType] = "counter"
+    _values: dict[LabelValues, float] = field(default_factory=dict, init=False, repr=False)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: str) -> None:
+        self._values[self._label_values(labels)] = value
+
+    def dump(self) -> dict[str, Any]:
+        return {"samples": [[list(key), value] for key, value in self._values.items()]}
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+@dataclass
+class Gauge(Metric):
+    type: ClassVar[MetricType] = "gauge"
+    _values: dict[LabelValues, float] = field(default_factory=dict, init=False, repr=False)
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._label_values(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def dump(self) -> dict[str, Any]:
+        return {"samples": [[list(key), value] for key, value in self._values.items()]}
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+@dataclass
+class Histogram(Metric):
+    type: ClassVar[MetricType] = "histogram"
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    _values: dict[LabelValues, list[float]] = field(default_factory=dict, init=False, repr=False)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        values = self._values.get(key)
+        if values is None:
+            values = self._values[key] = [0.0] * (len(self.buckets) + 3)
+        values[bisect.bisect_left(self.buckets, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "buckets": list(self.buckets),
+            "samples": [[list(key), list(values)] for key, values in self._values.items()],
+        }
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+@dataclass
+class MetricsRegistry:
+    multiprocess_dir: Path | None = None
+    _metrics: dict[str, Metric] = field(default_factory=dict, init=False, repr=False)
+    _collectors: dict[str, Callable[[], None]] = field(default_factory=dict, init=False, repr=False)
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets=buckets))
+
+    def register_collector(self, name: str, collector: Callable[[], None]) -> None:
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        for collector in self._collectors.values():
+            collector()
+        return {
+            name: {
+                "type": metric.type,
+                "documentation": metric.documentation,
+                "label_names": list(metric.label_names),
+                **metric.dump(),
+            }
+            for name, metric in self._metrics.items()
+        }
+
+    def flush(self) -> None:
+        if self.multiprocess_dir is None:
+            return
+        self._write_snapshot(self.snapshot())
+
+    async def flush_async(self) -> None:
+        if self.multiprocess_dir is None:
+            return
+        # Metrics are mutated on the event loop, so only the file I/O leaves it
+        await asyncio.to_thread(self._write_snapshot, self.snapshot())
+
+    async def render(self) -> str:
+        if self.multiprocess_dir is None:
+            return render_snapshot(self.snapshot())
+        return await asyncio.to_thread(self._render_multiprocess, self.snapshot())
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def _register[MetricT: Metric](self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name} is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def _write_snapshot(self, snapshot: dict[str, dict[str, Any]]) -> None:
+        if self.multiprocess_dir is None:
+            return
+        self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+        path = self.multiprocess_dir / f"{os.getpid()}.json"
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temp_path.write_bytes(orjson.dumps(snapshot))
+        temp_path.replace(path)
+
+    def _render_multiprocess(self, snapshot: dict[str, dict[str, Any]]) -> str:
+        self._write_snapshot(snapshot)
+        return render_snapshot(self._collect_multiprocess())
+
+    def _collect_multiprocess(self) -> dict[str, dict[str, Any]]:
+        if self.multiprocess_dir is None:
+            return {}
+        with (self.multiprocess_dir / LOCK_FILE_NAME).open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            archive_path = self.multiprocess_dir / ARCHIVE_FILE_NAME
+            archive = _read_snapshot(archive_path)
+            live: list[dict[str, dict[str, Any]]] = []
+            dead: list[Path] = []
+            for path in self.multiprocess_dir.glob("*.json"):
+                if path.name == ARCHIVE_FILE_NAME:
+                    continue
+                if _is_alive(int(path.stem)):
+                    live.append(_read_snapshot(path))
+                else:
+                    archive = merge_snapshots([archive, _drop_gauges(_read_snapshot(path))])
+                    dead.append(path)
+            if dead:
+                archive_path.write_bytes(orjson.dumps(archive))
+                for path in dead:
+                    path.unlink(missing_ok=True)
+        return merge_snapshots([*live, archive])
+
+
+def merge_snapshots(snapshots: list[dict[str, dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+    merged: dict[str, dict[str, Any]] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {**metric, "samples": []})
+            samples = {tuple(labels): value for labels, value in target["samples"]}
+            for labels, value in metric["samples"]:
+                key = tuple(labels)
+                if key not in samples:
+                    samples[key] = value
+                elif metric["type"] == "histogram":
+                    samples[key] = [a + b for a, b in zip(samples[key], value, strict=True)]
+                else:
+                    samples[key] += value
+            target["samples"] = [[list(labels), value] for labels, value in samples.items()]
+    return merged
+
+
+def render_snapshot(snapshot: dict[str, dict[str, Any]]) -> str:
+    lines: list[str] = []
+    for name, metric in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {_escape_help(metric['documentation'])}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        label_names = metric["label_names"]
+        for label_values, value in sorted(metric["samples"]):
+            labels = list(zip(label_names, label_values, strict=True))
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+            cumulative = 0.0
+            for bound, count in zip([*metric["buckets"], math.inf], value[:-2], strict=True):
+                cumulative += count
+                bucket_labels = [*labels, ("le", _format_value(bound))]
+                lines.append(
+                    f"{name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value[-2])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(value[-1])}")
+    return "\n".join(lines) + "\n"
+
+
+def _read_snapshot(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        snapshot: dict[str, dict[str, Any]] = orjson.loads(path.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+    return snapshot
+
+
+def _drop_gauges(snapshot: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {name: metric for name, metric in snapshot.items() if metric["type"] != "gauge"}
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels: list[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(documentation: str) -> str:
+    return documentation.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+metrics_registry = MetricsRegistry()
+
+http_request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+http_requests_in_progress = metrics_registry.gauge(
+    "http_requests_in_progress", "HTTP requests currently being processed", ("method",)
+)
+use_case_duration = metrics_registry.histogram(
+    "use_case_duration_seconds", "Use case execution time", ("use_case", "status")
+)
+minio_request_duration = metrics_registry.histogram(
+    "minio_request_duration_seconds", "MinIO API call latency", ("operation", "status")
+)
+password_hash_duration = metrics_registry.histogram(
+    "password_hash_duration_seconds",
+    "Time spent in bcrypt on the event loop",
+    ("operation",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5),
+)
+db_pool_connections = metrics_registry.gauge(
+    "db_pool_connections", "SQLAlchemy pool connections by state", ("state",)
+)
+media_cache_events = metrics_registry.counter(
+    "media_cache_events_total", "Media cache hits, misses and evictions", ("event",)
+)
+media_cache_size = metrics_registry.gauge(
+    "media_cache_size_bytes", "Media cache size by tier", ("tier",)
+)
+
+
+def observe_use_case(use_case: str, duration: float, status: str) -> None:
+    use_case_duration.observe(duration, use_case=use_case, status=status)
+
+
+def register_pool_metrics(engine: AsyncEngine) -> None:
+    def collect() -> None:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return
+        db_pool_connections.set(pool.size(), state="size")
+        db_pool_connections.set(pool.checkedin(), state="checked_in")
+        db_pool_connections.set(pool.checkedout(), state="checked_out")
+        db_pool_connections.set(max(pool.overflow(), 0), state="overflow")
+
+    metrics_registry.register_collector("db_pool", collect)
+
+
+def register_media_cache_metrics(media_cache: MediaCache) -> None:
+    def collect() -> None:
+        for event in MEDIA_CACHE_EVENTS:
+            media_cache_events.set_total(getattr(media_cache.stats, event), event=event)
+        media_cache_size.set(media_cache.size, tier="disk")
+        media_cache_size.set(media_cache.memory_size, tier="memory")
+
+    metrics_registry.register_collector("media_cache", collect)
+
+
+def instrument_minio_client(client: Any) -> None:  # noqa: ANN401
+    def before_call(context: dict[str, Any], **_: Any) -> None:  # noqa: ANN401
+        context[MINIO_START_TIME_KEY] = time.perf_counter()
+
+    def after_call(
+        context: dict[str, Any],
+        event_name: str,
+        http_response: Any,  # noqa: ANN401
+        **_: Any,  # noqa: ANN401
+    ) -> None:
+        _observe_minio_call(context, event_name, status=str(http_response.status_code))
+
+    def after_call_error(context: dict[str, Any], event_name: str, **_: Any) -> None:  # noqa: ANN401
+        _observe_minio_call(context, event_name, status="error")
+
+    client.meta.events.register("before-call.s3", before_call)
+    client.meta.events.register("after-call.s3", after_call)
+    client.meta.events.register("after-call-error.s3", after_call_error)
+
+
+def _observe_minio_call(context: dict[str, Any], event_name: str, status: str) -> None:
+    started_at = context.pop(MINIO_START_TIME_KEY, None)
+    if started_at is None:
+        return
+    minio_request_duration.observe(
+        time.perf_counter() - started_at, operation=event_name.rsplit(".", 1)[-1], status=status
+    )
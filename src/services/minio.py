@@ -1,33 +1,51 @@
-import uuid
+import logging
 from collections.abc import AsyncGenerator, AsyncIterator
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from dataclasses import dataclass, replace
+from functools import partial
 from typing import IO, Any
 
 from aiobotocore.client import AioBaseClient
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
 from src.config.settings import settings
 from src.core.file_storage import FileStorage
 from src.core.media.exceptions import MediaNotFoundError
-from src.core.media.schemas import FileMetadata, FileObject
+from src.core.media.schemas import (
+    FileMetadata,
+    FileObject,
+    FileStream,
+    StoredFile,
+    UploadPart,
+)
+
+logger = logging.getLogger(__name__)
+
+DELETE_BATCH_SIZE = 1000
 
 
 @dataclass
 class MinioService(FileStorage):
     minio_connection: AioBaseClient
+    presign_connection: AioBaseClient | None = None
     server_url: str = settings.SERVER.URL
     region_name: str = settings.MINIO.REGION
     bucket: str = settings.MINIO.BUCKET
     chunk_size: int = 65536
+    presigned_url_ttl: int = settings.MINIO.PRESIGNED_URL_TTL
+    multipart_part_size: int = settings.MINIO.MULTIPART_PART_SIZE
 
     @property
     def media_url_prefix(self) -> str:
         return f"{self.server_url}/media"
 
     async def get_file_metadata(self, key: str) -> FileMetadata:
-        response = await self.minio_connection.head_object(Bucket=self.bucket, Key=key)
-        return FileMetadata(file_size=response["ContentLength"], media_type=response["ContentType"])
+        try:
+            response = await self.minio_connection.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in {"NoSuchKey", "404"}:
+                raise MediaNotFoundError from e
+            raise
+        return self._build_metadata(response)
 
     async def ensure_bucket(self) -> None:
         buckets = await self.minio_connection.list_buckets()
@@ -45,48 +63,263 @@ class MinioService(FileStorage):
         file_stream: AsyncIterator[bytes] | IO[bytes],
         content_type: str | None = None,
         file_size: int | None = None,
+        key: str | None = None,
     ) -> FileObject:
         extra_args: dict[str, Any] = {}
         if content_type:
             extra_args["ContentType"] = content_type
 
-        unique_key = self._generate_unique_key(file_name=file_name)
+        unique_key = key or self.generate_unique_key(file_name=file_name)
+        if isinstance(file_stream, AsyncIterator):
+            etag, size = await self._upload_async_stream(
+                key=unique_key, file_stream=file_stream, extra_args=extra_args
+            )
+            return FileObject(
+                key=unique_key,
+                url=self.build_url(unique_key),
+                etag=etag,
+                content_type=content_type,
+                size=size,
+            )
+
         resp = await self.minio_connection.put_object(
             Bucket=self.bucket, Key=unique_key, Body=file_stream, **extra_args
         )
 
         return FileObject(
             key=unique_key,
-            url=self._build_url(unique_key),
+            url=self.build_url(unique_key),
             etag=resp.get("ETag", "").strip('"'),
             content_type=content_type,
             size=file_size,
         )
 
-    async def download_file(self, key: str) -> AsyncGenerator[bytes]:
+    async def _upload_async_stream(
+        self,
+        key: str,
+        file_stream: AsyncIterator[bytes],
+        extra_args: dict[str, Any],
+    ) -> tuple[str, int]:
+        buffer = bytearray()
+        size = 0
+        upload_id: str | None = None
+        parts: list[UploadPart] = []
+        try:
+            async for chunk in file_stream:
+                buffer.extend(chunk)
+                size += len(chunk)
+                if len(buffer) < self.multipart_part_size:
+                    continue
+                if upload_id is None:
+                    upload_id = await self.create_multipart_upload(
+                        key=key, content_type=extra_args.get("ContentType")
+                    )
+                parts.append(await self.upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                resp = await self.minio_connection.put_object(
+                    Bucket=self.bucket, Key=key, Body=bytes(buffer), **extra_args
+                )
+                return resp.get("ETag", "").strip('"'), size
+
+            if buffer:
+                parts.append(await self.upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+            file_object = await self.complete_multipart_upload(
+                key=key, upload_id=upload_id, parts=parts, content_type=None
+            )
+        except BaseException:
+            if upload_id is not None:
+                await self.abort_multipart_upload(key=key, upload_id=upload_id)
+            raise
+        return file_object.etag, size
+
+    async def delete_files(self, keys: list[str]) -> None:
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start : start + DELETE_BATCH_SIZE]
+            resp = await self.minio_connection.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = resp.get("Errors", [])
+            if errors:
+                logger.warning("Unable to delete %d media objects: %s", len(errors), errors[:5])
+
+    async def list_files(self, prefix: str = "") -> AsyncGenerator[StoredFile]:
+        paginator = self.minio_connection.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield StoredFile(
+                    key=obj["Key"], size=obj["Size"], last_modified=obj["LastModified"]
+                )
+
+    async def create_multipart_upload(self, key: str, content_type: str | None) -> str:
+        extra_args: dict[str, Any] = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        upload = await self.minio_connection.create_multipart_upload(
+            Bucket=self.bucket, Key=key, **extra_args
+        )
+        upload_id: str = upload["UploadId"]
+        return upload_id
+
+    async def upload_part(
+        self, key: str, upload_id: str, part_number: int, content: bytes
+    ) -> UploadPart:
+        try:
+            resp = await self.minio_connection.upload_part(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=content,
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchUpload":
+                raise MediaNotFoundError from e
+            raise
+        return UploadPart(number=part_number, etag=resp["ETag"].strip('"'), size=len(content))
+
+    async def list_parts(self, key: str, upload_id: str) -> list[UploadPart]:
+        parts: list[UploadPart] = []
+        marker = 0
+        while True:
+            try:
+                resp = await self.minio_connection.list_parts(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumberMarker=marker
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "NoSuchUpload":
+                    raise MediaNotFoundError from e
+                raise
+            parts.extend(
+                UploadPart(
+                    number=part["PartNumber"],
+                    etag=part["ETag"].strip('"'),
+                    size=part["Size"],
+                )
+                for part in resp.get("Parts", [])
+            )
+            if not resp.get("IsTruncated"):
+                return parts
+            marker = resp["NextPartNumberMarker"]
+
+    async def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[UploadPart], content_type: str | None
+    ) -> FileObject:
+        try:
+            resp = await self.minio_connection.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [{"ETag": part.etag, "PartNumber": part.number} for part in parts]
+                },
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchUpload":
+                raise MediaNotFoundError from e
+            raise
+        return FileObject(
+            key=key,
+            url=self.build_url(key),
+            etag=resp.get("ETag", "").strip('"'),
+            content_type=content_type,
+            size=sum(part.size for part in parts),
+        )
+
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        try:
+            await self.minio_connection.abort_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "NoSuchUpload":
+                raise
+
+    async def upload_file(self, key: str, content: bytes, content_type: str) -> FileObject:
+        resp = await self.minio_connection.put_object(
+            Bucket=self.bucket, Key=key, Body=content, ContentType=content_type
+        )
+
+        return FileObject(
+            key=key,
+            url=self.build_url(key),
+            etag=resp.get("ETag", "").strip('"'),
+            content_type=content_type,
+            size=len(content),
+        )
+
+    async def move_file(self, file_object: FileObject, key: str) -> FileObject:
+        resp = await self.minio_connection.copy_object(
+            Bucket=self.bucket,
+            Key=key,
+            CopySource={"Bucket": self.bucket, "Key": file_object.key},
+        )
+        try:
+            await self.delete_file(key=file_object.key)
+        except (ClientError, BotoCoreError):
+            # The copy is already in place; the unreferenced source is left to the media GC
+            logger.warning("Failed to delete %s after moving it to %s", file_object.key, key)
+        return replace(
+            file_object,
+            key=key,
+            url=self.build_url(key),
+            etag=resp["CopyObjectResult"]["ETag"].strip('"'),
+        )
+
+    async def open_file(self, key: str) -> FileStream:
         try:
             obj = await self.minio_connection.get_object(Bucket=self.bucket, Key=key)
-            async with obj["Body"] as response:
-                async for chunk in response.content.iter_chunked(self.chunk_size):
-                    if not chunk:
-                        continue
-                    yield chunk
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 raise MediaNotFoundError from e
             raise
+        return FileStream(
+            metadata=self._build_metadata(obj),
+            stream=self._iter_body(obj["Body"]),
+            release=partial(self._release_body, obj["Body"]),
+        )
+
+    async def download_file(self, key: str) -> AsyncGenerator[bytes]:
+        file = await self.open_file(key=key)
+        async for chunk in file.stream:
+            yield chunk
+
+    @staticmethod
+    def _build_metadata(response: dict[str, Any]) -> FileMetadata:
+        etag = response.get("ETag")
+        return FileMetadata(
+            file_size=response["ContentLength"],
+            media_type=response["ContentType"],
+            etag=etag.strip('"') if etag else None,
+            last_modified=response.get("LastModified"),
+        )
+
+    async def _iter_body(self, body: Any) -> AsyncGenerator[bytes]:  # noqa: ANN401
+        async with body as response:
+            async for chunk in response.content.iter_chunked(self.chunk_size):
+                if not chunk:
+                    continue
+                yield chunk
+
+    @staticmethod
+    async def _release_body(body: Any) -> None:  # noqa: ANN401
+        async with body:
+            pass
+
+    async def get_download_url(self, key: str) -> str:
+        connection = self.presign_connection or self.minio_connection
+        url: str = await connection.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=self.presigned_url_ttl,
+        )
+        return url
 
     async def delete_file(self, key: str) -> None:
         await self.minio_connection.delete_object(Bucket=self.bucket, Key=key)
 
-    def _build_url(self, key: str) -> str:
+    def build_url(self, key: str) -> str:
         base = self.media_url_prefix.rstrip("/")
         return f"{base}/{key.lstrip('/')}"
-
-    @staticmethod
-    def _generate_unique_key(file_name: str) -> str:
-        timestamp = datetime.now(UTC)
-        date_path = timestamp.strftime("%Y/%m/%d")
-        filename = file_name.lstrip("/").rsplit("/", 1)[-1]
-
-        return f"{date_path}/{timestamp.strftime('%H%M%S')}_{uuid.uuid4()}_{filename}"
@@ -6,6 +6,7 @@ import jwt as pyjwt
 from src.config.settings import settings
 from src.core.password import PasswordService
 from src.core.users.exceptions import UserIncorrectCredentialsError
+from src.services.metrics import password_hash_duration
 
 
 @dataclass
@@ -16,13 +17,16 @@ class UserPasswordService(PasswordService):
     def generate_password_hash(self, password: str) -> str:
         salt = bcrypt.gensalt()
         password_bytes = password.encode("utf-8")
-        hash_password = bcrypt.hashpw(password=password_bytes, salt=salt)
+        with password_hash_duration.time(operation="hash"):
+            hash_password = bcrypt.hashpw(password=password_bytes, salt=salt)
         return hash_password.decode("utf-8")
 
     def verify_password_hash(self, password: str, hashed_password: str) -> None:
         password_bytes = password.encode("utf-8")
         hashed_password_bytes = hashed_password.encode("utf-8")
-        if not bcrypt.checkpw(password_bytes, hashed_password_bytes):
+        with password_hash_duration.time(operation="verify"):
+            is_valid = bcrypt.checkpw(password_bytes, hashed_password_bytes)
+        if not is_valid:
             raise UserIncorrectCredentialsError
 
     def encode(self, payload: dict) -> str:
@@ -5,7 +5,11 @@ from src.config.settings import settings
 async_engine = create_async_engine(
     settings.DATABASE.URL.get_secret_value(),
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DATABASE.POOL_SIZE,
+    max_overflow=settings.DATABASE.MAX_OVERFLOW,
 )
 async_session = async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def reset_engine_after_fork() -> None:
+    async_engine.sync_engine.dispose(close=False)
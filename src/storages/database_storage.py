@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from datetime import datetime
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import delete, func, insert, literal, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -17,6 +19,8 @@ from src.core.competencies.exceptions import (
     CompetencySkillRelationAlreadyExistsError,
 )
 from src.core.competencies.schemas import Competencies, Competency
+from src.core.media.exceptions import MediaNotFoundError, UploadSessionNotFoundError
+from src.core.media.schemas import MediaObject, UploadSession
 from src.core.mission_chains.exceptions import (
     MissionChainMissionAlreadyExistsError,
     MissionChainNameAlreadyExistError,
@@ -24,6 +28,7 @@ from src.core.mission_chains.exceptions import (
     MissionDependencyAlreadyExistsError,
 )
 from src.core.mission_chains.schemas import MissionChain, MissionChainMission, MissionChains
+from src.core.missions.enums import MissionSortEnum
 from src.core.missions.exceptions import (
     MissionCompetencyRewardAlreadyExistsError,
     MissionNameAlreadyExistError,
@@ -32,6 +37,7 @@ from src.core.missions.exceptions import (
 )
 from src.core.missions.schemas import (
     Mission,
+    MissionFilter,
     Missions,
 )
 from src.core.ranks.exceptions import (
@@ -42,6 +48,8 @@ from src.core.ranks.exceptions import (
     RankNotFoundError,
 )
 from src.core.ranks.schemas import Rank, Ranks
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.schemas import SearchQuery, SearchResult, SearchResults
 from src.core.seasons.exceptions import SeasonNameAlreadyExistError, SeasonNotFoundError
 from src.core.seasons.schemas import Season, Seasons
 from src.core.skills.exceptions import (
@@ -53,8 +61,10 @@ from src.core.skills.schemas import Skill, Skills
 from src.core.storages import (
     ArtifactStorage,
     CompetencyStorage,
+    MediaStorage,
     MissionStorage,
     RankStorage,
+    SearchStorage,
     SkillStorage,
     StoreStorage,
     UserStorage,
@@ -78,11 +88,14 @@ from src.core.tasks.schemas import (
 from src.core.users.exceptions import UserAlreadyExistError, UserNotFoundError
 from src.core.users.schemas import CandidateUser, User
 from src.storages.models import (
+    SEARCH_CONFIG,
     ArtifactMissionRelationModel,
     ArtifactModel,
     ArtifactUserRelationModel,
     CompetencyModel,
     CompetencySkillRelationModel,
+    MediaObjectModel,
+    MediaUploadSessionModel,
     MissionBranchModel,
     MissionChainMissionRelationModel,
     MissionChainModel,
@@ -104,6 +117,20 @@ from src.storages.models import (
     UserTaskRelationModel,
 )
 
+FOREIGN_KEY_VIOLATION = "23503"
+
+MISSION_SORT_COLUMNS = {
+    MissionSortEnum.ID: MissionModel.id,
+    MissionSortEnum.TITLE: MissionModel.title,
+    MissionSortEnum.REWARD_XP: MissionModel.reward_xp,
+    MissionSortEnum.REWARD_MANA: MissionModel.reward_mana,
+    MissionSortEnum.RANK_REQUIREMENT: MissionModel.rank_requirement,
+}
+
+
+def _is_foreign_key_violation(error: IntegrityError) -> bool:
+    return getattr(error.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+
 
 @dataclass
 class DatabaseStorage(
@@ -114,6 +141,8 @@ class DatabaseStorage(
     RankStorage,
     SkillStorage,
     StoreStorage,
+    MediaStorage,
+    SearchStorage,
 ):
     session: AsyncSession
 
@@ -131,7 +160,8 @@ class DatabaseStorage(
             },
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             # TODO: Можно проверить на UniqueViolationError
             raise UserAlreadyExistError from error
@@ -195,7 +225,7 @@ class DatabaseStorage(
         users = await self.session.scalars(query)
         return [user.to_schema() for user in users]
 
-    async def insert_season(self, season: Season) -> None:
+    async def insert_season(self, season: Season) -> Season:
         query = (
             insert(MissionBranchModel)
             .values({
@@ -206,9 +236,11 @@ class DatabaseStorage(
             .returning(MissionBranchModel)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                branch = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise SeasonNameAlreadyExistError from error
+        return branch.to_schema()
 
     async def get_season_by_name(self, name: str) -> Season:
         query = select(MissionBranchModel).where(MissionBranchModel.name == name)
@@ -229,7 +261,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return Seasons(values=[row.to_schema() for row in result])
 
-    async def insert_mission(self, mission: Mission) -> None:
+    async def insert_mission(self, mission: Mission) -> Mission:
         query = (
             insert(MissionModel)
             .values({
@@ -244,9 +276,27 @@ class DatabaseStorage(
             .returning(MissionModel.id)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                mission_id = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
+            if _is_foreign_key_violation(error=error):
+                raise SeasonNotFoundError from error
             raise MissionNameAlreadyExistError from error
+        # Новая миссия еще без связей, поэтому схема собирается без дополнительных запросов
+        return Mission(
+            id=mission_id,
+            title=mission.title,
+            description=mission.description,
+            reward_xp=mission.reward_xp,
+            reward_mana=mission.reward_mana,
+            rank_requirement=mission.rank_requirement,
+            season_id=mission.season_id,
+            category=mission.category,
+            tasks=[],
+            reward_artifacts=[],
+            reward_competencies=[],
+            reward_skills=[],
+        )
 
     async def get_mission_by_id(self, mission_id: int) -> Mission:
         query = (
@@ -298,17 +348,51 @@ class DatabaseStorage(
             raise MissionNotFoundError
         return mission.to_schema()
 
-    async def list_missions(self) -> Missions:
-        query = select(MissionModel).options(
-            selectinload(MissionModel.tasks),
-            selectinload(MissionModel.artifacts),
-            selectinload(MissionModel.competency_rewards).selectinload(
-                MissionCompetencyRewardModel.competency
-            ),
-            selectinload(MissionModel.skill_rewards).selectinload(MissionSkillRewardModel.skill),
-        )
-        result = await self.session.scalars(query)
-        return Missions(values=[row.to_schema() for row in result])
+    async def list_missions(self, filters: MissionFilter) -> Missions:
+        conditions = []
+        if filters.season_id is not None:
+            conditions.append(MissionModel.branch_id == filters.season_id)
+        if filters.category is not None:
+            conditions.append(MissionModel.category == filters.category)
+        if filters.rank_requirement is not None:
+            conditions.append(MissionModel.rank_requirement == filters.rank_requirement)
+        if filters.min_reward_xp is not None:
+            conditions.append(MissionModel.reward_xp >= filters.min_reward_xp)
+        if filters.max_reward_xp is not None:
+            conditions.append(MissionModel.reward_xp <= filters.max_reward_xp)
+        if filters.min_reward_mana is not None:
+            conditions.append(MissionModel.reward_mana >= filters.min_reward_mana)
+        if filters.max_reward_mana is not None:
+            conditions.append(MissionModel.reward_mana <= filters.max_reward_mana)
+        sort_column = MISSION_SORT_COLUMNS[filters.sort_by]
+        query = (
+            select(MissionModel, func.count().over().label("total"))
+            .where(*conditions)
+            .options(
+                selectinload(MissionModel.tasks),
+                selectinload(MissionModel.artifacts),
+                selectinload(MissionModel.competency_rewards).selectinload(
+                    MissionCompetencyRewardModel.competency
+                ),
+                selectinload(MissionModel.skill_rewards).selectinload(
+                    MissionSkillRewardModel.skill
+                ),
+            )
+            .order_by(sort_column.desc() if filters.descending else sort_column, MissionModel.id)
+            .limit(filters.limit)
+            .offset(filters.offset)
+        )
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            total = rows[0].total
+        elif filters.offset:
+            # The window count only exists on returned rows, so a page past the end needs its own
+            total = await self.session.scalar(
+                select(func.count()).select_from(MissionModel).where(*conditions)
+            )
+        else:
+            total = 0
+        return Missions(values=[row.MissionModel.to_schema() for row in rows], total=total)
 
     async def get_missions_by_rank(self, rank_id: int) -> Missions:
         query = (
@@ -328,7 +412,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return Missions(values=[row.to_schema() for row in result])
 
-    async def update_mission(self, mission: Mission) -> None:
+    async def update_mission(self, mission: Mission) -> Mission:
         query = (
             update(MissionModel)
             .where(MissionModel.id == mission.id)
@@ -341,16 +425,36 @@ class DatabaseStorage(
                 "branch_id": mission.season_id,
                 "category": mission.category,
             })
+            .returning(MissionModel)
+            .options(
+                selectinload(MissionModel.tasks),
+                selectinload(MissionModel.artifacts),
+                selectinload(MissionModel.competency_rewards).selectinload(
+                    MissionCompetencyRewardModel.competency
+                ),
+                selectinload(MissionModel.skill_rewards).selectinload(
+                    MissionSkillRewardModel.skill
+                ),
+            )
+            .execution_options(populate_existing=True)
         )
-        await self.session.execute(query)
+        try:
+            async with self.session.begin_nested():
+                updated_mission = await self.session.scalar(query)
+        except IntegrityError as error:
+            if _is_foreign_key_violation(error=error):
+                raise SeasonNotFoundError from error
+            raise MissionNameAlreadyExistError from error
+        if updated_mission is None:
+            raise MissionNotFoundError
+        return updated_mission.to_schema()
 
     async def delete_mission(self, mission_id: int) -> None:
-        await self.get_mission_by_id(mission_id=mission_id)
-        query = delete(MissionModel).where(MissionModel.id == mission_id)
-        await self.session.execute(query)
+        query = delete(MissionModel).where(MissionModel.id == mission_id).returning(MissionModel.id)
+        if await self.session.scalar(query) is None:
+            raise MissionNotFoundError
 
-    async def update_season(self, branch: Season) -> None:
-        await self.get_season_by_id(season_id=branch.id)
+    async def update_season(self, branch: Season) -> Season:
         query = (
             update(MissionBranchModel)
             .where(MissionBranchModel.id == branch.id)
@@ -359,30 +463,42 @@ class DatabaseStorage(
                 "start_date": branch.start_date,
                 "end_date": branch.end_date,
             })
+            .returning(MissionBranchModel)
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_branch = await self.session.scalar(query)
         except IntegrityError as error:
             raise SeasonNameAlreadyExistError from error
+        if updated_branch is None:
+            raise SeasonNotFoundError
+        return updated_branch.to_schema()
 
     async def delete_season(self, season_id: int) -> None:
-        await self.get_season_by_id(season_id=season_id)
-        query = delete(MissionBranchModel).where(MissionBranchModel.id == season_id)
-        await self.session.execute(query)
+        query = (
+            delete(MissionBranchModel)
+            .where(MissionBranchModel.id == season_id)
+            .returning(MissionBranchModel.id)
+        )
+        if await self.session.scalar(query) is None:
+            raise SeasonNotFoundError
 
-    async def insert_mission_task(self, task: MissionTask) -> None:
+    async def insert_mission_task(self, task: MissionTask) -> MissionTask:
         query = (
             insert(MissionTaskModel)
             .values({
                 "title": task.title,
                 "description": task.description,
             })
-            .returning(MissionTaskModel.id)
+            .returning(MissionTaskModel)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                created_task = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise TaskNameAlreadyExistError from error
+        return created_task.to_schema()
 
     async def get_mission_task_by_id(self, task_id: int) -> MissionTask:
         query = select(MissionTaskModel).where(MissionTaskModel.id == task_id)
@@ -403,8 +519,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return MissionTasks(values=[row.to_schema() for row in result])
 
-    async def update_mission_task(self, task: MissionTask) -> None:
-        await self.get_mission_task_by_id(task_id=task.id)
+    async def update_mission_task(self, task: MissionTask) -> MissionTask:
         query = (
             update(MissionTaskModel)
             .where(MissionTaskModel.id == task.id)
@@ -412,16 +527,26 @@ class DatabaseStorage(
                 "title": task.title,
                 "description": task.description,
             })
+            .returning(MissionTaskModel)
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_task = await self.session.scalar(query)
         except IntegrityError as error:
             raise TaskNameAlreadyExistError from error
+        if updated_task is None:
+            raise TaskNotFoundError
+        return updated_task.to_schema()
 
     async def delete_mission_task(self, task_id: int) -> None:
-        await self.get_mission_task_by_id(task_id=task_id)
-        query = delete(MissionTaskModel).where(MissionTaskModel.id == task_id)
-        await self.session.execute(query)
+        query = (
+            delete(MissionTaskModel)
+            .where(MissionTaskModel.id == task_id)
+            .returning(MissionTaskModel.id)
+        )
+        if await self.session.scalar(query) is None:
+            raise TaskNotFoundError
 
     async def add_task_to_mission(self, mission_id: int, task_id: int) -> None:
         query = insert(MissionTaskRelationModel).values({
@@ -458,7 +583,8 @@ class DatabaseStorage(
             "level_increase": level_increase,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             # Fallback in case of race condition
             raise MissionCompetencyRewardAlreadyExistsError from error
@@ -493,7 +619,8 @@ class DatabaseStorage(
             "level_increase": level_increase,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             # Fallback in case of race condition
             raise MissionSkillRewardAlreadyExistsError from error
@@ -505,7 +632,7 @@ class DatabaseStorage(
         )
         await self.session.execute(query)
 
-    async def insert_artifact(self, artifact: Artifact) -> None:
+    async def insert_artifact(self, artifact: Artifact) -> Artifact:
         query = (
             insert(ArtifactModel)
             .values({
@@ -514,12 +641,14 @@ class DatabaseStorage(
                 "rarity": artifact.rarity,
                 "image_url": artifact.image_url,
             })
-            .returning(ArtifactModel.id)
+            .returning(ArtifactModel)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                created_artifact = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise ArtifactTitleAlreadyExistError from error
+        return created_artifact.to_schema()
 
     async def get_artifact_by_id(self, artifact_id: int) -> Artifact:
         query = select(ArtifactModel).where(ArtifactModel.id == artifact_id)
@@ -540,8 +669,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return Artifacts(values=[row.to_schema() for row in result])
 
-    async def update_artifact(self, artifact: Artifact) -> None:
-        await self.get_artifact_by_id(artifact_id=artifact.id)
+    async def update_artifact(self, artifact: Artifact) -> Artifact:
         query = (
             update(ArtifactModel)
             .where(ArtifactModel.id == artifact.id)
@@ -551,16 +679,24 @@ class DatabaseStorage(
                 "rarity": artifact.rarity,
                 "image_url": artifact.image_url,
             })
+            .returning(ArtifactModel)
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_artifact = await self.session.scalar(query)
         except IntegrityError as error:
             raise ArtifactTitleAlreadyExistError from error
+        if updated_artifact is None:
+            raise ArtifactNotFoundError
+        return updated_artifact.to_schema()
 
     async def delete_artifact(self, artifact_id: int) -> None:
-        await self.get_artifact_by_id(artifact_id=artifact_id)
-        query = delete(ArtifactModel).where(ArtifactModel.id == artifact_id)
-        await self.session.execute(query)
+        query = (
+            delete(ArtifactModel).where(ArtifactModel.id == artifact_id).returning(ArtifactModel.id)
+        )
+        if await self.session.scalar(query) is None:
+            raise ArtifactNotFoundError
 
     async def add_artifact_to_mission(self, mission_id: int, artifact_id: int) -> None:
         query = insert(ArtifactMissionRelationModel).values({
@@ -686,7 +822,7 @@ class DatabaseStorage(
         )
         await self.session.execute(query)
 
-    async def insert_competency(self, competency: Competency) -> None:
+    async def insert_competency(self, competency: Competency) -> Competency:
         query = (
             insert(CompetencyModel)
             .values({
@@ -696,9 +832,13 @@ class DatabaseStorage(
             .returning(CompetencyModel.id)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                competency_id = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise CompetencyNameAlreadyExistError from error
+        return Competency(
+            id=competency_id, name=competency.name, max_level=competency.max_level, skills=[]
+        )
 
     async def get_competency_by_id(self, competency_id: int) -> Competency:
         query = (
@@ -727,8 +867,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return Competencies(values=[row.to_schema() for row in result])
 
-    async def update_competency(self, competency: Competency) -> None:
-        await self.get_competency_by_id(competency_id=competency.id)
+    async def update_competency(self, competency: Competency) -> Competency:
         query = (
             update(CompetencyModel)
             .where(CompetencyModel.id == competency.id)
@@ -736,16 +875,27 @@ class DatabaseStorage(
                 "name": competency.name,
                 "max_level": competency.max_level,
             })
+            .returning(CompetencyModel)
+            .options(selectinload(CompetencyModel.skills))
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_competency = await self.session.scalar(query)
         except IntegrityError as error:
             raise CompetencyNameAlreadyExistError from error
+        if updated_competency is None:
+            raise CompetencyNotFoundError
+        return updated_competency.to_schema()
 
     async def delete_competency(self, competency_id: int) -> None:
-        await self.get_competency_by_id(competency_id=competency_id)
-        query = delete(CompetencyModel).where(CompetencyModel.id == competency_id)
-        await self.session.execute(query)
+        query = (
+            delete(CompetencyModel)
+            .where(CompetencyModel.id == competency_id)
+            .returning(CompetencyModel.id)
+        )
+        if await self.session.scalar(query) is None:
+            raise CompetencyNotFoundError
 
     async def add_skill_to_competency(self, competency_id: int, skill_id: int) -> None:
         await self.get_competency_by_id(competency_id=competency_id)
@@ -763,7 +913,8 @@ class DatabaseStorage(
             "skill_id": skill_id,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             # Fallback in case of race condition
             raise CompetencySkillRelationAlreadyExistsError from error
@@ -775,7 +926,7 @@ class DatabaseStorage(
         )
         await self.session.execute(query)
 
-    async def insert_rank(self, rank: Rank) -> None:
+    async def insert_rank(self, rank: Rank) -> Rank:
         query = (
             insert(RankModel)
             .values({
@@ -786,9 +937,18 @@ class DatabaseStorage(
             .returning(RankModel.id)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                rank_id = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise RankNameAlreadyExistError from error
+        return Rank(
+            id=rank_id,
+            name=rank.name,
+            required_xp=rank.required_xp,
+            image_url=rank.image_url,
+            required_missions=[],
+            required_competencies=[],
+        )
 
     async def get_rank_by_id(self, rank_id: int) -> Rank:
         query = (
@@ -832,8 +992,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return Ranks(values=[row.to_schema() for row in result])
 
-    async def update_rank(self, rank: Rank) -> None:
-        await self.get_rank_by_id(rank_id=rank.id)
+    async def update_rank(self, rank: Rank) -> Rank:
         query = (
             update(RankModel)
             .where(RankModel.id == rank.id)
@@ -842,16 +1001,28 @@ class DatabaseStorage(
                 "required_xp": rank.required_xp,
                 "image_url": rank.image_url,
             })
+            .returning(RankModel)
+            .options(
+                selectinload(RankModel.required_missions),
+                selectinload(RankModel.required_competencies_rel).selectinload(
+                    RankCompetencyRequirementModel.competency
+                ),
+            )
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_rank = await self.session.scalar(query)
         except IntegrityError as error:
             raise RankNameAlreadyExistError from error
+        if updated_rank is None:
+            raise RankNotFoundError
+        return updated_rank.to_schema()
 
     async def delete_rank(self, rank_id: int) -> None:
-        await self.get_rank_by_id(rank_id=rank_id)
-        query = delete(RankModel).where(RankModel.id == rank_id)
-        await self.session.execute(query)
+        query = delete(RankModel).where(RankModel.id == rank_id).returning(RankModel.id)
+        if await self.session.scalar(query) is None:
+            raise RankNotFoundError
 
     async def add_required_competency_to_rank(
         self, rank_id: int, competency_id: int, min_level: int
@@ -874,7 +1045,8 @@ class DatabaseStorage(
             "min_level": min_level,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             # Fallback in case of race condition
             raise RankCompetencyRequirementAlreadyExistsError from error
@@ -902,7 +1074,8 @@ class DatabaseStorage(
             "mission_id": mission_id,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             # Fallback in case of race condition
             raise RankMissionRequirementAlreadyExistsError from error
@@ -914,19 +1087,21 @@ class DatabaseStorage(
         )
         await self.session.execute(query)
 
-    async def insert_skill(self, skill: Skill) -> None:
+    async def insert_skill(self, skill: Skill) -> Skill:
         query = (
             insert(SkillModel)
             .values({
                 "name": skill.name,
                 "max_level": skill.max_level,
             })
-            .returning(SkillModel.id)
+            .returning(SkillModel)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                created_skill = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise SkillNameAlreadyExistError from error
+        return created_skill.to_schema()
 
     async def get_skill_by_id(self, skill_id: int) -> Skill:
         query = select(SkillModel).where(SkillModel.id == skill_id)
@@ -947,8 +1122,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return Skills(values=[row.to_schema() for row in result])
 
-    async def update_skill(self, skill: Skill) -> None:
-        await self.get_skill_by_id(skill_id=skill.id)
+    async def update_skill(self, skill: Skill) -> Skill:
         query = (
             update(SkillModel)
             .where(SkillModel.id == skill.id)
@@ -956,16 +1130,22 @@ class DatabaseStorage(
                 "name": skill.name,
                 "max_level": skill.max_level,
             })
+            .returning(SkillModel)
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_skill = await self.session.scalar(query)
         except IntegrityError as error:
             raise SkillNameAlreadyExistError from error
+        if updated_skill is None:
+            raise SkillNotFoundError
+        return updated_skill.to_schema()
 
     async def delete_skill(self, skill_id: int) -> None:
-        await self.get_skill_by_id(skill_id=skill_id)
-        query = delete(SkillModel).where(SkillModel.id == skill_id)
-        await self.session.execute(query)
+        query = delete(SkillModel).where(SkillModel.id == skill_id).returning(SkillModel.id)
+        if await self.session.scalar(query) is None:
+            raise SkillNotFoundError
 
     async def add_user_task(self, user_login: str, user_task: UserTask) -> None:
         query = insert(UserTaskRelationModel).values({
@@ -1147,7 +1327,7 @@ class DatabaseStorage(
         )
         await self.session.execute(query)
 
-    async def insert_mission_chain(self, mission_chain: MissionChain) -> None:
+    async def insert_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
         query = (
             insert(MissionChainModel)
             .values({
@@ -1159,9 +1339,20 @@ class DatabaseStorage(
             .returning(MissionChainModel.id)
         )
         try:
-            await self.session.scalar(query)
+            async with self.session.begin_nested():
+                chain_id = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise MissionChainNameAlreadyExistError from error
+        return MissionChain(
+            id=chain_id,
+            name=mission_chain.name,
+            description=mission_chain.description,
+            reward_xp=mission_chain.reward_xp,
+            reward_mana=mission_chain.reward_mana,
+            missions=[],
+            dependencies=[],
+            mission_orders=[],
+        )
 
     async def get_mission_chain_by_id(self, chain_id: int) -> MissionChain:
         query = (
@@ -1220,7 +1411,7 @@ class DatabaseStorage(
 
         return MissionChains(values=mission_chains)
 
-    async def update_mission_chain(self, mission_chain: MissionChain) -> None:
+    async def update_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
         query = (
             update(MissionChainModel)
             .where(MissionChainModel.id == mission_chain.id)
@@ -1230,16 +1421,33 @@ class DatabaseStorage(
                 "reward_xp": mission_chain.reward_xp,
                 "reward_mana": mission_chain.reward_mana,
             })
+            .returning(MissionChainModel)
+            .options(
+                selectinload(MissionChainModel.missions),
+                selectinload(MissionChainModel.dependencies),
+            )
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_chain = await self.session.scalar(query)
         except IntegrityError as error:
             raise MissionChainNameAlreadyExistError from error
+        if updated_chain is None:
+            raise MissionChainNotFoundError
+
+        schema = updated_chain.to_schema()
+        schema.mission_orders = await self._get_mission_chain_orders(mission_chain.id)
+        return schema
 
     async def delete_mission_chain(self, chain_id: int) -> None:
-        await self.get_mission_chain_by_id(chain_id=chain_id)
-        query = delete(MissionChainModel).where(MissionChainModel.id == chain_id)
-        await self.session.execute(query)
+        query = (
+            delete(MissionChainModel)
+            .where(MissionChainModel.id == chain_id)
+            .returning(MissionChainModel.id)
+        )
+        if await self.session.scalar(query) is None:
+            raise MissionChainNotFoundError
 
     async def _get_mission_chain_orders(self, chain_id: int) -> list[MissionChainMission]:
         """Получает порядок миссий в цепочке"""
@@ -1268,7 +1476,8 @@ class DatabaseStorage(
             "order": next_order,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             raise MissionChainMissionAlreadyExistsError from error
 
@@ -1344,7 +1553,8 @@ class DatabaseStorage(
             "prerequisite_mission_id": prerequisite_mission_id,
         })
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                await self.session.execute(query)
         except IntegrityError as error:
             raise MissionDependencyAlreadyExistsError from error
 
@@ -1358,17 +1568,23 @@ class DatabaseStorage(
         )
         await self.session.execute(query)
 
-    async def insert_store_item(self, store_item: StoreItem) -> None:
-        query = insert(StoreItemModel).values({
-            "title": store_item.title,
-            "price": store_item.price,
-            "stock": store_item.stock,
-            "image_url": store_item.image_url,
-        })
+    async def insert_store_item(self, store_item: StoreItem) -> StoreItem:
+        query = (
+            insert(StoreItemModel)
+            .values({
+                "title": store_item.title,
+                "price": store_item.price,
+                "stock": store_item.stock,
+                "image_url": store_item.image_url,
+            })
+            .returning(StoreItemModel)
+        )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                created_store_item = (await self.session.execute(query)).scalar_one()
         except IntegrityError as error:
             raise StoreItemTitleAlreadyExistError from error
+        return created_store_item.to_schema()
 
     async def get_store_item_by_id(self, store_item_id: int) -> StoreItem:
         query = select(StoreItemModel).where(StoreItemModel.id == store_item_id)
@@ -1389,8 +1605,7 @@ class DatabaseStorage(
         result = await self.session.scalars(query)
         return StoreItems(values=[row.to_schema() for row in result])
 
-    async def update_store_item(self, store_item: StoreItem) -> None:
-        await self.get_store_item_by_id(store_item_id=store_item.id)
+    async def update_store_item(self, store_item: StoreItem) -> StoreItem:
         query = (
             update(StoreItemModel)
             .where(StoreItemModel.id == store_item.id)
@@ -1400,16 +1615,26 @@ class DatabaseStorage(
                 "stock": store_item.stock,
                 "image_url": store_item.image_url,
             })
+            .returning(StoreItemModel)
+            .execution_options(populate_existing=True)
         )
         try:
-            await self.session.execute(query)
+            async with self.session.begin_nested():
+                updated_store_item = await self.session.scalar(query)
         except IntegrityError as error:
             raise StoreItemTitleAlreadyExistError from error
+        if updated_store_item is None:
+            raise StoreItemNotFoundError
+        return updated_store_item.to_schema()
 
     async def delete_store_item(self, store_item_id: int) -> None:
-        await self.get_store_item_by_id(store_item_id=store_item_id)
-        query = delete(StoreItemModel).where(StoreItemModel.id == store_item_id)
-        await self.session.execute(query)
+        query = (
+            delete(StoreItemModel)
+            .where(StoreItemModel.id == store_item_id)
+            .returning(StoreItemModel.id)
+        )
+        if await self.session.scalar(query) is None:
+            raise StoreItemNotFoundError
 
     async def purchase_store_item(self, purchase: StorePurchase, mana_count: int) -> None:
         store_item_query = select(StoreItemModel).where(StoreItemModel.id == purchase.store_item_id)
@@ -1441,3 +1666,138 @@ class DatabaseStorage(
             .values({"mana": UserModel.mana - mana_count})
         )
         await self.session.execute(mana_query)
+
+    async def insert_media_object(self, media_object: MediaObject) -> None:
+        query = (
+            pg_insert(MediaObjectModel)
+            .values({
+                "digest": media_object.digest,
+                "key": media_object.key,
+                "size": media_object.size,
+                "etag": media_object.etag,
+                "content_type": media_object.content_type,
+            })
+            .on_conflict_do_nothing(index_elements=[MediaObjectModel.digest])
+        )
+        await self.session.execute(query)
+
+    async def get_media_object_by_digest(self, digest: str) -> MediaObject:
+        query = select(MediaObjectModel).where(MediaObjectModel.digest == digest)
+        result = await self.session.scalar(query)
+        if result is None:
+            raise MediaNotFoundError
+        return result.to_schema()
+
+    async def delete_media_objects(self, keys: list[str]) -> None:
+        query = delete(MediaObjectModel).where(MediaObjectModel.key.in_(keys))
+        await self.session.execute(query)
+
+    async def get_media_urls(self) -> list[str]:
+        query = union_all(
+            select(RankModel.image_url),
+            select(ArtifactModel.image_url),
+            select(StoreItemModel.image_url),
+        )
+        result = await self.session.scalars(query)
+        return [url for url in result if url]
+
+    async def insert_upload_session(self, upload_session: UploadSession) -> None:
+        query = insert(MediaUploadSessionModel).values({
+            "id": upload_session.id,
+            "key": upload_session.key,
+            "upload_id": upload_session.upload_id,
+            "file_name": upload_session.file_name,
+            "content_type": upload_session.content_type,
+            "owner_login": upload_session.owner_login,
+            "chunk_size": upload_session.chunk_size,
+        })
+        await self.session.execute(query)
+
+    async def get_upload_session(self, session_id: str) -> UploadSession:
+        query = select(MediaUploadSessionModel).where(MediaUploadSessionModel.id == session_id)
+        result = await self.session.scalar(query)
+        if result is None:
+            raise UploadSessionNotFoundError
+        return result.to_schema()
+
+    async def delete_upload_session(self, session_id: str) -> None:
+        query = delete(MediaUploadSessionModel).where(MediaUploadSessionModel.id == session_id)
+        await self.session.execute(query)
+
+    async def get_stale_upload_sessions(self, created_before: datetime) -> list[UploadSession]:
+        query = (
+            select(MediaUploadSessionModel)
+            .where(MediaUploadSessionModel.created_at < created_before)
+            .order_by(MediaUploadSessionModel.created_at)
+        )
+        result = await self.session.scalars(query)
+        return [upload_session.to_schema() for upload_session in result]
+
+    async def search(self, query: SearchQuery) -> SearchResults:
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query.text)
+        sources = {
+            SearchEntityEnum.MISSION: (
+                MissionModel.id,
+                MissionModel.title,
+                MissionModel.description,
+                MissionModel.search_vector,
+            ),
+            SearchEntityEnum.TASK: (
+                MissionTaskModel.id,
+                MissionTaskModel.title,
+                MissionTaskModel.description,
+                MissionTaskModel.search_vector,
+            ),
+            SearchEntityEnum.ARTIFACT: (
+                ArtifactModel.id,
+                ArtifactModel.title,
+                ArtifactModel.description,
+                ArtifactModel.search_vector,
+            ),
+            SearchEntityEnum.STORE_ITEM: (
+                StoreItemModel.id,
+                StoreItemModel.title,
+                literal(""),
+                StoreItemModel.search_vector,
+            ),
+        }
+        selects = [
+            select(
+                literal(entity_type.value).label("entity_type"),
+                id_column.label("id"),
+                title_column.label("title"),
+                description_column.label("description"),
+                func.ts_rank(search_vector, ts_query).label("rank"),
+            ).where(search_vector.bool_op("@@")(ts_query))
+            for entity_type, (id_column, title_column, description_column, search_vector) in (
+                sources.items()
+            )
+            if entity_type in query.entity_types
+        ]
+        matches = union_all(*selects).subquery()
+        statement = (
+            select(matches, func.count().over().label("total"))
+            .order_by(matches.c.rank.desc(), matches.c.entity_type, matches.c.id)
+            .limit(query.limit)
+            .offset(query.offset)
+        )
+        rows = (await self.session.execute(statement)).all()
+        if rows:
+            total = rows[0].total
+        elif query.offset:
+            total = await self.session.scalar(select(func.count()).select_from(matches))
+        else:
+            total = 0
+        return SearchResults(
+            values=[
+                SearchResult(
+                    entity_type=SearchEntityEnum(row.entity_type),
+                    id=row.id,
+                    title=row.title,
+                    description=row.description,
+                    rank=row.rank,
+                )
+                for row in rows
+            ],
+            total=total,
+        )
@@ -0,0 +1,67 @@
+import copy
+import functools
+import inspect
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.storages.database_storage import DatabaseStorage
+
+READ_METHOD_PREFIXES = ("get_", "list_", "search")
+
+StorageMethod = Callable[..., Coroutine[Any, Any, Any]]
+
+
+def _memoize(name: str, method: StorageMethod) -> StorageMethod:
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: "IdentityMap", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        key = (name, *(value for argument, value in arguments.items() if argument != "self"))
+        try:
+            result = self.identity_map[key]
+        except KeyError:
+            result = await method(self, *args, **kwargs)
+            self.identity_map[key] = result
+        except TypeError:
+            # Unhashable arguments bypass the map
+            return await method(self, *args, **kwargs)
+        # Use cases may reassign fields or append to nested lists of a loaded object
+        return copy.deepcopy(result)
+
+    return wrapper
+
+
+def _invalidate(method: StorageMethod) -> StorageMethod:
+    @functools.wraps(method)
+    async def wrapper(self: "IdentityMap", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self.identity_map.clear()
+
+    return wrapper
+
+
+@dataclass
+class IdentityMap:
+    identity_map: dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        for name in dir(cls):
+            if name.startswith("_"):
+                continue
+            method = getattr(cls, name)
+            if not inspect.iscoroutinefunction(method):
+                continue
+            if name.startswith(READ_METHOD_PREFIXES):
+                setattr(cls, name, _memoize(name=name, method=method))
+            else:
+                setattr(cls, name, _invalidate(method=method))
+
+
+@dataclass
+class IdentityMapStorage(IdentityMap, DatabaseStorage):
+    pass
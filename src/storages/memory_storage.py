@@ -0,0 +1,1273 @@
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from itertools import count
+from typing import Any
+
+from src.core.artifacts.exceptions import ArtifactNotFoundError, ArtifactTitleAlreadyExistError
+from src.core.artifacts.schemas import Artifact, Artifacts
+from src.core.competencies.exceptions import (
+    CompetencyLevelIncreaseTooHighError,
+    CompetencyNameAlreadyExistError,
+    CompetencyNotFoundError,
+    CompetencySkillRelationAlreadyExistsError,
+)
+from src.core.competencies.schemas import Competencies, Competency, UserCompetency
+from src.core.media.exceptions import MediaNotFoundError, UploadSessionNotFoundError
+from src.core.media.schemas import MediaObject, UploadSession
+from src.core.mission_chains.exceptions import (
+    MissionChainMissionAlreadyExistsError,
+    MissionChainNameAlreadyExistError,
+    MissionChainNotFoundError,
+    MissionDependencyAlreadyExistsError,
+)
+from src.core.mission_chains.schemas import (
+    MissionChain,
+    MissionChainMission,
+    MissionChains,
+    MissionDependency,
+)
+from src.core.missions.exceptions import (
+    MissionCompetencyRewardAlreadyExistsError,
+    MissionNameAlreadyExistError,
+    MissionNotFoundError,
+    MissionSkillRewardAlreadyExistsError,
+)
+from src.core.missions.schemas import (
+    CompetencyReward,
+    Mission,
+    MissionFilter,
+    Missions,
+    SkillReward,
+)
+from src.core.ranks.exceptions import (
+    RankCompetencyMinLevelTooHighError,
+    RankCompetencyRequirementAlreadyExistsError,
+    RankMissionRequirementAlreadyExistsError,
+    RankNameAlreadyExistError,
+    RankNotFoundError,
+)
+from src.core.ranks.schemas import Rank, RankCompetencyRequirement, Ranks
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.schemas import SearchQuery, SearchResult, SearchResults
+from src.core.seasons.exceptions import SeasonNameAlreadyExistError, SeasonNotFoundError
+from src.core.seasons.schemas import Season, Seasons
+from src.core.skills.exceptions import (
+    SkillLevelIncreaseTooHighError,
+    SkillNameAlreadyExistError,
+    SkillNotFoundError,
+)
+from src.core.skills.schemas import Skill, Skills, UserSkill
+from src.core.storages import (
+    ArtifactStorage,
+    CompetencyStorage,
+    MediaStorage,
+    MissionStorage,
+    RankStorage,
+    SearchStorage,
+    SkillStorage,
+    StoreStorage,
+    UserStorage,
+)
+from src.core.store.exceptions import (
+    InsufficientManaError,
+    StoreItemInsufficientStockError,
+    StoreItemNotFoundError,
+    StoreItemTitleAlreadyExistError,
+)
+from src.core.store.schemas import StoreItem, StoreItems, StorePurchase
+from src.core.tasks.exceptions import TaskNameAlreadyExistError, TaskNotFoundError
+from src.core.tasks.schemas import MissionTask, MissionTasks, UserTask
+from src.core.users.exceptions import UserAlreadyExistError, UserNotFoundError
+from src.core.users.schemas import CandidateUser, User
+
+DEFAULT_RANK_NAME = "Искатель"
+
+# Соотношение весов повторяет setweight A и B из поисковых колонок базы
+TITLE_MATCH_WEIGHT = 1.0
+DESCRIPTION_MATCH_WEIGHT = 0.4
+
+# Связь "многие ко многим": прямой и обратный индексы, значение хранит атрибуты связи
+Relation = dict[Any, dict[Any, Any]]
+
+
+def _link(
+    forward: Relation,
+    backward: Relation,
+    left: Hashable,
+    right: Hashable,
+    value: object,
+) -> None:
+    forward.setdefault(left, {})[right] = value
+    backward.setdefault(right, {})[left] = None
+
+
+def _unlink(forward: Relation, backward: Relation, left: Hashable, right: Hashable) -> None:
+    forward.get(left, {}).pop(right, None)
+    if not forward.get(left, True):
+        del forward[left]
+    backward.get(right, {}).pop(left, None)
+    if not backward.get(right, True):
+        del backward[right]
+
+
+def _index_add(index: Relation, key: Hashable, row_id: Hashable) -> None:
+    index.setdefault(key, {})[row_id] = None
+
+
+def _index_remove(index: Relation, key: Hashable, row_id: Hashable) -> None:
+    index.get(key, {}).pop(row_id, None)
+    if not index.get(key, True):
+        del index[key]
+
+
+def _unlink_left(forward: Relation, backward: Relation, left: Hashable) -> None:
+    for right in list(forward.get(left, {})):
+        _unlink(forward, backward, left, right)
+
+
+def _unlink_right(forward: Relation, backward: Relation, right: Hashable) -> None:
+    for left in list(backward.get(right, {})):
+        _unlink(forward, backward, left, right)
+
+
+def _search_rank(terms: list[str], title: str, description: str) -> float:
+    title, description = title.lower(), description.lower()
+    rank = 0.0
+    for term in terms:
+        if term in title:
+            rank += TITLE_MATCH_WEIGHT
+        elif term in description:
+            rank += DESCRIPTION_MATCH_WEIGHT
+        else:
+            return 0.0
+    return rank
+
+
+def _mission_matches(mission: Mission, filters: MissionFilter) -> bool:
+    return (
+        (filters.season_id is None or mission.season_id == filters.season_id)
+        and (filters.category is None or mission.category == filters.category)
+        and (
+            filters.rank_requirement is None or mission.rank_requirement == filters.rank_requirement
+        )
+        and (filters.min_reward_xp is None or mission.reward_xp >= filters.min_reward_xp)
+        and (filters.max_reward_xp is None or mission.reward_xp <= filters.max_reward_xp)
+        and (filters.min_reward_mana is None or mission.reward_mana >= filters.min_reward_mana)
+        and (filters.max_reward_mana is None or mission.reward_mana <= filters.max_reward_mana)
+    )
+
+
+@dataclass
+class InMemoryStorage(
+    UserStorage,
+    MissionStorage,
+    ArtifactStorage,
+    CompetencyStorage,
+    RankStorage,
+    SkillStorage,
+    StoreStorage,
+    MediaStorage,
+    SearchStorage,
+):
+    users: dict[str, User] = field(default_factory=dict)
+    user_logins_by_rank: Relation = field(default_factory=dict)
+    seasons: dict[int, Season] = field(default_factory=dict)
+    season_ids_by_name: dict[str, int] = field(default_factory=dict)
+    missions: dict[int, Mission] = field(default_factory=dict)
+    mission_ids_by_title: dict[str, int] = field(default_factory=dict)
+    mission_ids_by_rank: Relation = field(default_factory=dict)
+    mission_ids_by_season: Relation = field(default_factory=dict)
+    tasks: dict[int, MissionTask] = field(default_factory=dict)
+    task_ids_by_title: dict[str, int] = field(default_factory=dict)
+    artifacts: dict[int, Artifact] = field(default_factory=dict)
+    artifact_ids_by_title: dict[str, int] = field(default_factory=dict)
+    competencies: dict[int, Competency] = field(default_factory=dict)
+    competency_ids_by_name: dict[str, int] = field(default_factory=dict)
+    skills: dict[int, Skill] = field(default_factory=dict)
+    skill_ids_by_name: dict[str, int] = field(default_factory=dict)
+    ranks: dict[int, Rank] = field(default_factory=dict)
+    rank_ids_by_name: dict[str, int] = field(default_factory=dict)
+    mission_chains: dict[int, MissionChain] = field(default_factory=dict)
+    mission_chain_ids_by_name: dict[str, int] = field(default_factory=dict)
+    store_items: dict[int, StoreItem] = field(default_factory=dict)
+    store_item_ids_by_title: dict[str, int] = field(default_factory=dict)
+    media_objects: dict[str, MediaObject] = field(default_factory=dict)
+    media_digests_by_key: dict[str, str] = field(default_factory=dict)
+    upload_sessions: dict[str, UploadSession] = field(default_factory=dict)
+
+    mission_tasks: Relation = field(default_factory=dict)
+    task_missions: Relation = field(default_factory=dict)
+    user_tasks: Relation = field(default_factory=dict)
+    task_users: Relation = field(default_factory=dict)
+    mission_approvals: Relation = field(default_factory=dict)
+    user_approvals: Relation = field(default_factory=dict)
+    mission_artifacts: Relation = field(default_factory=dict)
+    artifact_missions: Relation = field(default_factory=dict)
+    user_artifacts: Relation = field(default_factory=dict)
+    artifact_users: Relation = field(default_factory=dict)
+    competency_skills: Relation = field(default_factory=dict)
+    skill_competencies: Relation = field(default_factory=dict)
+    mission_competency_rewards: Relation = field(default_factory=dict)
+    competency_reward_missions: Relation = field(default_factory=dict)
+    mission_skill_rewards: Relation = field(default_factory=dict)
+    skill_reward_missions: Relation = field(default_factory=dict)
+    rank_missions: Relation = field(default_factory=dict)
+    mission_ranks: Relation = field(default_factory=dict)
+    rank_competencies: Relation = field(default_factory=dict)
+    competency_ranks: Relation = field(default_factory=dict)
+    user_competencies: Relation = field(default_factory=dict)
+    competency_users: Relation = field(default_factory=dict)
+    user_skills: Relation = field(default_factory=dict)
+    skill_users: Relation = field(default_factory=dict)
+    chain_missions: Relation = field(default_factory=dict)
+    mission_chain_ids: Relation = field(default_factory=dict)
+    chain_dependencies: Relation = field(default_factory=dict)
+    dependency_chains: Relation = field(default_factory=dict)
+
+    sequences: dict[str, Iterator[int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Как и миграция 0022, хранилище изначально содержит базовый ранг
+        if not self.ranks:
+            rank_id = self._next_id("ranks")
+            self.ranks[rank_id] = Rank(
+                id=rank_id, name=DEFAULT_RANK_NAME, required_xp=0, image_url=""
+            )
+            self.rank_ids_by_name[DEFAULT_RANK_NAME] = rank_id
+
+    def _next_id(self, table: str) -> int:
+        return next(self.sequences.setdefault(table, count(1)))
+
+    def _get_user_row(self, login: str) -> User:
+        try:
+            return self.users[login]
+        except KeyError as error:
+            raise UserNotFoundError from error
+
+    def _get_season_row(self, season_id: int) -> Season:
+        try:
+            return self.seasons[season_id]
+        except KeyError as error:
+            raise SeasonNotFoundError from error
+
+    def _get_mission_row(self, mission_id: int) -> Mission:
+        try:
+            return self.missions[mission_id]
+        except KeyError as error:
+            raise MissionNotFoundError from error
+
+    def _get_task_row(self, task_id: int) -> MissionTask:
+        try:
+            return self.tasks[task_id]
+        except KeyError as error:
+            raise TaskNotFoundError from error
+
+    def _get_artifact_row(self, artifact_id: int) -> Artifact:
+        try:
+            return self.artifacts[artifact_id]
+        except KeyError as error:
+            raise ArtifactNotFoundError from error
+
+    def _get_competency_row(self, competency_id: int) -> Competency:
+        try:
+            return self.competencies[competency_id]
+        except KeyError as error:
+            raise CompetencyNotFoundError from error
+
+    def _get_skill_row(self, skill_id: int) -> Skill:
+        try:
+            return self.skills[skill_id]
+        except KeyError as error:
+            raise SkillNotFoundError from error
+
+    def _get_rank_row(self, rank_id: int) -> Rank:
+        try:
+            return self.ranks[rank_id]
+        except KeyError as error:
+            raise RankNotFoundError from error
+
+    def _get_mission_chain_row(self, chain_id: int) -> MissionChain:
+        try:
+            return self.mission_chains[chain_id]
+        except KeyError as error:
+            raise MissionChainNotFoundError from error
+
+    def _get_store_item_row(self, store_item_id: int) -> StoreItem:
+        try:
+            return self.store_items[store_item_id]
+        except KeyError as error:
+            raise StoreItemNotFoundError from error
+
+    def _build_competency(self, competency_id: int) -> Competency:
+        return replace(
+            self.competencies[competency_id],
+            skills=[
+                replace(self.skills[skill_id])
+                for skill_id in self.competency_skills.get(competency_id, {})
+            ],
+        )
+
+    def _build_mission(self, mission_id: int) -> Mission:
+        return replace(
+            self.missions[mission_id],
+            tasks=[
+                replace(self.tasks[task_id]) for task_id in self.mission_tasks.get(mission_id, {})
+            ],
+            reward_artifacts=[
+                replace(self.artifacts[artifact_id])
+                for artifact_id in self.mission_artifacts.get(mission_id, {})
+            ],
+            reward_competencies=[
+                CompetencyReward(
+                    competency=self._build_competency(competency_id), level_increase=level_increase
+                )
+                for competency_id, level_increase in self.mission_competency_rewards.get(
+                    mission_id, {}
+                ).items()
+            ],
+            reward_skills=[
+                SkillReward(skill=replace(self.skills[skill_id]), level_increase=level_increase)
+                for skill_id, level_increase in self.mission_skill_rewards.get(
+                    mission_id, {}
+                ).items()
+            ],
+        )
+
+    def _build_user_mission(self, mission_id: int, user_login: str) -> Mission:
+        mission = self._build_mission(mission_id)
+        completion = self.user_tasks.get(user_login, {})
+        mission.user_tasks = [
+            UserTask(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                is_completed=completion.get(task.id, False),
+            )
+            for task in mission.tasks or []
+        ]
+        return mission
+
+    def _build_rank(self, rank_id: int) -> Rank:
+        return replace(
+            self.ranks[rank_id],
+            required_missions=[
+                self._build_mission(mission_id)
+                for mission_id in self.rank_missions.get(rank_id, {})
+            ],
+            required_competencies=[
+                RankCompetencyRequirement(
+                    competency=self._build_competency(competency_id), min_level=min_level
+                )
+                for competency_id, min_level in self.rank_competencies.get(rank_id, {}).items()
+            ],
+        )
+
+    def _build_mission_chain(self, chain_id: int) -> MissionChain:
+        orders = sorted(self.chain_missions.get(chain_id, {}).items(), key=lambda item: item[1])
+        return replace(
+            self.mission_chains[chain_id],
+            missions=[
+                self._build_mission(mission_id)
+                for mission_id in self.chain_missions.get(chain_id, {})
+            ],
+            dependencies=[
+                MissionDependency(mission_id=mission_id, prerequisite_mission_id=prerequisite_id)
+                for mission_id, prerequisite_id in self.chain_dependencies.get(chain_id, {})
+            ],
+            mission_orders=[
+                MissionChainMission(mission_id=mission_id, order=order)
+                for mission_id, order in orders
+            ],
+        )
+
+    def _build_user_skills(self, login: str) -> list[UserSkill]:
+        return [
+            UserSkill(
+                id=skill_id,
+                name=self.skills[skill_id].name,
+                max_level=self.skills[skill_id].max_level,
+                user_level=level,
+            )
+            for (skill_id, _), level in self.user_skills.get(login, {}).items()
+        ]
+
+    def _build_user_competencies(self, login: str) -> list[UserCompetency]:
+        user_skills = self.user_skills.get(login, {})
+        competencies = []
+        for competency_id in self.user_competencies.get(login, {}):
+            competency = self.competencies[competency_id]
+            skills = [
+                UserSkill(
+                    id=skill_id,
+                    name=self.skills[skill_id].name,
+                    max_level=self.skills[skill_id].max_level,
+                    user_level=user_skills.get((skill_id, competency_id), 0),
+                )
+                for skill_id in self.competency_skills.get(competency_id, {})
+            ]
+            competencies.append(
+                UserCompetency(
+                    id=competency.id,
+                    name=competency.name,
+                    max_level=competency.max_level,
+                    user_level=sum(skill.user_level for skill in skills),
+                    skills=skills,
+                )
+            )
+        return competencies
+
+    def _build_user(self, login: str) -> User:
+        return replace(
+            self.users[login],
+            artifacts=[
+                replace(self.artifacts[artifact_id])
+                for artifact_id in self.user_artifacts.get(login, {})
+            ],
+            competencies=self._build_user_competencies(login),
+            skills=self._build_user_skills(login),
+        )
+
+    def _check_unique(self, index: dict[str, int], key: str, row_id: int | None = None) -> bool:
+        existing_id = index.get(key)
+        return existing_id is None or existing_id == row_id
+
+    async def insert_user(self, user: User) -> None:
+        if user.login in self.users:
+            raise UserAlreadyExistError
+        self.users[user.login] = User(
+            login=user.login,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            password=user.password,
+            role=user.role,
+            rank_id=user.rank_id,
+            exp=0,
+            mana=0,
+        )
+        _index_add(self.user_logins_by_rank, user.rank_id, user.login)
+
+    async def get_user_by_login(self, login: str) -> User:
+        self._get_user_row(login)
+        return self._build_user(login)
+
+    async def get_user_by_login_with_relations(self, login: str) -> User:
+        return await self.get_user_by_login(login=login)
+
+    async def get_candidate_by_login(self, login: str) -> CandidateUser:
+        user = self._get_user_row(login)
+        return CandidateUser(
+            login=user.login,
+            password=user.password,
+            role=user.role,
+            rank_id=user.rank_id,
+            exp=user.exp,
+            mana=user.mana,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            artifacts=[
+                replace(self.artifacts[artifact_id])
+                for artifact_id in self.user_artifacts.get(login, {})
+            ],
+            competencies=self._build_user_competencies(login),
+        )
+
+    async def list_users(self) -> list[User]:
+        return [self._build_user(login) for login in self.users]
+
+    async def get_users_by_rank(self, rank_id: int) -> list[User]:
+        return [self._build_user(login) for login in self.user_logins_by_rank.get(rank_id, {})]
+
+    async def add_competency_to_user(
+        self, user_login: str, competency_id: int, level: int = 0
+    ) -> None:
+        self._get_user_row(user_login)
+        self._get_competency_row(competency_id)
+        if competency_id not in self.user_competencies.get(user_login, {}):
+            _link(self.user_competencies, self.competency_users, user_login, competency_id, level)
+
+    async def remove_competency_from_user(self, user_login: str, competency_id: int) -> None:
+        _unlink(self.user_competencies, self.competency_users, user_login, competency_id)
+
+    async def update_user_competency_level(
+        self, user_login: str, competency_id: int, level: int
+    ) -> None:
+        if competency_id in self.user_competencies.get(user_login, {}):
+            self.user_competencies[user_login][competency_id] = level
+
+    async def add_skill_to_user(
+        self, user_login: str, skill_id: int, competency_id: int, level: int = 0
+    ) -> None:
+        self._get_user_row(user_login)
+        self._get_skill_row(skill_id)
+        self._get_competency_row(competency_id)
+        if (skill_id, competency_id) not in self.user_skills.get(user_login, {}):
+            _link(self.user_skills, self.skill_users, user_login, (skill_id, competency_id), level)
+
+    async def remove_skill_from_user(
+        self, user_login: str, skill_id: int, competency_id: int
+    ) -> None:
+        _unlink(self.user_skills, self.skill_users, user_login, (skill_id, competency_id))
+
+    async def update_user_skill_level(
+        self, user_login: str, skill_id: int, competency_id: int, level: int
+    ) -> None:
+        if (skill_id, competency_id) in self.user_skills.get(user_login, {}):
+            self.user_skills[user_login][skill_id, competency_id] = level
+
+    async def update_user(self, user: User) -> None:
+        existing = self.users.get(user.login)
+        if existing is None:
+            return
+        _index_remove(self.user_logins_by_rank, existing.rank_id, user.login)
+        self.users[user.login] = replace(
+            existing,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            password=user.password,
+            role=user.role,
+            rank_id=user.rank_id,
+            exp=user.exp,
+            mana=user.mana,
+        )
+        _index_add(self.user_logins_by_rank, user.rank_id, user.login)
+
+    async def insert_season(self, season: Season) -> Season:
+        if not self._check_unique(self.season_ids_by_name, season.name):
+            raise SeasonNameAlreadyExistError
+        season_id = self._next_id("seasons")
+        self.seasons[season_id] = replace(season, id=season_id)
+        self.season_ids_by_name[season.name] = season_id
+        return replace(self.seasons[season_id])
+
+    async def get_season_by_name(self, name: str) -> Season:
+        try:
+            return replace(self.seasons[self.season_ids_by_name[name]])
+        except KeyError as error:
+            raise SeasonNotFoundError from error
+
+    async def get_season_by_id(self, season_id: int) -> Season:
+        return replace(self._get_season_row(season_id))
+
+    async def list_seasons(self) -> Seasons:
+        return Seasons(values=[replace(season) for season in self.seasons.values()])
+
+    async def update_season(self, branch: Season) -> Season:
+        existing = self._get_season_row(branch.id)
+        if not self._check_unique(self.season_ids_by_name, branch.name, branch.id):
+            raise SeasonNameAlreadyExistError
+        del self.season_ids_by_name[existing.name]
+        self.seasons[branch.id] = replace(branch)
+        self.season_ids_by_name[branch.name] = branch.id
+        return replace(self.seasons[branch.id])
+
+    async def delete_season(self, season_id: int) -> None:
+        season = self._get_season_row(season_id)
+        for mission_id in list(self.mission_ids_by_season.get(season_id, {})):
+            await self.delete_mission(mission_id=mission_id)
+        del self.seasons[season_id]
+        del self.season_ids_by_name[season.name]
+
+    async def insert_mission(self, mission: Mission) -> Mission:
+        if not self._check_unique(self.mission_ids_by_title, mission.title):
+            raise MissionNameAlreadyExistError
+        self._get_season_row(mission.season_id)
+        mission_id = self._next_id("missions")
+        self.missions[mission_id] = Mission(
+            id=mission_id,
+            title=mission.title,
+            description=mission.description,
+            reward_xp=mission.reward_xp,
+            reward_mana=mission.reward_mana,
+            rank_requirement=mission.rank_requirement,
+            season_id=mission.season_id,
+            category=mission.category,
+        )
+        self.mission_ids_by_title[mission.title] = mission_id
+        _index_add(self.mission_ids_by_rank, mission.rank_requirement, mission_id)
+        _index_add(self.mission_ids_by_season, mission.season_id, mission_id)
+        return self._build_mission(mission_id)
+
+    async def get_mission_by_id(self, mission_id: int) -> Mission:
+        self._get_mission_row(mission_id)
+        return self._build_mission(mission_id)
+
+    async def get_mission_by_title(self, title: str) -> Mission:
+        try:
+            return self._build_mission(self.mission_ids_by_title[title])
+        except KeyError as error:
+            raise MissionNotFoundError from error
+
+    async def get_mission_by_task(self, task_id: int) -> Mission:
+        for mission_id in self.task_missions.get(task_id, {}):
+            return self._build_mission(mission_id)
+        raise MissionNotFoundError
+
+    async def list_missions(self, filters: MissionFilter) -> Missions:
+        if filters.season_id is not None:
+            mission_ids = self.mission_ids_by_season.get(filters.season_id, {})
+        elif filters.rank_requirement is not None:
+            mission_ids = self.mission_ids_by_rank.get(filters.rank_requirement, {})
+        else:
+            mission_ids = self.missions
+        rows = sorted(
+            (
+                self.missions[mission_id]
+                for mission_id in mission_ids
+                if _mission_matches(mission=self.missions[mission_id], filters=filters)
+            ),
+            key=lambda row: row.id,
+        )
+        # Stable sort keeps ids ascending among equal keys, as the database ORDER BY does
+        rows.sort(key=lambda row: getattr(row, filters.sort_by), reverse=filters.descending)
+        end = None if filters.limit is None else filters.offset + filters.limit
+        return Missions(
+            values=[self._build_mission(row.id) for row in rows[filters.offset : end]],
+            total=len(rows),
+        )
+
+    async def get_missions_by_rank(self, rank_id: int) -> Missions:
+        return Missions(
+            values=[
+                self._build_mission(mission_id)
+                for mission_id in self.mission_ids_by_rank.get(rank_id, {})
+            ]
+        )
+
+    async def update_mission(self, mission: Mission) -> Mission:
+        existing = self._get_mission_row(mission.id)
+        if not self._check_unique(self.mission_ids_by_title, mission.title, mission.id):
+            raise MissionNameAlreadyExistError
+        self._get_season_row(mission.season_id)
+        del self.mission_ids_by_title[existing.title]
+        _index_remove(self.mission_ids_by_rank, existing.rank_requirement, mission.id)
+        _index_remove(self.mission_ids_by_season, existing.season_id, mission.id)
+        self.missions[mission.id] = replace(
+            existing,
+            title=mission.title,
+            description=mission.description,
+            reward_xp=mission.reward_xp,
+            reward_mana=mission.reward_mana,
+            rank_requirement=mission.rank_requirement,
+            season_id=mission.season_id,
+            category=mission.category,
+        )
+        self.mission_ids_by_title[mission.title] = mission.id
+        _index_add(self.mission_ids_by_rank, mission.rank_requirement, mission.id)
+        _index_add(self.mission_ids_by_season, mission.season_id, mission.id)
+        return self._build_mission(mission.id)
+
+    async def delete_mission(self, mission_id: int) -> None:
+        mission = self._get_mission_row(mission_id)
+        _unlink_left(self.mission_tasks, self.task_missions, mission_id)
+        _unlink_left(self.mission_artifacts, self.artifact_missions, mission_id)
+        _unlink_left(self.mission_competency_rewards, self.competency_reward_missions, mission_id)
+        _unlink_left(self.mission_skill_rewards, self.skill_reward_missions, mission_id)
+        _unlink_left(self.mission_approvals, self.user_approvals, mission_id)
+        _unlink_right(self.rank_missions, self.mission_ranks, mission_id)
+        _unlink_right(self.chain_missions, self.mission_chain_ids, mission_id)
+        for dependency in list(self.dependency_chains):
+            if mission_id in dependency:
+                _unlink_right(self.chain_dependencies, self.dependency_chains, dependency)
+        _index_remove(self.mission_ids_by_rank, mission.rank_requirement, mission_id)
+        _index_remove(self.mission_ids_by_season, mission.season_id, mission_id)
+        del self.mission_ids_by_title[mission.title]
+        del self.missions[mission_id]
+
+    async def insert_mission_task(self, task: MissionTask) -> MissionTask:
+        if not self._check_unique(self.task_ids_by_title, task.title):
+            raise TaskNameAlreadyExistError
+        task_id = self._next_id("tasks")
+        self.tasks[task_id] = MissionTask(
+            id=task_id, title=task.title, description=task.description
+        )
+        self.task_ids_by_title[task.title] = task_id
+        return replace(self.tasks[task_id])
+
+    async def get_mission_task_by_id(self, task_id: int) -> MissionTask:
+        return replace(self._get_task_row(task_id))
+
+    async def get_mission_task_by_title(self, title: str) -> MissionTask:
+        try:
+            return replace(self.tasks[self.task_ids_by_title[title]])
+        except KeyError as error:
+            raise TaskNotFoundError from error
+
+    async def list_mission_tasks(self) -> MissionTasks:
+        return MissionTasks(values=[replace(task) for task in self.tasks.values()])
+
+    async def update_mission_task(self, task: MissionTask) -> MissionTask:
+        existing = self._get_task_row(task.id)
+        if not self._check_unique(self.task_ids_by_title, task.title, task.id):
+            raise TaskNameAlreadyExistError
+        del self.task_ids_by_title[existing.title]
+        self.tasks[task.id] = MissionTask(
+            id=task.id, title=task.title, description=task.description
+        )
+        self.task_ids_by_title[task.title] = task.id
+        return replace(self.tasks[task.id])
+
+    async def delete_mission_task(self, task_id: int) -> None:
+        task = self._get_task_row(task_id)
+        _unlink_right(self.mission_tasks, self.task_missions, task_id)
+        _unlink_right(self.user_tasks, self.task_users, task_id)
+        del self.task_ids_by_title[task.title]
+        del self.tasks[task_id]
+
+    async def add_task_to_mission(self, mission_id: int, task_id: int) -> None:
+        self._get_mission_row(mission_id)
+        self._get_task_row(task_id)
+        _link(self.mission_tasks, self.task_missions, mission_id, task_id, None)
+
+    async def remove_task_from_mission(self, mission_id: int, task_id: int) -> None:
+        _unlink(self.mission_tasks, self.task_missions, mission_id, task_id)
+
+    async def add_competency_reward_to_mission(
+        self, mission_id: int, competency_id: int, level_increase: int
+    ) -> None:
+        self._get_mission_row(mission_id)
+        competency = self._get_competency_row(competency_id)
+        if level_increase < 1 or level_increase > competency.max_level:
+            raise CompetencyLevelIncreaseTooHighError
+        if competency_id in self.mission_competency_rewards.get(mission_id, {}):
+            raise MissionCompetencyRewardAlreadyExistsError
+        _link(
+            self.mission_competency_rewards,
+            self.competency_reward_missions,
+            mission_id,
+            competency_id,
+            level_increase,
+        )
+
+    async def remove_competency_reward_from_mission(
+        self, mission_id: int, competency_id: int
+    ) -> None:
+        _unlink(
+            self.mission_competency_rewards,
+            self.competency_reward_missions,
+            mission_id,
+            competency_id,
+        )
+
+    async def add_skill_reward_to_mission(
+        self, mission_id: int, skill_id: int, level_increase: int
+    ) -> None:
+        self._get_mission_row(mission_id)
+        skill = self._get_skill_row(skill_id)
+        if level_increase < 1 or level_increase > skill.max_level:
+            raise SkillLevelIncreaseTooHighError
+        if skill_id in self.mission_skill_rewards.get(mission_id, {}):
+            raise MissionSkillRewardAlreadyExistsError
+        _link(
+            self.mission_skill_rewards,
+            self.skill_reward_missions,
+            mission_id,
+            skill_id,
+            level_increase,
+        )
+
+    async def remove_skill_reward_from_mission(self, mission_id: int, skill_id: int) -> None:
+        _unlink(self.mission_skill_rewards, self.skill_reward_missions, mission_id, skill_id)
+
+    async def add_user_task(self, user_login: str, user_task: UserTask) -> None:
+        self._get_user_row(user_login)
+        self._get_task_row(user_task.id)
+        if user_task.id not in self.user_tasks.get(user_login, {}):
+            _link(
+                self.user_tasks, self.task_users, user_login, user_task.id, user_task.is_completed
+            )
+
+    async def get_user_mission(self, mission_id: int, user_login: str) -> Mission:
+        self._get_mission_row(mission_id)
+        return self._build_user_mission(mission_id=mission_id, user_login=user_login)
+
+    async def get_user_missions(self, user_login: str) -> Missions:
+        mission_ids = sorted({
+            mission_id
+            for task_id in self.user_tasks.get(user_login, {})
+            for mission_id in self.task_missions.get(task_id, {})
+        })
+        missions = []
+        for mission_id in mission_ids:
+            mission = self._build_user_mission(mission_id=mission_id, user_login=user_login)
+            mission.is_approved = self.mission_approvals.get(mission_id, {}).get(user_login, False)
+            missions.append(mission)
+        return Missions(values=missions)
+
+    async def approve_user_mission(self, mission_id: int, user_login: str) -> None:
+        self._get_mission_row(mission_id)
+        self._get_user_row(user_login)
+        _link(self.mission_approvals, self.user_approvals, mission_id, user_login, True)  # noqa: FBT003
+
+    async def update_user_task_completion(self, task_id: int, user_login: str) -> None:
+        if task_id in self.user_tasks.get(user_login, {}):
+            self.user_tasks[user_login][task_id] = True
+
+    async def update_user_exp_and_mana(
+        self, user_login: str, exp_increase: int, mana_increase: int
+    ) -> None:
+        user = self.users.get(user_login)
+        if user is not None:
+            user.exp += exp_increase
+            user.mana += mana_increase
+
+    async def insert_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
+        if not self._check_unique(self.mission_chain_ids_by_name, mission_chain.name):
+            raise MissionChainNameAlreadyExistError
+        chain_id = self._next_id("mission_chains")
+        self.mission_chains[chain_id] = MissionChain(
+            id=chain_id,
+            name=mission_chain.name,
+            description=mission_chain.description,
+            reward_xp=mission_chain.reward_xp,
+            reward_mana=mission_chain.reward_mana,
+        )
+        self.mission_chain_ids_by_name[mission_chain.name] = chain_id
+        return self._build_mission_chain(chain_id)
+
+    async def get_mission_chain_by_id(self, chain_id: int) -> MissionChain:
+        self._get_mission_chain_row(chain_id)
+        return self._build_mission_chain(chain_id)
+
+    async def get_mission_chain_by_name(self, name: str) -> MissionChain:
+        try:
+            return self._build_mission_chain(self.mission_chain_ids_by_name[name])
+        except KeyError as error:
+            raise MissionChainNotFoundError from error
+
+    async def list_mission_chains(self) -> MissionChains:
+        return MissionChains(
+            values=[self._build_mission_chain(chain_id) for chain_id in self.mission_chains]
+        )
+
+    async def update_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
+        existing = self._get_mission_chain_row(mission_chain.id)
+        if not self._check_unique(
+            self.mission_chain_ids_by_name, mission_chain.name, mission_chain.id
+        ):
+            raise MissionChainNameAlreadyExistError
+        del self.mission_chain_ids_by_name[existing.name]
+        self.mission_chains[mission_chain.id] = replace(
+            existing,
+            name=mission_chain.name,
+            description=mission_chain.description,
+            reward_xp=mission_chain.reward_xp,
+            reward_mana=mission_chain.reward_mana,
+        )
+        self.mission_chain_ids_by_name[mission_chain.name] = mission_chain.id
+        return self._build_mission_chain(mission_chain.id)
+
+    async def delete_mission_chain(self, chain_id: int) -> None:
+        mission_chain = self._get_mission_chain_row(chain_id)
+        _unlink_left(self.chain_missions, self.mission_chain_ids, chain_id)
+        _unlink_left(self.chain_dependencies, self.dependency_chains, chain_id)
+        del self.mission_chain_ids_by_name[mission_chain.name]
+        del self.mission_chains[chain_id]
+
+    async def add_mission_to_chain(self, chain_id: int, mission_id: int) -> None:
+        self._get_mission_chain_row(chain_id)
+        self._get_mission_row(mission_id)
+        orders = self.chain_missions.get(chain_id, {})
+        if mission_id in orders:
+            raise MissionChainMissionAlreadyExistsError
+        next_order = max(orders.values(), default=0) + 1
+        _link(self.chain_missions, self.mission_chain_ids, chain_id, mission_id, next_order)
+
+    async def remove_mission_from_chain(self, chain_id: int, mission_id: int) -> None:
+        _unlink(self.chain_missions, self.mission_chain_ids, chain_id, mission_id)
+
+    async def update_mission_order_in_chain(
+        self, chain_id: int, mission_id: int, new_order: int
+    ) -> None:
+        orders = self.chain_missions.get(chain_id, {})
+        current_order = orders.get(mission_id)
+        if current_order is None:
+            raise MissionNotFoundError
+        if current_order == new_order:
+            return
+        for other_id, order in orders.items():
+            if current_order < order <= new_order:
+                orders[other_id] = order - 1
+            elif new_order <= order < current_order:
+                orders[other_id] = order + 1
+        orders[mission_id] = new_order
+
+    async def add_mission_dependency(
+        self, chain_id: int, mission_id: int, prerequisite_mission_id: int
+    ) -> None:
+        self._get_mission_chain_row(chain_id)
+        self._get_mission_row(mission_id)
+        self._get_mission_row(prerequisite_mission_id)
+        dependency = (mission_id, prerequisite_mission_id)
+        if dependency in self.chain_dependencies.get(chain_id, {}):
+            raise MissionDependencyAlreadyExistsError
+        _link(self.chain_dependencies, self.dependency_chains, chain_id, dependency, None)
+
+    async def remove_mission_dependency(
+        self, chain_id: int, mission_id: int, prerequisite_mission_id: int
+    ) -> None:
+        _unlink(
+            self.chain_dependencies,
+            self.dependency_chains,
+            chain_id,
+            (mission_id, prerequisite_mission_id),
+        )
+
+    async def insert_artifact(self, artifact: Artifact) -> Artifact:
+        if not self._check_unique(self.artifact_ids_by_title, artifact.title):
+            raise ArtifactTitleAlreadyExistError
+        artifact_id = self._next_id("artifacts")
+        self.artifacts[artifact_id] = replace(artifact, id=artifact_id)
+        self.artifact_ids_by_title[artifact.title] = artifact_id
+        return replace(self.artifacts[artifact_id])
+
+    async def get_artifact_by_id(self, artifact_id: int) -> Artifact:
+        return replace(self._get_artifact_row(artifact_id))
+
+    async def get_artifact_by_title(self, title: str) -> Artifact:
+        try:
+            return replace(self.artifacts[self.artifact_ids_by_title[title]])
+        except KeyError as error:
+            raise ArtifactNotFoundError from error
+
+    async def list_artifacts(self) -> Artifacts:
+        return Artifacts(values=[replace(artifact) for artifact in self.artifacts.values()])
+
+    async def update_artifact(self, artifact: Artifact) -> Artifact:
+        existing = self._get_artifact_row(artifact.id)
+        if not self._check_unique(self.artifact_ids_by_title, artifact.title, artifact.id):
+            raise ArtifactTitleAlreadyExistError
+        del self.artifact_ids_by_title[existing.title]
+        self.artifacts[artifact.id] = replace(artifact)
+        self.artifact_ids_by_title[artifact.title] = artifact.id
+        return replace(self.artifacts[artifact.id])
+
+    async def delete_artifact(self, artifact_id: int) -> None:
+        artifact = self._get_artifact_row(artifact_id)
+        _unlink_right(self.mission_artifacts, self.artifact_missions, artifact_id)
+        _unlink_right(self.user_artifacts, self.artifact_users, artifact_id)
+        del self.artifact_ids_by_title[artifact.title]
+        del self.artifacts[artifact_id]
+
+    async def add_artifact_to_mission(self, mission_id: int, artifact_id: int) -> None:
+        self._get_mission_row(mission_id)
+        self._get_artifact_row(artifact_id)
+        _link(self.mission_artifacts, self.artifact_missions, mission_id, artifact_id, None)
+
+    async def remove_artifact_from_mission(self, mission_id: int, artifact_id: int) -> None:
+        _unlink(self.mission_artifacts, self.artifact_missions, mission_id, artifact_id)
+
+    async def add_artifact_to_user(self, user_login: str, artifact_id: int) -> None:
+        self._get_user_row(user_login)
+        self._get_artifact_row(artifact_id)
+        _link(self.user_artifacts, self.artifact_users, user_login, artifact_id, None)
+
+    async def remove_artifact_from_user(self, user_login: str, artifact_id: int) -> None:
+        _unlink(self.user_artifacts, self.artifact_users, user_login, artifact_id)
+
+    async def insert_competency(self, competency: Competency) -> Competency:
+        if not self._check_unique(self.competency_ids_by_name, competency.name):
+            raise CompetencyNameAlreadyExistError
+        competency_id = self._next_id("competencies")
+        self.competencies[competency_id] = Competency(
+            id=competency_id, name=competency.name, max_level=competency.max_level
+        )
+        self.competency_ids_by_name[competency.name] = competency_id
+        return self._build_competency(competency_id)
+
+    async def get_competency_by_id(self, competency_id: int) -> Competency:
+        self._get_competency_row(competency_id)
+        return self._build_competency(competency_id)
+
+    async def get_competency_by_name(self, name: str) -> Competency:
+        try:
+            return self._build_competency(self.competency_ids_by_name[name])
+        except KeyError as error:
+            raise CompetencyNotFoundError from error
+
+    async def get_competency_by_skill_id(self, skill_id: int) -> Competency:
+        for competency_id in self.skill_competencies.get(skill_id, {}):
+            return self._build_competency(competency_id)
+        raise CompetencyNotFoundError
+
+    async def list_competencies(self) -> Competencies:
+        return Competencies(
+            values=[self._build_competency(competency_id) for competency_id in self.competencies]
+        )
+
+    async def update_competency(self, competency: Competency) -> Competency:
+        existing = self._get_competency_row(competency.id)
+        if not self._check_unique(self.competency_ids_by_name, competency.name, competency.id):
+            raise CompetencyNameAlreadyExistError
+        del self.competency_ids_by_name[existing.name]
+        self.competencies[competency.id] = Competency(
+            id=competency.id, name=competency.name, max_level=competency.max_level
+        )
+        self.competency_ids_by_name[competency.name] = competency.id
+        return self._build_competency(competency.id)
+
+    async def delete_competency(self, competency_id: int) -> None:
+        competency = self._get_competency_row(competency_id)
+        _unlink_left(self.competency_skills, self.skill_competencies, competency_id)
+        _unlink_right(
+            self.mission_competency_rewards, self.competency_reward_missions, competency_id
+        )
+        _unlink_right(self.rank_competencies, self.competency_ranks, competency_id)
+        _unlink_right(self.user_competencies, self.competency_users, competency_id)
+        for skill_key in list(self.skill_users):
+            if skill_key[1] == competency_id:
+                _unlink_right(self.user_skills, self.skill_users, skill_key)
+        del self.competency_ids_by_name[competency.name]
+        del self.competencies[competency_id]
+
+    async def add_skill_to_competency(self, competency_id: int, skill_id: int) -> None:
+        self._get_competency_row(competency_id)
+        self._get_skill_row(skill_id)
+        if skill_id in self.competency_skills.get(competency_id, {}):
+            raise CompetencySkillRelationAlreadyExistsError
+        _link(self.competency_skills, self.skill_competencies, competency_id, skill_id, None)
+
+    async def remove_skill_from_competency(self, competency_id: int, skill_id: int) -> None:
+        _unlink(self.competency_skills, self.skill_competencies, competency_id, skill_id)
+
+    async def insert_rank(self, rank: Rank) -> Rank:
+        if not self._check_unique(self.rank_ids_by_name, rank.name):
+            raise RankNameAlreadyExistError
+        rank_id = self._next_id("ranks")
+        self.ranks[rank_id] = Rank(
+            id=rank_id, name=rank.name, required_xp=rank.required_xp, image_url=rank.image_url
+        )
+        self.rank_ids_by_name[rank.name] = rank_id
+        return self._build_rank(rank_id)
+
+    async def get_rank_by_id(self, rank_id: int) -> Rank:
+        self._get_rank_row(rank_id)
+        return self._build_rank(rank_id)
+
+    async def get_rank_by_name(self, name: str) -> Rank:
+        try:
+            return self._build_rank(self.rank_ids_by_name[name])
+        except KeyError as error:
+            raise RankNotFoundError from error
+
+    async def list_ranks(self) -> Ranks:
+        return Ranks(values=[self._build_rank(rank_id) for rank_id in self.ranks])
+
+    async def update_rank(self, rank: Rank) -> Rank:
+        existing = self._get_rank_row(rank.id)
+        if not self._check_unique(self.rank_ids_by_name, rank.name, rank.id):
+            raise RankNameAlreadyExistError
+        del self.rank_ids_by_name[existing.name]
+        self.ranks[rank.id] = Rank(
+            id=rank.id, name=rank.name, required_xp=rank.required_xp, image_url=rank.image_url
+        )
+        self.rank_ids_by_name[rank.name] = rank.id
+        return self._build_rank(rank.id)
+
+    async def delete_rank(self, rank_id: int) -> None:
+        rank = self._get_rank_row(rank_id)
+        _unlink_left(self.rank_missions, self.mission_ranks, rank_id)
+        _unlink_left(self.rank_competencies, self.competency_ranks, rank_id)
+        del self.rank_ids_by_name[rank.name]
+        del self.ranks[rank_id]
+
+    async def add_required_mission_to_rank(self, rank_id: int, mission_id: int) -> None:
+        self._get_rank_row(rank_id)
+        self._get_mission_row(mission_id)
+        if mission_id in self.rank_missions.get(rank_id, {}):
+            raise RankMissionRequirementAlreadyExistsError
+        _link(self.rank_missions, self.mission_ranks, rank_id, mission_id, None)
+
+    async def remove_required_mission_from_rank(self, rank_id: int, mission_id: int) -> None:
+        _unlink(self.rank_missions, self.mission_ranks, rank_id, mission_id)
+
+    async def add_required_competency_to_rank(
+        self, rank_id: int, competency_id: int, min_level: int
+    ) -> None:
+        self._get_rank_row(rank_id)
+        competency = self._get_competency_row(competency_id)
+        if min_level < 1 or min_level > competency.max_level:
+            raise RankCompetencyMinLevelTooHighError
+        if competency_id in self.rank_competencies.get(rank_id, {}):
+            raise RankCompetencyRequirementAlreadyExistsError
+        _link(self.rank_competencies, self.competency_ranks, rank_id, competency_id, min_level)
+
+    async def remove_required_competency_from_rank(self, rank_id: int, competency_id: int) -> None:
+        _unlink(self.rank_competencies, self.competency_ranks, rank_id, competency_id)
+
+    async def insert_skill(self, skill: Skill) -> Skill:
+        if not self._check_unique(self.skill_ids_by_name, skill.name):
+            raise SkillNameAlreadyExistError
+        skill_id = self._next_id("skills")
+        self.skills[skill_id] = Skill(id=skill_id, name=skill.name, max_level=skill.max_level)
+        self.skill_ids_by_name[skill.name] = skill_id
+        return replace(self.skills[skill_id])
+
+    async def get_skill_by_id(self, skill_id: int) -> Skill:
+        return replace(self._get_skill_row(skill_id))
+
+    async def get_skill_by_name(self, name: str) -> Skill:
+        try:
+            return replace(self.skills[self.skill_ids_by_name[name]])
+        except KeyError as error:
+            raise SkillNotFoundError from error
+
+    async def list_skills(self) -> Skills:
+        return Skills(values=[replace(skill) for skill in self.skills.values()])
+
+    async def update_skill(self, skill: Skill) -> Skill:
+        existing = self._get_skill_row(skill.id)
+        if not self._check_unique(self.skill_ids_by_name, skill.name, skill.id):
+            raise SkillNameAlreadyExistError
+        del self.skill_ids_by_name[existing.name]
+        self.skills[skill.id] = Skill(id=skill.id, name=skill.name, max_level=skill.max_level)
+        self.skill_ids_by_name[skill.name] = skill.id
+        return replace(self.skills[skill.id])
+
+    async def delete_skill(self, skill_id: int) -> None:
+        skill = self._get_skill_row(skill_id)
+        _unlink_right(self.competency_skills, self.skill_competencies, skill_id)
+        _unlink_right(self.mission_skill_rewards, self.skill_reward_missions, skill_id)
+        for skill_key in list(self.skill_users):
+            if skill_key[0] == skill_id:
+                _unlink_right(self.user_skills, self.skill_users, skill_key)
+        del self.skill_ids_by_name[skill.name]
+        del self.skills[skill_id]
+
+    async def insert_store_item(self, store_item: StoreItem) -> StoreItem:
+        if not self._check_unique(self.store_item_ids_by_title, store_item.title):
+            raise StoreItemTitleAlreadyExistError
+        store_item_id = self._next_id("store_items")
+        self.store_items[store_item_id] = replace(store_item, id=store_item_id)
+        self.store_item_ids_by_title[store_item.title] = store_item_id
+        return replace(self.store_items[store_item_id])
+
+    async def get_store_item_by_id(self, store_item_id: int) -> StoreItem:
+        return replace(self._get_store_item_row(store_item_id))
+
+    async def get_store_item_by_title(self, title: str) -> StoreItem:
+        try:
+            return replace(self.store_items[self.store_item_ids_by_title[title]])
+        except KeyError as error:
+            raise StoreItemNotFoundError from error
+
+    async def list_store_items(self) -> StoreItems:
+        return StoreItems(values=[replace(store_item) for store_item in self.store_items.values()])
+
+    async def update_store_item(self, store_item: StoreItem) -> StoreItem:
+        existing = self._get_store_item_row(store_item.id)
+        if not self._check_unique(self.store_item_ids_by_title, store_item.title, store_item.id):
+            raise StoreItemTitleAlreadyExistError
+        del self.store_item_ids_by_title[existing.title]
+        self.store_items[store_item.id] = replace(store_item)
+        self.store_item_ids_by_title[store_item.title] = store_item.id
+        return replace(self.store_items[store_item.id])
+
+    async def delete_store_item(self, store_item_id: int) -> None:
+        store_item = self._get_store_item_row(store_item_id)
+        del self.store_item_ids_by_title[store_item.title]
+        del self.store_items[store_item_id]
+
+    async def purchase_store_item(self, purchase: StorePurchase, mana_count: int) -> None:
+        store_item = self._get_store_item_row(purchase.store_item_id)
+        if store_item.stock <= 0:
+            raise StoreItemInsufficientStockError
+        user = self._get_user_row(purchase.user_login)
+        if user.mana < mana_count:
+            raise InsufficientManaError
+        store_item.stock -= 1
+        user.mana -= mana_count
+
+    async def insert_media_object(self, media_object: MediaObject) -> None:
+        if (
+            media_object.digest in self.media_objects
+            or media_object.key in self.media_digests_by_key
+        ):
+            return
+        self.media_objects[media_object.digest] = replace(media_object)
+        self.media_digests_by_key[media_object.key] = media_object.digest
+
+    async def get_media_object_by_digest(self, digest: str) -> MediaObject:
+        try:
+            return replace(self.media_objects[digest])
+        except KeyError as error:
+            raise MediaNotFoundError from error
+
+    async def delete_media_objects(self, keys: list[str]) -> None:
+        for key in keys:
+            digest = self.media_digests_by_key.pop(key, None)
+            if digest is not None:
+                del self.media_objects[digest]
+
+    async def get_media_urls(self) -> list[str]:
+        items: list[Rank | Artifact | StoreItem] = [
+            *self.ranks.values(),
+            *self.artifacts.values(),
+            *self.store_items.values(),
+        ]
+        return [item.image_url for item in items if item.image_url]
+
+    async def insert_upload_session(self, upload_session: UploadSession) -> None:
+        self.upload_sessions[upload_session.id] = replace(
+            upload_session, created_at=datetime.now(UTC)
+        )
+
+    async def get_upload_session(self, session_id: str) -> UploadSession:
+        try:
+            return replace(self.upload_sessions[session_id])
+        except KeyError as error:
+            raise UploadSessionNotFoundError from error
+
+    async def delete_upload_session(self, session_id: str) -> None:
+        self.upload_sessions.pop(session_id, None)
+
+    async def get_stale_upload_sessions(self, created_before: datetime) -> list[UploadSession]:
+        stale_sessions = [
+            replace(upload_session)
+            for upload_session in self.upload_sessions.values()
+            if upload_session.created_at is not None and upload_session.created_at < created_before
+        ]
+        return sorted(
+            stale_sessions, key=lambda upload_session: upload_session.created_at or created_before
+        )
+
+    async def search(self, query: SearchQuery) -> SearchResults:
+        terms = query.text.lower().split()
+        candidates: list[tuple[SearchEntityEnum, int, str, str]] = []
+        if SearchEntityEnum.MISSION in query.entity_types:
+            candidates += [
+                (SearchEntityEnum.MISSION, row.id, row.title, row.description)
+                for row in self.missions.values()
+            ]
+        if SearchEntityEnum.TASK in query.entity_types:
+            candidates += [
+                (SearchEntityEnum.TASK, row.id, row.title, row.description)
+                for row in self.tasks.values()
+            ]
+        if SearchEntityEnum.ARTIFACT in query.entity_types:
+            candidates += [
+                (SearchEntityEnum.ARTIFACT, row.id, row.title, row.description)
+                for row in self.artifacts.values()
+            ]
+        if SearchEntityEnum.STORE_ITEM in query.entity_types:
+            candidates += [
+                (SearchEntityEnum.STORE_ITEM, row.id, row.title, "")
+                for row in self.store_items.values()
+            ]
+        matches = [
+            SearchResult(
+                entity_type=entity_type,
+                id=row_id,
+                title=title,
+                description=description,
+                rank=_search_rank(terms=terms, title=title, description=description),
+            )
+            for entity_type, row_id, title, description in candidates
+        ]
+        matches = sorted(
+            (match for match in matches if match.rank > 0),
+            key=lambda match: (-match.rank, match.entity_type, match.id),
+        )
+        return SearchResults(
+            values=matches[query.offset : query.offset + query.limit], total=len(matches)
+        )
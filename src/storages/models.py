@@ -1,11 +1,23 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, PrimaryKeyConstraint, String, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from src.core.artifacts.enums import ArtifactRarityEnum
 from src.core.artifacts.schemas import Artifact
 from src.core.competencies.schemas import Competency, UserCompetency
+from src.core.media.schemas import MediaObject, UploadSession
 from src.core.mission_chains.schemas import MissionChain, MissionDependency
 from src.core.missions.enums import MissionCategoryEnum
 from src.core.missions.schemas import CompetencyReward, Mission, SkillReward
@@ -17,10 +29,22 @@ from src.core.tasks.schemas import MissionTask, UserTask
 from src.core.users.enums import UserRoleEnum
 from src.core.users.schemas import CandidateUser, User
 
+SEARCH_CONFIG = "russian"
+
 
 class Base(DeclarativeBase): ...
 
 
+def search_vector_column(title: str, description: str | None = None) -> Mapped[str]:
+    # Совпадения в названии весят больше, чем в описании
+    expression = f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({title}, '')), 'A')"
+    if description is not None:
+        expression += (
+            f" || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({description}, '')), 'B')"
+        )
+    return mapped_column(TSVECTOR, Computed(expression, persisted=True), deferred=True)
+
+
 class UserModel(Base):
     __tablename__ = "users_user"
     __table_args__ = (
@@ -129,7 +153,14 @@ class MissionBranchModel(Base):
 
 class MissionModel(Base):
     __tablename__ = "missions_mission"
-    __table_args__ = (UniqueConstraint("title", name="uq_missions_branch_title"),)
+    __table_args__ = (
+        UniqueConstraint("title", name="uq_missions_branch_title"),
+        Index("ix_missions_mission_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_missions_mission_branch_id_category", "branch_id", "category"),
+        Index("ix_missions_mission_rank_requirement", "rank_requirement"),
+        Index("ix_missions_mission_reward_xp", "reward_xp"),
+        Index("ix_missions_mission_reward_mana", "reward_mana"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -138,6 +169,7 @@ class MissionModel(Base):
     reward_mana: Mapped[int] = mapped_column()
     rank_requirement: Mapped[int] = mapped_column()
     category: Mapped[str] = mapped_column(String(100))
+    search_vector: Mapped[str] = search_vector_column(title="title", description="description")
 
     branch_id: Mapped[int] = mapped_column(ForeignKey(MissionBranchModel.id, ondelete="CASCADE"))
 
@@ -231,11 +263,15 @@ class MissionModel(Base):
 
 class MissionTaskModel(Base):
     __tablename__ = "missions_mission_task"
-    __table_args__ = (UniqueConstraint("title", name="uq_missions_task_title"),)
+    __table_args__ = (
+        UniqueConstraint("title", name="uq_missions_task_title"),
+        Index("ix_missions_mission_task_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255))
     description: Mapped[str] = mapped_column()
+    search_vector: Mapped[str] = search_vector_column(title="title", description="description")
 
     missions: Mapped[list["MissionModel"]] = relationship(
         MissionModel,
@@ -446,13 +482,17 @@ class SkillModel(Base):
 
 class ArtifactModel(Base):
     __tablename__ = "artifacts_artifact"
-    __table_args__ = (UniqueConstraint("title", name="uq_artifacts_artifact_title"),)
+    __table_args__ = (
+        UniqueConstraint("title", name="uq_artifacts_artifact_title"),
+        Index("ix_artifacts_artifact_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255))
     description: Mapped[str] = mapped_column()
     rarity: Mapped[str] = mapped_column(String(100))
     image_url: Mapped[str] = mapped_column()
+    search_vector: Mapped[str] = search_vector_column(title="title", description="description")
 
     missions: Mapped[list["MissionModel"]] = relationship(
         "MissionModel",
@@ -805,12 +845,16 @@ class UserCompetencyModel(Base):
 
 class StoreItemModel(Base):
     __tablename__ = "store_item"
+    __table_args__ = (
+        Index("ix_store_item_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     price: Mapped[int] = mapped_column(nullable=False)
     stock: Mapped[int] = mapped_column(nullable=False)
     image_url: Mapped[str] = mapped_column(nullable=False)
+    search_vector: Mapped[str] = search_vector_column(title="title")
 
     def to_schema(self) -> StoreItem:
         return StoreItem(
@@ -820,3 +864,52 @@ class StoreItemModel(Base):
             stock=self.stock,
             image_url=self.image_url,
         )
+
+
+class MediaObjectModel(Base):
+    __tablename__ = "media_object"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    key: Mapped[str] = mapped_column(unique=True, nullable=False)
+    size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    etag: Mapped[str] = mapped_column(nullable=False)
+    content_type: Mapped[str | None] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def to_schema(self) -> MediaObject:
+        return MediaObject(
+            digest=self.digest,
+            key=self.key,
+            size=self.size,
+            etag=self.etag,
+            content_type=self.content_type,
+        )
+
+
+class MediaUploadSessionModel(Base):
+    __tablename__ = "media_upload_session"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    key: Mapped[str] = mapped_column(nullable=False)
+    upload_id: Mapped[str] = mapped_column(nullable=False)
+    file_name: Mapped[str] = mapped_column(nullable=False)
+    content_type: Mapped[str | None] = mapped_column(nullable=True)
+    owner_login: Mapped[str] = mapped_column(nullable=False)
+    chunk_size: Mapped[int] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def to_schema(self) -> UploadSession:
+        return UploadSession(
+            id=self.id,
+            key=self.key,
+            upload_id=self.upload_id,
+            file_name=self.file_name,
+            content_type=self.content_type,
+            owner_login=self.owner_login,
+            chunk_size=self.chunk_size,
+            created_at=self.created_at,
+        )
@@ -0,0 +1,66 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+PLACEHOLDER = r"(?:\$\d+|\?|%\(\w+\)s|%s)"
+PLACEHOLDERS_PATTERN = re.compile(rf"{PLACEHOLDER}(?:\s*,\s*{PLACEHOLDER})*")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+START_TIME_KEY = "query_stats_start_time"
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def get_repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def normalize_statement(statement: str) -> str:
+    statement = WHITESPACE_PATTERN.sub(" ", statement).strip()
+    return PLACEHOLDERS_PATTERN.sub("?", statement)
+
+
+def instrument_engine(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn: Any, *_: Any) -> None:  # noqa: ANN401
+    if query_stats.get() is None:
+        return
+    conn.info.setdefault(START_TIME_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *_: Any) -> None:  # noqa: ANN401
+    _ = cursor
+    stats = query_stats.get()
+    start_times = conn.info.get(START_TIME_KEY)
+    if stats is None or not start_times:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - start_times.pop()
+    stats.statements[normalize_statement(statement)] += 1
+
+
+def _handle_error(context: Any) -> None:  # noqa: ANN401
+    start_times = context.connection.info.get(START_TIME_KEY) if context.connection else None
+    if start_times:
+        start_times.pop()
@@ -1,16 +1,47 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import codes
 
-from src.core.media.exceptions import MediaNotFoundError
-from src.core.media.schemas import FileMetadata, FileObject
+from src.config.settings import settings
+from src.core.media.enums import MediaVariantEnum
+from src.core.media.exceptions import (
+    MediaNotFoundError,
+    UploadSessionIncompleteError,
+    UploadSessionNotFoundError,
+)
+from src.core.media.schemas import (
+    FileMetadata,
+    FileObject,
+    FileStream,
+    UploadPart,
+    UploadSession,
+    UploadSessionStatus,
+)
+from src.core.media.use_cases import (
+    AbortUploadSessionUseCase,
+    CompleteUploadSessionUseCase,
+    CreateUploadSessionUseCase,
+    GetUploadSessionUseCase,
+    UploadChunkUseCase,
+    UploadFileUseCase,
+)
 from src.services.minio import MinioService
 from src.tests.fixtures import APIFixture, ContainerFixture
 
 
+async def file_stream(content: bytes) -> AsyncIterator[bytes]:
+    yield content
+
+
 class TestUploadFileAPI(APIFixture, ContainerFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
-        self.minio_service = await self.container.override_minio_service(MinioService)
+        self.use_case = await self.container.override_use_case(UploadFileUseCase)
+        self.image_variant_service = await self.container.override_image_variant_service()
 
     def test_not_auth(self) -> None:
         response = self.api.upload_file(
@@ -23,7 +54,7 @@ class TestUploadFileAPI(APIFixture, ContainerFixture):
         assert response.json() == {"detail": "Not authenticated"}
 
     def test_upload_file(self) -> None:
-        self.minio_service.upload_file_stream.return_value = FileObject(
+        self.use_case.execute.return_value = FileObject(
             key="TEST",
             url="http://test-url/test-key",
             size=len(b"test file content"),
@@ -44,16 +75,17 @@ class TestUploadFileAPI(APIFixture, ContainerFixture):
             "size": len(b"test file content"),
             "etag": "TEST",
             "contentType": "text/plain",
+            "variants": {},
         }
-        self.minio_service.upload_file_stream.assert_called_once()
-        call_args = self.minio_service.upload_file_stream.call_args
+        self.use_case.execute.assert_called_once()
+        call_args = self.use_case.execute.call_args
         assert call_args.kwargs["file_name"] == "test.txt"
         assert call_args.kwargs["content_type"] == "text/plain"
         assert call_args.kwargs["file_size"] == len(b"test file content")
         assert hasattr(call_args.kwargs["file_stream"], "read")
 
     def test_upload_file_with_different_content_type(self) -> None:
-        self.minio_service.upload_file_stream.return_value = FileObject(
+        self.use_case.execute.return_value = FileObject(
             key="test-key-pdf",
             url="http://test-url/test-key-pdf",
             size=len(b"test file content"),
@@ -74,16 +106,17 @@ class TestUploadFileAPI(APIFixture, ContainerFixture):
             "size": len(b"test file content"),
             "etag": "test-etag",
             "contentType": "application/pdf",
+            "variants": {},
         }
-        self.minio_service.upload_file_stream.assert_called_once()
-        call_args = self.minio_service.upload_file_stream.call_args
+        self.use_case.execute.assert_called_once()
+        call_args = self.use_case.execute.call_args
         assert call_args.kwargs["file_name"] == "document.pdf"
         assert call_args.kwargs["content_type"] == "application/pdf"
         assert call_args.kwargs["file_size"] == len(b"test file content")
         assert hasattr(call_args.kwargs["file_stream"], "read")
 
     def test_upload_image_file(self) -> None:
-        self.minio_service.upload_file_stream.return_value = FileObject(
+        self.use_case.execute.return_value = FileObject(
             key="image-key",
             url="http://test-url/image-key",
             size=100,
@@ -104,14 +137,288 @@ class TestUploadFileAPI(APIFixture, ContainerFixture):
             "size": 100,
             "etag": "image-etag",
             "contentType": "image/jpeg",
+            "variants": {},
         }
-        self.minio_service.upload_file_stream.assert_called_once()
-        call_args = self.minio_service.upload_file_stream.call_args
+        self.use_case.execute.assert_called_once()
+        call_args = self.use_case.execute.call_args
         assert call_args.kwargs["file_name"] == "test.jpg"
         assert call_args.kwargs["content_type"] == "image/jpeg"
         assert call_args.kwargs["file_size"] == len(b"fake image content")
         assert hasattr(call_args.kwargs["file_stream"], "read")
 
+    def test_upload_image_with_variants(self) -> None:
+        self.use_case.execute.return_value = FileObject(
+            key="image-key",
+            url="http://test-url/image-key",
+            size=100,
+            etag="image-etag",
+            content_type="image/png",
+        )
+        self.image_variant_service.create_variants.return_value = {
+            MediaVariantEnum.THUMB: FileObject(
+                key="image-key.thumb.webp",
+                url="http://test-url/image-key.thumb.webp",
+                size=10,
+                etag="thumb-etag",
+                content_type="image/webp",
+            ),
+        }
+
+        response = self.hr_api.upload_file(
+            file_content=b"fake image content",
+            filename="test.png",
+            content_type="image/png",
+            variants=True,
+        )
+
+        assert response.status_code == codes.CREATED
+        assert response.json()["variants"] == {"thumb": "http://test-url/image-key.thumb.webp"}
+        self.image_variant_service.create_variants.assert_awaited_once_with(
+            key="image-key",
+            content=b"fake image content",
+        )
+
+    def test_upload_not_image_with_variants(self) -> None:
+        self.use_case.execute.return_value = FileObject(
+            key="TEST",
+            url="http://test-url/test-key",
+            size=len(b"test file content"),
+            etag="TEST",
+            content_type="text/plain",
+        )
+
+        response = self.hr_api.upload_file(
+            file_content=b"test file content",
+            filename="test.txt",
+            content_type="text/plain",
+            variants=True,
+        )
+
+        assert response.status_code == codes.CREATED
+        assert response.json()["variants"] == {}
+        self.image_variant_service.create_variants.assert_not_called()
+
+
+class TestUploadFileStreamAPI(APIFixture, ContainerFixture):
+    @pytest.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.use_case = await self.container.override_use_case(UploadFileUseCase)
+        self.uploaded = b""
+        self.use_case.execute.side_effect = self._execute
+
+    async def _execute(
+        self,
+        file_name: str,
+        file_stream: AsyncIterator[bytes],
+        content_type: str | None,
+        file_size: int | None,
+    ) -> FileObject:
+        self.uploaded = b"".join([chunk async for chunk in file_stream])
+        return FileObject(
+            key=file_name,
+            url=f"http://test-url/{file_name}",
+            size=file_size,
+            etag="TEST",
+            content_type=content_type,
+        )
+
+    def test_not_auth(self) -> None:
+        response = self.api.upload_file_stream(file_content=b"test file content")
+
+        assert response.status_code == codes.FORBIDDEN
+        assert response.json() == {"detail": "Not authenticated"}
+
+    def test_upload_file_stream(self) -> None:
+        response = self.hr_api.upload_file_stream(
+            file_content=b"test file content",
+            filename="%D1%84%D0%B0%D0%B9%D0%BB.txt",
+            content_type="text/plain",
+        )
+
+        assert response.status_code == codes.CREATED
+        assert response.json() == {
+            "key": "файл.txt",
+            "url": "http://test-url/файл.txt",
+            "size": len(b"test file content"),
+            "etag": "TEST",
+            "contentType": "text/plain",
+            "variants": {},
+        }
+        assert self.uploaded == b"test file content"
+
+    def test_upload_file_stream_without_file_name(self) -> None:
+        response = self.candidate_api.upload_file_stream(file_content=b"test file content")
+
+        assert response.status_code == codes.CREATED
+        assert response.json()["key"] == "unknown"
+
+    def test_upload_file_stream_content_length_too_large(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings.MEDIA, "MAX_UPLOAD_SIZE", 4)
+
+        response = self.hr_api.upload_file_stream(file_content=b"test file content")
+
+        assert response.status_code == codes.REQUEST_ENTITY_TOO_LARGE
+        assert response.json() == {"detail": "MEDIA_TOO_LARGE_ERROR"}
+        self.use_case.execute.assert_not_called()
+
+    def test_upload_file_stream_chunked_too_large(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings.MEDIA, "MAX_UPLOAD_SIZE", 4)
+
+        response = self.hr_api.client.post(
+            url="/media/stream",
+            content=iter([b"test ", b"file ", b"content"]),
+            headers={"X-File-Name": "test.txt"},
+        )
+
+        assert response.status_code == codes.REQUEST_ENTITY_TOO_LARGE
+        assert response.json() == {"detail": "MEDIA_TOO_LARGE_ERROR"}
+
+
+class TestUploadSessionAPI(APIFixture, ContainerFixture):
+    @pytest.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.upload_session = UploadSession(
+            id="session",
+            key="2025/01/01/test.txt",
+            upload_id="upload",
+            file_name="test.txt",
+            content_type="text/plain",
+            owner_login="candidate_user",
+            chunk_size=4,
+        )
+        self.upload_session_response = {
+            "id": "session",
+            "key": "2025/01/01/test.txt",
+            "fileName": "test.txt",
+            "contentType": "text/plain",
+            "chunkSize": 4,
+        }
+
+    def test_not_auth(self) -> None:
+        response = self.api.create_upload_session(file_name="test.txt")
+
+        assert response.status_code == codes.FORBIDDEN
+        assert response.json() == {"detail": "Not authenticated"}
+
+    async def test_create_upload_session(self) -> None:
+        use_case = await self.container.override_use_case(CreateUploadSessionUseCase)
+        use_case.execute.return_value = self.upload_session
+
+        response = self.candidate_api.create_upload_session(
+            file_name="test.txt", content_type="text/plain"
+        )
+
+        assert response.status_code == codes.CREATED
+        assert response.json() == self.upload_session_response
+        use_case.execute.assert_awaited_once_with(
+            file_name="test.txt", content_type="text/plain", owner_login="candidate_user"
+        )
+
+    async def test_get_upload_session(self) -> None:
+        use_case = await self.container.override_use_case(GetUploadSessionUseCase)
+        use_case.execute.return_value = UploadSessionStatus(
+            session=self.upload_session,
+            parts=[
+                UploadPart(number=1, etag="part-1", size=4),
+                UploadPart(number=3, etag="part-3", size=2),
+            ],
+        )
+
+        response = self.candidate_api.get_upload_session(session_id="session")
+
+        assert response.status_code == codes.OK
+        assert response.json() == {
+            "session": self.upload_session_response,
+            "parts": [
+                {"number": 1, "etag": "part-1", "size": 4},
+                {"number": 3, "etag": "part-3", "size": 2},
+            ],
+            "offset": 4,
+        }
+        use_case.execute.assert_awaited_once_with(
+            session_id="session", owner_login="candidate_user"
+        )
+
+    async def test_get_upload_session_not_found(self) -> None:
+        use_case = await self.container.override_use_case(GetUploadSessionUseCase)
+        use_case.execute.side_effect = UploadSessionNotFoundError
+
+        response = self.candidate_api.get_upload_session(session_id="session")
+
+        assert response.status_code == codes.NOT_FOUND
+        assert response.json() == {"detail": "UPLOAD_SESSION_NOT_FOUND_ERROR"}
+
+    async def test_upload_chunk(self) -> None:
+        use_case = await self.container.override_use_case(UploadChunkUseCase)
+        use_case.execute.return_value = UploadPart(number=2, etag="part-2", size=4)
+
+        response = self.candidate_api.upload_chunk(
+            session_id="session", part_number=2, content=b"abcd"
+        )
+
+        assert response.status_code == codes.OK
+        assert response.json() == {"number": 2, "etag": "part-2", "size": 4}
+        use_case.execute.assert_awaited_once_with(
+            session_id="session",
+            owner_login="candidate_user",
+            part_number=2,
+            content=b"abcd",
+        )
+
+    async def test_upload_chunk_too_large(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings.MEDIA, "UPLOAD_CHUNK_SIZE", 2)
+        use_case = await self.container.override_use_case(UploadChunkUseCase)
+
+        response = self.candidate_api.upload_chunk(
+            session_id="session", part_number=1, content=b"abcd"
+        )
+
+        assert response.status_code == codes.REQUEST_ENTITY_TOO_LARGE
+        use_case.execute.assert_not_called()
+
+    async def test_complete_upload_session(self) -> None:
+        use_case = await self.container.override_use_case(CompleteUploadSessionUseCase)
+        use_case.execute.return_value = FileObject(
+            key="2025/01/01/test.txt",
+            url="http://test-url/2025/01/01/test.txt",
+            size=6,
+            etag="TEST",
+            content_type="text/plain",
+        )
+
+        response = self.candidate_api.complete_upload_session(session_id="session")
+
+        assert response.status_code == codes.CREATED
+        assert response.json() == {
+            "key": "2025/01/01/test.txt",
+            "url": "http://test-url/2025/01/01/test.txt",
+            "size": 6,
+            "etag": "TEST",
+            "contentType": "text/plain",
+            "variants": {},
+        }
+
+    async def test_complete_incomplete_upload_session(self) -> None:
+        use_case = await self.container.override_use_case(CompleteUploadSessionUseCase)
+        use_case.execute.side_effect = UploadSessionIncompleteError
+
+        response = self.candidate_api.complete_upload_session(session_id="session")
+
+        assert response.status_code == codes.CONFLICT
+        assert response.json() == {"detail": "UPLOAD_SESSION_INCOMPLETE_ERROR"}
+
+    async def test_abort_upload_session(self) -> None:
+        use_case = await self.container.override_use_case(AbortUploadSessionUseCase)
+
+        response = self.candidate_api.abort_upload_session(session_id="session")
+
+        assert response.status_code == codes.NO_CONTENT
+        use_case.execute.assert_awaited_once_with(
+            session_id="session", owner_login="candidate_user"
+        )
+
 
 class TestDownloadFileAPI(APIFixture, ContainerFixture):
     @pytest.fixture(autouse=True)
@@ -125,11 +432,10 @@ class TestDownloadFileAPI(APIFixture, ContainerFixture):
         assert response.json() == {"detail": "Not authenticated"}
 
     def test_download_file(self) -> None:
-        self.minio_service.get_file_metadata.return_value = FileMetadata(
-            file_size=(len(b"test file content")),
-            media_type="text/plain",
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"test file content")), media_type="text/plain"),
+            stream=file_stream(b"test file content"),
         )
-        self.minio_service.download_file.return_value = iter([b"test file content"])
 
         response = self.hr_api.download_file(key="test-file.txt")
 
@@ -138,18 +444,15 @@ class TestDownloadFileAPI(APIFixture, ContainerFixture):
         assert response.headers["content-type"].startswith("text/plain")
         assert response.headers["content-disposition"] == 'attachment; filename="test-file.txt"'
         assert response.headers["content-length"] == str(len(b"test file content"))
-        assert response.headers["cache-control"] == "public, max-age=3600"
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
 
-        self.minio_service.get_file_metadata.assert_called_once()
-        self.minio_service.get_file_metadata.assert_awaited_once_with(key="test-file.txt")
-        self.minio_service.download_file.assert_called_once_with("test-file.txt")
+        self.minio_service.open_file.assert_awaited_once_with(key="test-file.txt")
 
     def test_download_image_file(self) -> None:
-        self.minio_service.get_file_metadata.return_value = FileMetadata(
-            file_size=(len(b"fake image content")),
-            media_type="image/jpeg",
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"fake image content")), media_type="image/jpeg"),
+            stream=file_stream(b"fake image content"),
         )
-        self.minio_service.download_file.return_value = iter([b"fake image content"])
 
         response = self.candidate_api.download_file(key="test-image.jpg")
 
@@ -158,37 +461,277 @@ class TestDownloadFileAPI(APIFixture, ContainerFixture):
         assert response.headers["content-type"].startswith("image/jpeg")
         assert response.headers["content-disposition"] == 'inline; filename="test-image.jpg"'
         assert response.headers["content-length"] == str(len(b"fake image content"))
-        assert response.headers["cache-control"] == "public, max-age=3600"
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+        self.minio_service.open_file.assert_awaited_once_with(key="test-image.jpg")
 
-        self.minio_service.get_file_metadata.assert_called_once()
-        self.minio_service.get_file_metadata.assert_awaited_once_with(key="test-image.jpg")
-        self.minio_service.download_file.assert_called_once_with("test-image.jpg")
+    def test_download_local_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "test-image.jpg"
+        path.write_bytes(b"fake image content")
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"fake image content")), media_type="image/jpeg"),
+            stream=file_stream(b"fake image content"),
+            path=path,
+        )
+
+        response = self.candidate_api.download_file(key="test-image.jpg")
+
+        assert response.status_code == codes.OK
+        assert response.content == b"fake image content"
+        assert response.headers["content-type"].startswith("image/jpeg")
+        assert response.headers["content-disposition"] == 'inline; filename="test-image.jpg"'
+        assert response.headers["content-length"] == str(len(b"fake image content"))
 
     def test_download_file_with_nested_path(self) -> None:
-        self.minio_service.get_file_metadata.return_value = FileMetadata(
-            file_size=(len(b"test file content")),
-            media_type="text/plain",
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"test file content")), media_type="text/plain"),
+            stream=file_stream(b"test file content"),
         )
-        self.minio_service.download_file.return_value = iter([b"test file content"])
 
         response = self.hr_api.download_file(key="folder/subfolder/test-file.txt")
 
         assert response.status_code == codes.OK
         assert response.content == b"test file content"
         assert response.headers["content-disposition"] == 'attachment; filename="test-file.txt"'
-        self.minio_service.get_file_metadata.assert_called_once()
-        self.minio_service.get_file_metadata.assert_awaited_once_with(
+        self.minio_service.open_file.assert_awaited_once_with(
             key="folder/subfolder/test-file.txt",
         )
-        self.minio_service.download_file.assert_called_once_with("folder/subfolder/test-file.txt")
+
+    def test_download_file_with_validators(self) -> None:
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(
+                file_size=(len(b"test file content")),
+                media_type="text/plain",
+                etag="abc",
+                last_modified=datetime(2025, 1, 1, tzinfo=UTC),
+            ),
+            stream=file_stream(b"test file content"),
+        )
+
+        response = self.hr_api.download_file(key="test-file.txt")
+
+        assert response.status_code == codes.OK
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["last-modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_download_file_if_none_match(self) -> None:
+        release = AsyncMock()
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(
+                file_size=(len(b"test file content")), media_type="text/plain", etag="abc"
+            ),
+            stream=file_stream(b"test file content"),
+            release=release,
+        )
+
+        response = self.hr_api.download_file(
+            key="test-file.txt", headers={"If-None-Match": 'W/"other", "abc"'}
+        )
+
+        assert response.status_code == codes.NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        self.minio_service.open_file.assert_awaited_once_with(key="test-file.txt")
+        self.minio_service.get_file_metadata.assert_not_called()
+        release.assert_awaited_once_with()
+
+    def test_download_file_if_none_match_changed(self) -> None:
+        release = AsyncMock()
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(
+                file_size=(len(b"test file content")), media_type="text/plain", etag="new"
+            ),
+            stream=file_stream(b"test file content"),
+            release=release,
+        )
+
+        response = self.hr_api.download_file(
+            key="test-file.txt", headers={"If-None-Match": '"abc"'}
+        )
+
+        assert response.status_code == codes.OK
+        assert response.content == b"test file content"
+        assert response.headers["etag"] == '"new"'
+        self.minio_service.open_file.assert_awaited_once_with(key="test-file.txt")
+        self.minio_service.get_file_metadata.assert_not_called()
+        release.assert_not_called()
+
+    def test_download_file_if_modified_since(self) -> None:
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(
+                file_size=(len(b"test file content")),
+                media_type="text/plain",
+                last_modified=datetime(2025, 1, 1, 12, 0, 0, 500, tzinfo=UTC),
+            ),
+            stream=file_stream(b"test file content"),
+        )
+
+        response = self.hr_api.download_file(
+            key="test-file.txt", headers={"If-Modified-Since": "Wed, 01 Jan 2025 12:00:00 GMT"}
+        )
+
+        assert response.status_code == codes.NOT_MODIFIED
+        self.minio_service.get_file_metadata.assert_not_called()
+
+    def test_download_file_if_modified_since_older(self) -> None:
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(
+                file_size=(len(b"test file content")),
+                media_type="text/plain",
+                last_modified=datetime(2025, 1, 2, tzinfo=UTC),
+            ),
+            stream=file_stream(b"test file content"),
+        )
+
+        response = self.hr_api.download_file(
+            key="test-file.txt", headers={"If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        )
+
+        assert response.status_code == codes.OK
+        assert response.content == b"test file content"
+        self.minio_service.get_file_metadata.assert_not_called()
 
     def test_download_file_not_found(self) -> None:
-        self.minio_service.get_file_metadata.side_effect = MediaNotFoundError
+        self.minio_service.open_file.side_effect = MediaNotFoundError
 
         response = self.candidate_api.download_file(key="non-existent-file.txt")
 
         assert response.status_code == codes.NOT_FOUND
         assert response.json() == {"detail": MediaNotFoundError.detail}
-        self.minio_service.get_file_metadata.assert_called_once()
-        self.minio_service.get_file_metadata.assert_awaited_once_with(key="non-existent-file.txt")
-        self.minio_service.download_file.assert_not_called()
+        self.minio_service.open_file.assert_awaited_once_with(key="non-existent-file.txt")
+
+    def test_download_image_variant(self) -> None:
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"fake thumb content")), media_type="image/webp"),
+            stream=file_stream(b"fake thumb content"),
+        )
+
+        response = self.hr_api.download_file(key="test-image.jpg", variant=MediaVariantEnum.THUMB)
+
+        assert response.status_code == codes.OK
+        assert response.content == b"fake thumb content"
+        assert response.headers["content-type"].startswith("image/webp")
+        self.minio_service.open_file.assert_awaited_once_with(
+            key="test-image.jpg.thumb.webp",
+        )
+
+
+class TestDownloadCachedFileAPI(APIFixture, ContainerFixture):
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path: Path) -> AsyncIterator[None]:
+        self.minio_service = await self.container.override_minio_service(MinioService)
+        self.media_cache = await self.container.get_media_cache()
+        self.media_cache.enabled = True
+        self.media_cache.root = tmp_path
+        await self.media_cache.load()
+        yield
+        self.media_cache.close()
+
+    def test_download_file_is_served_from_cache(self) -> None:
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"fake image content")), media_type="image/jpeg"),
+            stream=file_stream(b"fake image content"),
+        )
+
+        first_response = self.hr_api.download_file(key="folder/test-image.jpg")
+        second_response = self.hr_api.download_file(key="folder/test-image.jpg")
+
+        assert first_response.status_code == codes.OK
+        assert second_response.status_code == codes.OK
+        assert second_response.content == b"fake image content"
+        assert second_response.headers["content-type"].startswith("image/jpeg")
+        assert second_response.headers["content-disposition"] == 'inline; filename="test-image.jpg"'
+        assert second_response.headers["content-length"] == str(len(b"fake image content"))
+        assert self.media_cache.stats.memory_hits == 1
+        self.minio_service.open_file.assert_awaited_once()
+
+    def test_download_large_file_is_served_from_disk_cache(self) -> None:
+        self.media_cache.memory_max_object_size = 0
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"test file content")), media_type="text/plain"),
+            stream=file_stream(b"test file content"),
+        )
+
+        self.hr_api.download_file(key="test-file.txt")
+        response = self.hr_api.download_file(key="test-file.txt")
+
+        assert response.status_code == codes.OK
+        assert response.content == b"test file content"
+        assert response.headers["content-disposition"] == 'attachment; filename="test-file.txt"'
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert self.media_cache.stats.hits == 1
+
+    def test_download_cached_file_if_none_match(self) -> None:
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(
+                file_size=(len(b"fake image content")), media_type="image/jpeg", etag="abc"
+            ),
+            stream=file_stream(b"fake image content"),
+        )
+
+        self.hr_api.download_file(key="test-image.jpg")
+        response = self.hr_api.download_file(
+            key="test-image.jpg", headers={"If-None-Match": '"abc"'}
+        )
+
+        assert response.status_code == codes.NOT_MODIFIED
+        assert response.headers["etag"] == '"abc"'
+        self.minio_service.open_file.assert_awaited_once()
+        self.minio_service.get_file_metadata.assert_not_called()
+
+
+class TestDownloadFilePresignedAPI(APIFixture, ContainerFixture):
+    @pytest.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.minio_service = await self.container.override_minio_service(MinioService)
+        self.minio_service.get_download_url.return_value = "http://minio/alabuga/test.jpg?sig"
+        self.minio_service.presigned_url_ttl = 300
+
+    def test_download_file_redirect(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings.MINIO, "DOWNLOAD_MODE", "redirect")
+
+        response = self.hr_api.download_file(key="folder/test.jpg", follow_redirects=False)
+
+        assert response.status_code == codes.FOUND
+        assert response.headers["location"] == "http://minio/alabuga/test.jpg?sig"
+        self.minio_service.get_download_url.assert_awaited_once_with(key="folder/test.jpg")
+        self.minio_service.open_file.assert_not_called()
+
+    def test_download_file_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings.MINIO, "DOWNLOAD_MODE", "url")
+
+        response = self.candidate_api.download_file(key="test.jpg", variant=MediaVariantEnum.THUMB)
+
+        assert response.status_code == codes.OK
+        assert response.json() == {"url": "http://minio/alabuga/test.jpg?sig", "expiresIn": 300}
+        self.minio_service.get_download_url.assert_awaited_once_with(key="test.jpg.thumb.webp")
+        self.minio_service.open_file.assert_not_called()
+
+    @pytest.mark.parametrize("download_mode", ["redirect", "url"])
+    def test_download_file_local_storage_is_proxied(
+        self, monkeypatch: pytest.MonkeyPatch, download_mode: str
+    ) -> None:
+        monkeypatch.setattr(settings.MINIO, "DOWNLOAD_MODE", download_mode)
+        monkeypatch.setattr(settings.MEDIA, "STORAGE", "local")
+        self.minio_service.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=(len(b"fake thumb content")), media_type="image/webp"),
+            stream=file_stream(b"fake thumb content"),
+        )
+
+        response = self.hr_api.download_file(
+            key="test.jpg", variant=MediaVariantEnum.THUMB, follow_redirects=False
+        )
+
+        assert response.status_code == codes.OK
+        assert response.content == b"fake thumb content"
+        self.minio_service.open_file.assert_awaited_once_with(key="test.jpg.thumb.webp")
+        self.minio_service.get_download_url.assert_not_called()
+
+    def test_not_auth(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings.MINIO, "DOWNLOAD_MODE", "redirect")
+
+        response = self.api.download_file(key="test.jpg", follow_redirects=False)
+
+        assert response.status_code == codes.FORBIDDEN
+        self.minio_service.get_download_url.assert_not_called()
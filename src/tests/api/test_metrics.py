@@ -0,0 +1,26 @@
+from httpx import codes
+
+from src.tests.fixtures import APIFixture
+
+
+class TestMetricsAPI(APIFixture):
+    def test_metrics(self) -> None:
+        self.api.get_health()
+
+        response = self.api.get_metrics()
+
+        assert response.status_code == codes.OK
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+            in response.text
+        )
+        assert "# TYPE use_case_duration_seconds histogram" in response.text
+
+    def test_unmatched_route(self) -> None:
+        self.api.client.get("/unknown-route")
+
+        response = self.api.get_metrics()
+
+        assert 'route="unmatched",status="404"' in response.text
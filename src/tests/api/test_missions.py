@@ -8,7 +8,7 @@ from src.core.artifacts.use_cases import (
     RemoveArtifactFromMissionUseCase,
 )
 from src.core.exceptions import PermissionDeniedError
-from src.core.missions.enums import MissionCategoryEnum
+from src.core.missions.enums import MissionCategoryEnum, MissionSortEnum
 from src.core.missions.exceptions import (
     MissionNameAlreadyExistError,
     MissionNotFoundError,
@@ -211,7 +211,8 @@ class TestGetMissionsAPI(APIFixture, FactoryFixture, ContainerFixture):
                     season_id=1,
                     category=MissionCategoryEnum.SIMULATOR,
                 ),
-            ]
+            ],
+            total=2,
         )
 
         response = self.hr_api.get_missions()
@@ -247,10 +248,51 @@ class TestGetMissionsAPI(APIFixture, FactoryFixture, ContainerFixture):
                     "rewardSkills": [],
                     "rewardCompetencies": [],
                 },
-            ]
+            ],
+            "total": 2,
         }
-        self.use_case.execute.assert_called_once()
-        self.use_case.execute.assert_awaited_once_with()
+        self.use_case.execute.assert_awaited_once_with(filters=self.factory.mission_filter())
+
+    def test_get_missions_filtered(self) -> None:
+        self.use_case.execute.return_value = self.factory.missions(values=[], total=0)
+
+        response = self.candidate_api.get_missions(
+            season_id=1,
+            category=MissionCategoryEnum.LECTURE,
+            rank_requirement=2,
+            min_reward_xp=10,
+            max_reward_xp=500,
+            min_reward_mana=5,
+            max_reward_mana=50,
+            sort_by=MissionSortEnum.REWARD_XP,
+            descending=True,
+            limit=10,
+            offset=20,
+        )
+
+        assert response.status_code == codes.OK
+        assert response.json() == {"values": [], "total": 0}
+        self.use_case.execute.assert_awaited_once_with(
+            filters=self.factory.mission_filter(
+                season_id=1,
+                category=MissionCategoryEnum.LECTURE,
+                rank_requirement=2,
+                min_reward_xp=10,
+                max_reward_xp=500,
+                min_reward_mana=5,
+                max_reward_mana=50,
+                sort_by=MissionSortEnum.REWARD_XP,
+                descending=True,
+                limit=10,
+                offset=20,
+            )
+        )
+
+    def test_get_missions_invalid_params(self) -> None:
+        response = self.candidate_api.get_missions(category="unknown", limit=0)
+
+        assert response.status_code == codes.UNPROCESSABLE_ENTITY
+        self.use_case.execute.assert_not_awaited()
 
     def test_get_missions_empty(self) -> None:
         self.use_case.execute.return_value = self.factory.missions(values=[])
@@ -258,7 +300,7 @@ class TestGetMissionsAPI(APIFixture, FactoryFixture, ContainerFixture):
         response = self.candidate_api.get_missions()
 
         assert response.status_code == codes.OK
-        assert response.json() == {"values": []}
+        assert response.json() == {"values": [], "total": None}
         self.use_case.execute.assert_called_once()
 
 
@@ -0,0 +1,69 @@
+import logging
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import codes
+from sqlalchemy import create_engine, text
+
+from src.api.middlewares import QueryStatsMiddleware
+from src.storages.query_stats import QueryStats, instrument_engine, normalize_statement
+
+
+class TestQueryStatsMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> Generator[None]:
+        engine = create_engine("sqlite://")
+        instrument_engine(engine=engine)
+        app = FastAPI()
+
+        @app.get("/items/{count}")
+        async def get_items(count: int) -> list[int]:
+            with engine.connect() as connection:
+                return [
+                    connection.execute(text("SELECT :item_id"), {"item_id": item_id}).scalar_one()
+                    for item_id in range(count)
+                ]
+
+        app.add_middleware(QueryStatsMiddleware, repeat_threshold=3, server_timing=True)
+        with TestClient(app) as client:
+            self.client = client
+            yield
+        engine.dispose()
+
+    def test_server_timing_header(self) -> None:
+        response = self.client.get("/items/2")
+
+        assert response.status_code == codes.OK
+        assert response.json() == [0, 1]
+        assert response.headers["server-timing"].startswith("db;dur=")
+        assert response.headers["server-timing"].endswith('desc="2 queries"')
+
+    def test_repeated_statement_warning(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.WARNING, logger="src.api.middlewares"):
+            self.client.get("/items/4")
+
+        assert [record.getMessage() for record in caplog.records] == [
+            "Possible N+1 query: GET /items/4 repeated a statement 4 times"
+        ]
+        assert caplog.records[0].__dict__["statement"] == "SELECT ?"
+
+    def test_no_warning_below_threshold(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.WARNING, logger="src.api.middlewares"):
+            self.client.get("/items/3")
+
+        assert caplog.records == []
+
+
+class TestQueryStats:
+    def test_normalize_statement(self) -> None:
+        statement = "SELECT *\n  FROM users WHERE id IN ($1, $2,$3) AND login = $4"
+
+        assert normalize_statement(statement) == "SELECT * FROM users WHERE id IN (?) AND login = ?"
+
+    def test_get_repeated_statements(self) -> None:
+        stats = QueryStats()
+        stats.statements.update({"SELECT 1": 5, "SELECT 2": 2})
+
+        assert stats.get_repeated_statements(threshold=2) == [("SELECT 1", 5)]
@@ -0,0 +1,76 @@
+import pytest
+from httpx import codes
+
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.use_cases import SearchUseCase
+from src.tests.fixtures import APIFixture, ContainerFixture, FactoryFixture
+
+
+class TestSearchAPI(APIFixture, FactoryFixture, ContainerFixture):
+    @pytest.fixture(autouse=True)
+    async def setup(self) -> None:
+        self.use_case = await self.container.override_use_case(SearchUseCase)
+
+    def test_not_auth(self) -> None:
+        response = self.api.search(query="TEST")
+
+        assert response.status_code == codes.FORBIDDEN
+        assert response.json() == {"detail": "Not authenticated"}
+
+    def test_search(self) -> None:
+        self.use_case.execute.return_value = self.factory.search_results(
+            values=[
+                self.factory.search_result(
+                    entity_type=SearchEntityEnum.ARTIFACT,
+                    result_id=1,
+                    title="Ракета",
+                    description="Редкий артефакт",
+                    rank=0.6,
+                )
+            ],
+            total=3,
+        )
+
+        response = self.candidate_api.search(query="ракета", limit=1)
+
+        assert response.status_code == codes.OK
+        assert response.json() == {
+            "values": [
+                {
+                    "entityType": "artifact",
+                    "id": 1,
+                    "title": "Ракета",
+                    "description": "Редкий артефакт",
+                    "rank": 0.6,
+                }
+            ],
+            "total": 3,
+        }
+        self.use_case.execute.assert_awaited_once_with(
+            query=self.factory.search_query(text="ракета", limit=1)
+        )
+
+    def test_search_entity_types(self) -> None:
+        self.use_case.execute.return_value = self.factory.search_results(values=[])
+
+        response = self.hr_api.search(query="ракета", types=["task", "store_item"], offset=20)
+
+        assert response.status_code == codes.OK
+        self.use_case.execute.assert_awaited_once_with(
+            query=self.factory.search_query(
+                text="ракета",
+                entity_types=[SearchEntityEnum.TASK, SearchEntityEnum.STORE_ITEM],
+                offset=20,
+            )
+        )
+
+    def test_search_empty_query(self) -> None:
+        response = self.hr_api.search(query="")
+
+        assert response.status_code == codes.UNPROCESSABLE_ENTITY
+        self.use_case.execute.assert_not_awaited()
+
+    def test_search_unknown_entity_type(self) -> None:
+        response = self.hr_api.search(query="ракета", types=["user"])
+
+        assert response.status_code == codes.UNPROCESSABLE_ENTITY
@@ -0,0 +1,64 @@
+import logging
+from collections.abc import Iterator
+
+import pytest
+import structlog
+
+from src.config.logger import AsyncQueueHandler, SamplingFilter
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def make_record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, "%s %d", ("GET", 200), None)
+
+
+class TestSamplingFilter:
+    def test_drops_sampled_logger(self) -> None:
+        sampling_filter = SamplingFilter(rates={"uvicorn.access": 0.0})
+
+        assert sampling_filter.filter(make_record("uvicorn.access")) is False
+        assert sampling_filter.filter(make_record("src.api")) is True
+
+    def test_keeps_warnings(self) -> None:
+        sampling_filter = SamplingFilter(rates={"uvicorn.access": 0.0})
+
+        assert sampling_filter.filter(make_record("uvicorn.access", logging.WARNING)) is True
+
+
+class TestAsyncQueueHandler:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> Iterator[None]:
+        self.target = CollectingHandler()
+        self.handler = AsyncQueueHandler(handlers=[self.target], max_size=2)
+        yield
+        structlog.contextvars.clear_contextvars()
+
+    def test_delivers_records(self) -> None:
+        self.handler.start()
+        self.handler.handle(make_record("uvicorn.access"))
+        self.handler.close()
+
+        assert [record.getMessage() for record in self.target.records] == ["GET 200"]
+
+    def test_captures_context(self) -> None:
+        structlog.contextvars.bind_contextvars(db_queries=3)
+
+        record = self.handler.prepare(make_record("uvicorn.access"))
+
+        assert record.msg == "GET 200"
+        assert record.args is None
+        assert record.__dict__["db_queries"] == 3
+
+    def test_drops_when_full(self) -> None:
+        for _ in range(3):
+            self.handler.handle(make_record("uvicorn.access"))
+
+        assert self.handler.dropped == 1
@@ -0,0 +1,23 @@
+import pytest
+from pydantic import ValidationError
+
+from src.config.settings import MIN_MULTIPART_PART_SIZE, MediaSettings, MinioSettings
+
+
+class TestMultipartPartSize:
+    def test_upload_chunk_size_too_small(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MEDIA_UPLOAD_CHUNK_SIZE", str(MIN_MULTIPART_PART_SIZE - 1))
+
+        with pytest.raises(ValidationError):
+            MediaSettings()
+
+    def test_multipart_part_size_too_small(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MINIO_MULTIPART_PART_SIZE", "1024")
+
+        with pytest.raises(ValidationError):
+            MinioSettings()
+
+    def test_minimal_part_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MEDIA_UPLOAD_CHUNK_SIZE", str(MIN_MULTIPART_PART_SIZE))
+
+        assert MediaSettings().UPLOAD_CHUNK_SIZE == MIN_MULTIPART_PART_SIZE
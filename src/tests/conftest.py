@@ -22,6 +22,8 @@ from src.storages.database_storage import DatabaseStorage
 from src.storages.models import (
     ArtifactModel,
     CompetencyModel,
+    MediaObjectModel,
+    MediaUploadSessionModel,
     MissionBranchModel,
     MissionChainModel,
     MissionTaskModel,
@@ -35,9 +37,11 @@ from src.tests.mocks.providers import (
     AuthProviderMock,
     CompetencyProviderMock,
     FileStorageProviderMock,
+    MediaProviderMock,
     MissionChainProviderMock,
     MissionProviderMock,
     RankProviderMock,
+    SearchProviderMock,
     SkillProviderMock,
     StoreProviderMock,
     UserProviderMock,
@@ -56,7 +60,9 @@ async def container() -> AsyncGenerator[AsyncContainer]:
         SkillProviderMock(),
         RankProviderMock(),
         StoreProviderMock(),
+        SearchProviderMock(),
         FileStorageProviderMock(),
+        MediaProviderMock(),
         AuthProviderMock(),
     )
     yield container
@@ -150,6 +156,8 @@ async def clear_tables(engine: AsyncEngine) -> None:
         await conn.execute(delete(RankModel))
         await conn.execute(delete(MissionChainModel))
         await conn.execute(delete(StoreItemModel))
+        await conn.execute(delete(MediaObjectModel))
+        await conn.execute(delete(MediaUploadSessionModel))
 
 
 @pytest.fixture
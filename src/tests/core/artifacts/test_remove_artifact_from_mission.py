@@ -13,6 +13,7 @@ class TestRemoveArtifactFromMissionUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = RemoveArtifactFromMissionUseCase(
             storage=self.storage, mission_storage=self.storage
         )
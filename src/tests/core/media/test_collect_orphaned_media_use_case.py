@@ -0,0 +1,115 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.media.schemas import MediaObject
+from src.core.media.use_cases import CollectOrphanedMediaUseCase
+from src.core.ranks.schemas import Rank
+from src.core.store.schemas import StoreItem
+from src.services.local_storage import LocalFileStorage
+from src.tests.mocks.storage_stub import StorageMock
+
+
+class TestCollectOrphanedMediaUseCase:
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path: Path) -> None:
+        self.storage = StorageMock()
+        self.file_storage = LocalFileStorage(
+            root=tmp_path, server_url="http://test-url", bucket="test"
+        )
+        await self.file_storage.ensure_bucket()
+        self.use_case = CollectOrphanedMediaUseCase(
+            file_storage=self.file_storage, storage=self.storage, grace_period=3600
+        )
+
+    async def _upload(self, key: str, *, old: bool = True) -> None:
+        await self.file_storage.upload_file(key=key, content=b"test", content_type="text/plain")
+        if old:
+            timestamp = time.time() - 7200
+            os.utime(self.file_storage.bucket_path / key, (timestamp, timestamp))
+
+    async def _keys(self) -> list[str]:
+        return [stored_file.key async for stored_file in self.file_storage.list_files()]
+
+    async def test_deletes_unreferenced_files(self) -> None:
+        await self._upload("rank.png")
+        await self._upload("orphan.png")
+        await self.storage.insert_rank(
+            rank=Rank(
+                id=1,
+                name="TEST",
+                required_xp=100,
+                image_url=self.file_storage.build_url("rank.png"),
+            )
+        )
+
+        report = await self.use_case.execute()
+
+        assert report.scanned == 2
+        assert report.deleted == 1
+        assert report.reclaimed_bytes == 4
+        assert await self._keys() == ["rank.png"]
+
+    async def test_keeps_files_within_grace_period(self) -> None:
+        await self._upload("fresh.png", old=False)
+
+        report = await self.use_case.execute()
+
+        assert report.deleted == 0
+        assert await self._keys() == ["fresh.png"]
+
+    async def test_keeps_variants_of_referenced_files(self) -> None:
+        await self._upload("item.png")
+        await self._upload("item.png.thumb.webp")
+        await self._upload("other.png.thumb.webp")
+        await self.storage.insert_store_item(
+            store_item=StoreItem(
+                id=1,
+                title="TEST",
+                price=10,
+                stock=1,
+                image_url="http://test-url/media/item.png",
+            )
+        )
+
+        report = await self.use_case.execute()
+
+        assert report.deleted == 1
+        assert await self._keys() == ["item.png", "item.png.thumb.webp"]
+
+    async def test_deletes_media_object_rows(self) -> None:
+        await self._upload("sha256/aa/orphan.png")
+        await self.storage.insert_media_object(
+            media_object=MediaObject(
+                digest="a" * 64,
+                key="sha256/aa/orphan.png",
+                size=4,
+                etag="TEST",
+                content_type="image/png",
+            )
+        )
+
+        await self.use_case.execute()
+
+        assert self.storage.media_object_table == {}
+
+    async def test_dry_run_keeps_files(self) -> None:
+        await self._upload("orphan.png")
+
+        report = await self.use_case.execute(dry_run=True)
+
+        assert report.deleted == 1
+        assert report.reclaimed_bytes == 4
+        assert await self._keys() == ["orphan.png"]
+
+    async def test_deletes_in_batches(self) -> None:
+        self.use_case.batch_size = 2
+        for index in range(5):
+            await self._upload(f"orphan_{index}.png")
+
+        report = await self.use_case.execute()
+
+        assert report.deleted == 5
+        assert await self._keys() == []
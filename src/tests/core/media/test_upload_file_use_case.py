@@ -0,0 +1,195 @@
+import hashlib
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from io import BytesIO
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.media.schemas import FileObject, MediaObject
+from src.core.media.use_cases import UploadFileUseCase
+from src.services.minio import MinioService
+from src.tests.mocks.storage_stub import StorageMock
+
+CONTENT = b"test file content"
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+CONTENT_KEY = f"sha256/{DIGEST[:2]}/{DIGEST}.txt"
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+class TestUploadFileUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.storage = StorageMock()
+        self.file_storage = AsyncMock(spec=MinioService)
+        self.file_storage.build_url.side_effect = lambda key: f"http://test-url/{key}"
+        self.file_storage.upload_file_stream.side_effect = self._upload_file_stream
+        self.file_storage.move_file.side_effect = lambda file_object, key: replace(
+            file_object, key=key, url=f"http://test-url/{key}"
+        )
+        self.use_case = UploadFileUseCase(
+            file_storage=self.file_storage,
+            storage=self.storage,
+            content_addressed=True,
+        )
+
+    @staticmethod
+    async def _upload_file_stream(
+        file_name: str,
+        file_stream: BytesIO | AsyncIterator[bytes],
+        content_type: str | None,
+        file_size: int | None,
+        key: str | None = None,
+    ) -> FileObject:
+        if isinstance(file_stream, AsyncIterator):
+            _ = [chunk async for chunk in file_stream]
+        return FileObject(
+            key=key or file_name,
+            url=f"http://test-url/{key or file_name}",
+            size=file_size,
+            etag="TEST",
+            content_type=content_type,
+        )
+
+    async def test_upload_file_stores_content_under_digest(self) -> None:
+        result = await self.use_case.execute(
+            file_name="test.TXT",
+            file_stream=BytesIO(CONTENT),
+            content_type="text/plain",
+            file_size=len(CONTENT),
+        )
+
+        assert result == FileObject(
+            key=CONTENT_KEY,
+            url=f"http://test-url/{CONTENT_KEY}",
+            size=len(CONTENT),
+            etag="TEST",
+            content_type="text/plain",
+        )
+        assert self.storage.media_object_table == {
+            DIGEST: MediaObject(
+                digest=DIGEST,
+                key=CONTENT_KEY,
+                size=len(CONTENT),
+                etag="TEST",
+                content_type="text/plain",
+            )
+        }
+        file_stream = self.file_storage.upload_file_stream.call_args.kwargs["file_stream"]
+        assert file_stream.tell() == 0
+
+    async def test_upload_duplicate_content_skips_write(self) -> None:
+        await self.use_case.execute(
+            file_name="first.txt",
+            file_stream=BytesIO(CONTENT),
+            content_type="text/plain",
+            file_size=len(CONTENT),
+        )
+
+        result = await self.use_case.execute(
+            file_name="second.txt",
+            file_stream=BytesIO(CONTENT),
+            content_type="text/plain",
+            file_size=len(CONTENT),
+        )
+
+        assert result.key == CONTENT_KEY
+        assert result.url == f"http://test-url/{CONTENT_KEY}"
+        self.file_storage.upload_file_stream.assert_called_once()
+
+    async def test_upload_different_content_writes_each_object(self) -> None:
+        await self.use_case.execute(
+            file_name="first.txt",
+            file_stream=BytesIO(CONTENT),
+            content_type="text/plain",
+            file_size=len(CONTENT),
+        )
+
+        await self.use_case.execute(
+            file_name="second.txt",
+            file_stream=BytesIO(b"other content"),
+            content_type="text/plain",
+            file_size=len(b"other content"),
+        )
+
+        assert self.file_storage.upload_file_stream.call_count == 2
+        assert len(self.storage.media_object_table) == 2
+
+    async def test_upload_without_content_addressing(self) -> None:
+        self.use_case.content_addressed = False
+
+        result = await self.use_case.execute(
+            file_name="test.txt",
+            file_stream=BytesIO(CONTENT),
+            content_type="text/plain",
+            file_size=len(CONTENT),
+        )
+
+        assert result.key == "test.txt"
+        assert self.storage.media_object_table == {}
+        assert "key" not in self.file_storage.upload_file_stream.call_args.kwargs
+
+    async def test_upload_async_stream_records_digest(self) -> None:
+        result = await self.use_case.execute(
+            file_name="test.txt",
+            file_stream=_stream(b"test file ", b"content"),
+            content_type="text/plain",
+            file_size=None,
+        )
+
+        assert result.key == CONTENT_KEY
+        assert self.storage.media_object_table[DIGEST].key == CONTENT_KEY
+        move_call = self.file_storage.move_file.call_args.kwargs
+        assert move_call["file_object"].key == "test.txt"
+        assert move_call["key"] == CONTENT_KEY
+        self.file_storage.delete_file.assert_not_called()
+
+    async def test_upload_duplicate_async_stream_removes_copy(self) -> None:
+        await self.use_case.execute(
+            file_name="first.txt",
+            file_stream=BytesIO(CONTENT),
+            content_type="text/plain",
+            file_size=len(CONTENT),
+        )
+
+        result = await self.use_case.execute(
+            file_name="second.txt",
+            file_stream=_stream(b"test file ", b"content"),
+            content_type="text/plain",
+            file_size=None,
+        )
+
+        assert result.key == CONTENT_KEY
+        self.file_storage.move_file.assert_not_called()
+        self.file_storage.delete_file.assert_awaited_once_with(key="second.txt")
+
+    async def test_upload_concurrent_duplicate_returns_winner(self) -> None:
+        winner = MediaObject(
+            digest=DIGEST,
+            key=f"sha256/{DIGEST[:2]}/{DIGEST}.bin",
+            size=len(CONTENT),
+            etag="WIN",
+            content_type="text/plain",
+        )
+        insert_media_object = self.storage.insert_media_object
+
+        async def _insert_after_winner(media_object: MediaObject) -> None:
+            await insert_media_object(media_object=winner)
+            await insert_media_object(media_object=media_object)
+
+        self.storage.insert_media_object = _insert_after_winner  # type: ignore[method-assign]
+
+        result = await self.use_case.execute(
+            file_name="test.txt",
+            file_stream=_stream(CONTENT),
+            content_type="text/plain",
+            file_size=None,
+        )
+
+        assert result.key == winner.key
+        assert self.storage.media_object_table == {DIGEST: winner}
+        self.file_storage.delete_file.assert_awaited_once_with(key=CONTENT_KEY)
@@ -0,0 +1,165 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.core.media.exceptions import (
+    InvalidUploadChunkError,
+    UploadSessionIncompleteError,
+    UploadSessionNotFoundError,
+)
+from src.core.media.use_cases import (
+    AbortUploadSessionUseCase,
+    CleanupUploadSessionsUseCase,
+    CompleteUploadSessionUseCase,
+    CreateUploadSessionUseCase,
+    GetUploadSessionUseCase,
+    UploadChunkUseCase,
+)
+from src.services.local_storage import LocalFileStorage
+from src.tests.mocks.storage_stub import StorageMock
+
+
+class TestUploadSessionUseCases:
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path: Path) -> None:
+        self.storage = StorageMock()
+        self.file_storage = LocalFileStorage(
+            root=tmp_path, server_url="http://test-url", bucket="test"
+        )
+        await self.file_storage.ensure_bucket()
+        self.create_use_case = CreateUploadSessionUseCase(
+            file_storage=self.file_storage, storage=self.storage, chunk_size=4
+        )
+        self.get_use_case = GetUploadSessionUseCase(
+            file_storage=self.file_storage, storage=self.storage
+        )
+        self.chunk_use_case = UploadChunkUseCase(
+            file_storage=self.file_storage, storage=self.storage
+        )
+        self.complete_use_case = CompleteUploadSessionUseCase(
+            file_storage=self.file_storage, storage=self.storage
+        )
+        self.abort_use_case = AbortUploadSessionUseCase(
+            file_storage=self.file_storage, storage=self.storage
+        )
+        self.upload_session = await self.create_use_case.execute(
+            file_name="test.txt", content_type="text/plain", owner_login="candidate"
+        )
+
+    async def _upload_chunk(self, part_number: int, content: bytes) -> None:
+        await self.chunk_use_case.execute(
+            session_id=self.upload_session.id,
+            owner_login="candidate",
+            part_number=part_number,
+            content=content,
+        )
+
+    async def test_create_upload_session(self) -> None:
+        assert self.upload_session.chunk_size == 4
+        assert self.upload_session.key.endswith("_test.txt")
+        assert self.storage.upload_session_table[self.upload_session.id].upload_id == (
+            self.upload_session.upload_id
+        )
+
+    async def test_get_upload_session_offset(self) -> None:
+        await self._upload_chunk(part_number=1, content=b"abcd")
+        await self._upload_chunk(part_number=3, content=b"ij")
+
+        result = await self.get_use_case.execute(
+            session_id=self.upload_session.id, owner_login="candidate"
+        )
+
+        assert [part.number for part in result.parts] == [1, 3]
+        assert result.offset == 4
+
+    async def test_upload_chunk_is_idempotent(self) -> None:
+        await self._upload_chunk(part_number=1, content=b"abcd")
+        await self._upload_chunk(part_number=1, content=b"abcd")
+
+        result = await self.get_use_case.execute(
+            session_id=self.upload_session.id, owner_login="candidate"
+        )
+
+        assert len(result.parts) == 1
+        assert result.offset == 4
+
+    async def test_upload_chunk_too_large(self) -> None:
+        with pytest.raises(InvalidUploadChunkError):
+            await self._upload_chunk(part_number=1, content=b"abcde")
+
+    async def test_upload_chunk_invalid_number(self) -> None:
+        with pytest.raises(InvalidUploadChunkError):
+            await self._upload_chunk(part_number=0, content=b"abcd")
+
+    async def test_upload_chunk_other_owner(self) -> None:
+        with pytest.raises(UploadSessionNotFoundError):
+            await self.chunk_use_case.execute(
+                session_id=self.upload_session.id,
+                owner_login="other",
+                part_number=1,
+                content=b"abcd",
+            )
+
+    async def test_complete_upload_session(self) -> None:
+        await self._upload_chunk(part_number=2, content=b"ef")
+        await self._upload_chunk(part_number=1, content=b"abcd")
+
+        result = await self.complete_use_case.execute(
+            session_id=self.upload_session.id, owner_login="candidate"
+        )
+
+        assert result.key == self.upload_session.key
+        assert result.size == 6
+        assert result.content_type == "text/plain"
+        assert self.storage.upload_session_table == {}
+        content = b"".join([
+            chunk async for chunk in self.file_storage.download_file(key=self.upload_session.key)
+        ])
+        assert content == b"abcdef"
+
+    async def test_complete_upload_session_with_missing_chunk(self) -> None:
+        await self._upload_chunk(part_number=1, content=b"abcd")
+        await self._upload_chunk(part_number=3, content=b"ij")
+
+        with pytest.raises(UploadSessionIncompleteError):
+            await self.complete_use_case.execute(
+                session_id=self.upload_session.id, owner_login="candidate"
+            )
+
+    async def test_complete_upload_session_with_short_chunk(self) -> None:
+        await self._upload_chunk(part_number=1, content=b"ab")
+        await self._upload_chunk(part_number=2, content=b"cd")
+
+        with pytest.raises(UploadSessionIncompleteError):
+            await self.complete_use_case.execute(
+                session_id=self.upload_session.id, owner_login="candidate"
+            )
+
+    async def test_abort_upload_session(self) -> None:
+        await self._upload_chunk(part_number=1, content=b"abcd")
+
+        await self.abort_use_case.execute(
+            session_id=self.upload_session.id, owner_login="candidate"
+        )
+
+        assert self.storage.upload_session_table == {}
+        assert list(self.file_storage.uploads_path.iterdir()) == []
+
+    async def test_cleanup_stale_upload_sessions(self) -> None:
+        fresh_session = await self.create_use_case.execute(
+            file_name="fresh.txt", content_type=None, owner_login="candidate"
+        )
+        self.upload_session.created_at = datetime.now(UTC) - timedelta(hours=2)
+        self.storage.upload_session_table[self.upload_session.id] = self.upload_session
+        use_case = CleanupUploadSessionsUseCase(
+            file_storage=self.file_storage, storage=self.storage, session_ttl=3600
+        )
+
+        removed = await use_case.execute()
+
+        assert removed == 1
+        assert list(self.storage.upload_session_table) == [fresh_session.id]
+        assert [path.name for path in self.file_storage.uploads_path.iterdir()] == [
+            fresh_session.upload_id
+        ]
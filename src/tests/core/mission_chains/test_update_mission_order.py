@@ -10,6 +10,7 @@ class TestUpdateMissionOrderInChainUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = UpdateMissionOrderInChainUseCase(storage=self.storage)
 
     async def test_update_mission_order_with_shift(self) -> None:
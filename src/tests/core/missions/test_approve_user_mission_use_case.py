@@ -11,6 +11,7 @@ class TestApproveUserMissionUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = ApproveUserMissionUseCase(
             mission_storage=self.storage,
             artifact_storage=self.storage,
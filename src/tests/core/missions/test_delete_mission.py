@@ -9,8 +9,9 @@ from src.tests.mocks.storage_stub import StorageMock
 
 class TestDeleteMissionUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
-    def setup(self) -> None:
+    async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = DeleteMissionUseCase(storage=self.storage)
 
     async def test_delete_mission(self) -> None:
@@ -9,8 +9,9 @@ from src.tests.mocks.storage_stub import StorageMock
 
 class TestGetMissionDetailUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
-    def setup(self) -> None:
+    async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = GetMissionDetailUseCase(storage=self.storage)
 
     async def test_get_mission(self) -> None:
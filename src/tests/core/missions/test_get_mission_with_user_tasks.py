@@ -12,6 +12,7 @@ class TestGetMissionWithUserTasksUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = GetMissionWithUserTasksUseCase(storage=self.storage)
 
     async def test_get_mission_with_user_tasks_empty(self) -> None:
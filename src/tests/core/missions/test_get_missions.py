@@ -1,6 +1,6 @@
 import pytest
 
-from src.core.missions.enums import MissionCategoryEnum
+from src.core.missions.enums import MissionCategoryEnum, MissionSortEnum
 from src.core.missions.use_cases import GetMissionsUseCase
 from src.tests.fixtures import FactoryFixture
 from src.tests.mocks.storage_stub import StorageMock
@@ -8,8 +8,9 @@ from src.tests.mocks.storage_stub import StorageMock
 
 class TestGetMissionsUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
-    def setup(self) -> None:
+    async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = GetMissionsUseCase(storage=self.storage)
 
     async def test_get_missions(self) -> None:
@@ -42,7 +43,7 @@ class TestGetMissionsUseCase(FactoryFixture):
             )
         )
 
-        missions = await self.use_case.execute()
+        missions = await self.use_case.execute(filters=self.factory.mission_filter())
 
         assert len(missions.values) == 2
         assert missions == self.factory.missions(
@@ -67,9 +68,39 @@ class TestGetMissionsUseCase(FactoryFixture):
                     season_id=1,
                     category=MissionCategoryEnum.SIMULATOR,
                 ),
-            ]
+            ],
+            total=2,
         )
 
+    async def test_get_missions_filtered(self) -> None:
+        for mission_id, reward_xp in enumerate([300, 100, 200, 50], start=1):
+            await self.storage.insert_mission(
+                mission=self.factory.mission(
+                    mission_id=mission_id,
+                    title=f"MISSION_{mission_id}",
+                    reward_xp=reward_xp,
+                    category=MissionCategoryEnum.QUEST,
+                )
+            )
+        await self.storage.insert_mission(
+            mission=self.factory.mission(
+                mission_id=5, title="LECTURE", reward_xp=400, category=MissionCategoryEnum.LECTURE
+            )
+        )
+
+        missions = await self.use_case.execute(
+            filters=self.factory.mission_filter(
+                category=MissionCategoryEnum.QUEST,
+                min_reward_xp=100,
+                sort_by=MissionSortEnum.REWARD_XP,
+                descending=True,
+                limit=2,
+            )
+        )
+
+        assert [mission.id for mission in missions.values] == [1, 3]
+        assert missions.total == 3
+
     async def test_get_empty_missions(self) -> None:
-        result = await self.use_case.execute()
+        result = await self.use_case.execute(filters=self.factory.mission_filter())
         assert len(result.values) == 0
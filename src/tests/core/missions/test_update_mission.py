@@ -59,6 +59,7 @@ class TestUpdateMissionUseCase(FactoryFixture):
         )
 
     async def test_update_mission_title_already_exists(self) -> None:
+        await self.storage.insert_mission(mission=self.factory.mission(mission_id=1))
         await self.storage.insert_mission(
             mission=(
                 self.factory.mission(
@@ -91,6 +92,8 @@ class TestUpdateMissionUseCase(FactoryFixture):
             )
 
     async def test_update_mission_branch_not_found(self) -> None:
+        await self.storage.insert_mission(mission=self.factory.mission(mission_id=1))
+
         with pytest.raises(SeasonNotFoundError):
             await self.use_case.execute(
                 mission=(
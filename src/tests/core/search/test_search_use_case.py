@@ -0,0 +1,59 @@
+import pytest
+
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.use_cases import SearchUseCase
+from src.tests.fixtures import FactoryFixture
+from src.tests.mocks.storage_stub import StorageMock
+
+
+class TestSearchUseCase(FactoryFixture):
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.storage = StorageMock()
+        self.use_case = SearchUseCase(storage=self.storage)
+
+    async def test_search(self) -> None:
+        await self.storage.insert_mission_task(
+            task=self.factory.mission_task(task_id=1, title="Лекция", description="Про ракеты")
+        )
+        await self.storage.insert_store_item(
+            store_item=self.factory.store_item(store_item_id=2, title="Ракета")
+        )
+
+        result = await self.use_case.execute(query=self.factory.search_query(text="ракет"))
+
+        assert result == self.factory.search_results(
+            values=[
+                self.factory.search_result(
+                    entity_type=SearchEntityEnum.STORE_ITEM,
+                    result_id=2,
+                    title="Ракета",
+                    description="",
+                    rank=1.0,
+                ),
+                self.factory.search_result(
+                    entity_type=SearchEntityEnum.TASK,
+                    result_id=1,
+                    title="Лекция",
+                    description="Про ракеты",
+                    rank=0.5,
+                ),
+            ]
+        )
+
+    async def test_search_filters_entity_types(self) -> None:
+        await self.storage.insert_mission_task(task=self.factory.mission_task(title="Ракета"))
+        await self.storage.insert_store_item(store_item=self.factory.store_item(title="Ракета"))
+
+        result = await self.use_case.execute(
+            query=self.factory.search_query(text="ракета", entity_types=[SearchEntityEnum.TASK])
+        )
+
+        assert [value.entity_type for value in result.values] == [SearchEntityEnum.TASK]
+
+    async def test_search_blank_query(self) -> None:
+        await self.storage.insert_store_item(store_item=self.factory.store_item(title="Ракета"))
+
+        result = await self.use_case.execute(query=self.factory.search_query(text="  "))
+
+        assert result == self.factory.search_results(values=[])
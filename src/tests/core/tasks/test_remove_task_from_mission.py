@@ -12,6 +12,7 @@ class TestRemoveTaskFromMissionUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = RemoveTaskFromMissionUseCase(storage=self.storage)
         await self.storage.insert_mission(
             mission=self.factory.mission(
@@ -9,6 +9,7 @@ class TestTaskApproveUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
     async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.use_case = TaskApproveUseCase(storage=self.storage)
 
     async def test_approve_task_when_last_task_completed_no_rewards(self) -> None:
@@ -36,6 +36,7 @@ class TestUpdateMissionTaskUseCase(FactoryFixture):
         )
 
     async def test_update_mission_task_already_exists(self) -> None:
+        await self.storage.insert_mission_task(task=self.factory.mission_task(task_id=2))
         await self.storage.insert_mission_task(
             task=self.factory.mission_task(
                 task_id=0,
@@ -9,8 +9,9 @@ from src.tests.mocks.user_password import UserPasswordServiceMock
 
 class TestCreateUserUseCase(FactoryFixture):
     @pytest.fixture(autouse=True)
-    def setup(self) -> None:
+    async def setup(self) -> None:
         self.storage = StorageMock()
+        await self.storage.insert_season(season=self.factory.season(season_id=1))
         self.password_service = UserPasswordServiceMock()
         self.use_case = CreateUserUseCase(
             user_storage=self.storage,
@@ -14,6 +14,9 @@ class APIHelper:
     def get_health(self) -> Response:
         return self.client.get("/health")
 
+    def get_metrics(self) -> Response:
+        return self.client.get("/metrics")
+
     def register_hr_user(
         self, login: str, first_name: str, last_name: str, password: str
     ) -> Response:
@@ -99,8 +102,8 @@ class APIHelper:
             },
         )
 
-    def get_missions(self) -> Response:
-        return self.client.get("/missions")
+    def get_missions(self, **params: str | int | bool) -> Response:
+        return self.client.get("/missions", params=params)
 
     def get_mission(self, mission_id: int) -> Response:
         return self.client.get(f"/missions/{mission_id}")
@@ -258,14 +261,56 @@ class APIHelper:
         file_content: bytes,
         filename: str,
         content_type: str = "text/plain",
+        variants: bool = False,
     ) -> Response:
         return self.client.post(
             url="/media",
+            params={"variants": variants},
             files={"file": (filename, BytesIO(file_content), content_type)},
         )
 
-    def download_file(self, key: str) -> Response:
-        return self.client.get(f"/media/{key}")
+    def upload_file_stream(
+        self,
+        file_content: bytes,
+        filename: str | None = None,
+        content_type: str = "text/plain",
+    ) -> Response:
+        headers = {"Content-Type": content_type}
+        if filename is not None:
+            headers["X-File-Name"] = filename
+        return self.client.post(url="/media/stream", content=file_content, headers=headers)
+
+    def create_upload_session(self, file_name: str, content_type: str | None = None) -> Response:
+        return self.client.post(
+            url="/media/uploads",
+            json={"fileName": file_name, "contentType": content_type},
+        )
+
+    def get_upload_session(self, session_id: str) -> Response:
+        return self.client.get(f"/media/uploads/{session_id}")
+
+    def upload_chunk(self, session_id: str, part_number: int, content: bytes) -> Response:
+        return self.client.put(
+            url=f"/media/uploads/{session_id}/chunks/{part_number}", content=content
+        )
+
+    def complete_upload_session(self, session_id: str) -> Response:
+        return self.client.post(f"/media/uploads/{session_id}/complete")
+
+    def abort_upload_session(self, session_id: str) -> Response:
+        return self.client.delete(f"/media/uploads/{session_id}")
+
+    def download_file(
+        self,
+        key: str,
+        variant: str | None = None,
+        follow_redirects: bool = True,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        params = {"variant": variant} if variant else None
+        return self.client.get(
+            f"/media/{key}", params=params, follow_redirects=follow_redirects, headers=headers
+        )
 
     def create_skill(self, name: str, max_level: int) -> Response:
         return self.client.post(
@@ -461,6 +506,22 @@ class APIHelper:
     def purchase_store_item(self, store_item_id: int) -> Response:
         return self.client.post(url="/store/purchase", json={"store_item_id": store_item_id})
 
+    def search(
+        self,
+        query: str,
+        types: list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Response:
+        params: dict[str, str | int | list[str]] = {"query": query}
+        if types is not None:
+            params["types"] = types
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        return self.client.get("/search", params=params)
+
     def list_users(self) -> Response:
         return self.client.get("/users")
 
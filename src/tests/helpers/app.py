@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock
 from dishka import AsyncContainer
 
 from src.core.use_case import UseCase
+from src.services.image_variants import ImageVariantService
+from src.services.media_cache import MediaCache
 from src.services.minio import MinioService
 
 
@@ -19,3 +21,10 @@ class ContainerHelper:
     async def override_minio_service(self, service: type[MinioService]) -> AsyncMock:
         mocked_service = await self.container.get(service)
         return cast("AsyncMock", mocked_service)
+
+    async def override_image_variant_service(self) -> AsyncMock:
+        mocked_service = await self.container.get(ImageVariantService)
+        return cast("AsyncMock", mocked_service)
+
+    async def get_media_cache(self) -> MediaCache:
+        return await self.container.get(MediaCache)
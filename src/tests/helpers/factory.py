@@ -9,14 +9,17 @@ from src.core.mission_chains.schemas import (
     MissionChains,
     MissionDependency,
 )
-from src.core.missions.enums import MissionCategoryEnum
+from src.core.missions.enums import MissionCategoryEnum, MissionSortEnum
 from src.core.missions.schemas import (
     CompetencyReward,
     Mission,
+    MissionFilter,
     Missions,
     SkillReward,
 )
 from src.core.ranks.schemas import Rank, RankCompetencyRequirement, Ranks
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.schemas import SearchQuery, SearchResult, SearchResults
 from src.core.seasons.schemas import Season, Seasons
 from src.core.skills.schemas import Skill, Skills
 from src.core.store.schemas import StoreItem, StoreItems, StorePurchase
@@ -203,8 +206,37 @@ class FactoryHelper:
         return UserTask(id=task_id, title=title, description=description, is_completed=is_completed)
 
     @classmethod
-    def missions(cls, values: list[Mission]) -> Missions:
-        return Missions(values=values)
+    def missions(cls, values: list[Mission], total: int | None = None) -> Missions:
+        return Missions(values=values, total=total)
+
+    @classmethod
+    def mission_filter(
+        cls,
+        season_id: int | None = None,
+        category: MissionCategoryEnum | None = None,
+        rank_requirement: int | None = None,
+        min_reward_xp: int | None = None,
+        max_reward_xp: int | None = None,
+        min_reward_mana: int | None = None,
+        max_reward_mana: int | None = None,
+        sort_by: MissionSortEnum = MissionSortEnum.ID,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> MissionFilter:
+        return MissionFilter(
+            season_id=season_id,
+            category=category,
+            rank_requirement=rank_requirement,
+            min_reward_xp=min_reward_xp,
+            max_reward_xp=max_reward_xp,
+            min_reward_mana=min_reward_mana,
+            max_reward_mana=max_reward_mana,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
 
     @classmethod
     def mission_tasks(cls, values: list[MissionTask]) -> MissionTasks:
@@ -373,6 +405,38 @@ class FactoryHelper:
     ) -> StorePurchase:
         return StorePurchase(user_login=user_login, store_item_id=store_item_id)
 
+    @classmethod
+    def search_query(
+        cls,
+        text: str = "TEST",
+        entity_types: list[SearchEntityEnum] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> SearchQuery:
+        return SearchQuery(
+            text=text,
+            entity_types=entity_types if entity_types is not None else list(SearchEntityEnum),
+            limit=limit,
+            offset=offset,
+        )
+
+    @classmethod
+    def search_result(
+        cls,
+        entity_type: SearchEntityEnum = SearchEntityEnum.MISSION,
+        result_id: int = 1,
+        title: str = "TEST",
+        description: str = "TEST",
+        rank: float = 1.0,
+    ) -> SearchResult:
+        return SearchResult(
+            entity_type=entity_type, id=result_id, title=title, description=description, rank=rank
+        )
+
+    @classmethod
+    def search_results(cls, values: list[SearchResult], total: int | None = None) -> SearchResults:
+        return SearchResults(values=values, total=len(values) if total is None else total)
+
     @classmethod
     def task_approve_params(
         cls,
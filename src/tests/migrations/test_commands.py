@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config.settings import settings
+from src.migrations import commands
+
+
+class TestMigrationCommands:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.db_url = settings.DATABASE.URL.get_secret_value()
+
+    def test_current_revisions_match_heads(self) -> None:
+        assert commands.get_current_revisions(db_url=self.db_url) == commands.get_head_revisions(
+            db_url=self.db_url
+        )
+
+    def test_migrate_if_needed_skips_up_to_date_schema(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        migrate = MagicMock()
+        monkeypatch.setattr(commands, "migrate", migrate)
+
+        assert commands.migrate_if_needed(db_url=self.db_url) is False
+        migrate.assert_not_called()
+
+    def test_migrate_if_needed_upgrades_outdated_schema(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        migrate = MagicMock()
+        monkeypatch.setattr(commands, "migrate", migrate)
+        monkeypatch.setattr(commands, "get_current_revisions", MagicMock(return_value=set()))
+
+        assert commands.migrate_if_needed(db_url=self.db_url) is True
+        migrate.assert_called_once_with(revision="heads", db_url=self.db_url)
@@ -26,6 +26,15 @@ from src.core.competencies.use_cases import (
     UpdateCompetencyUseCase,
 )
 from src.core.exceptions import InvalidJWTTokenError, PermissionDeniedError
+from src.core.file_storage import FileStorage
+from src.core.media.use_cases import (
+    AbortUploadSessionUseCase,
+    CompleteUploadSessionUseCase,
+    CreateUploadSessionUseCase,
+    GetUploadSessionUseCase,
+    UploadChunkUseCase,
+    UploadFileUseCase,
+)
 from src.core.mission_chains.use_cases import (
     AddMissionDependencyUseCase,
     AddMissionToChainUseCase,
@@ -66,6 +75,7 @@ from src.core.ranks.use_cases import (
     RemoveRequiredMissionFromRankUseCase,
     UpdateRankUseCase,
 )
+from src.core.search.use_cases import SearchUseCase
 from src.core.seasons.use_cases import (
     CreateSeasonUseCase,
     DeleteSeasonUseCase,
@@ -113,6 +123,8 @@ from src.core.users.use_cases import (
     UpdateUserSkillLevelUseCase,
     UpdateUserUseCase,
 )
+from src.services.image_variants import ImageVariantService
+from src.services.media_cache import CachedFileStorage, MediaCache
 from src.services.minio import MinioService
 from src.tests.mocks.user_password import UserPasswordServiceMock
 
@@ -322,6 +334,46 @@ class FileStorageProviderMock(Provider):
     def get_minio_service(self) -> MinioService:
         return AsyncMock(spec=MinioService)
 
+    @provide
+    def get_file_storage(self, minio_service: MinioService, media_cache: MediaCache) -> FileStorage:
+        return CachedFileStorage(file_storage=minio_service, media_cache=media_cache)
+
+    @provide
+    def get_media_cache(self) -> MediaCache:
+        return MediaCache(enabled=False)
+
+    @provide
+    def get_image_variant_service(self) -> ImageVariantService:
+        return AsyncMock(spec=ImageVariantService)
+
+
+class MediaProviderMock(Provider):
+    scope: Scope = Scope.APP
+
+    @provide
+    def override_upload_file_use_case(self) -> UploadFileUseCase:
+        return AsyncMock(spec=UploadFileUseCase)
+
+    @provide
+    def override_create_upload_session_use_case(self) -> CreateUploadSessionUseCase:
+        return AsyncMock(spec=CreateUploadSessionUseCase)
+
+    @provide
+    def override_get_upload_session_use_case(self) -> GetUploadSessionUseCase:
+        return AsyncMock(spec=GetUploadSessionUseCase)
+
+    @provide
+    def override_upload_chunk_use_case(self) -> UploadChunkUseCase:
+        return AsyncMock(spec=UploadChunkUseCase)
+
+    @provide
+    def override_complete_upload_session_use_case(self) -> CompleteUploadSessionUseCase:
+        return AsyncMock(spec=CompleteUploadSessionUseCase)
+
+    @provide
+    def override_abort_upload_session_use_case(self) -> AbortUploadSessionUseCase:
+        return AsyncMock(spec=AbortUploadSessionUseCase)
+
 
 class AuthProviderMock(Provider):
     scope = Scope.APP
@@ -535,3 +587,11 @@ class StoreProviderMock(Provider):
     @provide
     def override_purchase_store_item_use_case(self) -> PurchaseStoreItemUseCase:
         return AsyncMock(spec=PurchaseStoreItemUseCase)
+
+
+class SearchProviderMock(Provider):
+    scope: Scope = Scope.APP
+
+    @provide
+    def override_search_use_case(self) -> SearchUseCase:
+        return AsyncMock(spec=SearchUseCase)
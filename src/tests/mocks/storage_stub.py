@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 from typing import cast
 
 from src.core.artifacts.exceptions import ArtifactNotFoundError, ArtifactTitleAlreadyExistError
@@ -8,6 +9,8 @@ from src.core.competencies.exceptions import (
     CompetencyNotFoundError,
 )
 from src.core.competencies.schemas import Competencies, Competency, UserCompetencies, UserCompetency
+from src.core.media.exceptions import MediaNotFoundError, UploadSessionNotFoundError
+from src.core.media.schemas import MediaObject, UploadSession
 from src.core.mission_chains.exceptions import (
     MissionChainMissionAlreadyExistsError,
     MissionChainNameAlreadyExistError,
@@ -16,13 +19,15 @@ from src.core.mission_chains.exceptions import (
 )
 from src.core.mission_chains.schemas import MissionChain, MissionChains, MissionDependency
 from src.core.missions.exceptions import MissionNameAlreadyExistError, MissionNotFoundError
-from src.core.missions.schemas import Mission, Missions
+from src.core.missions.schemas import Mission, MissionFilter, Missions
 from src.core.ranks.exceptions import (
     RankCompetencyMinLevelTooHighError,
     RankNameAlreadyExistError,
     RankNotFoundError,
 )
 from src.core.ranks.schemas import Rank, RankCompetencyRequirement, Ranks
+from src.core.search.enums import SearchEntityEnum
+from src.core.search.schemas import SearchQuery, SearchResult, SearchResults
 from src.core.seasons.exceptions import SeasonNameAlreadyExistError, SeasonNotFoundError
 from src.core.seasons.schemas import Season, Seasons
 from src.core.skills.exceptions import SkillNameAlreadyExistError, SkillNotFoundError
@@ -30,8 +35,10 @@ from src.core.skills.schemas import Skill, Skills, UserSkill, UserSkills
 from src.core.storages import (
     ArtifactStorage,
     CompetencyStorage,
+    MediaStorage,
     MissionStorage,
     RankStorage,
+    SearchStorage,
     SkillStorage,
     StoreStorage,
     UserStorage,
@@ -53,6 +60,8 @@ class StorageMock(
     SkillStorage,
     RankStorage,
     StoreStorage,
+    MediaStorage,
+    SearchStorage,
 ):
     user_table: dict[str, User | CandidateUser | HRUser] = field(default_factory=dict)
     season_table: dict[str, Season] = field(default_factory=dict)
@@ -77,6 +86,8 @@ class StorageMock(
     store_item_table: dict[int, StoreItem] = field(default_factory=dict)
     users_competencies_relations: dict[str, dict[int, int]] = field(default_factory=dict)
     users_skills_relations: dict[str, dict[int, dict[int, int]]] = field(default_factory=dict)
+    media_object_table: dict[str, MediaObject] = field(default_factory=dict)
+    upload_session_table: dict[str, UploadSession] = field(default_factory=dict)
 
     async def insert_user(self, user: User) -> None:
         try:
@@ -97,12 +108,13 @@ class StorageMock(
         except KeyError as error:
             raise UserNotFoundError from error
 
-    async def insert_season(self, season: Season) -> None:
+    async def insert_season(self, season: Season) -> Season:
         try:
             self.season_table[season.name]
             raise SeasonNameAlreadyExistError
         except KeyError:
             self.season_table[season.name] = season
+        return await self.get_season_by_name(name=season.name)
 
     async def get_season_by_name(self, name: str) -> Season:
         try:
@@ -119,11 +131,13 @@ class StorageMock(
     async def list_seasons(self) -> Seasons:
         return Seasons(values=list(self.season_table.values()))
 
-    async def insert_mission(self, mission: Mission) -> None:
+    async def insert_mission(self, mission: Mission) -> Mission:
+        await self.get_season_by_id(season_id=mission.season_id)
         for existing_mission in self.mission_table.values():
             if existing_mission.title == mission.title:
                 raise MissionNameAlreadyExistError
         self.mission_table[mission.id] = mission
+        return await self.get_mission_by_title(title=mission.title)
 
     async def get_mission_by_id(self, mission_id: int) -> Mission:
         try:
@@ -154,13 +168,37 @@ class StorageMock(
                 return mission
         raise MissionNotFoundError
 
-    async def list_missions(self) -> Missions:
-        return Missions(values=list(self.mission_table.values()))
+    async def list_missions(self, filters: MissionFilter) -> Missions:
+        missions = [
+            mission
+            for mission in self.mission_table.values()
+            if (filters.season_id is None or mission.season_id == filters.season_id)
+            and (filters.category is None or mission.category == filters.category)
+            and (
+                filters.rank_requirement is None
+                or mission.rank_requirement == filters.rank_requirement
+            )
+            and (filters.min_reward_xp is None or mission.reward_xp >= filters.min_reward_xp)
+            and (filters.max_reward_xp is None or mission.reward_xp <= filters.max_reward_xp)
+            and (filters.min_reward_mana is None or mission.reward_mana >= filters.min_reward_mana)
+            and (filters.max_reward_mana is None or mission.reward_mana <= filters.max_reward_mana)
+        ]
+        missions.sort(key=lambda mission: mission.id)
+        missions.sort(
+            key=lambda mission: getattr(mission, filters.sort_by), reverse=filters.descending
+        )
+        end = None if filters.limit is None else filters.offset + filters.limit
+        return Missions(values=missions[filters.offset : end], total=len(missions))
 
-    async def update_mission(self, mission: Mission) -> None:
+    async def update_mission(self, mission: Mission) -> Mission:
         if mission.id not in self.mission_table:
             raise MissionNotFoundError
+        await self.get_season_by_id(season_id=mission.season_id)
+        for existing_mission in self.mission_table.values():
+            if existing_mission.title == mission.title and existing_mission.id != mission.id:
+                raise MissionNameAlreadyExistError
         self.mission_table[mission.id] = mission
+        return await self.get_mission_by_id(mission_id=mission.id)
 
     async def delete_mission(self, mission_id: int) -> None:
         try:
@@ -168,7 +206,7 @@ class StorageMock(
         except KeyError as error:
             raise MissionNotFoundError from error
 
-    async def update_season(self, branch: Season) -> None:
+    async def update_season(self, branch: Season) -> Season:
         try:
             existing_branch = self.season_table[branch.name]
             if existing_branch.id != branch.id:
@@ -180,7 +218,7 @@ class StorageMock(
             if existing_branch.id == branch.id:
                 del self.season_table[name]
                 self.season_table[branch.name] = branch
-                return
+                return branch
         raise SeasonNotFoundError
 
     async def delete_season(self, season_id: int) -> None:
@@ -190,11 +228,12 @@ class StorageMock(
                 return
         raise SeasonNotFoundError
 
-    async def insert_mission_task(self, task: MissionTask) -> None:
+    async def insert_mission_task(self, task: MissionTask) -> MissionTask:
         for existing_task in self.task_table.values():
             if existing_task.title == task.title:
                 raise TaskNameAlreadyExistError
         self.task_table[task.id] = task
+        return await self.get_mission_task_by_title(title=task.title)
 
     async def get_mission_task_by_id(self, task_id: int) -> MissionTask:
         try:
@@ -211,10 +250,14 @@ class StorageMock(
     async def list_mission_tasks(self) -> MissionTasks:
         return MissionTasks(values=list(self.task_table.values()))
 
-    async def update_mission_task(self, task: MissionTask) -> None:
+    async def update_mission_task(self, task: MissionTask) -> MissionTask:
         if task.id not in self.task_table:
             raise TaskNotFoundError
+        for existing_task in self.task_table.values():
+            if existing_task.title == task.title and existing_task.id != task.id:
+                raise TaskNameAlreadyExistError
         self.task_table[task.id] = task
+        return await self.get_mission_task_by_id(task_id=task.id)
 
     async def delete_mission_task(self, task_id: int) -> None:
         try:
@@ -243,7 +286,7 @@ class StorageMock(
             if not self.missions_tasks_relations[mission_id]:
                 del self.missions_tasks_relations[mission_id]
 
-    async def insert_artifact(self, artifact: Artifact) -> None:
+    async def insert_artifact(self, artifact: Artifact) -> Artifact:
         for existing_artifact in self.artifact_table.values():
             if existing_artifact.title == artifact.title:
                 raise ArtifactTitleAlreadyExistError
@@ -260,6 +303,7 @@ class StorageMock(
             )
 
         self.artifact_table[artifact.id] = artifact
+        return await self.get_artifact_by_title(title=artifact.title)
 
     async def get_artifact_by_id(self, artifact_id: int) -> Artifact:
         try:
@@ -276,10 +320,14 @@ class StorageMock(
     async def list_artifacts(self) -> Artifacts:
         return Artifacts(values=list(self.artifact_table.values()))
 
-    async def update_artifact(self, artifact: Artifact) -> None:
+    async def update_artifact(self, artifact: Artifact) -> Artifact:
         if artifact.id not in self.artifact_table:
             raise ArtifactNotFoundError
+        for existing_artifact in self.artifact_table.values():
+            if existing_artifact.title == artifact.title and existing_artifact.id != artifact.id:
+                raise ArtifactTitleAlreadyExistError
         self.artifact_table[artifact.id] = artifact
+        return await self.get_artifact_by_id(artifact_id=artifact.id)
 
     async def delete_artifact(self, artifact_id: int) -> None:
         try:
@@ -367,11 +415,12 @@ class StorageMock(
                 del self.missions_skills_rewards[mission_id]
 
     # CompetencyStorage methods
-    async def insert_competency(self, competency: Competency) -> None:
+    async def insert_competency(self, competency: Competency) -> Competency:
         for existing in self.competencies_table.values():
             if existing.name == competency.name:
                 raise CompetencyNameAlreadyExistError
         self.competencies_table[competency.id] = competency
+        return await self.get_competency_by_name(name=competency.name)
 
     async def get_competency_by_id(self, competency_id: int) -> Competency:
         try:
@@ -388,10 +437,14 @@ class StorageMock(
     async def list_competencies(self) -> Competencies:
         return Competencies(values=list(self.competencies_table.values()))
 
-    async def update_competency(self, competency: Competency) -> None:
+    async def update_competency(self, competency: Competency) -> Competency:
         if competency.id not in self.competencies_table:
             raise CompetencyNotFoundError
+        for existing in self.competencies_table.values():
+            if existing.name == competency.name and existing.id != competency.id:
+                raise CompetencyNameAlreadyExistError
         self.competencies_table[competency.id] = competency
+        return await self.get_competency_by_id(competency_id=competency.id)
 
     async def delete_competency(self, competency_id: int) -> None:
         try:
@@ -419,11 +472,12 @@ class StorageMock(
             if not self.competencies_skills_relations[competency_id]:
                 del self.competencies_skills_relations[competency_id]
 
-    async def insert_skill(self, skill: Skill) -> None:
+    async def insert_skill(self, skill: Skill) -> Skill:
         for existing in self.skill_table.values():
             if existing.name == skill.name:
                 raise SkillNameAlreadyExistError
         self.skill_table[skill.id] = skill
+        return await self.get_skill_by_name(name=skill.name)
 
     async def get_skill_by_id(self, skill_id: int) -> Skill:
         try:
@@ -440,10 +494,14 @@ class StorageMock(
     async def list_skills(self) -> Skills:
         return Skills(values=list(self.skill_table.values()))
 
-    async def update_skill(self, skill: Skill) -> None:
+    async def update_skill(self, skill: Skill) -> Skill:
         if skill.id not in self.skill_table:
             raise SkillNotFoundError
+        for existing in self.skill_table.values():
+            if existing.name == skill.name and existing.id != skill.id:
+                raise SkillNameAlreadyExistError
         self.skill_table[skill.id] = skill
+        return await self.get_skill_by_id(skill_id=skill.id)
 
     async def delete_skill(self, skill_id: int) -> None:
         try:
@@ -457,11 +515,12 @@ class StorageMock(
                 del self.competencies_skills_relations[comp_id]
 
     # RankStorage methods
-    async def insert_rank(self, rank: Rank) -> None:
+    async def insert_rank(self, rank: Rank) -> Rank:
         for existing in self.rank_table.values():
             if existing.name == rank.name:
                 raise RankNameAlreadyExistError
         self.rank_table[rank.id] = rank
+        return await self.get_rank_by_name(name=rank.name)
 
     async def get_rank_by_id(self, rank_id: int) -> Rank:
         try:
@@ -497,10 +556,14 @@ class StorageMock(
     async def list_ranks(self) -> Ranks:
         return Ranks(values=list(self.rank_table.values()))
 
-    async def update_rank(self, rank: Rank) -> None:
+    async def update_rank(self, rank: Rank) -> Rank:
         if rank.id not in self.rank_table:
             raise RankNotFoundError
+        for existing in self.rank_table.values():
+            if existing.name == rank.name and existing.id != rank.id:
+                raise RankNameAlreadyExistError
         self.rank_table[rank.id] = rank
+        return await self.get_rank_by_id(rank_id=rank.id)
 
     async def delete_rank(self, rank_id: int) -> None:
         try:
@@ -554,11 +617,12 @@ class StorageMock(
                 del self.ranks_competencies_requirements[rank_id]
 
     # Mission chain methods
-    async def insert_mission_chain(self, mission_chain: MissionChain) -> None:
+    async def insert_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
         for existing in self.mission_chain_table.values():
             if existing.name == mission_chain.name:
                 raise MissionChainNameAlreadyExistError
         self.mission_chain_table[mission_chain.id] = mission_chain
+        return await self.get_mission_chain_by_name(name=mission_chain.name)
 
     async def get_mission_chain_by_id(self, chain_id: int) -> MissionChain:
         try:
@@ -633,10 +697,14 @@ class StorageMock(
     async def list_mission_chains(self) -> MissionChains:
         return MissionChains(values=list(self.mission_chain_table.values()))
 
-    async def update_mission_chain(self, mission_chain: MissionChain) -> None:
+    async def update_mission_chain(self, mission_chain: MissionChain) -> MissionChain:
         if mission_chain.id not in self.mission_chain_table:
             raise MissionChainNotFoundError
+        for existing in self.mission_chain_table.values():
+            if existing.name == mission_chain.name and existing.id != mission_chain.id:
+                raise MissionChainNameAlreadyExistError
         self.mission_chain_table[mission_chain.id] = mission_chain
+        return await self.get_mission_chain_by_id(chain_id=mission_chain.id)
 
     async def delete_mission_chain(self, chain_id: int) -> None:
         try:
@@ -741,11 +809,12 @@ class StorageMock(
             reward_skills=mission.reward_skills,
         )
 
-    async def insert_store_item(self, store_item: StoreItem) -> None:
+    async def insert_store_item(self, store_item: StoreItem) -> StoreItem:
         for existing in self.store_item_table.values():
             if existing.title == store_item.title:
                 raise StoreItemTitleAlreadyExistError
         self.store_item_table[store_item.id] = store_item
+        return await self.get_store_item_by_title(title=store_item.title)
 
     async def get_store_item_by_id(self, store_item_id: int) -> StoreItem:
         try:
@@ -762,10 +831,14 @@ class StorageMock(
     async def list_store_items(self) -> StoreItems:
         return StoreItems(values=list(self.store_item_table.values()))
 
-    async def update_store_item(self, store_item: StoreItem) -> None:
+    async def update_store_item(self, store_item: StoreItem) -> StoreItem:
         if store_item.id not in self.store_item_table:
             raise StoreItemNotFoundError
+        for existing in self.store_item_table.values():
+            if existing.title == store_item.title and existing.id != store_item.id:
+                raise StoreItemTitleAlreadyExistError
         self.store_item_table[store_item.id] = store_item
+        return await self.get_store_item_by_id(store_item_id=store_item.id)
 
     async def delete_store_item(self, store_item_id: int) -> None:
         try:
@@ -1069,3 +1142,85 @@ class StorageMock(
                         )
                     )
         return tasks
+
+    async def insert_media_object(self, media_object: MediaObject) -> None:
+        self.media_object_table.setdefault(media_object.digest, media_object)
+
+    async def get_media_object_by_digest(self, digest: str) -> MediaObject:
+        try:
+            return self.media_object_table[digest]
+        except KeyError as error:
+            raise MediaNotFoundError from error
+
+    async def delete_media_objects(self, keys: list[str]) -> None:
+        self.media_object_table = {
+            digest: media_object
+            for digest, media_object in self.media_object_table.items()
+            if media_object.key not in keys
+        }
+
+    async def get_media_urls(self) -> list[str]:
+        items: list[Rank | Artifact | StoreItem] = [
+            *self.rank_table.values(),
+            *self.artifact_table.values(),
+            *self.store_item_table.values(),
+        ]
+        return [item.image_url for item in items if item.image_url]
+
+    async def insert_upload_session(self, upload_session: UploadSession) -> None:
+        self.upload_session_table[upload_session.id] = replace(
+            upload_session, created_at=upload_session.created_at or datetime.now(UTC)
+        )
+
+    async def get_upload_session(self, session_id: str) -> UploadSession:
+        try:
+            return self.upload_session_table[session_id]
+        except KeyError as error:
+            raise UploadSessionNotFoundError from error
+
+    async def delete_upload_session(self, session_id: str) -> None:
+        self.upload_session_table.pop(session_id, None)
+
+    async def get_stale_upload_sessions(self, created_before: datetime) -> list[UploadSession]:
+        return [
+            upload_session
+            for upload_session in self.upload_session_table.values()
+            if upload_session.created_at is not None and upload_session.created_at < created_before
+        ]
+
+    async def search(self, query: SearchQuery) -> SearchResults:
+        rows: list[tuple[SearchEntityEnum, int, str, str]] = [
+            *(
+                (SearchEntityEnum.MISSION, m.id, m.title, m.description)
+                for m in self.mission_table.values()
+            ),
+            *(
+                (SearchEntityEnum.TASK, t.id, t.title, t.description)
+                for t in self.task_table.values()
+            ),
+            *(
+                (SearchEntityEnum.ARTIFACT, a.id, a.title, a.description)
+                for a in self.artifact_table.values()
+            ),
+            *(
+                (SearchEntityEnum.STORE_ITEM, i.id, i.title, "")
+                for i in self.store_item_table.values()
+            ),
+        ]
+        text = query.text.lower()
+        results = [
+            SearchResult(
+                entity_type=entity_type,
+                id=row_id,
+                title=title,
+                description=description,
+                rank=1.0 if text in title.lower() else 0.5,
+            )
+            for entity_type, row_id, title, description in rows
+            if entity_type in query.entity_types
+            and (text in title.lower() or text in description.lower())
+        ]
+        results.sort(key=lambda result: -result.rank)
+        return SearchResults(
+            values=results[query.offset : query.offset + query.limit], total=len(results)
+        )
@@ -0,0 +1,60 @@
+from collections import defaultdict
+from typing import Any
+
+import pytest
+
+from src.scripts.generate_data import GenerationVolume, SyntheticDataGenerator
+
+VOLUME = GenerationVolume(users=300, seasons=3, missions=40, tasks=200, store_items=5)
+
+
+def generate(seed: int) -> tuple[SyntheticDataGenerator, dict[str, list[Any]]]:
+    generator = SyntheticDataGenerator(volume=VOLUME, seed=seed, password="password")
+    seasons = generator.generate_seasons()
+    relations = generator.generate_missions(seasons=seasons)
+    rows: dict[str, list[Any]] = {
+        "missions": list(generator.generate_mission_rows()),
+        "relations": list(relations),
+        "users": list(generator.generate_users()),
+        "user_tasks": list(generator.generate_user_tasks()),
+        "store_items": list(generator.generate_store_items()),
+    }
+    return generator, rows
+
+
+class TestSyntheticDataGenerator:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.generator, self.rows = generate(seed=7)
+
+    def test_volume(self) -> None:
+        assert len(self.rows["missions"]) == VOLUME.missions
+        assert len(self.rows["relations"]) == VOLUME.tasks
+        assert len(self.rows["users"]) == VOLUME.users
+        assert len(self.rows["store_items"]) == VOLUME.store_items
+        assert all(mission.task_ids for mission in self.generator.missions)
+
+    def test_deterministic(self) -> None:
+        _, rows = generate(seed=7)
+        _, other_rows = generate(seed=8)
+
+        assert rows["missions"] == self.rows["missions"]
+        assert rows["user_tasks"] == self.rows["user_tasks"]
+        assert other_rows["user_tasks"] != self.rows["user_tasks"]
+
+    def test_approvals_only_for_completed_missions(self) -> None:
+        task_missions = {
+            task_id: mission.id
+            for mission in self.generator.missions
+            for task_id in mission.task_ids
+        }
+        progress: dict[tuple[int, str], list[bool]] = defaultdict(list)
+        for task_id, login, is_completed in self.rows["user_tasks"]:
+            progress[task_missions[task_id], login].append(is_completed)
+
+        completed = {key for key, tasks in progress.items() if all(tasks)}
+
+        assert self.generator.approvals
+        assert {(mission_id, login) for mission_id, login, *_ in self.generator.approvals} == (
+            completed
+        )
@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import AsyncMock
+
+import pytest
+from PIL import Image
+
+from src.core.media.enums import MediaVariantEnum
+from src.core.media.schemas import FileObject
+from src.services.image_variants import (
+    WEBP_MAX_SIZE,
+    ImageVariantService,
+    build_variant_key,
+)
+from src.services.minio import MinioService
+
+
+def _png(width: int, height: int) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", (width, height), color="red").save(output, format="PNG")
+    return output.getvalue()
+
+
+class TestImageVariantService:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.file_storage = AsyncMock(spec=MinioService)
+        self.file_storage.upload_file.side_effect = lambda key, content, content_type: FileObject(
+            key=key,
+            url=f"http://test-url/{key}",
+            size=len(content),
+            etag="etag",
+            content_type=content_type,
+        )
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.service = ImageVariantService(
+            file_storage=self.file_storage,
+            executor=self.executor,
+            thumb_size=16,
+            medium_size=64,
+        )
+
+    async def test_create_variants(self) -> None:
+        result = await self.service.create_variants(key="image.png", content=_png(200, 100))
+
+        assert set(result) == set(MediaVariantEnum)
+        assert result[MediaVariantEnum.THUMB].key == "image.png.thumb.webp"
+        uploaded = {
+            call.kwargs["key"]: call.kwargs["content"]
+            for call in self.file_storage.upload_file.await_args_list
+        }
+        sizes = {key: Image.open(BytesIO(content)).size for key, content in uploaded.items()}
+        assert sizes == {
+            "image.png.thumb.webp": (16, 8),
+            "image.png.medium.webp": (64, 32),
+            "image.png.webp.webp": (200, 100),
+        }
+
+    async def test_create_variants_for_invalid_image(self) -> None:
+        result = await self.service.create_variants(key="image.png", content=b"not an image")
+
+        assert result == {}
+        self.file_storage.upload_file.assert_not_called()
+
+    async def test_create_variants_clamps_webp_size(self) -> None:
+        result = await self.service.create_variants(key="wide.png", content=_png(17000, 10))
+
+        assert set(result) == set(MediaVariantEnum)
+        webp = next(
+            call.kwargs["content"]
+            for call in self.file_storage.upload_file.await_args_list
+            if call.kwargs["key"] == "wide.png.webp.webp"
+        )
+        assert Image.open(BytesIO(webp)).size[0] == WEBP_MAX_SIZE
+
+    async def test_create_variants_for_decompression_bomb(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+
+        result = await self.service.create_variants(key="image.png", content=_png(200, 100))
+
+        assert result == {}
+        self.file_storage.upload_file.assert_not_called()
+
+    def test_build_variant_key(self) -> None:
+        assert build_variant_key(key="a/b.png", variant=MediaVariantEnum.MEDIUM) == (
+            "a/b.png.medium.webp"
+        )
@@ -0,0 +1,178 @@
+import hashlib
+from collections.abc import AsyncIterator
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from src.core.media.exceptions import MediaNotFoundError
+from src.services.local_storage import LocalFileStorage
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _consume(stream: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestLocalFileStorage:
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path: Path) -> None:
+        self.storage = LocalFileStorage(
+            root=tmp_path,
+            server_url="http://test-url",
+            bucket="test",
+            chunk_size=4,
+        )
+        await self.storage.ensure_bucket()
+
+    async def test_upload_file_stream_from_file(self) -> None:
+        result = await self.storage.upload_file_stream(
+            file_name="test.txt",
+            file_stream=BytesIO(b"test file content"),
+            content_type="text/plain",
+            key="2025/01/01/test.txt",
+        )
+
+        assert result.key == "2025/01/01/test.txt"
+        assert result.url == "http://test-url/media/2025/01/01/test.txt"
+        assert result.size == len(b"test file content")
+        assert result.etag == hashlib.md5(b"test file content", usedforsecurity=False).hexdigest()
+        path = self.storage.bucket_path / "2025/01/01/test.txt"
+        assert path.read_bytes() == b"test file content"
+        assert not list(path.parent.glob("*.tmp"))
+
+    async def test_upload_file_stream_generates_key(self) -> None:
+        result = await self.storage.upload_file_stream(
+            file_name="test.txt",
+            file_stream=_stream(b"test ", b"content"),
+            content_type="text/plain",
+        )
+
+        assert result.key.endswith("_test.txt")
+        metadata = await self.storage.get_file_metadata(key=result.key)
+        assert metadata.file_size == len(b"test content")
+        assert metadata.media_type == "text/plain"
+        assert metadata.etag == result.etag
+        assert metadata.last_modified is not None
+
+    async def test_open_file(self) -> None:
+        await self.storage.upload_file(key="a.png", content=b"image", content_type="image/png")
+
+        file = await self.storage.open_file(key="a.png")
+
+        assert file.metadata.file_size == 5
+        assert file.metadata.media_type == "image/png"
+        assert file.path == self.storage.bucket_path / "a.png"
+        assert await _consume(file.stream) == b"image"
+
+    async def test_upload_file_overwrites_existing(self) -> None:
+        await self.storage.upload_file(key="a.png", content=b"old", content_type="image/png")
+        await self.storage.upload_file(key="a.png", content=b"new", content_type="image/webp")
+
+        assert await _consume(self.storage.download_file(key="a.png")) == b"new"
+        metadata = await self.storage.get_file_metadata(key="a.png")
+        assert (metadata.file_size, metadata.media_type) == (3, "image/webp")
+
+    async def test_open_file_not_found(self) -> None:
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.open_file(key="missing.png")
+
+    async def test_open_file_outside_bucket(self) -> None:
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.open_file(key="../secret.txt")
+
+    async def test_delete_file(self) -> None:
+        await self.storage.upload_file(key="a.png", content=b"image", content_type="image/png")
+
+        await self.storage.delete_file(key="a.png")
+
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.get_file_metadata(key="a.png")
+        assert list(self.storage.bucket_path.iterdir()) == []
+
+    async def test_list_files(self) -> None:
+        await self.storage.upload_file(key="a/1.png", content=b"image", content_type="image/png")
+        await self.storage.upload_file(key="b/2.png", content=b"img", content_type="image/png")
+
+        result = [stored_file async for stored_file in self.storage.list_files(prefix="a/")]
+
+        assert [(stored_file.key, stored_file.size) for stored_file in result] == [("a/1.png", 5)]
+
+    async def test_delete_files(self) -> None:
+        await self.storage.upload_file(key="a.png", content=b"image", content_type="image/png")
+        await self.storage.upload_file(key="b.png", content=b"image", content_type="image/png")
+
+        await self.storage.delete_files(keys=["a.png", "b.png", "missing.png"])
+
+        assert [stored_file async for stored_file in self.storage.list_files()] == []
+
+    async def test_move_file(self) -> None:
+        file_object = await self.storage.upload_file(
+            key="tmp/a.png", content=b"image", content_type="image/png"
+        )
+
+        result = await self.storage.move_file(file_object=file_object, key="sha256/ab/abc.png")
+
+        assert result.key == "sha256/ab/abc.png"
+        assert result.url == "http://test-url/media/sha256/ab/abc.png"
+        assert result.etag == file_object.etag
+        assert await _consume(self.storage.download_file(key="sha256/ab/abc.png")) == b"image"
+        metadata = await self.storage.get_file_metadata(key="sha256/ab/abc.png")
+        assert (metadata.file_size, metadata.media_type) == (5, "image/png")
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.get_file_metadata(key="tmp/a.png")
+        assert list((self.storage.bucket_path / "tmp").iterdir()) == []
+
+    async def test_get_download_url(self) -> None:
+        assert await self.storage.get_download_url(key="a.png") == "http://test-url/media/a.png"
+
+    async def test_multipart_upload(self) -> None:
+        upload_id = await self.storage.create_multipart_upload(
+            key="parts.txt", content_type="text/plain"
+        )
+        await self.storage.upload_part(
+            key="parts.txt", upload_id=upload_id, part_number=2, content=b"efgh"
+        )
+        await self.storage.upload_part(
+            key="parts.txt", upload_id=upload_id, part_number=1, content=b"abcd"
+        )
+
+        parts = await self.storage.list_parts(key="parts.txt", upload_id=upload_id)
+        result = await self.storage.complete_multipart_upload(
+            key="parts.txt", upload_id=upload_id, parts=parts, content_type="text/plain"
+        )
+
+        assert [part.number for part in parts] == [1, 2]
+        assert result.size == 8
+        assert await _consume(self.storage.download_file(key="parts.txt")) == b"abcdefgh"
+        assert list(self.storage.uploads_path.iterdir()) == []
+
+    async def test_list_parts_after_retried_part(self) -> None:
+        upload_id = await self.storage.create_multipart_upload(key="parts.txt", content_type=None)
+        await self.storage.upload_part(
+            key="parts.txt", upload_id=upload_id, part_number=1, content=b"abcd"
+        )
+        retried = await self.storage.upload_part(
+            key="parts.txt", upload_id=upload_id, part_number=1, content=b"xyz"
+        )
+
+        parts = await self.storage.list_parts(key="parts.txt", upload_id=upload_id)
+
+        assert parts == [retried]
+        assert retried.etag == hashlib.md5(b"xyz", usedforsecurity=False).hexdigest()
+        assert retried.size == 3
+        assert not list((self.storage.uploads_path / upload_id).glob("*.tmp*"))
+
+    async def test_list_parts_unknown_upload(self) -> None:
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.list_parts(key="parts.txt", upload_id="unknown")
+
+    async def test_list_parts_other_key(self) -> None:
+        upload_id = await self.storage.create_multipart_upload(key="parts.txt", content_type=None)
+
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.list_parts(key="other.txt", upload_id=upload_id)
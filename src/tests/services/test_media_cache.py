@@ -0,0 +1,197 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.file_storage import FileStorage
+from src.core.media.schemas import FileMetadata, FileStream
+from src.services.media_cache import CachedFileStorage, MediaCache
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _consume(stream: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestMediaCache:
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path: Path) -> AsyncIterator[None]:
+        self.root = tmp_path
+        self.cache = MediaCache(
+            enabled=True,
+            root=tmp_path,
+            max_size=10,
+            max_object_size=8,
+            memory_max_size=4,
+            memory_max_object_size=2,
+            workers=1,
+        )
+        await self.cache.load()
+        yield
+        self.cache.close()
+
+    async def test_cache_stream_stores_file(self) -> None:
+        metadata = FileMetadata(file_size=6, media_type="image/png")
+
+        content = await _consume(
+            self.cache.cache_stream(key="a.png", metadata=metadata, stream=_stream(b"abc", b"def"))
+        )
+
+        assert content == b"abcdef"
+        cached = await self.cache.get("a.png")
+        assert cached is not None
+        assert cached.content is None
+        assert cached.media_type == "image/png"
+        assert cached.path.read_bytes() == b"abcdef"
+        assert self.cache.stats.hits == 1
+
+    async def test_small_objects_are_kept_in_memory(self) -> None:
+        metadata = FileMetadata(file_size=2, media_type="image/png")
+
+        await _consume(self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"ab")))
+
+        cached = await self.cache.get("a")
+        assert cached is not None
+        assert cached.content == b"ab"
+        assert self.cache.stats.memory_hits == 1
+
+    async def test_large_objects_are_not_cached(self) -> None:
+        metadata = FileMetadata(file_size=9, media_type="image/png")
+
+        content = await _consume(
+            self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"123456789"))
+        )
+
+        assert content == b"123456789"
+        assert await self.cache.get("a") is None
+        assert self.cache.stats.misses == 1
+
+    async def test_incomplete_stream_is_not_cached(self) -> None:
+        metadata = FileMetadata(file_size=6, media_type="image/png")
+
+        await _consume(self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"abc")))
+
+        assert await self.cache.get("a") is None
+        assert list(self.root.rglob("*.tmp")) == []
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        metadata = FileMetadata(file_size=4, media_type="image/png")
+        await _consume(self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"aaaa")))
+        await _consume(self.cache.cache_stream(key="b", metadata=metadata, stream=_stream(b"bbbb")))
+        await self.cache.get("a")
+
+        await _consume(self.cache.cache_stream(key="c", metadata=metadata, stream=_stream(b"cccc")))
+
+        assert await self.cache.get("b") is None
+        assert await self.cache.get("a") is not None
+        assert await self.cache.get("c") is not None
+        assert self.cache.size == 8
+        assert self.cache.stats.evictions == 1
+        assert self.cache.stats.evicted_bytes == 4
+
+    async def test_load_restores_index(self) -> None:
+        metadata = FileMetadata(
+            file_size=4,
+            media_type="image/png",
+            etag="abc",
+            last_modified=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        await _consume(self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"aaaa")))
+        self.cache.close()
+        restored = MediaCache(enabled=True, root=self.root, max_size=10, max_object_size=8)
+
+        await restored.load()
+
+        cached = await restored.get("a")
+        assert cached is not None
+        assert cached.metadata == metadata
+        assert cached.path.read_bytes() == b"aaaa"
+
+    async def test_disabled_cache_always_misses(self, tmp_path: Path) -> None:
+        root = tmp_path / "disabled"
+        cache = MediaCache(enabled=False, root=root)
+
+        await cache.load()
+
+        assert await cache.get("a") is None
+        assert not root.exists()
+
+    async def test_workers_use_separate_directories(self) -> None:
+        metadata = FileMetadata(file_size=4, media_type="image/png")
+        other = MediaCache(enabled=True, root=self.root, max_size=14, max_object_size=8, workers=2)
+        await other.load()
+        await _consume(self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"aaaa")))
+        await _consume(other.cache_stream(key="b", metadata=metadata, stream=_stream(b"bbbb")))
+        await _consume(other.cache_stream(key="c", metadata=metadata, stream=_stream(b"cccc")))
+        other.close()
+
+        cached = await self.cache.get("a")
+
+        assert cached is not None
+        assert cached.path.parent.parent == self.root / "worker-0"
+        assert len(list((self.root / "worker-1").glob("*/*.json"))) == 1
+        assert other.size == 4
+        assert other.stats.evictions == 1
+
+    async def test_invalidate_removes_copies_of_other_workers(self) -> None:
+        metadata = FileMetadata(file_size=4, media_type="image/png")
+        other = MediaCache(enabled=True, root=self.root, max_size=10, max_object_size=8)
+        await other.load()
+        await _consume(self.cache.cache_stream(key="a", metadata=metadata, stream=_stream(b"aaaa")))
+        await _consume(other.cache_stream(key="a", metadata=metadata, stream=_stream(b"aaaa")))
+
+        await other.invalidate("a")
+
+        assert await other.get("a") is None
+        assert await self.cache.get("a") is None
+        assert self.cache.size == 0
+        other.close()
+
+
+class TestCachedFileStorage:
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path: Path) -> AsyncIterator[None]:
+        self.cache = MediaCache(enabled=True, root=tmp_path, max_size=10, max_object_size=8)
+        await self.cache.load()
+        self.file_storage = AsyncMock(spec=FileStorage)
+        self.cached_file_storage = CachedFileStorage(
+            file_storage=self.file_storage, media_cache=self.cache
+        )
+        yield
+        self.cache.close()
+
+    async def _open(self, key: str) -> bytes:
+        file = await self.cached_file_storage.open_file(key=key)
+        return await _consume(file.stream)
+
+    async def test_open_file_is_served_from_cache(self) -> None:
+        self.file_storage.open_file.return_value = FileStream(
+            metadata=FileMetadata(file_size=4, media_type="image/png"), stream=_stream(b"aaaa")
+        )
+
+        first_content = await self._open("a")
+        second_content = await self._open("a")
+
+        assert first_content == second_content == b"aaaa"
+        self.file_storage.open_file.assert_awaited_once_with(key="a")
+
+    async def test_delete_files_invalidates_cache(self) -> None:
+        self.file_storage.open_file.side_effect = [
+            FileStream(
+                metadata=FileMetadata(file_size=4, media_type="image/png"),
+                stream=_stream(content),
+            )
+            for content in (b"aaaa", b"bbbb")
+        ]
+        await self._open("a")
+
+        await self.cached_file_storage.delete_files(keys=["a"])
+
+        assert await self._open("a") == b"bbbb"
+        self.file_storage.delete_files.assert_awaited_once_with(keys=["a"])
@@ -0,0 +1,117 @@
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import orjson
+import pytest
+
+from src.core.use_case import UseCase, set_execution_observer
+from src.services.metrics import MetricsRegistry, merge_snapshots, render_snapshot
+
+DEAD_PID = 2**22 + 1
+
+
+@dataclass
+class DummyUseCase(UseCase):
+    fail: bool = False
+
+    async def execute(self) -> str:
+        if self.fail:
+            raise RuntimeError
+        return "done"
+
+
+class TestMetricsRegistry:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.registry = MetricsRegistry()
+
+    async def test_render_histogram(self) -> None:
+        histogram = self.registry.histogram(
+            "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+        )
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.5, route="/a")
+        histogram.observe(5, route="/a")
+
+        assert await self.registry.render() == (
+            "# HELP latency_seconds Latency\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{route="/a",le="0.1"} 1\n'
+            'latency_seconds_bucket{route="/a",le="1"} 2\n'
+            'latency_seconds_bucket{route="/a",le="+Inf"} 3\n'
+            'latency_seconds_sum{route="/a"} 5.55\n'
+            'latency_seconds_count{route="/a"} 3\n'
+        )
+
+    async def test_render_gauge_with_collector(self) -> None:
+        gauge = self.registry.gauge("connections", "Connections", ("state",))
+        self.registry.register_collector("pool", lambda: gauge.set(3, state='checked "out"'))
+
+        assert 'connections{state="checked \\"out\\""} 3' in await self.registry.render()
+
+    def test_register_duplicate(self) -> None:
+        self.registry.counter("requests_total", "Requests")
+
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.counter("requests_total", "Requests")
+
+    def test_merge_snapshots(self) -> None:
+        first = MetricsRegistry()
+        second = MetricsRegistry()
+        for registry, value in ((first, 1), (second, 2)):
+            registry.counter("requests_total", "Requests").inc(value)
+            registry.histogram("latency_seconds", "Latency", buckets=(1.0,)).observe(value)
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+
+        assert "requests_total 3" in render_snapshot(merged)
+        assert 'latency_seconds_bucket{le="1"} 1' in render_snapshot(merged)
+        assert "latency_seconds_count 2" in render_snapshot(merged)
+
+    async def test_multiprocess_render(self, tmp_path: Path) -> None:
+        self.registry.multiprocess_dir = tmp_path
+        self.registry.counter("requests_total", "Requests").inc(2)
+        self.registry.gauge("in_progress", "In progress").set(1)
+        dead_worker = MetricsRegistry()
+        dead_worker.counter("requests_total", "Requests").inc(5)
+        dead_worker.gauge("in_progress", "In progress").set(4)
+        (tmp_path / f"{DEAD_PID}.json").write_bytes(orjson.dumps(dead_worker.snapshot()))
+
+        content = await self.registry.render()
+
+        assert "requests_total 7" in content
+        assert "in_progress 1" in content
+        assert not (tmp_path / f"{DEAD_PID}.json").exists()
+        assert (tmp_path / f"{os.getpid()}.json").exists()
+        assert "requests_total 7" in await self.registry.render()
+
+    async def test_flush_async(self, tmp_path: Path) -> None:
+        self.registry.multiprocess_dir = tmp_path
+        self.registry.counter("requests_total", "Requests").inc(2)
+
+        await self.registry.flush_async()
+
+        snapshot = orjson.loads((tmp_path / f"{os.getpid()}.json").read_bytes())
+        assert snapshot["requests_total"]["samples"] == [[[], 2.0]]
+
+
+class TestUseCaseObserver:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> Iterator[None]:
+        self.observations: list[tuple[str, str]] = []
+        set_execution_observer(lambda name, _, status: self.observations.append((name, status)))
+        yield
+        set_execution_observer(None)
+
+    async def test_observes_execution(self) -> None:
+        assert await DummyUseCase().execute() == "done"
+
+        assert self.observations == [("DummyUseCase", "success")]
+
+    async def test_observes_failure(self) -> None:
+        with pytest.raises(RuntimeError):
+            await DummyUseCase(fail=True).execute()
+
+        assert self.observations == [("DummyUseCase", "error")]
@@ -0,0 +1,191 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.core.media.schemas import FileObject, StoredFile
+from src.services.minio import MinioService
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _failing_stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+    raise RuntimeError
+
+
+class TestMinioServiceStreamUpload:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.connection = AsyncMock()
+        self.connection.put_object.return_value = {"ETag": '"put-etag"'}
+        self.connection.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+        self.connection.upload_part.side_effect = [{"ETag": '"part-1"'}, {"ETag": '"part-2"'}]
+        self.connection.complete_multipart_upload.return_value = {"ETag": '"multipart-etag"'}
+        self.service = MinioService(
+            minio_connection=self.connection,
+            server_url="http://test-url",
+            bucket="test",
+            multipart_part_size=4,
+        )
+
+    async def test_small_stream_uses_single_put(self) -> None:
+        result = await self.service.upload_file_stream(
+            file_name="test.txt",
+            file_stream=_stream(b"ab", b"c"),
+            content_type="text/plain",
+            key="test.txt",
+        )
+
+        assert result.etag == "put-etag"
+        assert result.size == 3
+        self.connection.put_object.assert_awaited_once_with(
+            Bucket="test", Key="test.txt", Body=b"abc", ContentType="text/plain"
+        )
+        self.connection.create_multipart_upload.assert_not_called()
+
+    async def test_large_stream_uses_multipart_upload(self) -> None:
+        result = await self.service.upload_file_stream(
+            file_name="test.txt",
+            file_stream=_stream(b"abc", b"def", b"g"),
+            content_type="text/plain",
+            key="test.txt",
+        )
+
+        assert result.etag == "multipart-etag"
+        assert result.size == 7
+        bodies = [call.kwargs["Body"] for call in self.connection.upload_part.await_args_list]
+        assert bodies == [b"abcdef", b"g"]
+        self.connection.complete_multipart_upload.assert_awaited_once_with(
+            Bucket="test",
+            Key="test.txt",
+            UploadId="upload-id",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "part-1", "PartNumber": 1},
+                    {"ETag": "part-2", "PartNumber": 2},
+                ]
+            },
+        )
+        self.connection.put_object.assert_not_called()
+
+    async def test_failed_stream_aborts_multipart_upload(self) -> None:
+        with pytest.raises(RuntimeError):
+            await self.service.upload_file_stream(
+                file_name="test.txt",
+                file_stream=_failing_stream(b"abcd"),
+                key="test.txt",
+            )
+
+        self.connection.abort_multipart_upload.assert_awaited_once_with(
+            Bucket="test", Key="test.txt", UploadId="upload-id"
+        )
+        self.connection.complete_multipart_upload.assert_not_called()
+
+    async def test_move_file(self) -> None:
+        self.connection.copy_object.return_value = {"CopyObjectResult": {"ETag": '"copy-etag"'}}
+        file_object = FileObject(
+            key="tmp.txt",
+            url="http://test-url/media/tmp.txt",
+            size=3,
+            etag="multipart-etag",
+            content_type="text/plain",
+        )
+
+        result = await self.service.move_file(file_object=file_object, key="sha256/ab/abc.txt")
+
+        assert result == FileObject(
+            key="sha256/ab/abc.txt",
+            url="http://test-url/media/sha256/ab/abc.txt",
+            size=3,
+            etag="copy-etag",
+            content_type="text/plain",
+        )
+        self.connection.copy_object.assert_awaited_once_with(
+            Bucket="test", Key="sha256/ab/abc.txt", CopySource={"Bucket": "test", "Key": "tmp.txt"}
+        )
+        self.connection.delete_object.assert_awaited_once_with(Bucket="test", Key="tmp.txt")
+
+    async def test_move_file_keeps_copy_when_delete_fails(self) -> None:
+        self.connection.copy_object.return_value = {"CopyObjectResult": {"ETag": '"copy-etag"'}}
+        self.connection.delete_object.side_effect = ClientError(
+            {"Error": {"Code": "InternalError"}}, "DeleteObject"
+        )
+        file_object = FileObject(
+            key="tmp.txt",
+            url="http://test-url/media/tmp.txt",
+            size=3,
+            etag="multipart-etag",
+            content_type="text/plain",
+        )
+
+        result = await self.service.move_file(file_object=file_object, key="sha256/ab/abc.txt")
+
+        assert result.key == "sha256/ab/abc.txt"
+        assert result.etag == "copy-etag"
+
+
+class TestMinioServiceOpenFile:
+    async def test_close_unread_file_releases_body(self) -> None:
+        body = MagicMock()
+        body.__aenter__ = AsyncMock(return_value=body)
+        body.__aexit__ = AsyncMock(return_value=None)
+        connection = AsyncMock()
+        connection.get_object.return_value = {
+            "Body": body,
+            "ContentLength": 3,
+            "ContentType": "text/plain",
+            "ETag": '"abc"',
+        }
+        service = MinioService(minio_connection=connection, bucket="test")
+
+        file = await service.open_file(key="test.txt")
+        await file.close()
+
+        assert file.metadata.etag == "abc"
+        body.__aexit__.assert_awaited_once()
+
+
+class TestMinioServiceCleanup:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.connection = AsyncMock()
+        self.connection.delete_objects.return_value = {}
+        self.service = MinioService(
+            minio_connection=self.connection, server_url="http://test-url", bucket="test"
+        )
+
+    async def test_delete_files_in_batches(self) -> None:
+        keys = [f"{index}.png" for index in range(1500)]
+
+        await self.service.delete_files(keys=keys)
+
+        batches = [
+            call.kwargs["Delete"]["Objects"]
+            for call in self.connection.delete_objects.await_args_list
+        ]
+        assert [len(batch) for batch in batches] == [1000, 500]
+        assert batches[1][-1] == {"Key": "1499.png"}
+
+    async def test_list_files(self) -> None:
+        last_modified = datetime(2025, 1, 1, tzinfo=UTC)
+
+        async def _pages(**_: str) -> AsyncIterator[dict[str, Any]]:
+            yield {"Contents": [{"Key": "a.png", "Size": 1, "LastModified": last_modified}]}
+            yield {}
+
+        paginator = MagicMock()
+        paginator.paginate.side_effect = _pages
+        self.connection.get_paginator = MagicMock(return_value=paginator)
+
+        result = [stored_file async for stored_file in self.service.list_files(prefix="a")]
+
+        assert result == [StoredFile(key="a.png", size=1, last_modified=last_modified)]
+        paginator.paginate.assert_called_once_with(Bucket="test", Prefix="a")
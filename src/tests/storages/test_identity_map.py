@@ -0,0 +1,66 @@
+from collections import Counter
+from dataclasses import dataclass, field
+
+import pytest
+
+from src.core.ranks.exceptions import RankNotFoundError
+from src.core.ranks.schemas import Rank
+from src.storages.identity_map import IdentityMap
+from src.storages.memory_storage import InMemoryStorage
+from src.tests.fixtures import FactoryFixture
+
+
+@dataclass
+class CountingStorage(InMemoryStorage):
+    calls: Counter[str] = field(default_factory=Counter)
+
+    async def get_rank_by_id(self, rank_id: int) -> Rank:
+        self.calls["get_rank_by_id"] += 1
+        return await super().get_rank_by_id(rank_id=rank_id)
+
+
+@dataclass
+class IdentityMapCountingStorage(IdentityMap, CountingStorage):
+    pass
+
+
+class TestIdentityMap(FactoryFixture):
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.storage = IdentityMapCountingStorage()
+
+    async def test_repeated_read_is_served_from_map(self) -> None:
+        first = await self.storage.get_rank_by_id(rank_id=1)
+        second = await self.storage.get_rank_by_id(1)
+
+        assert first == second
+        assert self.storage.calls["get_rank_by_id"] == 1
+
+    async def test_write_invalidates_map(self) -> None:
+        await self.storage.get_rank_by_id(rank_id=1)
+        await self.storage.update_rank(rank=self.factory.rank(rank_id=1, name="RENAMED"))
+
+        rank = await self.storage.get_rank_by_id(rank_id=1)
+
+        assert rank.name == "RENAMED"
+        assert self.storage.calls["get_rank_by_id"] == 2
+
+    async def test_returned_object_is_a_copy(self) -> None:
+        rank = await self.storage.get_rank_by_id(rank_id=1)
+        rank.name = "CHANGED"
+
+        assert (await self.storage.get_rank_by_id(rank_id=1)).name != "CHANGED"
+
+    async def test_nested_lists_are_copied(self) -> None:
+        rank = await self.storage.get_rank_by_id(rank_id=1)
+        assert rank.required_missions is not None
+        rank.required_missions.append(self.factory.mission())
+
+        assert (await self.storage.get_rank_by_id(rank_id=1)).required_missions == []
+
+    async def test_errors_are_not_cached(self) -> None:
+        with pytest.raises(RankNotFoundError):
+            await self.storage.get_rank_by_id(rank_id=2)
+        await self.storage.insert_rank(rank=self.factory.rank())
+
+        assert (await self.storage.get_rank_by_id(rank_id=2)).name == "TEST"
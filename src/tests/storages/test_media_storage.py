@@ -0,0 +1,146 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.core.media.exceptions import MediaNotFoundError, UploadSessionNotFoundError
+from src.core.media.schemas import MediaObject, UploadSession
+from src.core.ranks.schemas import Rank
+from src.core.store.schemas import StoreItem
+from src.storages.database_storage import DatabaseStorage
+
+
+class TestMediaStorage:
+    @pytest.fixture(autouse=True)
+    async def setup(self, storage: DatabaseStorage) -> None:
+        self.storage = storage
+
+    async def test_insert_media_object(self) -> None:
+        media_object = MediaObject(
+            digest="a" * 64,
+            key="sha256/aa/TEST.txt",
+            size=10,
+            etag="TEST",
+            content_type="text/plain",
+        )
+
+        await self.storage.insert_media_object(media_object=media_object)
+
+        result = await self.storage.get_media_object_by_digest(digest="a" * 64)
+        assert result == media_object
+
+    async def test_insert_media_object_twice_keeps_first(self) -> None:
+        media_object = MediaObject(
+            digest="a" * 64,
+            key="sha256/aa/TEST.txt",
+            size=10,
+            etag="TEST",
+            content_type="text/plain",
+        )
+        await self.storage.insert_media_object(media_object=media_object)
+
+        await self.storage.insert_media_object(
+            media_object=MediaObject(
+                digest="a" * 64,
+                key="sha256/aa/OTHER.txt",
+                size=10,
+                etag="OTHER",
+                content_type="text/plain",
+            )
+        )
+
+        result = await self.storage.get_media_object_by_digest(digest="a" * 64)
+        assert result == media_object
+
+    async def test_get_media_object_not_found(self) -> None:
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.get_media_object_by_digest(digest="b" * 64)
+
+    async def test_delete_media_objects(self) -> None:
+        await self.storage.insert_media_object(
+            media_object=MediaObject(
+                digest="a" * 64,
+                key="sha256/aa/TEST.txt",
+                size=10,
+                etag="TEST",
+                content_type="text/plain",
+            )
+        )
+
+        await self.storage.delete_media_objects(keys=["sha256/aa/TEST.txt"])
+
+        with pytest.raises(MediaNotFoundError):
+            await self.storage.get_media_object_by_digest(digest="a" * 64)
+
+    async def test_get_media_urls(self) -> None:
+        await self.storage.insert_rank(
+            rank=Rank(id=1, name="TEST", required_xp=100, image_url="http://test/media/rank.png")
+        )
+        await self.storage.insert_store_item(
+            store_item=StoreItem(
+                id=1, title="TEST", price=10, stock=1, image_url="http://test/media/item.png"
+            )
+        )
+
+        result = await self.storage.get_media_urls()
+
+        assert sorted(result) == ["http://test/media/item.png", "http://test/media/rank.png"]
+
+    async def test_insert_upload_session(self) -> None:
+        await self.storage.insert_upload_session(
+            upload_session=UploadSession(
+                id="session",
+                key="2025/01/01/test.txt",
+                upload_id="upload",
+                file_name="test.txt",
+                content_type="text/plain",
+                owner_login="candidate",
+                chunk_size=4,
+            )
+        )
+
+        result = await self.storage.get_upload_session(session_id="session")
+        assert result.key == "2025/01/01/test.txt"
+        assert result.upload_id == "upload"
+        assert result.owner_login == "candidate"
+        assert result.created_at is not None
+
+    async def test_delete_upload_session(self) -> None:
+        await self.storage.insert_upload_session(
+            upload_session=UploadSession(
+                id="session",
+                key="test.txt",
+                upload_id="upload",
+                file_name="test.txt",
+                content_type=None,
+                owner_login="candidate",
+                chunk_size=4,
+            )
+        )
+
+        await self.storage.delete_upload_session(session_id="session")
+
+        with pytest.raises(UploadSessionNotFoundError):
+            await self.storage.get_upload_session(session_id="session")
+
+    async def test_get_stale_upload_sessions(self) -> None:
+        await self.storage.insert_upload_session(
+            upload_session=UploadSession(
+                id="session",
+                key="test.txt",
+                upload_id="upload",
+                file_name="test.txt",
+                content_type=None,
+                owner_login="candidate",
+                chunk_size=4,
+            )
+        )
+
+        stale = await self.storage.get_stale_upload_sessions(
+            created_before=datetime.now(UTC) + timedelta(minutes=1)
+        )
+        fresh = await self.storage.get_stale_upload_sessions(
+            created_before=datetime.now(UTC) - timedelta(minutes=1)
+        )
+
+        assert [upload_session.id for upload_session in stale] == ["session"]
+        assert fresh == []
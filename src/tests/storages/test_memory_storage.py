@@ -0,0 +1,286 @@
+import pytest
+
+from src.core.competencies.exceptions import CompetencyLevelIncreaseTooHighError
+from src.core.mission_chains.exceptions import MissionChainMissionAlreadyExistsError
+from src.core.mission_chains.schemas import MissionChainMission
+from src.core.missions.enums import MissionSortEnum
+from src.core.missions.exceptions import (
+    MissionNameAlreadyExistError,
+    MissionNotFoundError,
+    MissionSkillRewardAlreadyExistsError,
+)
+from src.core.ranks.exceptions import RankNameAlreadyExistError
+from src.core.search.enums import SearchEntityEnum
+from src.core.seasons.exceptions import SeasonNotFoundError
+from src.core.store.exceptions import (
+    InsufficientManaError,
+    StoreItemInsufficientStockError,
+    StoreItemTitleAlreadyExistError,
+)
+from src.core.store.schemas import StorePurchase
+from src.core.tasks.schemas import UserTask
+from src.core.users.exceptions import UserAlreadyExistError, UserNotFoundError
+from src.storages.memory_storage import DEFAULT_RANK_NAME, InMemoryStorage
+from src.tests.fixtures import FactoryFixture
+
+
+class TestInMemoryStorage(FactoryFixture):
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.storage = InMemoryStorage()
+
+    async def _create_mission(self, title: str = "TEST") -> int:
+        if not self.storage.seasons:
+            await self.storage.insert_season(season=self.factory.season())
+        await self.storage.insert_mission(mission=self.factory.mission(title=title))
+        return (await self.storage.get_mission_by_title(title=title)).id
+
+    async def test_default_rank(self) -> None:
+        ranks = await self.storage.list_ranks()
+
+        assert [rank.name for rank in ranks.values] == [DEFAULT_RANK_NAME]
+
+    async def test_insert_user(self) -> None:
+        await self.storage.insert_user(user=self.factory.candidate(exp=100, mana=100))
+
+        user = await self.storage.get_user_by_login(login="TEST")
+        assert user.exp == 0
+        assert user.mana == 0
+        assert user.artifacts == []
+        assert user.competencies == []
+        assert user.skills == []
+
+    async def test_insert_user_duplicate(self) -> None:
+        await self.storage.insert_user(user=self.factory.candidate())
+
+        with pytest.raises(UserAlreadyExistError):
+            await self.storage.insert_user(user=self.factory.candidate())
+
+    async def test_get_user_not_found(self) -> None:
+        with pytest.raises(UserNotFoundError):
+            await self.storage.get_user_by_login(login="UNKNOWN")
+
+    async def test_returned_rows_are_copies(self) -> None:
+        await self.storage.insert_store_item(store_item=self.factory.store_item(stock=5))
+        store_item = await self.storage.get_store_item_by_title(title="TEST")
+
+        store_item.stock = 0
+
+        assert (await self.storage.get_store_item_by_id(store_item_id=store_item.id)).stock == 5
+
+    async def test_ids_are_generated(self) -> None:
+        await self.storage.insert_rank(rank=self.factory.rank(rank_id=100, name="FIRST"))
+        await self.storage.insert_rank(rank=self.factory.rank(rank_id=100, name="SECOND"))
+
+        ranks = await self.storage.list_ranks()
+        assert [rank.id for rank in ranks.values] == [1, 2, 3]
+
+    async def test_write_returns_row(self) -> None:
+        inserted = await self.storage.insert_rank(rank=self.factory.rank(name="SECOND"))
+        updated = await self.storage.update_rank(
+            rank=self.factory.rank(rank_id=inserted.id, name="RENAMED")
+        )
+
+        assert inserted.id == 2
+        assert updated == await self.storage.get_rank_by_id(rank_id=2)
+        assert updated.name == "RENAMED"
+
+    async def test_update_rank_duplicate_name(self) -> None:
+        await self.storage.insert_rank(rank=self.factory.rank(name="SECOND"))
+
+        with pytest.raises(RankNameAlreadyExistError):
+            await self.storage.update_rank(
+                rank=self.factory.rank(rank_id=2, name=DEFAULT_RANK_NAME)
+            )
+
+    async def test_update_rank_keeps_name_index(self) -> None:
+        await self.storage.update_rank(rank=self.factory.rank(rank_id=1, name="RENAMED"))
+
+        assert (await self.storage.get_rank_by_name(name="RENAMED")).id == 1
+        await self.storage.insert_rank(rank=self.factory.rank(name=DEFAULT_RANK_NAME))
+
+    async def test_insert_mission_season_not_found(self) -> None:
+        with pytest.raises(SeasonNotFoundError):
+            await self.storage.insert_mission(mission=self.factory.mission())
+
+    async def test_insert_mission_duplicate_title(self) -> None:
+        await self._create_mission()
+
+        with pytest.raises(MissionNameAlreadyExistError):
+            await self.storage.insert_mission(mission=self.factory.mission())
+
+    async def test_list_missions_filtered(self) -> None:
+        await self.storage.insert_season(season=self.factory.season())
+        await self.storage.insert_season(season=self.factory.season(name="SECOND"))
+        for title, season_id, rank_requirement in [
+            ("A", 1, 2),
+            ("B", 2, 2),
+            ("C", 1, 1),
+            ("D", 1, 2),
+        ]:
+            await self.storage.insert_mission(
+                mission=self.factory.mission(
+                    title=title, season_id=season_id, rank_requirement=rank_requirement
+                )
+            )
+
+        missions = await self.storage.list_missions(
+            filters=self.factory.mission_filter(
+                season_id=1, sort_by=MissionSortEnum.RANK_REQUIREMENT, descending=True
+            )
+        )
+
+        assert [mission.title for mission in missions.values] == ["A", "D", "C"]
+        assert missions.total == 3
+        past_end = await self.storage.list_missions(
+            filters=self.factory.mission_filter(season_id=1, limit=10, offset=10)
+        )
+        assert past_end == self.factory.missions(values=[], total=3)
+
+    async def test_delete_season_cascades_to_missions(self) -> None:
+        mission_id = await self._create_mission()
+        await self.storage.insert_mission_task(task=self.factory.mission_task())
+        await self.storage.add_task_to_mission(mission_id=mission_id, task_id=1)
+
+        await self.storage.delete_season(season_id=1)
+
+        with pytest.raises(MissionNotFoundError):
+            await self.storage.get_mission_by_id(mission_id=mission_id)
+        with pytest.raises(MissionNotFoundError):
+            await self.storage.get_mission_by_task(task_id=1)
+        assert (await self.storage.get_missions_by_rank(rank_id=1)).values == []
+
+    async def test_delete_skill_cascades_to_rewards(self) -> None:
+        mission_id = await self._create_mission()
+        await self.storage.insert_skill(skill=self.factory.skill(max_level=10))
+        await self.storage.add_skill_reward_to_mission(
+            mission_id=mission_id, skill_id=1, level_increase=5
+        )
+
+        await self.storage.delete_skill(skill_id=1)
+
+        mission = await self.storage.get_mission_by_id(mission_id=mission_id)
+        assert mission.reward_skills == []
+
+    async def test_add_skill_reward_duplicate(self) -> None:
+        mission_id = await self._create_mission()
+        await self.storage.insert_skill(skill=self.factory.skill())
+        await self.storage.add_skill_reward_to_mission(
+            mission_id=mission_id, skill_id=1, level_increase=1
+        )
+
+        with pytest.raises(MissionSkillRewardAlreadyExistsError):
+            await self.storage.add_skill_reward_to_mission(
+                mission_id=mission_id, skill_id=1, level_increase=1
+            )
+
+    async def test_add_competency_reward_level_too_high(self) -> None:
+        mission_id = await self._create_mission()
+        await self.storage.insert_competency(competency=self.factory.competency(max_level=3))
+
+        with pytest.raises(CompetencyLevelIncreaseTooHighError):
+            await self.storage.add_competency_reward_to_mission(
+                mission_id=mission_id, competency_id=1, level_increase=4
+            )
+
+    async def test_update_mission_order_in_chain(self) -> None:
+        mission_ids = [await self._create_mission(title=f"TEST_{i}") for i in range(3)]
+        await self.storage.insert_mission_chain(mission_chain=self.factory.mission_chain())
+        for mission_id in mission_ids:
+            await self.storage.add_mission_to_chain(chain_id=1, mission_id=mission_id)
+
+        await self.storage.update_mission_order_in_chain(
+            chain_id=1, mission_id=mission_ids[2], new_order=1
+        )
+
+        chain = await self.storage.get_mission_chain_by_id(chain_id=1)
+        assert chain.mission_orders == [
+            MissionChainMission(mission_id=mission_ids[2], order=1),
+            MissionChainMission(mission_id=mission_ids[0], order=2),
+            MissionChainMission(mission_id=mission_ids[1], order=3),
+        ]
+        with pytest.raises(MissionChainMissionAlreadyExistsError):
+            await self.storage.add_mission_to_chain(chain_id=1, mission_id=mission_ids[0])
+
+    async def test_user_missions(self) -> None:
+        mission_id = await self._create_mission()
+        await self.storage.insert_mission_task(task=self.factory.mission_task(title="FIRST"))
+        await self.storage.insert_mission_task(task=self.factory.mission_task(title="SECOND"))
+        await self.storage.add_task_to_mission(mission_id=mission_id, task_id=1)
+        await self.storage.add_task_to_mission(mission_id=mission_id, task_id=2)
+        await self.storage.insert_user(user=self.factory.candidate())
+        await self.storage.add_user_task(
+            user_login="TEST", user_task=UserTask(id=1, title="FIRST", description="TEST")
+        )
+
+        await self.storage.update_user_task_completion(task_id=1, user_login="TEST")
+        await self.storage.approve_user_mission(mission_id=mission_id, user_login="TEST")
+
+        missions = await self.storage.get_user_missions(user_login="TEST")
+        assert len(missions.values) == 1
+        assert missions.values[0].is_approved
+        assert [task.is_completed for task in missions.values[0].user_tasks or []] == [True, False]
+
+    async def test_user_competency_level(self) -> None:
+        await self.storage.insert_user(user=self.factory.candidate())
+        await self.storage.insert_competency(competency=self.factory.competency())
+        await self.storage.insert_skill(skill=self.factory.skill(name="FIRST"))
+        await self.storage.insert_skill(skill=self.factory.skill(name="SECOND"))
+        await self.storage.add_skill_to_competency(competency_id=1, skill_id=1)
+        await self.storage.add_skill_to_competency(competency_id=1, skill_id=2)
+        await self.storage.add_competency_to_user(user_login="TEST", competency_id=1)
+        await self.storage.add_skill_to_user(
+            user_login="TEST", skill_id=1, competency_id=1, level=2
+        )
+        await self.storage.add_skill_to_user(
+            user_login="TEST", skill_id=2, competency_id=1, level=3
+        )
+
+        candidate = await self.storage.get_candidate_by_login(login="TEST")
+
+        assert candidate.competencies is not None
+        assert candidate.competencies[0].user_level == 5
+
+    async def test_insert_store_item_duplicate_title(self) -> None:
+        await self.storage.insert_store_item(store_item=self.factory.store_item())
+
+        with pytest.raises(StoreItemTitleAlreadyExistError):
+            await self.storage.insert_store_item(store_item=self.factory.store_item())
+
+    async def test_purchase_store_item(self) -> None:
+        await self.storage.insert_user(user=self.factory.candidate())
+        await self.storage.update_user_exp_and_mana(
+            user_login="TEST", exp_increase=0, mana_increase=150
+        )
+        await self.storage.insert_store_item(store_item=self.factory.store_item(stock=1))
+        purchase = StorePurchase(user_login="TEST", store_item_id=1)
+
+        await self.storage.purchase_store_item(purchase=purchase, mana_count=100)
+
+        assert (await self.storage.get_user_by_login(login="TEST")).mana == 50
+        with pytest.raises(StoreItemInsufficientStockError):
+            await self.storage.purchase_store_item(purchase=purchase, mana_count=10)
+
+    async def test_purchase_store_item_insufficient_mana(self) -> None:
+        await self.storage.insert_user(user=self.factory.candidate())
+        await self.storage.insert_store_item(store_item=self.factory.store_item())
+
+        with pytest.raises(InsufficientManaError):
+            await self.storage.purchase_store_item(
+                purchase=StorePurchase(user_login="TEST", store_item_id=1), mana_count=100
+            )
+
+    async def test_search_ranks_title_matches_first(self) -> None:
+        await self.storage.insert_mission_task(
+            task=self.factory.mission_task(title="Лекция", description="Про ракеты")
+        )
+        await self.storage.insert_store_item(store_item=self.factory.store_item(title="Ракета"))
+        await self.storage.insert_artifact(artifact=self.factory.artifact(title="Кристалл"))
+
+        results = await self.storage.search(query=self.factory.search_query(text="ракет"))
+
+        assert results.total == 2
+        assert [value.entity_type for value in results.values] == [
+            SearchEntityEnum.STORE_ITEM,
+            SearchEntityEnum.TASK,
+        ]
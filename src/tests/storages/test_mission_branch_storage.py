@@ -44,6 +44,14 @@ class TestMissionBranchStorage(FactoryFixture, StorageFixture):
                 self.factory.season(season_id=self.created_branch.id, name="TEST2")
             )
 
+    async def test_session_is_usable_after_name_conflict(self) -> None:
+        with pytest.raises(SeasonNameAlreadyExistError):
+            await self.storage.insert_season(self.factory.season(name="TEST"))
+
+        branch = await self.storage.get_season_by_id(season_id=self.created_branch.id)
+
+        assert branch.name == "TEST"
+
     async def test_delete_mission_branch_success(self) -> None:
         await self.storage.delete_season(season_id=self.created_branch.id)
 
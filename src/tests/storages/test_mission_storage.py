@@ -1,8 +1,9 @@
 import pytest
 
 from src.core.artifacts.enums import ArtifactRarityEnum
-from src.core.missions.enums import MissionCategoryEnum
+from src.core.missions.enums import MissionCategoryEnum, MissionSortEnum
 from src.core.missions.exceptions import MissionNameAlreadyExistError, MissionNotFoundError
+from src.core.seasons.exceptions import SeasonNotFoundError
 from src.storages.database_storage import DatabaseStorage
 from src.tests.fixtures import FactoryFixture, StorageFixture
 
@@ -275,6 +276,17 @@ class TestMissionStorage(FactoryFixture, StorageFixture):
         assert result.branch_id == self.created_branch.id
         assert result.category == MissionCategoryEnum.QUEST
 
+    async def test_insert_mission_returns_created_mission(self) -> None:
+        mission = await self.storage.insert_mission(
+            mission=self.factory.mission(title="TEST_MISSION", season_id=self.created_branch.id)
+        )
+
+        stored_mission = await self.storage_helper.get_mission_by_title(title="TEST_MISSION")
+        assert stored_mission is not None
+        assert mission.id == stored_mission.id
+        assert mission.title == "TEST_MISSION"
+        assert mission.tasks == []
+
     async def test_insert_mission_already_exists(self) -> None:
         mission = self.factory.mission(
             title="TEST_MISSION",
@@ -290,6 +302,10 @@ class TestMissionStorage(FactoryFixture, StorageFixture):
         with pytest.raises(MissionNameAlreadyExistError):
             await self.storage.insert_mission(mission=mission)
 
+    async def test_insert_mission_season_not_found(self) -> None:
+        with pytest.raises(SeasonNotFoundError):
+            await self.storage.insert_mission(mission=self.factory.mission(season_id=999))
+
     async def test_list_missions(self) -> None:
         await self.storage_helper.insert_mission(
             mission=(
@@ -318,7 +334,7 @@ class TestMissionStorage(FactoryFixture, StorageFixture):
             )
         )
 
-        missions = await self.storage.list_missions()
+        missions = await self.storage.list_missions(filters=self.factory.mission_filter())
 
         assert len(missions.values) == 2
         missions.values[0].title = "TEST1"
@@ -336,8 +352,49 @@ class TestMissionStorage(FactoryFixture, StorageFixture):
         missions.values[1].season_id = self.created_branch.id
         missions.values[1].category = MissionCategoryEnum.LECTURE
 
+    async def test_list_missions_filtered(self) -> None:
+        for title, reward_mana, category in [
+            ("TEST1", 50, MissionCategoryEnum.QUEST),
+            ("TEST2", 150, MissionCategoryEnum.QUEST),
+            ("TEST3", 100, MissionCategoryEnum.QUEST),
+            ("TEST4", 200, MissionCategoryEnum.LECTURE),
+        ]:
+            await self.storage_helper.insert_mission(
+                mission=self.factory.mission(
+                    title=title,
+                    reward_mana=reward_mana,
+                    season_id=self.created_branch.id,
+                    category=category,
+                )
+            )
+
+        missions = await self.storage.list_missions(
+            filters=self.factory.mission_filter(
+                season_id=self.created_branch.id,
+                category=MissionCategoryEnum.QUEST,
+                max_reward_mana=150,
+                sort_by=MissionSortEnum.REWARD_MANA,
+                limit=2,
+                offset=1,
+            )
+        )
+
+        assert [mission.title for mission in missions.values] == ["TEST3", "TEST2"]
+        assert missions.total == 3
+
+    async def test_list_missions_offset_past_end(self) -> None:
+        await self.storage_helper.insert_mission(
+            mission=self.factory.mission(season_id=self.created_branch.id)
+        )
+
+        missions = await self.storage.list_missions(
+            filters=self.factory.mission_filter(limit=10, offset=10)
+        )
+
+        assert missions == self.factory.missions(values=[], total=1)
+
     async def test_list_empty_missions(self) -> None:
-        result = await self.storage.list_missions()
+        result = await self.storage.list_missions(filters=self.factory.mission_filter())
 
         assert len(result.values) == 0
 
@@ -0,0 +1,67 @@
+import pytest
+
+from src.core.search.enums import SearchEntityEnum
+from src.storages.database_storage import DatabaseStorage
+from src.tests.fixtures import FactoryFixture, StorageFixture
+
+
+class TestSearchStorage(FactoryFixture, StorageFixture):
+    @pytest.fixture(autouse=True)
+    async def setup(self, storage: DatabaseStorage) -> None:
+        self.storage = storage
+        await self.storage_helper.insert_season(season=self.factory.season(name="TEST"))
+        season = await self.storage_helper.get_branch_by_name(name="TEST")
+        assert season is not None
+        await self.storage_helper.insert_mission(
+            mission=self.factory.mission(
+                title="Полет на Марс",
+                description="Собрать ракету и долететь",
+                season_id=season.id,
+            )
+        )
+        await self.storage_helper.insert_task(
+            task=self.factory.mission_task(title="Ракеты", description="Лекция о двигателях")
+        )
+        await self.storage_helper.insert_artifact(
+            artifact=self.factory.artifact(title="Кристалл", description="Светится в темноте")
+        )
+        await self.storage_helper.insert_store_item(
+            store_item=self.factory.store_item(title="Модель ракеты")
+        )
+
+    async def test_search_ranks_title_matches_first(self) -> None:
+        results = await self.storage.search(query=self.factory.search_query(text="ракета"))
+
+        assert results.total == 3
+        assert {value.entity_type for value in results.values[:2]} == {
+            SearchEntityEnum.TASK,
+            SearchEntityEnum.STORE_ITEM,
+        }
+        assert results.values[2].entity_type == SearchEntityEnum.MISSION
+
+    async def test_search_entity_types(self) -> None:
+        results = await self.storage.search(
+            query=self.factory.search_query(text="ракета", entity_types=[SearchEntityEnum.MISSION])
+        )
+
+        assert [value.title for value in results.values] == ["Полет на Марс"]
+
+    async def test_search_pagination(self) -> None:
+        results = await self.storage.search(
+            query=self.factory.search_query(text="ракета", limit=1, offset=1)
+        )
+
+        assert results.total == 3
+        assert len(results.values) == 1
+
+    async def test_search_offset_past_end(self) -> None:
+        results = await self.storage.search(
+            query=self.factory.search_query(text="ракета", limit=10, offset=10)
+        )
+
+        assert results == self.factory.search_results(values=[], total=3)
+
+    async def test_search_no_matches(self) -> None:
+        results = await self.storage.search(query=self.factory.search_query(text="луноход"))
+
+        assert results == self.factory.search_results(values=[])